@@ -0,0 +1,37 @@
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+)
+from django.http.response import HttpResponseBase
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+)
+from django.utils.http import http_date
+
+import hashlib
+from datetime import datetime
+from typing import Any
+
+
+def make_etag(version: str, *parts: Any) -> str:
+    """Build a strong ETag from a cache version token and the request
+    parameters that select a slice of the cached document."""
+    payload = '|'.join([version, *(str(part) for part in parts)])
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+
+def not_modified_response(request: HttpRequest, etag: str) -> HttpResponseBase | None:
+    """Return a 304 when the client already holds `etag`, `None` when the
+    handler has to build the full response."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response.headers['ETag'] = etag
+    return response
+
+
+def set_conditional_headers(response: HttpResponse, etag: str, last_modified: datetime | None = None) -> None:
+    response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+    patch_cache_control(response, no_cache=True)
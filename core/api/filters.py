@@ -1,15 +1,33 @@
 from ninja import Schema
 
+from pydantic import Field
+
 
 class PaginationOut(Schema):
     offset: int
     limit: int
-    total: int
+    total: int | None = Field(
+        default=None,
+        description="Number of matching items; null on cursor pages and when `with_total` is false.",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Pass as `cursor` to fetch the next page; null on the last page.",
+    )
 
 
 class PaginationIn(Schema):
     offset: int = 0
     limit: int = 50
+    cursor: str | None = Field(
+        default=None,
+        description="`next_cursor` of the previous page. Continues after that page's last item and ignores "
+        "`offset`, so deep pages cost the same as the first one.",
+    )
+    with_total: bool = Field(
+        default=True,
+        description="Count all matching items on offset pages, in the same query as the page itself.",
+    )
 
 
 class SearchFilter(Schema):
@@ -1,5 +1,6 @@
 from ninja import Schema
 
+import dataclasses
 from pydantic import Field
 from typing import (
     Any,
@@ -8,6 +9,7 @@ from typing import (
 )
 
 from core.api.filters import PaginationOut
+from core.apps.common.exceptions import ServiceException
 
 
 TData = TypeVar("TData")
@@ -34,6 +36,14 @@ class ApiErrorDetail(Schema):
         description="Per-exception payload (dataclass fields of the raised ServiceException).",
     )
 
+    @classmethod
+    def from_exception(cls, exc: ServiceException, **data: Any) -> 'ApiErrorDetail':
+        """Describe `exc`; extra `data` (e.g. the index of a failed item in
+        a bulk request) is merged into its payload."""
+        if dataclasses.is_dataclass(exc):
+            data.update({field.name: getattr(exc, field.name) for field in dataclasses.fields(exc)})
+        return cls(code=type(exc).get_code(), message=exc.message, data=data)
+
 
 class ApiResponse(Schema, Generic[TData]):
     """Success envelope (2xx).
@@ -71,16 +71,17 @@ def get_client_list(
         search=filters.search,
         allowed_roles=_allowed_roles_for_caller(request.client_roles),
     )
-    item_list, item_count = use_case.execute(filters=domain_filter, pagination_in=pagination_in)
+    page = use_case.execute(filters=domain_filter, pagination_in=pagination_in)
     pagination_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
-        total=item_count,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
     return ApiResponse(
         data=ListPaginatedResponse(
-            items=[ClientSchemaPrivate.from_entity(obj) for obj in item_list],
+            items=[ClientSchemaPrivate.from_entity(obj) for obj in page.items],
             pagination=pagination_out,
         ),
     )
@@ -68,13 +68,15 @@ def get_client_info(request: HttpRequest) -> ApiResponse[ClientSchemaPrivate]:
         400: ApiErrorResponse,
         401: ApiErrorResponse,
         404: ApiErrorResponse,
+        503: ApiErrorResponse,
     },
     operation_id='login',
     summary="Log in with email and password",
     description=(
         "Authenticates a client and issues a JWT pair. The access token is returned in the JSON body; "
         "the refresh token is set as an HttpOnly, SameSite=Strict cookie named `refresh_token` and is "
-        "never exposed in the response body."
+        "never exposed in the response body. Answers 503 when too many logins are already waiting "
+        "for password verification on this worker."
     ),
 )
 def login(request: HttpRequest, response: HttpResponse, schema: LogInSchema) -> ApiResponse[TokenOutSchema]:
@@ -0,0 +1,68 @@
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+)
+from ninja import Router
+
+from core.api.schemas import ApiErrorResponse
+from core.api.v1.metrics.prometheus import (
+    PROMETHEUS_CONTENT_TYPE,
+    render_cache_metrics,
+    render_password_hash_metrics,
+)
+from core.apps.common.authentication.ninja_auth import jwt_auth_admin
+from core.apps.common.authentication.password import get_password_hash_pool
+from core.apps.common.cache.metrics import BaseCacheMetricsService
+from core.project.containers.containers import get_container
+
+
+router = Router(tags=["Metrics"])
+
+
+@router.get(
+    "cache",
+    response={
+        200: None,
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+    },
+    operation_id="get_cache_metrics",
+    auth=jwt_auth_admin,
+    summary="Admin: cache metrics (Prometheus text format)",
+    description=(
+        "Returns cache hit/miss counters, stampede-protection outcomes (leader, follower wait, "
+        "follower fallback) and a histogram of time spent computing missed values, labelled by "
+        "`model_prefix` and `func_prefix`. Totals are aggregated across workers; each worker ships "
+        "its counters every `CACHE_METRICS_FLUSH_INTERVAL` seconds. Requires ADMIN role."
+    ),
+)
+def get_cache_metrics(request: HttpRequest) -> HttpResponse:
+    container = get_container()
+    metrics_service: BaseCacheMetricsService = container.resolve(BaseCacheMetricsService)
+    return HttpResponse(
+        render_cache_metrics(metrics_service.collect()),
+        content_type=PROMETHEUS_CONTENT_TYPE,
+    )
+
+
+@router.get(
+    "password-hashing",
+    response={
+        200: None,
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+    },
+    operation_id="get_password_hash_metrics",
+    auth=jwt_auth_admin,
+    summary="Admin: password hashing pool metrics (Prometheus text format)",
+    description=(
+        "Returns the size, queue depth and running calls of the bcrypt thread pool, plus counters of "
+        "completed and rejected calls and total time spent queued. Values belong to the worker that "
+        "serves the request. Requires ADMIN role."
+    ),
+)
+def get_password_hash_metrics(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(
+        render_password_hash_metrics(get_password_hash_pool().stats()),
+        content_type=PROMETHEUS_CONTENT_TYPE,
+    )
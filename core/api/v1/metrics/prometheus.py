@@ -0,0 +1,65 @@
+from core.apps.common.authentication.password import PasswordHashPoolStats
+from core.apps.common.cache.metrics import (
+    CacheMetricsSnapshot,
+    COMPUTE_LATENCY_BUCKETS,
+)
+
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _labels(**labels: str) -> str:
+    pairs = ','.join(
+        '{}="{}"'.format(name, value.replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+    return f'{{{pairs}}}'
+
+
+def render_cache_metrics(snapshot: CacheMetricsSnapshot) -> str:
+    lines = [
+        '# HELP schedule_cache_events_total Cache lookups by outcome.',
+        '# TYPE schedule_cache_events_total counter',
+    ]
+    for (model_prefix, func_prefix, event), value in sorted(snapshot.events.items()):
+        labels = _labels(model_prefix=model_prefix, func_prefix=func_prefix, event=event.value)
+        lines.append(f'schedule_cache_events_total{labels} {value}')
+
+    lines += [
+        '# HELP schedule_cache_compute_seconds Time spent computing values on cache misses.',
+        '# TYPE schedule_cache_compute_seconds histogram',
+    ]
+    for (model_prefix, func_prefix), histogram in sorted(snapshot.compute.items()):
+        # Every bound is written, even one no sample reached, so the
+        # series of a histogram never come and go between scrapes.
+        for bound in COMPUTE_LATENCY_BUCKETS:
+            labels = _labels(model_prefix=model_prefix, func_prefix=func_prefix, le=repr(bound))
+            lines.append(f'schedule_cache_compute_seconds_bucket{labels} {histogram.buckets.get(bound, 0)}')
+        labels = _labels(model_prefix=model_prefix, func_prefix=func_prefix, le='+Inf')
+        lines.append(f'schedule_cache_compute_seconds_bucket{labels} {histogram.count}')
+
+        labels = _labels(model_prefix=model_prefix, func_prefix=func_prefix)
+        lines.append(f'schedule_cache_compute_seconds_sum{labels} {histogram.total_seconds}')
+        lines.append(f'schedule_cache_compute_seconds_count{labels} {histogram.count}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def render_password_hash_metrics(stats: PasswordHashPoolStats) -> str:
+    metrics = [
+        ('gauge', 'workers', 'Threads hashing passwords.', stats.workers),
+        ('gauge', 'capacity', 'Calls that may run or queue before new ones are rejected.', stats.capacity),
+        ('gauge', 'running', 'Hashing calls currently running.', stats.running),
+        ('gauge', 'queue_depth', 'Hashing calls waiting for a free thread.', stats.queued),
+        ('counter', 'completed_total', 'Hashing calls finished.', stats.completed),
+        ('counter', 'rejected_total', 'Hashing calls rejected because the queue was full.', stats.rejected),
+        ('counter', 'wait_seconds_total', 'Time hashing calls spent queued.', stats.wait_seconds_total),
+    ]
+    lines = []
+    for kind, name, description, value in metrics:
+        lines += [
+            f'# HELP schedule_password_hash_{name} {description}',
+            f'# TYPE schedule_password_hash_{name} {kind}',
+            f'schedule_password_hash_{name} {value}',
+        ]
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,8 @@
+from ninja import Router
+
+from core.api.v1.metrics.handlers import router as metrics_router
+
+
+router = Router(tags=['Metrics'])
+
+router.add_router(prefix="", router=metrics_router)
@@ -1,7 +1,9 @@
 from django.http import HttpRequest
 from ninja import (
+    File,
     Query,
     Router,
+    UploadedFile,
 )
 
 from core.api.filters import (
@@ -20,16 +22,20 @@ from core.api.v1.schedule.faculty.schemas import (
     FacultyInSchema,
     FacultyNameSchema,
     FacultySchema,
+    TimetableImportInSchema,
+    TimetableImportOutSchema,
 )
 from core.apps.common.authentication.ninja_auth import (
     jwt_auth,
     jwt_auth_faculty_manager,
+    jwt_auth_schedule_manager,
 )
 from core.apps.common.filters import SearchFilter as SearchFilterEntity
 from core.apps.schedule.use_cases.faculty.create import CreateFacultyUseCase
 from core.apps.schedule.use_cases.faculty.delete import DeleteFacultyUseCase
 from core.apps.schedule.use_cases.faculty.get_all import GetAllFacultiesUseCase
 from core.apps.schedule.use_cases.faculty.get_list import GetFacultyListUseCase
+from core.apps.schedule.use_cases.faculty.import_timetable import ImportFacultyTimetableUseCase
 from core.apps.schedule.use_cases.faculty.update_code_name import UpdateFacultyCodeNameUseCase
 from core.apps.schedule.use_cases.faculty.update_name import UpdateFacultyNameUseCase
 from core.project.containers.containers import get_container
@@ -83,19 +89,20 @@ def get_faculty_list(
 ) -> ApiResponse[ListPaginatedResponse[FacultySchema]]:
     container = get_container()
     use_case: GetFacultyListUseCase = container.resolve(GetFacultyListUseCase)
-    item_list, item_count = use_case.execute(
+    page = use_case.execute(
         filters=SearchFilterEntity(search=filters.search),
         pagination_in=pagination_in,
     )
     pagination_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
-        total=item_count,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
     return ApiResponse(
         data=ListPaginatedResponse(
-            items=[FacultySchema.from_entity(obj) for obj in item_list],
+            items=[FacultySchema.from_entity(obj) for obj in page.items],
             pagination=pagination_out,
         ),
     )
@@ -216,3 +223,72 @@ def delete_faculty(
     return ApiResponse(
         data=StatusResponse(status="Faculty deleted successfully"),
     )
+
+
+@router.post(
+    "{faculty_uuid}/timetable",
+    response={
+        200: ApiResponse[TimetableImportOutSchema],
+        400: ApiErrorResponse,
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+        404: ApiErrorResponse,
+    },
+    operation_id="import_faculty_timetable",
+    auth=jwt_auth_schedule_manager,
+    summary="Admin: import a faculty's timetable",
+    description=(
+        "Assigns every lesson in `lessons` to its group in one transaction. Each row names the "
+        "group (and `subgroup` for groups that have subgroups), the subject, teacher and room by "
+        "uuid, and the lesson `type` and timeslot (`day`, `ord_number`, `is_even`). Missing "
+        "timeslots and lessons are created; assignments that already exist are left as they are, "
+        "so the same timetable can be imported again safely. Nothing is written if any row fails "
+        "validation: 404 lists every unknown uuid, 400 is returned for groups of another faculty "
+        "or an invalid subgroup. Requires ADMIN or SCHEDULE_MANAGER role."
+    ),
+)
+def import_faculty_timetable(
+        request: HttpRequest,
+        faculty_uuid: str,
+        schema: TimetableImportInSchema,
+) -> ApiResponse[TimetableImportOutSchema]:
+    container = get_container()
+    use_case: ImportFacultyTimetableUseCase = container.resolve(ImportFacultyTimetableUseCase)
+    result = use_case.execute(faculty_uuid=faculty_uuid, rows=schema.to_entities())
+    return ApiResponse(
+        data=TimetableImportOutSchema.from_entity(entity=result),
+    )
+
+
+@router.post(
+    "{faculty_uuid}/timetable/csv",
+    response={
+        200: ApiResponse[TimetableImportOutSchema],
+        400: ApiErrorResponse,
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+        404: ApiErrorResponse,
+    },
+    operation_id="import_faculty_timetable_csv",
+    auth=jwt_auth_schedule_manager,
+    summary="Admin: import a faculty's timetable from CSV",
+    description=(
+        "Same as `import_faculty_timetable`, but the rows come from an uploaded UTF-8 CSV `file` "
+        "whose header names the row fields (`group_uuid,subgroup,subject_uuid,teacher_uuid,"
+        "room_uuid,type,day,ord_number,is_even`). Leave `subgroup` empty for groups without "
+        "subgroups. A malformed row is reported with its line number. Requires ADMIN or "
+        "SCHEDULE_MANAGER role."
+    ),
+)
+def import_faculty_timetable_csv(
+        request: HttpRequest,
+        faculty_uuid: str,
+        file: File[UploadedFile],
+) -> ApiResponse[TimetableImportOutSchema]:
+    schema = TimetableImportInSchema.from_csv(content=file.read())
+    container = get_container()
+    use_case: ImportFacultyTimetableUseCase = container.resolve(ImportFacultyTimetableUseCase)
+    result = use_case.execute(faculty_uuid=faculty_uuid, rows=schema.to_entities())
+    return ApiResponse(
+        data=TimetableImportOutSchema.from_entity(entity=result),
+    )
@@ -1,6 +1,21 @@
 from ninja import Schema
 
+import csv
+import io
+from pydantic import ValidationError
+
+from core.apps.common.models import (
+    Day,
+    LessonType,
+    OrdinaryNumber,
+    Subgroup,
+)
 from core.apps.schedule.entities.faculty import Faculty as FacultyEntity
+from core.apps.schedule.entities.timetable_import import (
+    TimetableImportResult,
+    TimetableImportRow,
+)
+from core.apps.schedule.exceptions.timetable_import import TimetableImportParseException
 
 
 class FacultySchema(Schema):
@@ -34,3 +49,71 @@ class FacultyNameSchema(Schema):
 class FacultyInSchema(Schema):
     name: str
     code_name: str
+
+
+class TimetableImportRowSchema(Schema):
+    group_uuid: str
+    subgroup: Subgroup | None = None
+    subject_uuid: str
+    teacher_uuid: str
+    room_uuid: str
+    type: LessonType
+    day: Day
+    ord_number: OrdinaryNumber
+    is_even: bool
+
+    def to_entity(self) -> TimetableImportRow:
+        return TimetableImportRow(
+            group_uuid=self.group_uuid,
+            subgroup=self.subgroup,
+            subject_uuid=self.subject_uuid,
+            teacher_uuid=self.teacher_uuid,
+            room_uuid=self.room_uuid,
+            type=self.type,
+            day=self.day,
+            ord_number=self.ord_number,
+            is_even=self.is_even,
+        )
+
+
+class TimetableImportInSchema(Schema):
+    lessons: list[TimetableImportRowSchema]
+
+    @classmethod
+    def from_csv(cls, content: bytes) -> 'TimetableImportInSchema':
+        """Parse a CSV file whose header names the `TimetableImportRowSchema`
+        fields; empty cells are treated as missing."""
+        try:
+            reader = csv.DictReader(io.StringIO(content.decode('utf-8-sig')))
+            lessons = []
+            for row in reader:
+                values = {key: value for key, value in row.items() if key is not None and value}
+                try:
+                    lessons.append(TimetableImportRowSchema.model_validate(values))
+                except ValidationError as error:
+                    raise TimetableImportParseException(
+                        line=reader.line_num,
+                        detail='; '.join(
+                            f"{'.'.join(map(str, item['loc']))}: {item['msg']}" for item in error.errors()
+                        ),
+                    )
+        except (UnicodeDecodeError, csv.Error) as error:
+            raise TimetableImportParseException(detail=str(error))
+        return cls(lessons=lessons)
+
+    def to_entities(self) -> list[TimetableImportRow]:
+        return [lesson.to_entity() for lesson in self.lessons]
+
+
+class TimetableImportOutSchema(Schema):
+    groups: int
+    lessons: int
+    group_lessons: int
+
+    @classmethod
+    def from_entity(cls, entity: TimetableImportResult) -> 'TimetableImportOutSchema':
+        return cls(
+            groups=entity.groups,
+            lessons=entity.lessons,
+            group_lessons=entity.group_lessons,
+        )
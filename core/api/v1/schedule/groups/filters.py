@@ -1,5 +1,7 @@
 from ninja import Schema
 
+from pydantic import Field
+
 from core.apps.common.models import Subgroup
 
 
@@ -9,3 +11,23 @@ class GroupLessonFilter(Schema):
 
     class Config:
         model = Subgroup
+
+
+class GroupLessonChangesFilter(Schema):
+    since: int | None = Field(
+        default=None,
+        ge=0,
+        description="`version` of the timetable the client holds; omit it to get the whole timetable.",
+    )
+
+
+MAX_BATCH_GROUPS = 50
+
+
+class GroupsLessonsFilter(Schema):
+    group_uuid: list[str] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_GROUPS,
+        description="Groups to fetch; repeat the parameter for each of them.",
+    )
+    is_even: bool
@@ -1,24 +1,40 @@
-from django.http import HttpRequest
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+)
 from ninja import (
     Query,
     Router,
 )
 
+from core.api.conditional import (
+    make_etag,
+    not_modified_response,
+    set_conditional_headers,
+)
 from core.api.filters import (
     PaginationIn,
     PaginationOut,
     SearchFilter,
 )
 from core.api.schemas import (
+    ApiErrorDetail,
     ApiErrorResponse,
     ApiResponse,
     ListPaginatedResponse,
     StatusResponse,
 )
-from core.api.v1.schedule.groups.filters import GroupLessonFilter
+from core.api.v1.schedule.groups.filters import (
+    GroupLessonChangesFilter,
+    GroupLessonFilter,
+    GroupsLessonsFilter,
+)
 from core.api.v1.schedule.groups.schemas import (
     CreateGroupSchema,
     GroupAllOutSchema,
+    GroupLessonBatchInSchema,
+    GroupLessonBatchOutSchema,
+    GroupLessonChangesOutSchema,
     GroupLessonsOutSchema,
     GroupSchema,
     GroupSchemaWithHeadman,
@@ -32,17 +48,26 @@ from core.apps.common.authentication.ninja_auth import (
 )
 from core.apps.common.filters import SearchFilter as SearchFilterEntity
 from core.apps.common.models import Subgroup
+from core.apps.common.threads import sync_read_to_async
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.group_lessons import GroupLessonOperationResult
+from core.apps.schedule.exceptions.group import GroupNotFoundException
 from core.apps.schedule.filters.group import LessonFilter
+from core.apps.schedule.services.schedule_version import BaseScheduleVersionService
 from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.admin_batch_lessons import AdminBatchUpdateGroupLessonsUseCase
 from core.apps.schedule.use_cases.group.admin_remove_lesson import AdminRemoveLessonFromGroupUseCase
 from core.apps.schedule.use_cases.group.admin_update_lesson import AdminUpdateLessonInGroupUseCase
 from core.apps.schedule.use_cases.group.create import CreateGroupUseCase
 from core.apps.schedule.use_cases.group.delete import DeleteGroupUseCase
 from core.apps.schedule.use_cases.group.get_all import GetAllGroupsUseCase
 from core.apps.schedule.use_cases.group.get_group_lessons import GetGroupLessonsUseCase
+from core.apps.schedule.use_cases.group.get_groups_lessons import GetGroupsLessonsUseCase
 from core.apps.schedule.use_cases.group.get_info import GetGroupInfoUseCase
+from core.apps.schedule.use_cases.group.get_lesson_changes import GetGroupLessonChangesUseCase
 from core.apps.schedule.use_cases.group.get_list import GetGroupListUseCase
 from core.apps.schedule.use_cases.group.headman_add_lesson import HeadmanAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.headman_batch_lessons import HeadmanBatchUpdateGroupLessonsUseCase
 from core.apps.schedule.use_cases.group.headman_remove_lesson import HeadmanRemoveLessonFromGroupUseCase
 from core.apps.schedule.use_cases.group.headman_update_lesson import HeadmanUpdateLessonInGroupUseCase
 from core.apps.schedule.use_cases.group.update_headman import UpdateGroupHeadmanUseCase
@@ -52,21 +77,62 @@ from core.project.containers.containers import get_container
 router = Router(tags=['Group'])
 
 
+BATCH_DESCRIPTION = (
+    "Each operation is `add` (attach `lesson_uuid`), `remove` (detach `lesson_uuid`) or `replace` "
+    "(swap `old_lesson_uuid` for `lesson_uuid`), optionally scoped to a `subgroup`. Operations are "
+    "validated together and applied in order within one transaction. An operation that fails "
+    "does not abort the batch: it is skipped and reported in `errors`, where `data.index` is its "
+    "position in `operations`."
+)
+
+
+def _batch_response(
+        group: GroupEntity,
+        results: list[GroupLessonOperationResult],
+) -> ApiResponse[GroupLessonBatchOutSchema]:
+    return ApiResponse(
+        data=GroupLessonBatchOutSchema.from_results(group_entity=group, results=results),
+        errors=[
+            ApiErrorDetail.from_exception(result.error, index=index)
+            for index, result in enumerate(results) if result.error is not None
+        ],
+    )
+
+
 @router.get(
     'all',
-    response=ApiResponse[list[GroupAllOutSchema]],
+    response={
+        200: ApiResponse[list[GroupAllOutSchema]],
+        304: None,
+    },
     operation_id='get_all_groups',
     summary="List every active group (public)",
     description=(
         "Returns every active group with its faculty, subgroup flag, and the timestamp of the "
         "group's last schedule edit (`schedule_updated_at`). This endpoint is public — clients use "
-        "it to populate the group picker before login."
+        "it to populate the group picker before login. Supports conditional GET: send the last "
+        "`ETag` back in `If-None-Match` to get an empty 304 while nothing has changed."
     ),
 )
-def get_all_groups(request: HttpRequest) -> ApiResponse[list[GroupAllOutSchema]]:
+async def get_all_groups(request: HttpRequest, response: HttpResponse) -> ApiResponse[list[GroupAllOutSchema]]:
     container = get_container()
+    version_service: BaseScheduleVersionService = container.resolve(BaseScheduleVersionService)
+    etag = make_etag(await version_service.aget_all_groups_version())
+    not_modified = not_modified_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
     use_case: GetAllGroupsUseCase = container.resolve(GetAllGroupsUseCase)
-    items = [GroupAllOutSchema.from_entity(obj) for obj in use_case.execute()]
+    groups = await sync_read_to_async(use_case.execute)()
+    set_conditional_headers(
+        response,
+        etag=etag,
+        last_modified=max(
+            (group.schedule_updated_at for group in groups if group.schedule_updated_at is not None),
+            default=None,
+        ),
+    )
+    items = [GroupAllOutSchema.from_entity(obj) for obj in groups]
     return ApiResponse(
         data=items,
     )
@@ -95,28 +161,63 @@ def get_group_list(
 ) -> ApiResponse[ListPaginatedResponse[GroupSchemaWithHeadman]]:
     container = get_container()
     use_case: GetGroupListUseCase = container.resolve(GetGroupListUseCase)
-    item_list, item_count = use_case.execute(
+    page = use_case.execute(
         filters=SearchFilterEntity(search=filters.search),
         pagination_in=pagination_in,
     )
     pagination_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
-        total=item_count,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
     return ApiResponse(
         data=ListPaginatedResponse(
-            items=[GroupSchemaWithHeadman.from_entity(obj) for obj in item_list],
+            items=[GroupSchemaWithHeadman.from_entity(obj) for obj in page.items],
             pagination=pagination_out,
         ),
     )
 
 
+@router.get(
+    "lessons",
+    response=ApiResponse[list[GroupLessonsOutSchema]],
+    operation_id="get_groups_lessons",
+    summary="Get the schedules of several groups at once (public)",
+    description=(
+        "Returns the lessons of every group in `group_uuid` for the requested week parity, in the order "
+        "the groups were given; repeated groups are returned once. Groups that do not exist are left out "
+        "and reported in `errors`, where `data.index` is their position in `group_uuid`. Public — no "
+        "authentication required."
+    ),
+)
+async def get_groups_lessons(
+        request: HttpRequest,
+        filters: Query[GroupsLessonsFilter],
+) -> ApiResponse[list[GroupLessonsOutSchema]]:
+    container = get_container()
+    use_case: GetGroupsLessonsUseCase = container.resolve(GetGroupsLessonsUseCase)
+    timetables = await sync_read_to_async(use_case.execute)(group_uuids=filters.group_uuid, is_even=filters.is_even)
+
+    return ApiResponse(
+        data=[
+            GroupLessonsOutSchema.from_timetable(group_entity=group, timetable=timetable)
+            for uuid in dict.fromkeys(filters.group_uuid) if uuid in timetables
+            for group, timetable in [timetables[uuid]]
+        ],
+        errors=[
+            ApiErrorDetail.from_exception(GroupNotFoundException(uuid=uuid), index=index)
+            for index, uuid in enumerate(filters.group_uuid) if uuid not in timetables
+        ],
+    )
+
+
 @router.get(
     "{group_uuid}/lessons",
     response={
         200: ApiResponse[GroupLessonsOutSchema],
+        304: None,
         404: ApiErrorResponse,
     },
     operation_id="get_group_lessons",
@@ -125,31 +226,72 @@ def get_group_list(
         "Returns the lessons assigned to the given group for the requested week parity "
         "(`is_even=true` for even weeks, `false` for odd). If the group uses subgroups, pass "
         "`subgroup=A` or `subgroup=B` to filter to that subgroup; omit it to get every lesson "
-        "regardless of subgroup. Public — no authentication required."
+        "regardless of subgroup. Public — no authentication required. Responses carry an `ETag` "
+        "and a `Last-Modified` taken from `schedule_updated_at`; a matching `If-None-Match` yields 304."
     ),
 )
-def get_group_lessons(
+async def get_group_lessons(
         request: HttpRequest,
+        response: HttpResponse,
         group_uuid: str,
         filters: Query[GroupLessonFilter],
 ) -> ApiResponse[GroupLessonsOutSchema]:
     container = get_container()
-    use_case: GetGroupLessonsUseCase = container.resolve(GetGroupLessonsUseCase)
+    version_service: BaseScheduleVersionService = container.resolve(BaseScheduleVersionService)
+    etag = make_etag(
+        await version_service.aget_group_lessons_version(group_uuid=group_uuid),
+        filters.is_even,
+        filters.subgroup,
+    )
+    not_modified = not_modified_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
 
-    group, views = use_case.execute(
+    use_case: GetGroupLessonsUseCase = container.resolve(GetGroupLessonsUseCase)
+    group, timetable = await sync_read_to_async(use_case.execute)(
         group_uuid=group_uuid,
         filters=LessonFilter(subgroup=filters.subgroup, is_even=filters.is_even),
     )
+    set_conditional_headers(response, etag=etag, last_modified=group.schedule_updated_at)
 
     return ApiResponse(
-        data=GroupLessonsOutSchema.from_views(
+        data=GroupLessonsOutSchema.from_timetable(
             group_entity=group,
-            lesson_views=views,
+            timetable=timetable,
             subgroup=filters.subgroup,
         ),
     )
 
 
+@router.get(
+    "{group_uuid}/lessons/changes",
+    response={
+        200: ApiResponse[GroupLessonChangesOutSchema],
+        404: ApiErrorResponse,
+    },
+    operation_id="get_group_lesson_changes",
+    summary="Get what changed in a group's schedule (public)",
+    description=(
+        "Returns the lessons added to and removed from the group since `since`, the `version` of the "
+        "timetable the client last received, together with the new `version`. Covers both week parities "
+        "and every subgroup. Without `since`, or when the history since then is no longer kept, the "
+        "response is the whole timetable with `is_full=true`. Public — no authentication required."
+    ),
+)
+async def get_group_lesson_changes(
+        request: HttpRequest,
+        group_uuid: str,
+        filters: Query[GroupLessonChangesFilter],
+) -> ApiResponse[GroupLessonChangesOutSchema]:
+    container = get_container()
+    use_case: GetGroupLessonChangesUseCase = container.resolve(GetGroupLessonChangesUseCase)
+    delta = await sync_read_to_async(use_case.execute)(group_uuid=group_uuid, since=filters.since)
+
+    return ApiResponse(
+        data=GroupLessonChangesOutSchema.from_entity(delta),
+    )
+
+
 @router.get(
     "{group_uuid}/info",
     response={
@@ -496,3 +638,51 @@ def remove_lesson_from_group_headman(
     return ApiResponse(
         data=StatusResponse(status="Lesson was removed successfully"),
     )
+
+
+@router.patch(
+    '{group_uuid}/lessons/batch',
+    response={
+        200: ApiResponse[GroupLessonBatchOutSchema],
+        400: ApiErrorResponse,
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+        404: ApiErrorResponse,
+    },
+    operation_id='batch_update_lessons_in_group_admin',
+    auth=jwt_auth_schedule_manager,
+    summary="Admin: apply several lesson changes to a group",
+    description=f"{BATCH_DESCRIPTION} Requires ADMIN or SCHEDULE_MANAGER role.",
+)
+def batch_update_lessons_in_group_admin(
+        request: HttpRequest,
+        group_uuid: str,
+        schema: GroupLessonBatchInSchema,
+) -> ApiResponse[GroupLessonBatchOutSchema]:
+    container = get_container()
+    use_case: AdminBatchUpdateGroupLessonsUseCase = container.resolve(AdminBatchUpdateGroupLessonsUseCase)
+    group, results = use_case.execute(group_uuid=group_uuid, operations=schema.to_entities())
+    return _batch_response(group=group, results=results)
+
+
+@router.patch(
+    'lessons/batch',
+    response={
+        200: ApiResponse[GroupLessonBatchOutSchema],
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+        404: ApiErrorResponse,
+    },
+    operation_id='batch_update_lessons_in_group_headman',
+    auth=jwt_auth_headman,
+    summary="Headman: apply several lesson changes to my group",
+    description=f"Headman-scoped batch edit of the caller's group. {BATCH_DESCRIPTION} Requires HEADMAN role.",
+)
+def batch_update_lessons_in_group_headman(
+        request: HttpRequest,
+        schema: GroupLessonBatchInSchema,
+) -> ApiResponse[GroupLessonBatchOutSchema]:
+    container = get_container()
+    use_case: HeadmanBatchUpdateGroupLessonsUseCase = container.resolve(HeadmanBatchUpdateGroupLessonsUseCase)
+    group, results = use_case.execute(headman_email=request.client_email, operations=schema.to_entities())
+    return _batch_response(group=group, results=results)
@@ -1,16 +1,31 @@
 from ninja import Schema
 
 from datetime import datetime
+from pydantic import (
+    Field,
+    model_validator,
+)
 
 from core.api.v1.clients.schemas import ClientSchemaPrivate
 from core.api.v1.schedule.faculty.schemas import FacultyCodeNameSchema
 from core.api.v1.schedule.lessons.schema_for_groups import LessonForGroupOutSchema
+from core.api.v1.schedule.lessons.timetable import TimetableDimensionSchemas
 from core.apps.common.models import Subgroup
 from core.apps.schedule.entities.group import Group as GroupEntity
-from core.apps.schedule.entities.views import (
-    GroupForLessonView,
-    LessonForGroupView,
+from core.apps.schedule.entities.group_lessons import (
+    GroupLessonAction,
+    GroupLessonCell,
+    GroupLessonOperation,
+    GroupLessonOperationResult,
+)
+from core.apps.schedule.entities.timetable import (
+    Timetable,
+    TimetableGroup,
 )
+from core.apps.schedule.entities.views import GroupTimetableDelta
+
+
+MAX_BATCH_OPERATIONS = 100
 
 
 class GroupSchema(Schema):
@@ -78,15 +93,53 @@ class GroupLessonsOutSchema(Schema):
     lessons: list[LessonForGroupOutSchema] | None = None
 
     @classmethod
-    def from_views(
+    def from_timetable(
             cls,
             group_entity: GroupEntity,
-            lesson_views: list[LessonForGroupView],
+            timetable: Timetable,
             subgroup: Subgroup | None = None,
     ) -> 'GroupLessonsOutSchema':
+        dimensions = TimetableDimensionSchemas(timetable=timetable)
         return cls(
             group=GroupSchemaWithSubgroup.from_entity(entity=group_entity, subgroup=subgroup),
-            lessons=[LessonForGroupOutSchema.from_view(v) for v in lesson_views] if lesson_views else None,
+            lessons=[
+                LessonForGroupOutSchema.from_timetable_entry(entry, dimensions) for entry in timetable.entries
+            ] or None,
+        )
+
+
+class GroupLessonCellSchema(Schema):
+    lesson_uuid: str
+    subgroup: Subgroup | None = None
+
+    @classmethod
+    def from_entity(cls, entity: GroupLessonCell) -> 'GroupLessonCellSchema':
+        return cls(lesson_uuid=entity.lesson_uuid, subgroup=entity.subgroup)
+
+
+class GroupLessonChangesOutSchema(Schema):
+    group: GroupSchema
+    version: int = Field(description="Pass back as `since` on the next call.")
+    is_full: bool = Field(
+        description="`added` is the whole timetable (both week parities); replace the local copy with it.",
+    )
+    added: list[LessonForGroupOutSchema] = Field(
+        description="Lessons gained since `since`; `subgroups` lists the subgroups that gained them, null for the "
+        "whole group. A lesson the client already has is updated in place.",
+    )
+    removed: list[GroupLessonCellSchema] = Field(
+        description="Lesson cells dropped since `since`; `subgroup` null means the whole-group cell.",
+    )
+
+    @classmethod
+    def from_entity(cls, entity: GroupTimetableDelta) -> 'GroupLessonChangesOutSchema':
+        dimensions = TimetableDimensionSchemas(timetable=entity.added)
+        return cls(
+            group=GroupSchema.from_entity(entity.group),
+            version=entity.version,
+            is_full=entity.is_full,
+            added=[LessonForGroupOutSchema.from_timetable_entry(entry, dimensions) for entry in entity.added.entries],
+            removed=[GroupLessonCellSchema.from_entity(cell) for cell in entity.removed],
         )
 
 
@@ -96,13 +149,56 @@ class GroupSchemaForLesson(Schema):
     subgroups: list[Subgroup] | None = None
 
     @classmethod
-    def from_view(cls, view: 'GroupForLessonView') -> 'GroupSchemaForLesson':
+    def from_timetable_group(cls, group: TimetableGroup, entity: GroupEntity) -> 'GroupSchemaForLesson':
         return cls(
-            uuid=view.group.uuid,
-            number=view.group.number,
-            subgroups=view.subgroups or None,
+            uuid=entity.uuid,
+            number=entity.number,
+            subgroups=group.subgroups or None,
         )
 
 
 class HeadmanEmailInSchema(Schema):
     headman_email: str
+
+
+class GroupLessonOperationSchema(Schema):
+    action: GroupLessonAction
+    lesson_uuid: str
+    old_lesson_uuid: str | None = Field(default=None, description="Lesson to swap out; required for `replace`.")
+    subgroup: Subgroup | None = None
+
+    @model_validator(mode='after')
+    def check_old_lesson_uuid(self) -> 'GroupLessonOperationSchema':
+        if (self.action == GroupLessonAction.REPLACE) != (self.old_lesson_uuid is not None):
+            raise ValueError('old_lesson_uuid must be given for replace operations and only for them')
+        return self
+
+    def to_entity(self) -> GroupLessonOperation:
+        return GroupLessonOperation(
+            action=self.action,
+            lesson_uuid=self.lesson_uuid,
+            subgroup=self.subgroup,
+            old_lesson_uuid=self.old_lesson_uuid,
+        )
+
+
+class GroupLessonBatchInSchema(Schema):
+    operations: list[GroupLessonOperationSchema] = Field(min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+    def to_entities(self) -> list[GroupLessonOperation]:
+        return [operation.to_entity() for operation in self.operations]
+
+
+class GroupLessonBatchOutSchema(Schema):
+    group_uuid: str
+    applied: int
+    failed: int
+
+    @classmethod
+    def from_results(
+            cls,
+            group_entity: GroupEntity,
+            results: list[GroupLessonOperationResult],
+    ) -> 'GroupLessonBatchOutSchema':
+        applied = sum(result.is_applied for result in results)
+        return cls(group_uuid=group_entity.uuid, applied=applied, failed=len(results) - applied)
@@ -12,8 +12,14 @@ from core.api.v1.schedule.lessons.schema_for_groups import (
 from core.api.v1.schedule.lessons.schemas import (
     CreateLessonInSchema,
     LessonInSchema,
+    TimetableConflictSchema,
 )
-from core.apps.common.authentication.ninja_auth import jwt_auth_schedule_or_headman
+from core.apps.common.authentication.ninja_auth import (
+    jwt_auth_schedule_manager,
+    jwt_auth_schedule_or_headman,
+)
+from core.apps.schedule.entities.timetable_index import ConflictDimension
+from core.apps.schedule.use_cases.lesson.get_conflicts import GetTimetableConflictsUseCase
 from core.apps.schedule.use_cases.lesson.get_or_create import GetOrCreateLessonUseCase
 from core.apps.schedule.use_cases.lesson.update import UpdateLessonUseCase
 from core.project.containers.containers import get_container
@@ -102,3 +108,33 @@ def update_lesson(
     )
 
     return ApiResponse(data=UpdatedLessonOutSchema.from_entity(updated_lesson=lesson, old_lesson=old_lesson))
+
+
+@router.get(
+    "conflicts",
+    response={
+        200: ApiResponse[list[TimetableConflictSchema]],
+        401: ApiErrorResponse,
+        403: ApiErrorResponse,
+    },
+    operation_id="get_timetable_conflicts",
+    auth=jwt_auth_schedule_manager,
+    summary="List double-booked teachers, rooms and groups",
+    description=(
+        "Scans the whole timetable for timeslots where a teacher or a room is booked for more than one "
+        "lesson, or where a group (or one of its subgroups) attends more than one lesson. Each entry names "
+        "the `dimension`, the uuid of the teacher, room or group as `identifier`, the timeslot and the "
+        "clashing `lesson_uuids`. Pass `dimension` to narrow the report. Requires ADMIN or SCHEDULE_MANAGER "
+        "role."
+    ),
+)
+def get_timetable_conflicts(
+    request: HttpRequest,
+    dimension: ConflictDimension | None = None,
+) -> ApiResponse[list[TimetableConflictSchema]]:
+    container = get_container()
+    use_case: GetTimetableConflictsUseCase = container.resolve(GetTimetableConflictsUseCase)
+
+    conflicts = use_case.execute(dimension=dimension)
+
+    return ApiResponse(data=[TimetableConflictSchema.from_entity(conflict) for conflict in conflicts])
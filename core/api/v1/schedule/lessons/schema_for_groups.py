@@ -1,5 +1,6 @@
 from ninja import Schema
 
+from core.api.v1.schedule.lessons.timetable import TimetableDimensionSchemas
 from core.api.v1.schedule.rooms.schemas import RoomSchema
 from core.api.v1.schedule.subjects.schemas import SubjectSchema
 from core.api.v1.schedule.teachers.schemas import TeacherSchema
@@ -9,7 +10,7 @@ from core.apps.common.models import (
     Subgroup,
 )
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
-from core.apps.schedule.entities.views import LessonForGroupView
+from core.apps.schedule.entities.timetable import TimetableEntry
 
 
 class LessonForGroupOutSchema(Schema):
@@ -33,15 +34,19 @@ class LessonForGroupOutSchema(Schema):
         )
 
     @classmethod
-    def from_view(cls, view: LessonForGroupView) -> 'LessonForGroupOutSchema':
+    def from_timetable_entry(
+            cls,
+            entry: TimetableEntry,
+            dimensions: TimetableDimensionSchemas,
+    ) -> 'LessonForGroupOutSchema':
         return cls(
-            uuid=view.lesson.uuid,
-            type=view.lesson.type,
-            subject=SubjectSchema.from_entity(view.lesson.subject),
-            teacher=TeacherSchema.from_entity(view.lesson.teacher),
-            room=RoomSchema.from_entity(view.lesson.room),
-            timeslot=TimeslotSchema.from_entity(view.lesson.timeslot),
-            subgroups=view.subgroups or None,
+            uuid=entry.lesson_uuid,
+            type=entry.type,
+            subject=dimensions.subject(entry.subject_id),
+            teacher=dimensions.teacher(entry.teacher_id),
+            room=dimensions.room(entry.room_id),
+            timeslot=dimensions.timeslot(entry.timeslot_id),
+            subgroups=entry.subgroups or None,
         )
 
 
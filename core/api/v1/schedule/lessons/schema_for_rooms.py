@@ -0,0 +1,60 @@
+from ninja import Schema
+
+from core.api.v1.schedule.groups.schemas import GroupSchemaForLesson
+from core.api.v1.schedule.lessons.timetable import TimetableDimensionSchemas
+from core.api.v1.schedule.rooms.schemas import RoomSchema
+from core.api.v1.schedule.subjects.schemas import SubjectSchema
+from core.api.v1.schedule.teachers.schemas import TeacherSchema
+from core.api.v1.schedule.timeslots.schemas import TimeslotSchema
+from core.apps.common.models import LessonType
+from core.apps.schedule.entities.room import Room as RoomEntity
+from core.apps.schedule.entities.timetable import (
+    Timetable,
+    TimetableEntry,
+)
+
+
+class RoomLessonOutSchema(Schema):
+    uuid: str
+    type: LessonType
+    groups: list[GroupSchemaForLesson]
+    subject: SubjectSchema
+    teacher: TeacherSchema
+    timeslot: TimeslotSchema
+
+    @classmethod
+    def from_timetable_entry(
+            cls,
+            entry: TimetableEntry,
+            dimensions: TimetableDimensionSchemas,
+    ) -> 'RoomLessonOutSchema':
+        return cls(
+            uuid=entry.lesson_uuid,
+            type=entry.type,
+            subject=dimensions.subject(entry.subject_id),
+            teacher=dimensions.teacher(entry.teacher_id),
+            timeslot=dimensions.timeslot(entry.timeslot_id),
+            groups=[
+                GroupSchemaForLesson.from_timetable_group(group, dimensions.timetable.groups[group.group_id])
+                for group in entry.groups
+            ],
+        )
+
+
+class RoomLessonsOutSchema(Schema):
+    room: RoomSchema
+    lessons: list[RoomLessonOutSchema] | None = None
+
+    @classmethod
+    def from_timetable(
+            cls,
+            room: RoomEntity,
+            timetable: Timetable,
+    ) -> 'RoomLessonsOutSchema':
+        dimensions = TimetableDimensionSchemas(timetable=timetable)
+        return cls(
+            room=RoomSchema.from_entity(entity=room),
+            lessons=[
+                RoomLessonOutSchema.from_timetable_entry(entry, dimensions) for entry in timetable.entries
+            ] or None,
+        )
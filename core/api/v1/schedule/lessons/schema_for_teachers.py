@@ -1,13 +1,17 @@
 from ninja import Schema
 
 from core.api.v1.schedule.groups.schemas import GroupSchemaForLesson
+from core.api.v1.schedule.lessons.timetable import TimetableDimensionSchemas
 from core.api.v1.schedule.rooms.schemas import RoomSchema
 from core.api.v1.schedule.subjects.schemas import SubjectSchema
 from core.api.v1.schedule.teachers.schemas import TeacherSchema
 from core.api.v1.schedule.timeslots.schemas import TimeslotSchema
 from core.apps.common.models import LessonType
 from core.apps.schedule.entities.teacher import Teacher as TeacherEntity
-from core.apps.schedule.entities.views import LessonWithGroupsView
+from core.apps.schedule.entities.timetable import (
+    Timetable,
+    TimetableEntry,
+)
 
 
 class LessonWithGroupsOutSchema(Schema):
@@ -19,14 +23,21 @@ class LessonWithGroupsOutSchema(Schema):
     timeslot: TimeslotSchema
 
     @classmethod
-    def from_view(cls, view: LessonWithGroupsView) -> 'LessonWithGroupsOutSchema':
+    def from_timetable_entry(
+            cls,
+            entry: TimetableEntry,
+            dimensions: TimetableDimensionSchemas,
+    ) -> 'LessonWithGroupsOutSchema':
         return cls(
-            uuid=view.lesson.uuid,
-            type=view.lesson.type,
-            subject=SubjectSchema.from_entity(view.lesson.subject),
-            room=RoomSchema.from_entity(view.lesson.room),
-            timeslot=TimeslotSchema.from_entity(view.lesson.timeslot),
-            groups=[GroupSchemaForLesson.from_view(gv) for gv in view.groups],
+            uuid=entry.lesson_uuid,
+            type=entry.type,
+            subject=dimensions.subject(entry.subject_id),
+            room=dimensions.room(entry.room_id),
+            timeslot=dimensions.timeslot(entry.timeslot_id),
+            groups=[
+                GroupSchemaForLesson.from_timetable_group(group, dimensions.timetable.groups[group.group_id])
+                for group in entry.groups
+            ],
         )
 
 
@@ -35,12 +46,15 @@ class TeacherLessonsOutSchema(Schema):
     lessons: list[LessonWithGroupsOutSchema] | None = None
 
     @classmethod
-    def from_views(
+    def from_timetable(
             cls,
             teacher: TeacherEntity,
-            views: list[LessonWithGroupsView],
+            timetable: Timetable,
     ) -> 'TeacherLessonsOutSchema':
+        dimensions = TimetableDimensionSchemas(timetable=timetable)
         return cls(
             teacher=TeacherSchema.from_entity(entity=teacher),
-            lessons=[LessonWithGroupsOutSchema.from_view(v) for v in views] if views else None,
+            lessons=[
+                LessonWithGroupsOutSchema.from_timetable_entry(entry, dimensions) for entry in timetable.entries
+            ] or None,
         )
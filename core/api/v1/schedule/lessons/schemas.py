@@ -1,8 +1,16 @@
 from ninja import Schema
 
 from core.api.v1.schedule.timeslots.schemas import CreateTimeslotSchema
-from core.apps.common.models import LessonType
+from core.apps.common.models import (
+    Day,
+    LessonType,
+    OrdinaryNumber,
+)
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
+from core.apps.schedule.entities.timetable_index import (
+    ConflictDimension,
+    TimetableConflict,
+)
 
 
 class LessonInSchema(Schema):
@@ -17,3 +25,23 @@ class CreateLessonInSchema(Schema):
     subject_uuid: str
     teacher_uuid: str
     room_uuid: str
+
+
+class TimetableConflictSchema(Schema):
+    dimension: ConflictDimension
+    identifier: str
+    day: Day
+    ord_number: OrdinaryNumber
+    is_even: bool
+    lesson_uuids: list[str]
+
+    @classmethod
+    def from_entity(cls, entity: TimetableConflict) -> 'TimetableConflictSchema':
+        return cls(
+            dimension=entity.dimension,
+            identifier=entity.identifier,
+            day=entity.day,
+            ord_number=entity.ord_number,
+            is_even=entity.is_even,
+            lesson_uuids=list(entity.lesson_uuids),
+        )
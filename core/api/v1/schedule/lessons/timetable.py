@@ -0,0 +1,40 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Callable,
+)
+
+from core.api.v1.schedule.rooms.schemas import RoomSchema
+from core.api.v1.schedule.subjects.schemas import SubjectSchema
+from core.api.v1.schedule.teachers.schemas import TeacherSchema
+from core.api.v1.schedule.timeslots.schemas import TimeslotSchema
+from core.apps.schedule.entities.timetable import Timetable
+
+
+@dataclass
+class TimetableDimensionSchemas:
+    """Renders each dimension row of a timetable into its schema once and
+    hands the same instance to every lesson that references it."""
+    timetable: Timetable
+    _rendered: dict[tuple[str, int], Any] = field(default_factory=dict)
+
+    def subject(self, subject_id: int) -> SubjectSchema:
+        return self._render('subjects', subject_id, SubjectSchema.from_entity)
+
+    def teacher(self, teacher_id: int) -> TeacherSchema:
+        return self._render('teachers', teacher_id, TeacherSchema.from_entity)
+
+    def room(self, room_id: int) -> RoomSchema:
+        return self._render('rooms', room_id, RoomSchema.from_entity)
+
+    def timeslot(self, timeslot_id: int) -> TimeslotSchema:
+        return self._render('timeslots', timeslot_id, TimeslotSchema.from_entity)
+
+    def _render(self, table: str, row_id: int, from_entity: Callable) -> Any:
+        key = (table, row_id)
+        if key not in self._rendered:
+            self._rendered[key] = from_entity(getattr(self.timetable, table)[row_id])
+        return self._rendered[key]
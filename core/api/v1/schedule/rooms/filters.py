@@ -0,0 +1,5 @@
+from ninja import Schema
+
+
+class RoomLessonFilter(Schema):
+    is_even: bool
@@ -1,9 +1,17 @@
-from django.http import HttpRequest
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+)
 from ninja import (
     Query,
     Router,
 )
 
+from core.api.conditional import (
+    make_etag,
+    not_modified_response,
+    set_conditional_headers,
+)
 from core.api.filters import (
     PaginationIn,
     PaginationOut,
@@ -15,7 +23,10 @@ from core.api.schemas import (
     ListPaginatedResponse,
     StatusResponse,
 )
+from core.api.v1.schedule.lessons.schema_for_rooms import RoomLessonsOutSchema
+from core.api.v1.schedule.rooms.filters import RoomLessonFilter
 from core.api.v1.schedule.rooms.schemas import (
+    FreeRoomFilterSchema,
     RoomDescriptionInSchema,
     RoomNumberInSchema,
     RoomSchema,
@@ -25,10 +36,15 @@ from core.apps.common.authentication.ninja_auth import (
     jwt_auth_room_manager,
 )
 from core.apps.common.filters import SearchFilter as SearchFilterEntity
+from core.apps.common.threads import sync_read_to_async
+from core.apps.schedule.filters.group import LessonFilter
+from core.apps.schedule.services.schedule_version import BaseScheduleVersionService
 from core.apps.schedule.use_cases.room.create import CreateRoomUseCase
 from core.apps.schedule.use_cases.room.delete import DeleteRoomUseCase
 from core.apps.schedule.use_cases.room.get_all import GetAllRoomsUseCase
+from core.apps.schedule.use_cases.room.get_free import GetFreeRoomsUseCase
 from core.apps.schedule.use_cases.room.get_list import GetRoomListUseCase
+from core.apps.schedule.use_cases.room.get_room_lessons import GetLessonsForRoomUseCase
 from core.apps.schedule.use_cases.room.update_description import UpdateRoomDescriptionUseCase
 from core.apps.schedule.use_cases.room.update_number import UpdateRoomNumberUseCase
 from core.project.containers.containers import get_container
@@ -60,6 +76,30 @@ def get_all_rooms(request: HttpRequest) -> ApiResponse[list[RoomSchema]]:
     )
 
 
+@router.get(
+    'free',
+    response={
+        200: ApiResponse[list[RoomSchema]],
+        401: ApiErrorResponse,
+    },
+    operation_id='get_free_rooms',
+    auth=jwt_auth,
+    summary="List rooms free in a timeslot",
+    description=(
+        "Returns the active rooms that have no lesson on `day` in any of the given `ord_number` slots. "
+        "Repeat `ord_number` to ask for several consecutive lessons. With `is_even` the check covers that "
+        "week parity only; without it a room must be free in both."
+    ),
+)
+def get_free_rooms(request: HttpRequest, filters: Query[FreeRoomFilterSchema]) -> ApiResponse[list[RoomSchema]]:
+    container = get_container()
+    use_case: GetFreeRoomsUseCase = container.resolve(GetFreeRoomsUseCase)
+    rooms = use_case.execute(day=filters.day, ord_numbers=filters.ord_number, is_even=filters.is_even)
+    return ApiResponse(
+        data=[RoomSchema.from_entity(room) for room in rooms],
+    )
+
+
 @router.get(
     "",
     response={
@@ -78,24 +118,68 @@ def get_room_list(
 ) -> ApiResponse[ListPaginatedResponse[RoomSchema]]:
     container = get_container()
     use_case: GetRoomListUseCase = container.resolve(GetRoomListUseCase)
-    item_list, item_count = use_case.execute(
+    page = use_case.execute(
         filters=SearchFilterEntity(search=filters.search),
         pagination_in=pagination_in,
     )
     pagination_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
-        total=item_count,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
     return ApiResponse(
         data=ListPaginatedResponse(
-            items=[RoomSchema.from_entity(obj) for obj in item_list],
+            items=[RoomSchema.from_entity(obj) for obj in page.items],
             pagination=pagination_out,
         ),
     )
 
 
+@router.get(
+    "{room_uuid}/lessons",
+    response={
+        200: ApiResponse[RoomLessonsOutSchema],
+        304: None,
+        404: ApiErrorResponse,
+    },
+    operation_id="get_lessons_for_room",
+    summary="Get a room's schedule (public)",
+    description=(
+        "Returns every lesson held in the room for the requested week parity, along with its teacher "
+        "and the groups (and subgroups) attending. Public — no authentication required. Responses carry "
+        "an `ETag`; a matching `If-None-Match` yields 304."
+    ),
+)
+async def get_lessons_for_room(
+        request: HttpRequest,
+        response: HttpResponse,
+        room_uuid: str,
+        filters: Query[RoomLessonFilter],
+) -> ApiResponse[RoomLessonsOutSchema]:
+    container = get_container()
+    version_service: BaseScheduleVersionService = container.resolve(BaseScheduleVersionService)
+    etag = make_etag(
+        await version_service.aget_room_lessons_version(room_uuid=room_uuid),
+        filters.is_even,
+    )
+    not_modified = not_modified_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    use_case: GetLessonsForRoomUseCase = container.resolve(GetLessonsForRoomUseCase)
+    room, timetable = await sync_read_to_async(use_case.execute)(
+        room_uuid=room_uuid,
+        filters=LessonFilter(is_even=filters.is_even),
+    )
+    set_conditional_headers(response, etag=etag)
+
+    return ApiResponse(
+        data=RoomLessonsOutSchema.from_timetable(room=room, timetable=timetable),
+    )
+
+
 @router.post(
     "",
     response={
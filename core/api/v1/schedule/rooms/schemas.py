@@ -1,7 +1,12 @@
 from ninja import Schema
 
+from pydantic import Field
 from typing import Optional
 
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+)
 from core.apps.schedule.entities.room import Room as RoomEntity
 
 
@@ -25,3 +30,9 @@ class RoomNumberInSchema(Schema):
 
 class RoomDescriptionInSchema(Schema):
     description: str
+
+
+class FreeRoomFilterSchema(Schema):
+    day: Day
+    ord_number: list[OrdinaryNumber] = Field(min_length=1, description="One or more lesson numbers.")
+    is_even: bool | None = Field(default=None, description="Week parity; omit to require both parities free.")
@@ -0,0 +1,11 @@
+from ninja import Schema
+
+from pydantic import Field
+
+from core.apps.schedule.entities.search import SearchKind
+
+
+class SearchFilter(Schema):
+    q: str = Field(min_length=1, max_length=100, description="What the user has typed so far, in any script.")
+    kind: list[SearchKind] | None = Field(default=None, description="Kinds to search; omit to search all of them.")
+    limit: int = Field(default=10, ge=1, le=50)
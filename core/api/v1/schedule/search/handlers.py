@@ -0,0 +1,34 @@
+from django.http import HttpRequest
+from ninja import (
+    Query,
+    Router,
+)
+
+from core.api.schemas import ApiResponse
+from core.api.v1.schedule.search.filters import SearchFilter
+from core.api.v1.schedule.search.schemas import SearchHitSchema
+from core.apps.common.threads import sync_read_to_async
+from core.apps.schedule.use_cases.search.typeahead import TypeaheadSearchUseCase
+from core.project.containers.containers import get_container
+
+
+router = Router(tags=["Search"])
+
+
+@router.get(
+    "",
+    response=ApiResponse[list[SearchHitSchema]],
+    operation_id="search_schedule",
+    summary="Typeahead over teachers, groups, rooms and subjects (public)",
+    description=(
+        "Returns the best matches for `q`, best first. Every word of `q` has to occur in a match; case, "
+        "apostrophes and the script it was typed in (Cyrillic or Latin) do not matter."
+    ),
+)
+async def search_schedule(request: HttpRequest, filters: Query[SearchFilter]) -> ApiResponse[list[SearchHitSchema]]:
+    container = get_container()
+    use_case: TypeaheadSearchUseCase = container.resolve(TypeaheadSearchUseCase)
+    hits = await sync_read_to_async(use_case.execute)(query=filters.q, kinds=filters.kind, limit=filters.limit)
+    return ApiResponse(
+        data=[SearchHitSchema.from_entity(hit) for hit in hits],
+    )
@@ -0,0 +1,20 @@
+from ninja import Schema
+
+from core.apps.schedule.entities.search import (
+    SearchHit,
+    SearchKind,
+)
+
+
+class SearchHitSchema(Schema):
+    kind: SearchKind
+    uuid: str
+    label: str
+
+    @classmethod
+    def from_entity(cls, entity: SearchHit) -> 'SearchHitSchema':
+        return cls(
+            kind=entity.kind,
+            uuid=entity.uuid,
+            label=entity.label,
+        )
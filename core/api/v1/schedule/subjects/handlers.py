@@ -76,19 +76,20 @@ def get_subject_list(
 ) -> ApiResponse[ListPaginatedResponse[SubjectSchema]]:
     container = get_container()
     use_case: GetSubjectListUseCase = container.resolve(GetSubjectListUseCase)
-    item_list, item_count = use_case.execute(
+    page = use_case.execute(
         filters=SearchFilterEntity(search=filters.search),
         pagination_in=pagination_in,
     )
     pagination_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
-        total=item_count,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
     return ApiResponse(
         data=ListPaginatedResponse(
-            items=[SubjectSchema.from_entity(obj) for obj in item_list],
+            items=[SubjectSchema.from_entity(obj) for obj in page.items],
             pagination=pagination_out,
         ),
     )
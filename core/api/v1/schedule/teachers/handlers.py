@@ -1,9 +1,17 @@
-from django.http import HttpRequest
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+)
 from ninja import (
     Query,
     Router,
 )
 
+from core.api.conditional import (
+    make_etag,
+    not_modified_response,
+    set_conditional_headers,
+)
 from core.api.filters import (
     PaginationIn,
     PaginationOut,
@@ -29,8 +37,10 @@ from core.apps.common.authentication.ninja_auth import (
     jwt_auth,
     jwt_auth_teacher_manager,
 )
+from core.apps.common.threads import sync_read_to_async
 from core.apps.schedule.filters.group import LessonFilter
 from core.apps.schedule.filters.teacher import TeacherFilter as TeacherFilterEntity
+from core.apps.schedule.services.schedule_version import BaseScheduleVersionService
 from core.apps.schedule.use_cases.teacher.create import CreateTeacherUseCase
 from core.apps.schedule.use_cases.teacher.delete import DeleteTeacherUseCase
 from core.apps.schedule.use_cases.teacher.get_all import GetAllTeachersUseCase
@@ -55,10 +65,10 @@ router = Router(tags=["Teachers"])
         "access."
     ),
 )
-def get_all_teachers(request: HttpRequest) -> ApiResponse[list[TeacherSchema]]:
+async def get_all_teachers(request: HttpRequest) -> ApiResponse[list[TeacherSchema]]:
     container = get_container()
     use_case: GetAllTeachersUseCase = container.resolve(GetAllTeachersUseCase)
-    items = [TeacherSchema.from_entity(obj) for obj in use_case.execute()]
+    items = [TeacherSchema.from_entity(obj) for obj in await sync_read_to_async(use_case.execute)()]
     return ApiResponse(
         data=items,
     )
@@ -87,7 +97,7 @@ def get_teacher_list(
 ) -> ApiResponse[ListPaginatedResponse[TeacherSchema]]:
     container = get_container()
     use_case: GetTeacherListUseCase = container.resolve(GetTeacherListUseCase)
-    item_list, item_count = use_case.execute(
+    page = use_case.execute(
         filters=TeacherFilterEntity(
             name=filters.name,
             rank=filters.rank,
@@ -97,12 +107,13 @@ def get_teacher_list(
     pagination_out = PaginationOut(
         offset=pagination_in.offset,
         limit=pagination_in.limit,
-        total=item_count,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
     return ApiResponse(
         data=ListPaginatedResponse(
-            items=[TeacherSchema.from_entity(obj) for obj in item_list],
+            items=[TeacherSchema.from_entity(obj) for obj in page.items],
             pagination=pagination_out,
         ),
     )
@@ -112,29 +123,53 @@ def get_teacher_list(
     "{teacher_uuid}/lessons",
     response={
         200: ApiResponse[TeacherLessonsOutSchema],
+        304: None,
         404: ApiErrorResponse,
     },
     operation_id="get_lessons_for_teacher",
     summary="Get a teacher's schedule (public)",
     description=(
         "Returns every lesson the teacher leads for the requested week parity, along with the "
-        "groups (and subgroups) each lesson is attached to. Public — no authentication required."
+        "groups (and subgroups) each lesson is attached to. Public — no authentication required. "
+        "Responses carry an `ETag` and, when the teacher has lessons, a `Last-Modified` taken from the "
+        "newest `schedule_updated_at` of the groups listed; a matching `If-None-Match` yields 304."
     ),
 )
-def get_lessons_for_teacher(
+async def get_lessons_for_teacher(
         request: HttpRequest,
+        response: HttpResponse,
         teacher_uuid: str,
         filters: Query[TeacherLessonFilter],
 ) -> ApiResponse[TeacherLessonsOutSchema]:
     container = get_container()
+    version_service: BaseScheduleVersionService = container.resolve(BaseScheduleVersionService)
+    etag = make_etag(
+        await version_service.aget_teacher_lessons_version(teacher_uuid=teacher_uuid),
+        filters.is_even,
+    )
+    not_modified = not_modified_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
     use_case: GetLessonsForTeacherUseCase = container.resolve(GetLessonsForTeacherUseCase)
-    teacher, views = use_case.execute(
+    teacher, timetable = await sync_read_to_async(use_case.execute)(
         teacher_uuid=teacher_uuid,
         filters=LessonFilter(is_even=filters.is_even),
     )
+    set_conditional_headers(
+        response,
+        etag=etag,
+        last_modified=max(
+            (
+                group.schedule_updated_at for group in timetable.groups.values()
+                if group.schedule_updated_at is not None
+            ),
+            default=None,
+        ),
+    )
 
     return ApiResponse(
-        data=TeacherLessonsOutSchema.from_views(teacher=teacher, views=views),
+        data=TeacherLessonsOutSchema.from_timetable(teacher=teacher, timetable=timetable),
     )
 
 
@@ -4,6 +4,7 @@ from core.api.v1.schedule.faculty.handlers import router as faculty_router
 from core.api.v1.schedule.groups.handlers import router as group_router
 from core.api.v1.schedule.lessons.handlers import router as lesson_router
 from core.api.v1.schedule.rooms.handlers import router as room_router
+from core.api.v1.schedule.search.handlers import router as search_router
 from core.api.v1.schedule.subjects.handlers import router as subject_router
 from core.api.v1.schedule.teachers.handlers import router as teacher_router
 from core.api.v1.schedule.timeslots.handlers import router as timeslot_router
@@ -18,3 +19,4 @@ router.add_router(prefix="subject/", router=subject_router)
 router.add_router(prefix="room/", router=room_router)
 router.add_router(prefix="faculty/", router=faculty_router)
 router.add_router(prefix="timeslot/", router=timeslot_router)
+router.add_router(prefix="search/", router=search_router)
@@ -23,10 +23,10 @@ router = Router(tags=["Time"])
         "required."
     ),
 )
-def get_current_time_info(request: HttpRequest) -> ApiResponse[TimeInfoOutSchema]:
+async def get_current_time_info(request: HttpRequest) -> ApiResponse[TimeInfoOutSchema]:
     container = get_container()
     use_case: GetCurrentTimeInfoUseCase = container.resolve(GetCurrentTimeInfoUseCase)
-    time_info = use_case.execute()
+    time_info = await use_case.aexecute()
     return ApiResponse(
         data=TimeInfoOutSchema.from_entity(entity=time_info),
     )
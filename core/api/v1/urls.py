@@ -2,6 +2,7 @@ from django.http import HttpRequest
 from ninja import Router
 
 from core.api.v1.clients.urls import router as client_router
+from core.api.v1.metrics.urls import router as metrics_router
 from core.api.v1.schedule.urls import router as schedule_router
 from core.api.v1.time.urls import router as time_router
 
@@ -10,6 +11,7 @@ router = Router(tags=['v1'])
 router.add_router('time/', time_router)
 router.add_router('clients/', client_router)
 router.add_router('schedule/', schedule_router)
+router.add_router('metrics/', metrics_router)
 
 
 @router.get(
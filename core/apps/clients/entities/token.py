@@ -3,8 +3,28 @@ from dataclasses import (
     field,
 )
 
+from core.apps.common.models import (
+    ClientRole,
+    TokenType,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TokenClaims:
+    type: TokenType
+    jti: str
+    subject: str
+    client_email: str
+    client_roles: list[ClientRole]
+    device_id: str | None
+    issued_at: int
+    not_before: int
+    expiration_time: int
+
 
 @dataclass
 class Token:
     access_token: str | None = field(default=None, kw_only=True)
     refresh_token: str | None = field(default=None, kw_only=True)
+    access_claims: TokenClaims | None = field(default=None, kw_only=True, repr=False)
+    refresh_claims: TokenClaims | None = field(default=None, kw_only=True, repr=False)
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 import logging
 import os
@@ -16,6 +17,7 @@ from django_apscheduler.models import DjangoJobExecution
 from pathlib import Path
 
 from core.apps.clients.services.issuedjwttoken import BaseIssuedJwtTokenService
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
 from core.project.containers.containers import get_container
 
 
@@ -27,6 +29,14 @@ def delete_old_job_executions(max_age=604_800):
     DjangoJobExecution.objects.delete_old_job_executions(max_age)
 
 
+@util.close_old_connections
+def compact_group_lesson_changes():
+    service: BaseGroupLessonChangeService = get_container().resolve(BaseGroupLessonChangeService)
+    before = timezone.now() - timedelta(days=settings.GROUP_LESSON_CHANGES_RETENTION_DAYS)
+    deleted = service.compact(before=before)
+    logger.info("Compacted group lesson changes older than %s (%s rows deleted)", before, deleted)
+
+
 def backup_database():
     backup_dir = Path(os.environ.get("BACKUP_DIR", "/backups"))
     retention_days = int(os.environ.get("BACKUP_RETENTION_DAYS", "30"))
@@ -102,6 +112,15 @@ class Command(BaseCommand):
         )
         logger.info("Added daily job: 'backup_database'.")
 
+        scheduler.add_job(
+            compact_group_lesson_changes,
+            trigger=CronTrigger(hour="03", minute="00"),
+            id="compact_group_lesson_changes",
+            max_instances=1,
+            replace_existing=True,
+        )
+        logger.info("Added daily job: 'compact_group_lesson_changes'.")
+
         try:
             logger.info("Starting scheduler...")
             scheduler.start()
@@ -68,4 +68,5 @@ class Client(TimedBaseModel):
         verbose_name_plural = "Clients"
         indexes = [
             models.Index(fields=["email"]),
+            models.Index(fields=["last_name", "first_name", "id"], name="client_list_order_idx"),
         ]
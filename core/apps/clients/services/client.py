@@ -1,4 +1,8 @@
-from django.db.models import Q
+from django.db.models import (
+    Exists,
+    OuterRef,
+    Q,
+)
 from django.db.utils import IntegrityError
 
 from abc import (
@@ -16,6 +20,13 @@ from core.apps.clients.exceptions.client import (
 )
 from core.apps.clients.filters.client import ClientSearchFilter
 from core.apps.clients.models.client import Client as ClientModel
+from core.apps.common.pagination import (
+    Page,
+    paginate,
+)
+
+
+CLIENT_LIST_ORDERING = ('last_name', 'first_name', 'id')
 
 
 class BaseClientService(ABC):
@@ -35,19 +46,19 @@ class BaseClientService(ABC):
         ...
 
     @abstractmethod
-    def get_list(self, filters: ClientSearchFilter, pagination: PaginationIn) -> Iterable[ClientEntity]:
+    def get_page(self, filters: ClientSearchFilter, pagination: PaginationIn) -> Page[ClientEntity]:
         ...
 
     @abstractmethod
-    def get_count(self, filters: ClientSearchFilter) -> int:
+    def update_email(self, client_id: int, email: str) -> None:
         ...
 
     @abstractmethod
-    def update_email(self, client_id: int, email: str) -> None:
+    def update_password(self, client_id: int, hashed_password: str) -> None:
         ...
 
     @abstractmethod
-    def update_password(self, client_id: int, hashed_password: str) -> None:
+    def replace_password_hash(self, client_email: str, old_hashed_password: str, new_hashed_password: str) -> bool:
         ...
 
     @abstractmethod
@@ -98,7 +109,12 @@ class ORMClientService(BaseClientService):
             )
 
         if filters.allowed_roles is not None:
-            query &= Q(roles__id__in=list(filters.allowed_roles))
+            # EXISTS rather than a join, so a client with several matching roles is one row without DISTINCT.
+            client_roles = ClientModel.roles.through.objects.filter(
+                client_id=OuterRef('pk'),
+                role_id__in=list(filters.allowed_roles),
+            )
+            query &= Q(Exists(client_roles))
 
         return query
 
@@ -129,27 +145,18 @@ class ORMClientService(BaseClientService):
             ClientModel.objects.
             filter(query).
             prefetch_related('roles').
-            distinct().
-            order_by('last_name', 'first_name')
+            order_by(*CLIENT_LIST_ORDERING)
         )
         return [client.to_entity() for client in qs]
 
-    def get_list(self, filters: ClientSearchFilter, pagination: PaginationIn) -> list[ClientEntity]:
+    def get_page(self, filters: ClientSearchFilter, pagination: PaginationIn) -> Page[ClientEntity]:
         query = self._build_client_query(filters)
-        qs = (
-            ClientModel.objects.
-            filter(query).
-            prefetch_related('roles').
-            distinct().
-            order_by('last_name', 'first_name')
-            [pagination.offset:pagination.offset + pagination.limit]
+        return paginate(
+            ClientModel.objects.filter(query).prefetch_related('roles'),
+            ordering=CLIENT_LIST_ORDERING,
+            pagination=pagination,
+            to_entity=lambda client: client.to_entity(),
         )
-        return [client.to_entity() for client in qs]
-
-    def get_count(self, filters: ClientSearchFilter) -> int:
-        query = self._build_client_query(filters)
-
-        return ClientModel.objects.filter(query).distinct().count()
 
     def update_email(self, client_id: int, email: str) -> None:
         is_updated = ClientModel.objects.filter(id=client_id).update(email=email)
@@ -161,6 +168,14 @@ class ORMClientService(BaseClientService):
         if not is_updated:
             raise ClientUpdateException(id=client_id)
 
+    def replace_password_hash(self, client_email: str, old_hashed_password: str, new_hashed_password: str) -> bool:
+        # Only swaps the hash that was verified, so a concurrent password change wins.
+        return bool(
+            ClientModel.objects
+            .filter(email=client_email, password=old_hashed_password)
+            .update(password=new_hashed_password),
+        )
+
     def update_credentials(
         self,
         client_id: int,
@@ -44,6 +44,13 @@ class ORMClientAuthService(BaseClientAuthService):
         if not self.password_service.verify_password(plain_password=plain_password, hashed_password=hashed):
             raise InvalidAuthDataException
 
+        if self.password_service.needs_rehash(hashed_password=hashed):
+            self.client_service.replace_password_hash(
+                client_email=email,
+                old_hashed_password=hashed,
+                new_hashed_password=self.password_service.hash_password(plain_password=plain_password),
+            )
+
     def check_client_role(self, client_roles: list[ClientRole], required_role: ClientRole) -> None:
         if required_role not in client_roles:
             raise ClientRoleNotMatchingWithRequiredException(
@@ -53,12 +60,26 @@ class ORMClientAuthService(BaseClientAuthService):
 
     def generate_tokens(self, client: ClientEntity) -> TokenEntity:
         device_id = get_new_uuid()
-        access_token = self.token_service.create_access_token(client=client, payload={"device_id": device_id})
-        refresh_token = self.token_service.create_refresh_token(client=client, payload={"device_id": device_id})
+        access_token, access_claims = self.token_service.issue_access_token(
+            client=client,
+            payload={"device_id": device_id},
+        )
+        refresh_token, refresh_claims = self.token_service.issue_refresh_token(
+            client=client,
+            payload={"device_id": device_id},
+        )
 
-        return TokenEntity(access_token=access_token, refresh_token=refresh_token)
+        return TokenEntity(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            access_claims=access_claims,
+            refresh_claims=refresh_claims,
+        )
 
     def update_access_token(self, client: ClientEntity, device_id: str) -> TokenEntity:
-        access_token = self.token_service.create_access_token(client=client, payload={"device_id": device_id})
+        access_token, access_claims = self.token_service.issue_access_token(
+            client=client,
+            payload={"device_id": device_id},
+        )
 
-        return TokenEntity(access_token=access_token)
+        return TokenEntity(access_token=access_token, access_claims=access_claims)
@@ -1,3 +1,6 @@
+from django.core.cache import cache
+from django.db.models import QuerySet
+
 import logging
 from abc import (
     ABC,
@@ -8,9 +11,15 @@ from datetime import (
     timezone,
 )
 from django_apscheduler import util
-from typing import Any
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from typing import (
+    Any,
+    Iterable,
+)
 
 from core.apps.clients.entities.client import Client as ClientEntity
+from core.apps.clients.entities.token import TokenClaims
 from core.apps.clients.models import (
     IssuedJwtToken,
     IssuedJwtToken as IssuedJwtTokenModel,
@@ -21,6 +30,10 @@ from core.apps.common.factory import convert_to_timestamp
 logger = logging.getLogger(__name__)
 
 
+REVOKED_JTI_KEY = 'revoked_jwt_tokens'
+REVOKED_JTI_SENTINEL = '__loaded__'
+
+
 class BaseIssuedJwtTokenService(ABC):
     @abstractmethod
     def create(
@@ -36,7 +49,7 @@ class BaseIssuedJwtTokenService(ABC):
     def bulk_create(
             self,
             subject: ClientEntity,
-            raw_tokens: list[dict[str, Any]],
+            claims: list[TokenClaims],
     ) -> None:
         ...
 
@@ -66,16 +79,16 @@ class ORMIssuedJwtTokenService(BaseIssuedJwtTokenService):
             expiration_time=expiration_time,
         )
 
-    def bulk_create(self, subject: ClientEntity, raw_tokens: list[dict[str, Any]]) -> None:
+    def bulk_create(self, subject: ClientEntity, claims: list[TokenClaims]) -> None:
         IssuedJwtTokenModel.objects.bulk_create(
             [
                 IssuedJwtTokenModel(
                     subject_id=subject.id,
-                    jti=token_payload.get('jti'),
-                    device_id=token_payload.get('device_id'),
-                    expiration_time=token_payload.get('exp'),
+                    jti=token_claims.jti,
+                    device_id=token_claims.device_id,
+                    expiration_time=token_claims.expiration_time,
                 )
-                for token_payload in raw_tokens
+                for token_claims in claims
             ],
         )
 
@@ -97,3 +110,84 @@ class ORMIssuedJwtTokenService(BaseIssuedJwtTokenService):
             expiration_time__lt=current_timestamp,
         ).delete()
         logger.info("Deleted %s expired JWT tokens", deleted)
+
+
+class RedisIssuedJwtTokenService(ORMIssuedJwtTokenService):
+    """Answers `check_revoked` from a Redis sorted set instead of Postgres.
+
+    Every revoked, unexpired JTI is a member scored by its `exp`, so
+    entries are pruned by score once the token could not be accepted
+    anyway. A sentinel member marks the set as complete: when it is
+    missing (fresh Redis, flush, eviction) the set is reloaded from the
+    database before answering. Revocations are written to the database
+    first, and any Redis failure falls back to the database query.
+
+    """
+
+    def check_revoked(self, jti: str) -> bool:
+        try:
+            connection = get_redis_connection('default')
+            loaded, score = connection.zmscore(self._key(), [REVOKED_JTI_SENTINEL, str(jti)])
+            if loaded is None:
+                self._load_revoked()
+                score = connection.zscore(self._key(), str(jti))
+        except RedisError:
+            logger.warning('revocation store unavailable, checking token in the database', exc_info=True)
+            return super().check_revoked(jti=jti)
+        return score is not None
+
+    def revoke_client_tokens(self, subject: ClientEntity) -> None:
+        super().revoke_client_tokens(subject=subject)
+        self._store_revoked(IssuedJwtTokenModel.objects.filter(subject_id=subject.id))
+
+    def revoke_client_device_tokens(self, subject: ClientEntity, device_id: str) -> None:
+        super().revoke_client_device_tokens(subject=subject, device_id=device_id)
+        self._store_revoked(IssuedJwtTokenModel.objects.filter(subject_id=subject.id, device_id=device_id))
+
+    def delete_expired_tokens(self) -> None:
+        super().delete_expired_tokens()
+        try:
+            get_redis_connection('default').zremrangebyscore(self._key(), '-inf', f'({self._now()}')
+        except RedisError:
+            logger.warning('could not prune expired JTIs from the revocation store', exc_info=True)
+
+    def _load_revoked(self) -> None:
+        self._add(
+            self._revoked_tokens(IssuedJwtTokenModel.objects.all()),
+            {REVOKED_JTI_SENTINEL: float('inf')},
+        )
+
+    def _store_revoked(self, tokens: QuerySet[IssuedJwtTokenModel]) -> None:
+        try:
+            self._add(self._revoked_tokens(tokens))
+        except RedisError:
+            # The database already holds the revocation; dropping the sentinel
+            # makes the next check reload the set from it.
+            logger.warning('could not record revoked JTIs, invalidating the revocation store', exc_info=True)
+            try:
+                get_redis_connection('default').zrem(self._key(), REVOKED_JTI_SENTINEL)
+            except RedisError:
+                logger.exception('revocation store is unreachable and may be stale')
+
+    def _add(self, revoked: Iterable[tuple[Any, int]], extra: dict[str, float] | None = None) -> None:
+        members = {str(jti): expiration_time for jti, expiration_time in revoked}
+        members.update(extra or {})
+        if not members:
+            return
+        pipeline = get_redis_connection('default').pipeline(transaction=True)
+        pipeline.zadd(self._key(), members)
+        pipeline.zremrangebyscore(self._key(), '-inf', f'({self._now()}')
+        pipeline.execute()
+
+    def _revoked_tokens(self, tokens: QuerySet[IssuedJwtTokenModel]) -> list[tuple[Any, int]]:
+        return list(
+            tokens.filter(revoked=True, expiration_time__gte=self._now()).values_list('jti', 'expiration_time'),
+        )
+
+    @staticmethod
+    def _key() -> str:
+        return cache.make_key(REVOKED_JTI_KEY)
+
+    @staticmethod
+    def _now() -> int:
+        return convert_to_timestamp(datetime.now(tz=timezone.utc))
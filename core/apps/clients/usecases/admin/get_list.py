@@ -1,4 +1,3 @@
-from collections.abc import Iterable
 from dataclasses import dataclass
 
 from core.api.filters import PaginationIn
@@ -7,6 +6,7 @@ from core.apps.clients.filters.client import ClientSearchFilter
 from core.apps.clients.services.client import BaseClientService
 from core.apps.common.cache.decorator import cache_decorator
 from core.apps.common.cache.timeouts import Timeout
+from core.apps.common.pagination import Page
 
 
 @dataclass
@@ -18,8 +18,5 @@ class GetClientListUseCase:
             self,
             filters: ClientSearchFilter,
             pagination_in: PaginationIn,
-    ) -> tuple[Iterable[ClientEntity], int]:
-        client_list = self.client_service.get_list(filters=filters, pagination=pagination_in)
-        client_count = self.client_service.get_count(filters=filters)
-
-        return client_list, client_count
+    ) -> Page[ClientEntity]:
+        return self.client_service.get_page(filters=filters, pagination=pagination_in)
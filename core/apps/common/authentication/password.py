@@ -1,10 +1,28 @@
+from django.conf import settings
+
 import bcrypt
+import threading
+import time
 from abc import (
     ABC,
     abstractmethod,
 )
-from dataclasses import dataclass
-from typing import ClassVar
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import lru_cache
+from typing import (
+    Callable,
+    ClassVar,
+    TypeVar,
+)
+
+from core.apps.common.exceptions import PasswordHashingOverloadedException
+
+
+T = TypeVar('T')
 
 
 @dataclass
@@ -19,6 +37,10 @@ class BasePasswordService(ABC):
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         ...
 
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        ...
+
 
 class BcryptPasswordService(BasePasswordService):
     HASH_ENCODING: ClassVar[str] = "UTF-8"
@@ -26,7 +48,7 @@ class BcryptPasswordService(BasePasswordService):
     def hash_password(self, plain_password: str) -> str:
         hashed_password = bcrypt.hashpw(
             password=plain_password.encode(self.HASH_ENCODING),
-            salt=bcrypt.gensalt(),
+            salt=bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS),
         )
         return hashed_password.decode(self.HASH_ENCODING)
 
@@ -35,3 +57,89 @@ class BcryptPasswordService(BasePasswordService):
             password=plain_password.encode(self.HASH_ENCODING),
             hashed_password=hashed_password.encode(self.HASH_ENCODING),
         )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # bcrypt hashes look like `$2b$<cost>$<salt and digest>`.
+        try:
+            rounds = int(hashed_password.split('$')[2])
+        except (IndexError, ValueError):
+            return True
+        return rounds != settings.PASSWORD_HASH_ROUNDS
+
+
+@dataclass(kw_only=True)
+class PasswordHashPoolStats:
+    workers: int
+    capacity: int
+    running: int = 0
+    queued: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_seconds_total: float = 0.0
+
+
+class PasswordHashPool:
+    """Runs password hashing on a fixed number of threads of this worker.
+
+    bcrypt releases the GIL, so the request thread only waits while a
+    pool thread burns the CPU. At most `max_pending` calls may queue
+    behind the busy threads; anything beyond that is rejected with
+    `PasswordHashingOverloadedException` instead of piling up.
+
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._lock = threading.Lock()
+        self._stats = PasswordHashPoolStats(workers=max_workers, capacity=max_workers + max_pending)
+
+    def run(self, func: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats.rejected += 1
+            raise PasswordHashingOverloadedException()
+
+        with self._lock:
+            self._stats.queued += 1
+        try:
+            return self._executor.submit(self._call, time.monotonic(), func, *args).result()
+        finally:
+            self._slots.release()
+
+    def stats(self) -> PasswordHashPoolStats:
+        with self._lock:
+            return PasswordHashPoolStats(**vars(self._stats))
+
+    def _call(self, submitted_at: float, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            self._stats.queued -= 1
+            self._stats.running += 1
+            self._stats.wait_seconds_total += time.monotonic() - submitted_at
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._stats.running -= 1
+                self._stats.completed += 1
+
+
+@lru_cache(1)
+def get_password_hash_pool() -> PasswordHashPool:
+    return PasswordHashPool(
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    )
+
+
+@dataclass
+class PooledBcryptPasswordService(BcryptPasswordService):
+    """Bcrypt hashing and verification executed on the shared
+    `PasswordHashPool` instead of the request thread."""
+    pool: PasswordHashPool = field(default_factory=get_password_hash_pool)
+
+    def hash_password(self, plain_password: str) -> str:
+        return self.pool.run(super().hash_password, plain_password)
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return self.pool.run(super().verify_password, plain_password, hashed_password)
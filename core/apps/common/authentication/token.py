@@ -14,6 +14,7 @@ from typing import (
 )
 
 from core.apps.clients.entities.client import Client as ClientEntity
+from core.apps.clients.entities.token import TokenClaims
 from core.apps.common.exceptions import JWTKeyParsingException
 from core.apps.common.factory import (
     convert_to_timestamp,
@@ -35,10 +36,22 @@ class BaseTokenService(ABC):
     def create_refresh_token(self, client: ClientEntity, payload: dict[str, Any]) -> str:
         ...
 
+    @abstractmethod
+    def issue_access_token(self, client: ClientEntity, payload: dict[str, Any]) -> tuple[str, TokenClaims]:
+        ...
+
+    @abstractmethod
+    def issue_refresh_token(self, client: ClientEntity, payload: dict[str, Any]) -> tuple[str, TokenClaims]:
+        ...
+
     @abstractmethod
     def decode_token(self, token: str) -> dict[str, Any]:
         ...
 
+    @abstractmethod
+    def decode_claims(self, token: str) -> TokenClaims:
+        ...
+
     @abstractmethod
     def get_client_email_from_token(self, token: str) -> str:
         ...
@@ -102,7 +115,7 @@ class JWTTokenService(BaseTokenService):
             subject: str,
             payload: dict[str, Any],
             ttl: timedelta = None,
-    ) -> str:
+    ) -> tuple[str, dict[str, Any]]:
         current_timestamp = convert_to_timestamp(datetime.now(tz=timezone.utc))
         data: dict[str, Any] = {
             self.ISSUER: "chmnu@auth_service",
@@ -115,7 +128,23 @@ class JWTTokenService(BaseTokenService):
         data.update({self.EXPIRATION_TIME: data[self.NOT_BEFORE] + int(ttl.total_seconds())}) if ttl else None
         data.update(payload)
 
-        return self.__encode_jwt(payload=data)
+        return self.__encode_jwt(payload=data), data
+
+    def __to_claims(self, payload: dict[str, Any]) -> TokenClaims:
+        client_email: str = payload.get(self.CLIENT_EMAIL_KEY)
+        if not client_email:
+            raise JWTKeyParsingException
+        return TokenClaims(
+            type=TokenType(payload[self.TOKEN_TYPE]),
+            jti=payload[self.JWT_ID],
+            subject=payload.get(self.SUBJECT),
+            client_email=client_email,
+            client_roles=[ClientRole(role) for role in payload.get(self.CLIENT_ROLE_KEY) or []],
+            device_id=payload.get(self.DEVICE_ID),
+            issued_at=payload[self.ISSUED_AT],
+            not_before=payload[self.NOT_BEFORE],
+            expiration_time=payload[self.EXPIRATION_TIME],
+        )
 
     def __get_payload(self, client: ClientEntity, payload: dict[str, Any]) -> dict[str, Any]:
         payload.update({
@@ -126,26 +155,39 @@ class JWTTokenService(BaseTokenService):
         return payload
 
     def create_access_token(self, client: ClientEntity, payload: dict[str, Any]) -> str:
+        token, _ = self.issue_access_token(client=client, payload=payload)
+        return token
+
+    def create_refresh_token(self, client: ClientEntity, payload: dict[str, Any]) -> str:
+        token, _ = self.issue_refresh_token(client=client, payload=payload)
+        return token
+
+    def issue_access_token(self, client: ClientEntity, payload: dict[str, Any]) -> tuple[str, TokenClaims]:
         new_payload: dict[str, Any] = self.__get_payload(client=client, payload=payload)
-        return self.__sign_jwt_token(
+        token, data = self.__sign_jwt_token(
             token_type=TokenType.ACCESS,
             subject=new_payload.get(self.CLIENT_EMAIL_KEY),
             payload=new_payload,
             ttl=self.ACCESS_TOKEN_TTL,
         )
+        return token, self.__to_claims(payload=data)
 
-    def create_refresh_token(self, client: ClientEntity, payload: dict[str, Any]) -> str:
+    def issue_refresh_token(self, client: ClientEntity, payload: dict[str, Any]) -> tuple[str, TokenClaims]:
         new_payload: dict[str, Any] = self.__get_payload(client=client, payload=payload)
-        return self.__sign_jwt_token(
+        token, data = self.__sign_jwt_token(
             token_type=TokenType.REFRESH,
             subject=new_payload.get(self.CLIENT_EMAIL_KEY),
             payload=new_payload,
             ttl=self.REFRESH_TOKEN_TTL,
         )
+        return token, self.__to_claims(payload=data)
 
     def decode_token(self, token: str) -> dict[str, Any]:
         return self.__decode_jwt_token(token=token)
 
+    def decode_claims(self, token: str) -> TokenClaims:
+        return self.__to_claims(payload=self.__decode_jwt_token(token=token))
+
     def get_client_email_from_token(self, token: str) -> str:
         payload: dict[str, Any] = self.__decode_jwt_token(token=token)
         client_email: str = payload.get(self.CLIENT_EMAIL_KEY)
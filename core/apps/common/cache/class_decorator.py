@@ -1,18 +1,37 @@
+from django.db import connections
+
 import inspect
 import logging
 import time
-from dataclasses import dataclass
-from functools import wraps
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import (
+    lru_cache,
+    wraps,
+)
 from typing import (
     Any,
     Callable,
+    Iterable,
     ParamSpec,
     TypeVar,
 )
 
+from core.apps.common.cache.metrics import (
+    BaseCacheMetricsService,
+    CacheEvent,
+    get_cache_metrics,
+)
 from core.apps.common.cache.service import (
     BaseCacheService,
     CACHE_MISS,
+    ReservedCacheKey,
 )
 from core.apps.common.cache.timeouts import Timeout
 
@@ -23,18 +42,29 @@ F_Param = ParamSpec('F_Param')
 F_Return = TypeVar('F_Return')
 
 LOCK_TTL_SECONDS = 10
-FOLLOWER_POLL_INTERVAL = 0.05
-FOLLOWER_MAX_POLLS = 20
+FOLLOWER_WAIT_SECONDS = 1.0
+REFRESH_MAX_WORKERS = 2
 
 
-def _resolve_identifier(identifier: Any, kwargs: dict, result: Any) -> Any:
-    """Resolve identifier; callables may take (kwargs) or (kwargs, result)."""
-    if not callable(identifier):
-        return identifier
-    arity = len(inspect.signature(identifier).parameters)
+def _resolve_key_part(part: Any, kwargs: dict, result: Any) -> Any:
+    """Resolve an identifier or filters; callables may take (kwargs) or
+    (kwargs, result)."""
+    if not callable(part):
+        return part
+    arity = len(inspect.signature(part).parameters)
     if arity == 1:
-        return identifier(kwargs)
-    return identifier(kwargs, result)
+        return part(kwargs)
+    return part(kwargs, result)
+
+
+def _namespace_params(params: dict) -> dict:
+    """Keep only the parts of a key spec that name a namespace; filters and
+    pagination are covered by the namespace generation."""
+    return {
+        name: params[name]
+        for name in ('model_prefix', 'identifier', 'func_prefix')
+        if params.get(name) is not None
+    }
 
 
 @dataclass(eq=False, frozen=True)
@@ -48,9 +78,9 @@ class BaseCacheDecorator:
 
     def _resolve_key_params(self, args: tuple, kwargs: dict, result: Any = None) -> dict[str, Any]:
         """Compute per-call cache key params WITHOUT mutating self."""
-        identifier = _resolve_identifier(self.identifier, kwargs, result)
+        identifier = _resolve_key_part(self.identifier, kwargs, result)
 
-        filters = self.filters if self.filters is not None else kwargs.get('filters')
+        filters = _resolve_key_part(self.filters, kwargs, result) if self.filters is not None else kwargs.get('filters')
         pagination = self.pagination_in if self.pagination_in is not None else kwargs.get('pagination_in')
 
         return {
@@ -62,43 +92,176 @@ class BaseCacheDecorator:
         }
 
 
+@dataclass(slots=True, frozen=True)
+class StaleWhileRevalidateEntry:
+    """Cached value stored by the stale-while-revalidate mode; `fresh_until`
+    is a unix timestamp shared by every worker."""
+    value: Any
+    fresh_until: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+
+class RefreshExecutor(ThreadPoolExecutor):
+    """Thread pool for background cache refreshes; drops the database
+    connections a task opened, as no request cycle will close them."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        def run():
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                connections.close_all()
+
+        return super().submit(run)
+
+
+@lru_cache(1)
+def get_refresh_executor() -> Executor:
+    return RefreshExecutor(max_workers=REFRESH_MAX_WORKERS, thread_name_prefix='cache-refresh')
+
+
 @dataclass(eq=False, frozen=True)
 class BaseSetCacheDecorator(BaseCacheDecorator):
     timeout: Timeout | None = None
+    stale_after: Timeout | None = None
+    dependencies: Callable[[Any], Iterable[tuple[str, str]]] | None = None
+    metrics_service: BaseCacheMetricsService = field(default_factory=get_cache_metrics)
+    refresh_executor: Executor = field(default_factory=get_refresh_executor)
 
     def __call__(self, original_func: Callable[F_Param, F_Return]) -> Callable[F_Param, F_Return]:
         @wraps(original_func)
         def wrapped(*args: F_Param.args, **kwargs: F_Param.kwargs) -> F_Return:
             params = self._resolve_key_params(args, kwargs)
-            cache_key = self.cache_service.generate_cache_key(**params)
+            # Reserved rather than generated: the namespace counters are
+            # only created once the call succeeded, so calls for rows that
+            # do not exist leave nothing behind in Redis.
+            reserved = self.cache_service.reserve_cache_key(**params)
+            cache_key = reserved.key
+            lock_key = f'{cache_key}:lock'
+            ready_key = f'{cache_key}:ready'
 
-            cached = self.cache_service.get_cache_value(key=cache_key, default=CACHE_MISS)
+            cached = CACHE_MISS
+            if not reserved.unseeded:
+                cached = self.cache_service.get_cache_value(key=cache_key, default=CACHE_MISS)
+            if isinstance(cached, StaleWhileRevalidateEntry) and not cached.is_fresh:
+                # A stale copy may come from this worker's memory while the
+                # shared tier already holds another worker's refresh.
+                cached = self.cache_service.get_shared_cache_value(key=cache_key, default=cached)
+            if isinstance(cached, StaleWhileRevalidateEntry):
+                if not cached.is_fresh:
+                    logger.debug('cache hit (stale): %s', cache_key)
+                    self._record(CacheEvent.STALE_HIT)
+                    self._refresh_in_background(original_func, args, kwargs, params, reserved, lock_key)
+                    return cached.value
+                cached = cached.value
             if cached is not CACHE_MISS:
                 logger.debug('cache hit: %s', cache_key)
+                self._record(CacheEvent.HIT)
                 return cached
+            self._record(CacheEvent.MISS)
 
-            lock_key = f'{cache_key}:lock'
             if self.cache_service.try_acquire_lock(lock_key, ttl=LOCK_TTL_SECONDS):
                 logger.debug('cache miss (leader): %s', cache_key)
+                self._record(CacheEvent.LEADER)
                 try:
-                    result = original_func(*args, **kwargs)
-                    self.cache_service.set_cache(key=cache_key, value=result, timeout=self.timeout)
+                    dependents_version = self._read_dependents_version()
+                    result = self._compute(original_func, args, kwargs)
+                    self._store(params, reserved, result, dependents_version)
                     return result
                 finally:
                     self.cache_service.release_lock(lock_key)
+                    # Followers are woken on failure too, so they fall back
+                    # at once instead of sitting out the whole wait.
+                    self.cache_service.send_signal(ready_key)
 
             logger.debug('cache miss (follower, waiting): %s', cache_key)
-            for _ in range(FOLLOWER_MAX_POLLS):
-                time.sleep(FOLLOWER_POLL_INTERVAL)
+            self._record(CacheEvent.FOLLOWER_WAIT)
+            if self.cache_service.wait_for_signal(ready_key, timeout=FOLLOWER_WAIT_SECONDS):
                 cached = self.cache_service.get_cache_value(key=cache_key, default=CACHE_MISS)
+                if isinstance(cached, StaleWhileRevalidateEntry):
+                    cached = cached.value
                 if cached is not CACHE_MISS:
                     return cached
 
             logger.debug('cache miss (follower, fallback): %s', cache_key)
-            return original_func(*args, **kwargs)
+            self._record(CacheEvent.FOLLOWER_FALLBACK)
+            return self._compute(original_func, args, kwargs)
 
         return wrapped
 
+    def _read_dependents_version(self) -> int | None:
+        if self.dependencies is None:
+            return None
+        return self.cache_service.get_dependents_version()
+
+    def _store(self, params: dict, reserved: ReservedCacheKey, result: Any, dependents_version: int | None) -> None:
+        # Dependencies are recorded before the claim, so a rename either
+        # finds them and bumps the namespace or makes the claim fail.
+        if self.dependencies is not None:
+            self.cache_service.add_dependencies(
+                namespace=_namespace_params(params),
+                dependencies=self.dependencies(result),
+            )
+        if not self.cache_service.claim_cache_key(reserved, dependents_version=dependents_version):
+            logger.debug('cache store skipped, namespace changed meanwhile: %s', reserved.key)
+            return
+        value = result
+        if self.stale_after is not None:
+            value = StaleWhileRevalidateEntry(value=result, fresh_until=time.time() + self.stale_after)
+        self.cache_service.set_cache(key=reserved.key, value=value, timeout=self.timeout)
+
+    def _refresh_in_background(
+            self,
+            original_func: Callable[F_Param, F_Return],
+            args: tuple,
+            kwargs: dict,
+            params: dict,
+            reserved: ReservedCacheKey,
+            lock_key: str,
+    ) -> None:
+        """Recompute a stale entry off the request path.
+
+        The stampede lock makes sure a single request across all workers
+        schedules the refresh; everyone else keeps serving the stale value
+        until it lands.
+
+        """
+        if not self.cache_service.try_acquire_lock(lock_key, ttl=LOCK_TTL_SECONDS):
+            return
+
+        def refresh() -> None:
+            try:
+                dependents_version = self._read_dependents_version()
+                self._store(params, reserved, self._compute(original_func, args, kwargs), dependents_version)
+            except Exception:
+                logger.exception('cache refresh failed: %s', reserved.key)
+            finally:
+                self.cache_service.release_lock(lock_key)
+
+        self._record(CacheEvent.REFRESH)
+        try:
+            self.refresh_executor.submit(refresh)
+        except RuntimeError:
+            logger.warning('cache refresh not scheduled, executor is shut down: %s', reserved.key)
+            self.cache_service.release_lock(lock_key)
+
+    def _record(self, event: CacheEvent) -> None:
+        self.metrics_service.record_event(model_prefix=self.model_prefix, func_prefix=self.func_prefix, event=event)
+
+    def _compute(self, original_func: Callable[F_Param, F_Return], args: tuple, kwargs: dict) -> F_Return:
+        started = time.perf_counter()
+        try:
+            return original_func(*args, **kwargs)
+        finally:
+            self.metrics_service.observe_compute(
+                model_prefix=self.model_prefix,
+                func_prefix=self.func_prefix,
+                seconds=time.perf_counter() - started,
+            )
+
 
 @dataclass(eq=False, frozen=True)
 class BaseDeleteCacheDecorator(BaseCacheDecorator):
@@ -106,10 +269,27 @@ class BaseDeleteCacheDecorator(BaseCacheDecorator):
         @wraps(original_func)
         def wrapped(*args: F_Param.args, **kwargs: F_Param.kwargs) -> F_Return:
             result = original_func(*args, **kwargs)
-            params = self._resolve_key_params(args, kwargs, result)
-            cache_key = self.cache_service.generate_cache_key(**params)
-            logger.debug('cache invalidate (pattern): %s', cache_key)
-            self.cache_service.invalidate_cache_pattern(key=cache_key)
+            namespace = _namespace_params(self._resolve_key_params(args, kwargs, result))
+            logger.debug('cache invalidate (namespace): %s', namespace)
+            self.cache_service.invalidate_namespace(**namespace)
+            return result
+
+        return wrapped
+
+
+@dataclass(eq=False, frozen=True)
+class BaseDeleteDependentsCacheDecorator:
+    cache_service: BaseCacheService
+    dimension: str
+    identifier: str | Callable
+
+    def __call__(self, original_func: Callable[F_Param, F_Return]) -> Callable[F_Param, F_Return]:
+        @wraps(original_func)
+        def wrapped(*args: F_Param.args, **kwargs: F_Param.kwargs) -> F_Return:
+            result = original_func(*args, **kwargs)
+            identifier = _resolve_key_part(self.identifier, kwargs, result)
+            logger.debug('cache invalidate (dependents): %s %s', self.dimension, identifier)
+            self.cache_service.invalidate_dependents(dimension=self.dimension, identifier=identifier)
             return result
 
         return wrapped
@@ -126,19 +306,19 @@ class BaseDeleteManyCacheDecorator:
         if not callable(identifier):
             return spec
         resolved = dict(spec)
-        resolved['identifier'] = _resolve_identifier(identifier, kwargs, result)
+        resolved['identifier'] = _resolve_key_part(identifier, kwargs, result)
         return resolved
 
     def __call__(self, original_func: Callable[F_Param, F_Return]) -> Callable[F_Param, F_Return]:
         @wraps(original_func)
         def wrapped(*args: F_Param.args, **kwargs: F_Param.kwargs) -> F_Return:
             result = original_func(*args, **kwargs)
-            keys = [
-                self.cache_service.generate_cache_key(**self._resolve_spec(spec, args, kwargs, result))
+            namespaces = [
+                _namespace_params(self._resolve_spec(spec, args, kwargs, result))
                 for spec in self.key_specs
             ]
-            logger.debug('cache invalidate (patterns): %s', keys)
-            self.cache_service.invalidate_cache_pattern_list(keys=keys)
+            logger.debug('cache invalidate (namespaces): %s', namespaces)
+            self.cache_service.invalidate_namespace_list(namespaces=namespaces)
             return result
 
         return wrapped
@@ -147,17 +327,30 @@ class BaseDeleteManyCacheDecorator:
 @dataclass(eq=False)
 class CacheDecorator:
     cache_service: BaseCacheService
+    metrics_service: BaseCacheMetricsService = field(default_factory=get_cache_metrics)
+    refresh_executor: Executor = field(default_factory=get_refresh_executor)
 
     def get_or_set_cache(
             self,
             model_prefix: str,
             *,
             timeout: Timeout,
+            stale_after: Timeout | None = None,
+            dependencies: Callable[[Any], Iterable[tuple[str, str]]] | None = None,
             identifier: str | Callable | None = None,
             func_prefix: str | None = None,
             filters: Any = None,
             pagination_in: Any = None,
     ) -> BaseSetCacheDecorator:
+        """Cache the decorated function's result for `timeout` seconds.
+
+        With `stale_after` set, results older than it are still served but
+        trigger a single background refresh (stale-while-revalidate), so
+        only the very first computation runs on a request. `dependencies`
+        maps a result to the `(dimension, identifier)` rows it was built
+        from; `delete_dependents` on any of them evicts the entry.
+
+        """
         return BaseSetCacheDecorator(
             cache_service=self.cache_service,
             model_prefix=model_prefix,
@@ -166,6 +359,10 @@ class CacheDecorator:
             filters=filters,
             pagination_in=pagination_in,
             timeout=timeout,
+            stale_after=stale_after,
+            dependencies=dependencies,
+            metrics_service=self.metrics_service,
+            refresh_executor=self.refresh_executor,
         )
 
     def delete_cache(
@@ -186,6 +383,13 @@ class CacheDecorator:
             pagination_in=pagination_in,
         )
 
+    def delete_dependents(self, dimension: str, *, identifier: str | Callable) -> BaseDeleteDependentsCacheDecorator:
+        return BaseDeleteDependentsCacheDecorator(
+            cache_service=self.cache_service,
+            dimension=dimension,
+            identifier=identifier,
+        )
+
     def delete_caches(self, key_specs: list[dict]) -> BaseDeleteManyCacheDecorator:
         return BaseDeleteManyCacheDecorator(
             cache_service=self.cache_service,
@@ -1,5 +1,5 @@
 from core.apps.common.cache.class_decorator import CacheDecorator
-from core.apps.common.cache.service import RedisCacheService
+from core.apps.common.cache.service import TwoTierCacheService
 
 
-cache_decorator: CacheDecorator = CacheDecorator(cache_service=RedisCacheService())
+cache_decorator: CacheDecorator = CacheDecorator(cache_service=TwoTierCacheService())
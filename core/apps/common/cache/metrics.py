@@ -0,0 +1,168 @@
+from django.conf import settings
+
+import logging
+import threading
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import Counter
+from dataclasses import (
+    dataclass,
+    field,
+)
+from django_redis import get_redis_connection
+from enum import Enum
+from functools import lru_cache
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger(__name__)
+
+
+COMPUTE_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_REDIS_KEY = 'cache_metrics'
+FIELD_SEPARATOR = '|'
+
+
+class CacheEvent(str, Enum):
+    HIT = 'hit'
+    MISS = 'miss'
+    LEADER = 'leader'
+    FOLLOWER_WAIT = 'follower_wait'
+    FOLLOWER_FALLBACK = 'follower_fallback'
+    STALE_HIT = 'stale_hit'
+    REFRESH = 'refresh'
+
+
+@dataclass(kw_only=True)
+class CacheLatencyHistogram:
+    buckets: dict[float, int] = field(default_factory=dict)
+    total_seconds: float = 0.0
+    count: int = 0
+
+
+@dataclass(kw_only=True)
+class CacheMetricsSnapshot:
+    events: dict[tuple[str, str, CacheEvent], int] = field(default_factory=dict)
+    compute: dict[tuple[str, str], CacheLatencyHistogram] = field(default_factory=dict)
+
+
+class BaseCacheMetricsService(ABC):
+    @abstractmethod
+    def record_event(self, model_prefix: str, func_prefix: str | None, event: CacheEvent) -> None:
+        ...
+
+    @abstractmethod
+    def observe_compute(self, model_prefix: str, func_prefix: str | None, seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    def collect(self) -> CacheMetricsSnapshot:
+        ...
+
+
+class InMemoryCacheMetricsService(BaseCacheMetricsService):
+    """Counts cache events of the current process.
+
+    Counters are kept as flat `field -> value` pairs (histograms are
+    cumulative buckets plus sum and count), which is also the layout the
+    Redis-backed subclass ships to its shared hash.
+
+    """
+
+    def __init__(self):
+        self._values: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record_event(self, model_prefix: str, func_prefix: str | None, event: CacheEvent) -> None:
+        self._add({self._field('event', model_prefix, func_prefix, event.value): 1})
+
+    def observe_compute(self, model_prefix: str, func_prefix: str | None, seconds: float) -> None:
+        deltas = {
+            self._field('compute_sum', model_prefix, func_prefix): seconds,
+            self._field('compute_count', model_prefix, func_prefix): 1,
+        }
+        for bound in COMPUTE_LATENCY_BUCKETS:
+            if seconds <= bound:
+                deltas[self._field('compute_bucket', model_prefix, func_prefix, str(bound))] = 1
+        self._add(deltas)
+
+    def collect(self) -> CacheMetricsSnapshot:
+        with self._lock:
+            values = dict(self._values)
+        return self._to_snapshot(values)
+
+    def _add(self, deltas: dict[str, float]) -> None:
+        with self._lock:
+            self._values.update(deltas)
+
+    @staticmethod
+    def _field(kind: str, model_prefix: str, func_prefix: str | None, *rest: str) -> str:
+        return FIELD_SEPARATOR.join((kind, model_prefix, func_prefix or '', *rest))
+
+    @staticmethod
+    def _to_snapshot(values: dict[str, float]) -> CacheMetricsSnapshot:
+        snapshot = CacheMetricsSnapshot()
+        for name, value in values.items():
+            kind, model_prefix, func_prefix, *rest = name.split(FIELD_SEPARATOR)
+            labels = (model_prefix, func_prefix)
+            if kind == 'event':
+                snapshot.events[(model_prefix, func_prefix, CacheEvent(rest[0]))] = int(value)
+                continue
+
+            histogram = snapshot.compute.setdefault(labels, CacheLatencyHistogram())
+            if kind == 'compute_sum':
+                histogram.total_seconds = float(value)
+            elif kind == 'compute_count':
+                histogram.count = int(value)
+            elif kind == 'compute_bucket':
+                histogram.buckets[float(rest[0])] = int(value)
+        return snapshot
+
+
+class RedisCacheMetricsService(InMemoryCacheMetricsService):
+    """Aggregates cache metrics of every worker in one Redis hash.
+
+    Each worker accumulates deltas in memory and ships them with a single
+    pipelined HINCRBYFLOAT batch at most every
+    `CACHE_METRICS_FLUSH_INTERVAL` seconds, so recording stays off the
+    request's critical path. `collect` flushes this worker's deltas and
+    reads the shared totals.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._last_flush = time.monotonic()
+
+    def _add(self, deltas: dict[str, float]) -> None:
+        super()._add(deltas)
+        if time.monotonic() - self._last_flush >= settings.CACHE_METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._values = self._values, Counter()
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        try:
+            pipeline = get_redis_connection('default').pipeline(transaction=False)
+            for name, value in pending.items():
+                pipeline.hincrbyfloat(METRICS_REDIS_KEY, name, value)
+            pipeline.execute()
+        except RedisError:
+            logger.warning('dropping %d cache metric deltas: redis unavailable', len(pending), exc_info=True)
+
+    def collect(self) -> CacheMetricsSnapshot:
+        self.flush()
+        values = get_redis_connection('default').hgetall(METRICS_REDIS_KEY)
+        return self._to_snapshot({name.decode(): float(value) for name, value in values.items()})
+
+
+@lru_cache(1)
+def get_cache_metrics() -> BaseCacheMetricsService:
+    return RedisCacheMetricsService()
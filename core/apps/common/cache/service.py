@@ -1,20 +1,66 @@
+from django.conf import settings
 from django.core.cache import cache
 
 import json
+import math
 import random
+import time
 from abc import (
     ABC,
     abstractmethod,
 )
-from typing import Any
+from asgiref.sync import sync_to_async
+from dataclasses import (
+    dataclass,
+    field,
+)
+from django_redis import get_redis_connection
+from typing import (
+    Any,
+    Iterable,
+)
+
+from core.apps.common.cache.local import (
+    get_local_cache,
+    LocalLRUCache,
+)
+from core.apps.common.cache.timeouts import Timeout
 
 
 CACHE_TTL_JITTER_RATIO = 0.1
+# The longest a cached entry can live: the longest timeout stretched by its jitter.
+MAX_ENTRY_TTL_SECONDS = math.ceil(max(Timeout) * (1 + CACHE_TTL_JITTER_RATIO))
 
 
 CACHE_MISS = object()
 
 
+WILDCARD = '*'
+GENERATION_KEY_PREFIX = 'generation'
+# Generation counters outlive every entry built under them and are refreshed on each bump.
+GENERATION_TTL_SECONDS = MAX_ENTRY_TTL_SECONDS + int(Timeout.DAY)
+
+SIGNAL_TTL_SECONDS = 2
+
+DEPENDENTS_KEY_PREFIX = 'dependents'
+DEPENDENTS_VERSION_KEY = 'dependents_version'
+# A reverse index must outlive every entry recorded in it, jitter included.
+DEPENDENTS_TTL_SECONDS = MAX_ENTRY_TTL_SECONDS
+
+
+@dataclass(frozen=True)
+class ReservedCacheKey:
+    """A cache key built without creating missing generation counters.
+
+    Each namespace that had no counter is listed in `unseeded` with the
+    provisional generation `key` was built with; `claim_cache_key`
+    creates those counters once the value has been computed.
+
+    """
+    key: str
+    unseeded: dict[str, int] = field(default_factory=dict)
+
+
 class BaseCacheService(ABC):
     @abstractmethod
     def generate_cache_key(
@@ -28,14 +74,92 @@ class BaseCacheService(ABC):
     ) -> str:
         ...
 
+    @abstractmethod
+    def reserve_cache_key(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            filters: Any = None,
+            pagination_in: Any = None,
+    ) -> ReservedCacheKey:
+        ...
+
+    @abstractmethod
+    def reserve_cache_keys(
+            self,
+            model_prefix: str,
+            *,
+            identifiers: Iterable[str],
+            func_prefix: str | None = None,
+            filters: Any = None,
+            pagination_in: Any = None,
+    ) -> dict[str, ReservedCacheKey]:
+        ...
+
+    @abstractmethod
+    def claim_cache_key(self, reserved: ReservedCacheKey, dependents_version: int | None = None) -> bool:
+        ...
+
+    @abstractmethod
+    def claim_cache_keys(
+            self,
+            reserved: dict[str, ReservedCacheKey],
+            dependents_version: int | None = None,
+    ) -> set[str]:
+        ...
+
+    @abstractmethod
+    def get_dependents_version(self) -> int:
+        ...
+
+    @abstractmethod
+    def get_generation(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            seed: bool = True,
+    ) -> str | None:
+        ...
+
+    @abstractmethod
+    async def aget_generation(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            seed: bool = True,
+    ) -> str | None:
+        ...
+
     @abstractmethod
     def get_cache_value(self, key: str, default: Any = None) -> Any:
         ...
 
+    @abstractmethod
+    async def aget_cache_value(self, key: str, default: Any = None) -> Any:
+        ...
+
+    @abstractmethod
+    def get_shared_cache_value(self, key: str, default: Any = None) -> Any:
+        ...
+
+    @abstractmethod
+    def get_cache_values(self, keys: list[str]) -> dict[str, Any]:
+        ...
+
     @abstractmethod
     def set_cache(self, key: str, value, timeout: int | None = None) -> None:
         ...
 
+    @abstractmethod
+    def set_cache_many(self, values: dict[str, Any], timeout: int | None = None) -> None:
+        ...
+
     @abstractmethod
     def invalidate_cache(self, key: str) -> None:
         ...
@@ -45,11 +169,29 @@ class BaseCacheService(ABC):
         ...
 
     @abstractmethod
-    def invalidate_cache_pattern(self, key: str) -> None:
+    def invalidate_namespace(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate_namespace_list(self, namespaces: list[dict]) -> None:
+        ...
+
+    @abstractmethod
+    def add_dependencies(self, namespace: dict, dependencies: Iterable[tuple[str, str]]) -> None:
         ...
 
     @abstractmethod
-    def invalidate_cache_pattern_list(self, keys: list[str]) -> None:
+    def add_dependencies_many(self, entries: Iterable[tuple[dict, Iterable[tuple[str, str]]]]) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate_dependents(self, dimension: str, identifier: str) -> None:
         ...
 
     @abstractmethod
@@ -60,8 +202,25 @@ class BaseCacheService(ABC):
     def release_lock(self, key: str) -> None:
         ...
 
+    @abstractmethod
+    def send_signal(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def wait_for_signal(self, key: str, timeout: float) -> bool:
+        ...
+
 
 class RedisCacheService(BaseCacheService):
+    """Redis-backed cache with generation-counter invalidation.
+
+    Every cache key carries the generations of the namespaces it belongs
+    to: the model prefix, the model prefix + identifier and the model
+    prefix + function prefix. Invalidating a namespace is a single INCR on
+    its counter; entries built under the old generation are never read
+    again and simply expire.
+
+    """
     def generate_cache_key(
             self,
             model_prefix: str,
@@ -69,6 +228,123 @@ class RedisCacheService(BaseCacheService):
             func_prefix: str | None = None,
             filters: Any = None,
             pagination_in: Any = None,
+    ) -> str:
+        generation = self.get_generation(model_prefix, identifier=identifier, func_prefix=func_prefix)
+        return self._format_cache_key(
+            model_prefix,
+            identifier=identifier,
+            func_prefix=func_prefix,
+            filters=filters,
+            pagination_in=pagination_in,
+            generation=generation,
+        )
+
+    def reserve_cache_key(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            filters: Any = None,
+            pagination_in: Any = None,
+    ) -> ReservedCacheKey:
+        """`generate_cache_key` for readers, which may be handed identifiers
+        of rows that do not exist.
+
+        Nothing is written: a namespace without a counter gets a
+        provisional generation, and the counter is only created by
+        `claim_cache_key` after the caller has computed, and so resolved,
+        the value. Until then the key holds nothing and lookups miss.
+
+        """
+        return self.reserve_cache_keys(
+            model_prefix,
+            identifiers=[identifier],
+            func_prefix=func_prefix,
+            filters=filters,
+            pagination_in=pagination_in,
+        )[identifier]
+
+    def reserve_cache_keys(
+            self,
+            model_prefix: str,
+            *,
+            identifiers: Iterable[str],
+            func_prefix: str | None = None,
+            filters: Any = None,
+            pagination_in: Any = None,
+    ) -> dict[str, ReservedCacheKey]:
+        """`reserve_cache_key` for many identifiers at once, keyed by
+        identifier; the generations of all their namespaces are read with
+        a single MGET."""
+        generation_keys = {
+            identifier: self._generation_keys(model_prefix, identifier=identifier, func_prefix=func_prefix)
+            for identifier in identifiers
+        }
+        generations = self._read_generations(list({key for keys in generation_keys.values() for key in keys}))
+        provisional = self._new_generation()
+        return {
+            identifier: ReservedCacheKey(
+                key=self._format_cache_key(
+                    model_prefix,
+                    identifier=identifier,
+                    func_prefix=func_prefix,
+                    filters=filters,
+                    pagination_in=pagination_in,
+                    generation='.'.join(str(generations.get(key, provisional)) for key in keys),
+                ),
+                unseeded={key: provisional for key in keys if key not in generations},
+            )
+            for identifier, keys in generation_keys.items()
+        }
+
+    def claim_cache_key(self, reserved: ReservedCacheKey, dependents_version: int | None = None) -> bool:
+        """Create the counters `reserved` was built without. False when
+        another caller created one first, e.g. by invalidating the
+        namespace while the value was computed: the value may be stale and
+        must not be stored.
+
+        A value with dependencies passes the `get_dependents_version` read
+        before it was computed, and records its dependencies before the
+        claim. The claim then also fails if `invalidate_dependents` ran in
+        between: that call may have read the dependents before they were
+        recorded, so it would not have invalidated the value.
+
+        """
+        if dependents_version is not None and self.get_dependents_version() != dependents_version:
+            return False
+        return all(self._add_generation(key, generation) for key, generation in reserved.unseeded.items())
+
+    def claim_cache_keys(
+            self,
+            reserved: dict[str, ReservedCacheKey],
+            dependents_version: int | None = None,
+    ) -> set[str]:
+        """`claim_cache_key` for keys reserved together by
+        `reserve_cache_keys`; returns the identifiers whose keys were
+        claimed.
+
+        Counters the keys share, such as the model-wide one, are created
+        once for all of them rather than by whichever key is claimed first.
+
+        """
+        if dependents_version is not None and self.get_dependents_version() != dependents_version:
+            return set()
+        unseeded = {
+            key: generation for cache_key in reserved.values() for key, generation in cache_key.unseeded.items()
+        }
+        created = {key for key, generation in unseeded.items() if self._add_generation(key, generation)}
+        return {identifier for identifier, cache_key in reserved.items() if created.issuperset(cache_key.unseeded)}
+
+    def _format_cache_key(
+            self,
+            model_prefix: str,
+            *,
+            generation: str,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            filters: Any = None,
+            pagination_in: Any = None,
     ) -> str:
         parts = [model_prefix]
         if identifier is not None:
@@ -79,7 +355,7 @@ class RedisCacheService(BaseCacheService):
             parts.append(self._stringify_for_key(filters))
         if pagination_in is not None:
             parts.append(self._stringify_for_key(pagination_in))
-        return '_'.join(parts)
+        return f"{'_'.join(parts)}:g{generation}"
 
     @staticmethod
     def _stringify_for_key(value: Any) -> str:
@@ -91,36 +367,369 @@ class RedisCacheService(BaseCacheService):
             return json.dumps(vars(value), sort_keys=True, default=str)
         return str(value)
 
+    def get_generation(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            seed: bool = True,
+    ) -> str | None:
+        """The generations of the namespaces of a key spec. A missing
+        counter is created, or, without `seed`, the result is None."""
+        generation_keys = self._generation_keys(model_prefix, identifier=identifier, func_prefix=func_prefix)
+        generations = self._read_generations(generation_keys)
+        if not seed and len(generations) < len(generation_keys):
+            return None
+        return '.'.join(
+            str(generations[key]) if key in generations else str(self._seed_generation(key))
+            for key in generation_keys
+        )
+
+    async def aget_generation(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+            seed: bool = True,
+    ) -> str | None:
+        generation_keys = self._generation_keys(model_prefix, identifier=identifier, func_prefix=func_prefix)
+        generations = await self._aread_generations(generation_keys)
+        if len(generations) < len(generation_keys):
+            if not seed:
+                return None
+            # A namespace is seeded once in its lifetime; leave that to the sync path.
+            return await sync_to_async(self.get_generation, thread_sensitive=False)(
+                model_prefix,
+                identifier=identifier,
+                func_prefix=func_prefix,
+            )
+        return '.'.join(str(generations[key]) for key in generation_keys)
+
+    def _read_generations(self, generation_keys: list[str]) -> dict[str, int]:
+        return cache.get_many(generation_keys)
+
+    async def _aread_generations(self, generation_keys: list[str]) -> dict[str, int]:
+        # django-redis has no native async API: its `aget_many` awaits `aget`
+        # once per key, each a hop to the thread shared with sync views. One
+        # MGET on a pool thread instead.
+        return await sync_to_async(cache.get_many, thread_sensitive=False)(generation_keys)
+
+    def _generation_keys(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+    ) -> list[str]:
+        keys = [f'{GENERATION_KEY_PREFIX}:{model_prefix}']
+        if identifier is not None:
+            keys.append(f'{GENERATION_KEY_PREFIX}:{model_prefix}:{self._stringify_for_key(identifier)}')
+        if func_prefix is not None:
+            keys.append(f'{GENERATION_KEY_PREFIX}:{model_prefix}:{WILDCARD}:{self._stringify_for_key(func_prefix)}')
+        return keys
+
+    def _seed_generation(self, generation_key: str) -> int:
+        seed = self._new_generation()
+        if self._add_generation(generation_key, seed):
+            return seed
+        return cache.get(generation_key, seed)
+
+    @staticmethod
+    def _new_generation() -> int:
+        # Counters start from the current time in milliseconds rather than
+        # zero, so a counter lost to eviction never comes back at a value
+        # that older, still-living entries were built under.
+        return int(time.time() * 1000)
+
+    def _add_generation(self, generation_key: str, generation: int) -> bool:
+        return cache.add(generation_key, generation, timeout=self._generation_timeout())
+
+    @staticmethod
+    def _generation_timeout() -> int:
+        # Jittered upwards only, so that no counter expires while an entry
+        # built under it can still be read.
+        jitter = random.uniform(0, CACHE_TTL_JITTER_RATIO) * GENERATION_TTL_SECONDS  # noqa: DUO102
+        return int(GENERATION_TTL_SECONDS + jitter)
+
     def get_cache_value(self, key: str, default: Any = None) -> Any:
         return cache.get(key=key, default=default)
 
+    async def aget_cache_value(self, key: str, default: Any = None) -> Any:
+        return await sync_to_async(cache.get, thread_sensitive=False)(key=key, default=default)
+
+    def get_shared_cache_value(self, key: str, default: Any = None) -> Any:
+        """The value of `key` as every worker sees it, skipping any
+        per-process tier."""
+        return cache.get(key=key, default=default)
+
+    def get_cache_values(self, keys: list[str]) -> dict[str, Any]:
+        """The cached values of `keys` by key, read with one MGET; keys not
+        in the cache are left out."""
+        return cache.get_many(keys)
+
     def set_cache(
             self,
             key: str,
             value,
             timeout: int | None = None,
     ) -> None:
-        if timeout is not None:
-            jitter = random.uniform(-CACHE_TTL_JITTER_RATIO, CACHE_TTL_JITTER_RATIO) * timeout  # noqa: DUO102
-            timeout = max(1, int(timeout + jitter))
-        cache.set(key=key, value=value, timeout=timeout)
+        cache.set(key=key, value=value, timeout=self._jitter(timeout))
+
+    def set_cache_many(self, values: dict[str, Any], timeout: int | None = None) -> None:
+        """`set_cache` for every item of `values`, sent as one pipeline;
+        each key still gets its own jittered timeout."""
+        if not values:
+            return
+        pipeline = get_redis_connection('default').pipeline(transaction=False)
+        for key, value in values.items():
+            cache.set(key, value, timeout=self._jitter(timeout), client=pipeline)
+        pipeline.execute()
+
+    @staticmethod
+    def _jitter(timeout: int | None) -> int | None:
+        if timeout is None:
+            return None
+        jitter = random.uniform(-CACHE_TTL_JITTER_RATIO, CACHE_TTL_JITTER_RATIO) * timeout  # noqa: DUO102
+        return max(1, int(timeout + jitter))
 
     def invalidate_cache(self, key: str) -> None:
         cache.delete(key=key)
 
     def invalidate_cache_list(self, keys: list[str]) -> None:
-        for key in keys:
-            cache.delete(key=key)
+        cache.delete_many(keys)
 
-    def invalidate_cache_pattern(self, key: str) -> None:
-        cache.delete_pattern(key)
+    def invalidate_namespace(
+            self,
+            model_prefix: str,
+            *,
+            identifier: str | None = None,
+            func_prefix: str | None = None,
+    ) -> None:
+        """Bump the narrowest namespace that covers the given key spec.
 
-    def invalidate_cache_pattern_list(self, keys: list[str]) -> None:
-        for key in keys:
-            cache.delete_pattern(key)
+        A concrete identifier bumps `model_prefix + identifier`; a wildcard
+        or missing identifier with a concrete function prefix bumps
+        `model_prefix + func_prefix`; anything else bumps the whole model
+        prefix.
+
+        """
+        if identifier not in (None, WILDCARD):
+            generation_key = self._generation_keys(model_prefix, identifier=identifier)[-1]
+        elif func_prefix not in (None, WILDCARD):
+            generation_key = self._generation_keys(model_prefix, func_prefix=func_prefix)[-1]
+        else:
+            generation_key = self._generation_keys(model_prefix)[-1]
+        self._bump_generation(generation_key)
+
+    def _bump_generation(self, generation_key: str) -> None:
+        if not self._add_generation(generation_key, self._new_generation()):
+            cache.incr(generation_key)
+            cache.touch(generation_key, self._generation_timeout())
+
+    def invalidate_namespace_list(self, namespaces: list[dict]) -> None:
+        for namespace in namespaces:
+            self.invalidate_namespace(**namespace)
+
+    def add_dependencies(self, namespace: dict, dependencies: Iterable[tuple[str, str]]) -> None:
+        """Record that entries of `namespace` were built from the given
+        `(dimension, identifier)` rows.
+
+        Each row keeps a Redis set of the namespaces depending on it, so
+        `invalidate_dependents` can bump exactly those. Sets outlive the
+        longest jittered cache timeout and are refreshed on every write.
+
+        """
+        self.add_dependencies_many(entries=[(namespace, dependencies)])
+
+    def add_dependencies_many(self, entries: Iterable[tuple[dict, Iterable[tuple[str, str]]]]) -> None:
+        """`add_dependencies` for several `(namespace, dependencies)` pairs
+        in one pipeline."""
+        pipeline = get_redis_connection('default').pipeline(transaction=False)
+        for namespace, dependencies in entries:
+            member = json.dumps(namespace, sort_keys=True, default=str)
+            for dimension, identifier in set(dependencies):
+                dependents_key = self._dependents_key(dimension, identifier)
+                pipeline.sadd(dependents_key, member)
+                pipeline.expire(dependents_key, DEPENDENTS_TTL_SECONDS)
+        pipeline.execute()
+
+    def get_dependents_version(self) -> int:
+        """Counter bumped by every `invalidate_dependents`, read from Redis
+        itself; see `claim_cache_key`."""
+        version = cache.get(DEPENDENTS_VERSION_KEY)
+        if version is None:
+            cache.add(DEPENDENTS_VERSION_KEY, self._new_generation(), timeout=self._generation_timeout())
+            version = cache.get(DEPENDENTS_VERSION_KEY)
+        return version
+
+    def invalidate_dependents(self, dimension: str, identifier: str) -> None:
+        # Bumped before the set is read: a writer whose dependents this
+        # call misses sees the new version once it has recorded them.
+        self._bump_generation(DEPENDENTS_VERSION_KEY)
+        pipeline = get_redis_connection('default').pipeline(transaction=True)
+        dependents_key = self._dependents_key(dimension, identifier)
+        pipeline.smembers(dependents_key)
+        pipeline.delete(dependents_key)
+        members, _ = pipeline.execute()
+        self.invalidate_namespace_list(namespaces=[json.loads(member) for member in members])
+
+    def _dependents_key(self, dimension: str, identifier: str) -> str:
+        return cache.make_key(f'{DEPENDENTS_KEY_PREFIX}:{dimension}:{self._stringify_for_key(identifier)}')
 
     def try_acquire_lock(self, key: str, ttl: int) -> bool:
         return cache.add(key, 1, timeout=ttl)
 
     def release_lock(self, key: str) -> None:
         cache.delete(key)
+
+    def send_signal(self, key: str) -> None:
+        """Wake everyone blocked in `wait_for_signal` on `key`.
+
+        The signal is a one-element list that lives for
+        `SIGNAL_TTL_SECONDS`, so a waiter that starts blocking just after it
+        was sent still returns at once.
+
+        """
+        signal_key = cache.make_key(key)
+        pipeline = get_redis_connection('default').pipeline(transaction=False)
+        pipeline.delete(signal_key)
+        pipeline.rpush(signal_key, 1)
+        pipeline.expire(signal_key, SIGNAL_TTL_SECONDS)
+        pipeline.execute()
+
+    def wait_for_signal(self, key: str, timeout: float) -> bool:
+        signal_key = cache.make_key(key)
+        connection = get_redis_connection('default')
+        if connection.blpop([signal_key], timeout=timeout) is None:
+            return False
+
+        # BLPOP hands the signal to a single waiter; put it back so the
+        # next one blocked on the same key wakes up too.
+        pipeline = connection.pipeline(transaction=False)
+        pipeline.rpush(signal_key, 1)
+        pipeline.expire(signal_key, SIGNAL_TTL_SECONDS)
+        pipeline.execute()
+        return True
+
+
+class TwoTierCacheService(RedisCacheService):
+    """Redis cache fronted by a per-worker in-process LRU.
+
+    Cache keys embed namespace generations, so a local entry can never be
+    served after its namespace was bumped. Generations themselves are
+    kept locally for `LOCAL_CACHE_GENERATION_TTL` seconds: a bump made in
+    this worker is visible at once, a bump made elsewhere within that
+    window. Keys removed with `invalidate_cache` are only dropped from
+    this worker's memory and age out elsewhere with `LOCAL_CACHE_TTL`.
+
+    """
+    @property
+    def local_cache(self) -> LocalLRUCache:
+        return get_local_cache()
+
+    @property
+    def generation_ttl(self) -> float:
+        return settings.LOCAL_CACHE_GENERATION_TTL
+
+    def get_cache_value(self, key: str, default: Any = None) -> Any:
+        value = self.local_cache.get(key, default=CACHE_MISS)
+        if value is not CACHE_MISS:
+            return value
+
+        value = super().get_cache_value(key=key, default=CACHE_MISS)
+        if value is CACHE_MISS:
+            return default
+        self.local_cache.set(key, value)
+        return value
+
+    async def aget_cache_value(self, key: str, default: Any = None) -> Any:
+        value = self.local_cache.get(key, default=CACHE_MISS)
+        if value is not CACHE_MISS:
+            return value
+
+        value = await super().aget_cache_value(key=key, default=CACHE_MISS)
+        if value is CACHE_MISS:
+            return default
+        self.local_cache.set(key, value)
+        return value
+
+    def get_shared_cache_value(self, key: str, default: Any = None) -> Any:
+        value = super().get_shared_cache_value(key=key, default=CACHE_MISS)
+        if value is CACHE_MISS:
+            return default
+        self.local_cache.set(key, value)
+        return value
+
+    def get_cache_values(self, keys: list[str]) -> dict[str, Any]:
+        values = {}
+        for key in keys:
+            value = self.local_cache.get(key, default=CACHE_MISS)
+            if value is not CACHE_MISS:
+                values[key] = value
+        missing = [key for key in keys if key not in values]
+        if missing:
+            for key, value in super().get_cache_values(keys=missing).items():
+                self.local_cache.set(key, value)
+                values[key] = value
+        return values
+
+    def set_cache(self, key: str, value, timeout: int | None = None) -> None:
+        super().set_cache(key=key, value=value, timeout=timeout)
+        self.local_cache.set(key, value, ttl=timeout)
+
+    def set_cache_many(self, values: dict[str, Any], timeout: int | None = None) -> None:
+        super().set_cache_many(values=values, timeout=timeout)
+        for key, value in values.items():
+            self.local_cache.set(key, value, ttl=timeout)
+
+    def invalidate_cache(self, key: str) -> None:
+        super().invalidate_cache(key=key)
+        self.local_cache.delete(key)
+
+    def invalidate_cache_list(self, keys: list[str]) -> None:
+        super().invalidate_cache_list(keys=keys)
+        for key in keys:
+            self.local_cache.delete(key)
+
+    def _read_generations(self, generation_keys: list[str]) -> dict[str, int]:
+        if self.generation_ttl <= 0:
+            return super()._read_generations(generation_keys)
+
+        generations, missing = self._local_generations(generation_keys)
+        if missing:
+            generations.update(self._remember_generations(super()._read_generations(missing)))
+        return generations
+
+    async def _aread_generations(self, generation_keys: list[str]) -> dict[str, int]:
+        if self.generation_ttl <= 0:
+            return await super()._aread_generations(generation_keys)
+
+        generations, missing = self._local_generations(generation_keys)
+        if missing:
+            generations.update(self._remember_generations(await super()._aread_generations(missing)))
+        return generations
+
+    def _local_generations(self, generation_keys: list[str]) -> tuple[dict[str, int], list[str]]:
+        generations = {}
+        for key in generation_keys:
+            generation = self.local_cache.get(key, default=CACHE_MISS)
+            if generation is not CACHE_MISS:
+                generations[key] = generation
+        return generations, [key for key in generation_keys if key not in generations]
+
+    def _remember_generations(self, generations: dict[str, int]) -> dict[str, int]:
+        for key, generation in generations.items():
+            self.local_cache.set(key, generation, ttl=self.generation_ttl, size=0)
+        return generations
+
+    def _add_generation(self, generation_key: str, generation: int) -> bool:
+        added = super()._add_generation(generation_key, generation)
+        if added and self.generation_ttl > 0:
+            self.local_cache.set(generation_key, generation, ttl=self.generation_ttl, size=0)
+        return added
+
+    def _bump_generation(self, generation_key: str) -> None:
+        super()._bump_generation(generation_key)
+        self.local_cache.delete(generation_key)
@@ -84,6 +84,12 @@ class PermissionException(ServiceException):
     log_level: ClassVar[int] = logging.INFO
 
 
+@dataclass(eq=False)
+class ServiceUnavailableException(ServiceException):
+    http_status: ClassVar[int] = 503
+    log_level: ClassVar[int] = logging.WARNING
+
+
 @dataclass(eq=False)
 class JWTKeyParsingException(AuthFailureException):
     log_level: ClassVar[int] = logging.WARNING
@@ -100,3 +106,19 @@ class InvalidTokenTypeException(AuthFailureException):
     @property
     def message(self):
         return 'Invalid token type'
+
+
+@dataclass(eq=False)
+class PasswordHashingOverloadedException(ServiceUnavailableException):
+    @property
+    def message(self):
+        return 'Too many sign-in attempts are being processed, try again shortly'
+
+
+@dataclass(eq=False)
+class InvalidPaginationCursorException(ValidationException):
+    cursor: str
+
+    @property
+    def message(self):
+        return 'Invalid pagination cursor'
@@ -1,5 +1,9 @@
 from django.db import models
 
+from typing import ClassVar
+
+from core.apps.common.search import build_search_text
+
 
 class TimedBaseModel(models.Model):
     created_at = models.DateTimeField(
@@ -34,6 +38,37 @@ class SoftDeletable(models.Model):
         abstract = True
 
 
+class Searchable(models.Model):
+    """Keeps `search_text`, the normalized form of `search_fields` (see
+    `core.apps.common.search`), up to date on `save`. Writes that go
+    through `QuerySet.update` must call `refresh_search_text`."""
+    search_fields: ClassVar[tuple[str, ...]] = ()
+
+    search_text = models.TextField(
+        verbose_name='Normalized text for search',
+        default='',
+        editable=False,
+    )
+
+    class Meta:
+        abstract = True
+
+    def build_search_text(self) -> str:
+        return build_search_text(getattr(self, field) for field in self.search_fields)
+
+    def save(self, *args, **kwargs):
+        self.search_text = self.build_search_text()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'search_text'}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def refresh_search_text(cls, pk: int) -> None:
+        instance = cls._base_manager.only(*cls.search_fields).get(pk=pk)
+        cls._base_manager.filter(pk=pk).update(search_text=instance.build_search_text())
+
+
 class Day(models.TextChoices):
 
     MONDAY = "MN", "Monday"
@@ -63,6 +98,12 @@ class Subgroup(models.TextChoices):
     B = "B", "B"
 
 
+class GroupLessonChangeKind(models.TextChoices):
+    ADD = "add", "Add"
+    REMOVE = "remove", "Remove"
+    RESET = "reset", "Reset"
+
+
 class OrdinaryNumber(models.IntegerChoices):
     FIRST = 1, "1"
     SECOND = 2, "2"
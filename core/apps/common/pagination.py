@@ -0,0 +1,104 @@
+from django.db.models import (
+    Count,
+    Model,
+    Q,
+    QuerySet,
+    Window,
+)
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Sequence,
+    TypeVar,
+)
+
+from core.api.filters import PaginationIn
+from core.apps.common.exceptions import InvalidPaginationCursorException
+
+
+TItem = TypeVar('TItem')
+
+TOTAL_ANNOTATION = 'pagination_total'
+
+
+@dataclass(frozen=True)
+class Page(Generic[TItem]):
+    items: list[TItem]
+    total: int | None = None
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(',', ':'), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidPaginationCursorException(cursor=cursor)
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidPaginationCursorException(cursor=cursor)
+    return values
+
+
+def keyset_after(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """Rows that sort after `values` by the ascending `ordering`:
+    `(a, b, id) > (va, vb, vid)` spelled out for the ORM."""
+    query = Q()
+    for position, field in enumerate(ordering):
+        step = Q(**{f'{field}__gt': values[position]})
+        for previous, value in zip(ordering[:position], values):
+            step &= Q(**{previous: value})
+        query |= step
+    return query
+
+
+def paginate(
+        queryset: QuerySet,
+        ordering: Sequence[str],
+        pagination: PaginationIn,
+        to_entity: Callable[[Model], TItem],
+) -> Page[TItem]:
+    """Fetch one page of `queryset` in a single query.
+
+    `ordering` lists ascending, non-null fields ending with a unique one,
+    so it is a total order: an offset page and a cursor page agree on
+    what comes next, and a cursor is just the ordering values of the last
+    item. A page given a cursor skips to it with `keyset_after`, which an
+    index on `ordering` answers without walking the skipped rows. On
+    offset pages the total is counted by a window function over the same
+    query; a page past the end has no row to carry it and falls back to
+    `count()`. Cursor pages leave the total out, as their WHERE clause
+    only sees the rows after the cursor.
+
+    """
+    queryset = queryset.order_by(*ordering)
+    offset, with_total = pagination.offset, pagination.with_total
+    if pagination.cursor is not None:
+        queryset = queryset.filter(keyset_after(ordering, decode_cursor(pagination.cursor, len(ordering))))
+        offset, with_total = 0, False
+    matching = queryset
+    if with_total:
+        queryset = queryset.annotate(**{TOTAL_ANNOTATION: Window(expression=Count('pk'))})
+
+    # One extra row tells whether a next page exists.
+    rows = list(queryset[offset:offset + pagination.limit + 1])
+    has_next, rows = len(rows) > pagination.limit, rows[:pagination.limit]
+
+    total = None
+    if with_total:
+        total = getattr(rows[0], TOTAL_ANNOTATION) if rows else (matching.count() if offset else 0)
+    next_cursor = None
+    if has_next and rows:
+        next_cursor = encode_cursor([getattr(rows[-1], field) for field in ordering])
+
+    return Page(items=[to_entity(row) for row in rows], total=total, next_cursor=next_cursor)
@@ -0,0 +1,42 @@
+from django.db.models import Q
+
+import re
+from collections.abc import Iterable
+from transliterate import translit
+
+
+APOSTROPHES = re.compile("['`’ʼʹ‘]")
+WHITESPACE = re.compile(r'\s+')
+
+SEARCH_LANGUAGE = 'uk'
+
+
+def fold_search_text(text: str) -> str:
+    """Case-fold `text` the way Ukrainian users type it: apostrophes are
+    dropped (they come in half a dozen code points) and ґ is treated as
+    г."""
+    text = APOSTROPHES.sub('', text).casefold().replace('ґ', 'г')
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def build_search_text(values: Iterable[str | None]) -> str:
+    """Normalized text stored next to a record for searching: the folded
+    values followed by their Latin and Cyrillic transliterations, so a
+    query matches in whichever script it was typed."""
+    text = APOSTROPHES.sub('', ' '.join(value for value in values if value))
+    variants = [text, translit(text, SEARCH_LANGUAGE, reversed=True), translit(text, SEARCH_LANGUAGE)]
+    return ' '.join(dict.fromkeys(fold_search_text(variant) for variant in variants if variant))
+
+
+def search_tokens(query: str | None) -> list[str]:
+    if not query:
+        return []
+    return fold_search_text(query).split()
+
+
+def search_text_query(query: str | None, field: str = 'search_text') -> Q:
+    """Every token of `query` has to occur in `field`."""
+    condition = Q()
+    for token in search_tokens(query):
+        condition &= Q(**{f'{field}__contains': token})
+    return condition
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.db import close_old_connections
+
+from asgiref.sync import sync_to_async
+from functools import wraps
+from typing import (
+    Awaitable,
+    Callable,
+    ParamSpec,
+    TypeVar,
+)
+
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+def sync_read_to_async(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """`sync_to_async` for the blocking part of an async read handler.
+
+    `sync_to_async` defaults to `thread_sensitive=True`, which runs every
+    call of a process on the one thread that also serves its sync views,
+    so reads would queue behind each other and behind a login waiting on
+    bcrypt. `func` runs on asgiref's thread pool instead. A pool thread
+    drops its database connection once it is unusable or past
+    `CONN_MAX_AGE`, the way Django's request signals do for the request
+    thread.
+
+    With `ASYNC_READS_THREAD_SENSITIVE` the plain thread-sensitive adapter
+    is returned, which keeps the ORM on the caller's connection.
+
+    """
+    if settings.ASYNC_READS_THREAD_SENSITIVE:
+        return sync_to_async(func)
+
+    @wraps(func)
+    def run(*args: P.args, **kwargs: P.kwargs) -> R:
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(run, thread_sensitive=False)
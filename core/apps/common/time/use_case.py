@@ -11,6 +11,7 @@ from core.apps.common.time.constants import (
 )
 from core.apps.common.time.entity import TimeInfo as TimeInfoEntity
 from core.apps.common.time.service import BaseTimeService
+from core.apps.schedule.entities.semester_settings import SemesterSettings as SemesterSettingsEntity
 from core.apps.schedule.services.semester_settings import BaseSemesterSettingsService
 
 
@@ -20,8 +21,18 @@ class GetCurrentTimeInfoUseCase:
     semester_settings_service: BaseSemesterSettingsService
 
     def execute(self) -> TimeInfoEntity:
-        current_time = self.time_service.get_current_time()
-        semester_settings = self.semester_settings_service.get_current_settings()
+        return self._build(
+            current_time=self.time_service.get_current_time(),
+            semester_settings=self.semester_settings_service.get_current_settings(),
+        )
+
+    async def aexecute(self) -> TimeInfoEntity:
+        return self._build(
+            current_time=self.time_service.get_current_time(),
+            semester_settings=await self.semester_settings_service.aget_current_settings(),
+        )
+
+    def _build(self, current_time: datetime, semester_settings: SemesterSettingsEntity) -> TimeInfoEntity:
         start_of_semester = datetime.combine(semester_settings.start_date, time.min)
         current_week = self.time_service.get_current_week_type(
             datetime_now=current_time,
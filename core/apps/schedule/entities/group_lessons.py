@@ -3,8 +3,13 @@ from dataclasses import (
     field,
 )
 from datetime import datetime
+from enum import Enum
 
-from core.apps.common.models import Subgroup
+from core.apps.common.exceptions import ServiceException
+from core.apps.common.models import (
+    GroupLessonChangeKind,
+    Subgroup,
+)
 from core.apps.schedule.entities.group import Group as GroupEntity
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
 
@@ -17,3 +22,53 @@ class GroupLesson:
     lesson: LessonEntity | None = field(default=None, kw_only=True)
     created_at: datetime | None = field(default=None, kw_only=True)
     updated_at: datetime | None = field(default=None, kw_only=True)
+
+
+class GroupLessonAction(str, Enum):
+    ADD = 'add'
+    REMOVE = 'remove'
+    REPLACE = 'replace'
+
+
+@dataclass(frozen=True, kw_only=True)
+class GroupLessonOperation:
+    """One step of a batch edit of a group's lessons; `old_lesson_uuid`
+    names the lesson a `REPLACE` swaps out."""
+    action: GroupLessonAction
+    lesson_uuid: str
+    subgroup: Subgroup | None = None
+    old_lesson_uuid: str | None = None
+
+    @property
+    def lesson_uuids(self) -> list[str]:
+        if self.old_lesson_uuid is None:
+            return [self.lesson_uuid]
+        return [self.lesson_uuid, self.old_lesson_uuid]
+
+
+@dataclass(kw_only=True)
+class GroupLessonOperationResult:
+    operation: GroupLessonOperation
+    lesson: LessonEntity | None = None
+    old_lesson: LessonEntity | None = None
+    error: ServiceException | None = None
+
+    @property
+    def is_applied(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class GroupLessonCell:
+    lesson_uuid: str
+    subgroup: Subgroup | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class GroupLessonChange:
+    """One entry of a group's lesson change log. `version` grows with every
+    change of the group; a `RESET` entry carries no cell and stands for
+    the compacted history up to its version."""
+    version: int
+    kind: GroupLessonChangeKind
+    cell: GroupLessonCell | None = None
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class SearchKind(str, Enum):
+    TEACHER = 'teacher'
+    GROUP = 'group'
+    ROOM = 'room'
+    SUBJECT = 'subject'
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SearchHit:
+    """One typeahead suggestion; `label` is what the user sees (a
+    teacher's full name, a group or room number, a subject title)."""
+    kind: SearchKind
+    uuid: str
+    label: str
+    score: int
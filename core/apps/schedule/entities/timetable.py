@@ -0,0 +1,77 @@
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+from typing import Callable
+
+from core.apps.common.models import (
+    LessonType,
+    Subgroup,
+)
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.room import Room as RoomEntity
+from core.apps.schedule.entities.subject import Subject as SubjectEntity
+from core.apps.schedule.entities.teacher import Teacher as TeacherEntity
+from core.apps.schedule.entities.timeslot import Timeslot as TimeslotEntity
+
+
+@dataclass(kw_only=True, slots=True)
+class TimetableGroup:
+    group_id: int
+    subgroups: list[Subgroup] = field(default_factory=list)
+
+
+@dataclass(kw_only=True, slots=True)
+class TimetableEntry:
+    """One lesson of a timetable; related rows are referenced by id and
+    resolved through the dimension tables of the owning `Timetable`."""
+    lesson_uuid: str
+    type: LessonType
+    subject_id: int
+    teacher_id: int
+    room_id: int
+    timeslot_id: int
+    subgroups: list[Subgroup] = field(default_factory=list)
+    groups: list[TimetableGroup] = field(default_factory=list)
+
+
+@dataclass(kw_only=True, slots=True)
+class Timetable:
+    """Flat timetable: a list of id-only entries plus one table per
+    dimension, so every subject, teacher, room, timeslot and group is
+    stored (and pickled) once however many lessons share it."""
+    entries: list[TimetableEntry] = field(default_factory=list)
+    subjects: dict[int, SubjectEntity] = field(default_factory=dict)
+    teachers: dict[int, TeacherEntity] = field(default_factory=dict)
+    rooms: dict[int, RoomEntity] = field(default_factory=dict)
+    timeslots: dict[int, TimeslotEntity] = field(default_factory=dict)
+    groups: dict[int, GroupEntity] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def timeslot_of(self, entry: TimetableEntry) -> TimeslotEntity:
+        return self.timeslots[entry.timeslot_id]
+
+    def with_entries(self, entries: list[TimetableEntry]) -> 'Timetable':
+        """Return a timetable holding `entries` that shares this one's
+        dimension tables."""
+        return replace(self, entries=entries)
+
+    def dependencies(self) -> set[tuple[str, str]]:
+        """`(model prefix, uuid)` of every row the timetable was built from,
+        for dependency-tracked cache invalidation."""
+        return {
+            (dimension, entity.uuid)
+            for dimension, table in (
+                ('subject', self.subjects),
+                ('teacher', self.teachers),
+                ('room', self.rooms),
+                ('group', self.groups),
+            )
+            for entity in table.values()
+        }
+
+    def filter(self, predicate: Callable[[TimetableEntry], bool]) -> 'Timetable':
+        return self.with_entries([entry for entry in self.entries if predicate(entry)])
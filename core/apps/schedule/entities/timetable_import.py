@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from core.apps.common.models import (
+    Day,
+    LessonType,
+    OrdinaryNumber,
+    Subgroup,
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TimetableImportRow:
+    """One lesson assignment of an imported timetable: the group (and
+    subgroup) attending plus everything that identifies the lesson."""
+    group_uuid: str
+    subgroup: Subgroup | None = None
+    subject_uuid: str
+    teacher_uuid: str
+    room_uuid: str
+    type: LessonType
+    day: Day
+    ord_number: OrdinaryNumber
+    is_even: bool
+
+    @property
+    def timeslot_key(self) -> tuple[Day, OrdinaryNumber, bool]:
+        return self.day, self.ord_number, self.is_even
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TimetableImportResult:
+    groups: int
+    lessons: int
+    group_lessons: int
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+    Subgroup,
+)
+from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
+
+
+class ConflictDimension(str, Enum):
+    TEACHER = 'teacher'
+    ROOM = 'room'
+    GROUP = 'group'
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TimetableIndexEntry:
+    """One group lesson as seen by the timetable index: who attends it,
+    who teaches it, where and when."""
+    group_uuid: str
+    subgroup: Subgroup | None = None
+    lesson_uuid: str
+    teacher_uuid: str
+    room_uuid: str
+    day: Day
+    ord_number: OrdinaryNumber
+    is_even: bool
+
+    @property
+    def timeslot_key(self) -> tuple[Day, OrdinaryNumber, bool]:
+        return self.day, self.ord_number, self.is_even
+
+    @classmethod
+    def from_group_lesson(cls, group_lesson: GroupLessonEntity) -> 'TimetableIndexEntry':
+        lesson = group_lesson.lesson
+        return cls(
+            group_uuid=group_lesson.group.uuid,
+            subgroup=group_lesson.subgroup,
+            lesson_uuid=lesson.uuid,
+            teacher_uuid=lesson.teacher.uuid,
+            room_uuid=lesson.room.uuid,
+            day=lesson.timeslot.day,
+            ord_number=lesson.timeslot.ord_number,
+            is_even=lesson.timeslot.is_even,
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TimetableIndexDelta:
+    """The group lessons one write added and removed, as replayed by the
+    indexes of the other workers."""
+    added: tuple[TimetableIndexEntry, ...] = ()
+    removed: tuple[TimetableIndexEntry, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TimetableConflict:
+    """Several lessons competing for one teacher, room or group in the
+    same timeslot; `identifier` is the uuid of that teacher, room or
+    group."""
+    dimension: ConflictDimension
+    identifier: str
+    day: Day
+    ord_number: OrdinaryNumber
+    is_even: bool
+    lesson_uuids: tuple[str, ...]
@@ -2,25 +2,29 @@ from dataclasses import (
     dataclass,
     field,
 )
+from datetime import datetime
 
-from core.apps.common.models import Subgroup
 from core.apps.schedule.entities.group import Group as GroupEntity
-from core.apps.schedule.entities.lesson import Lesson as LessonEntity
+from core.apps.schedule.entities.group_lessons import GroupLessonCell
+from core.apps.schedule.entities.timetable import Timetable
 
 
 @dataclass(kw_only=True)
-class GroupForLessonView:
+class GroupScheduleSnapshot:
     group: GroupEntity
-    subgroups: list[Subgroup] = field(default_factory=list)
+    version: datetime | None = None
+    changes_version: int = 0
+    timetable: Timetable = field(default_factory=Timetable)
 
 
 @dataclass(kw_only=True)
-class LessonWithGroupsView:
-    lesson: LessonEntity
-    groups: list[GroupForLessonView] = field(default_factory=list)
-
-
-@dataclass(kw_only=True)
-class LessonForGroupView:
-    lesson: LessonEntity
-    subgroups: list[Subgroup] = field(default_factory=list)
+class GroupTimetableDelta:
+    """What a client holding `since` needs to reach `version`: the lesson
+    cells added since then, with their current content, and the ones
+    removed. With `is_full` the timetable is the group's whole schedule
+    and the client drops whatever it had."""
+    group: GroupEntity
+    version: int
+    is_full: bool = False
+    added: Timetable = field(default_factory=Timetable)
+    removed: list[GroupLessonCell] = field(default_factory=list)
@@ -1,4 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field,
+)
 
 from core.apps.common.exceptions import (
     AlreadyExistsException,
@@ -27,3 +30,15 @@ class GroupLessonAlreadyExists(AlreadyExistsException):
     @property
     def message(self):
         return 'Group already contains this lesson'
+
+
+@dataclass(eq=False)
+class GroupLessonScheduleConflict(AlreadyExistsException):
+    group_uuid: str | None = None
+    lesson_uuid: str | None = None
+    subgroup: Subgroup | None = None
+    conflicts: list[dict] = field(default_factory=list)
+
+    @property
+    def message(self):
+        return 'Lesson overlaps with another lesson of the same teacher, room or group'
@@ -0,0 +1,46 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.apps.common.exceptions import (
+    NotFoundException,
+    ValidationException,
+)
+
+
+@dataclass(eq=False)
+class TimetableImportEmptyException(ValidationException):
+
+    @property
+    def message(self):
+        return 'Timetable import does not contain any lessons'
+
+
+@dataclass(eq=False)
+class TimetableImportReferencesNotFoundException(NotFoundException):
+    missing: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def message(self):
+        return 'Timetable import references rows that were not found'
+
+
+@dataclass(eq=False)
+class TimetableImportGroupsOutsideFacultyException(ValidationException):
+    faculty_uuid: str | None = None
+    group_uuids: list[str] = field(default_factory=list)
+
+    @property
+    def message(self):
+        return 'Timetable import contains groups of another faculty'
+
+
+@dataclass(eq=False)
+class TimetableImportParseException(ValidationException):
+    line: int | None = None
+    detail: str | None = None
+
+    @property
+    def message(self):
+        return 'Timetable import file could not be parsed'
@@ -0,0 +1,96 @@
+# Generated by Django 5.1.3 on 2026-10-18 16:53
+
+import re
+
+from django.db import migrations, models
+
+from transliterate import translit
+
+
+SEARCH_FIELDS = {
+    'teacher': ('last_name', 'first_name', 'middle_name'),
+    'room': ('number', 'description'),
+    'group': ('number',),
+    'subject': ('title',),
+}
+
+# Trigram indexes let `search_text LIKE '%token%'` skip the sequential scan. pg_trgm ships with
+# the standard Postgres images; where it is missing the search still works, only unindexed.
+CREATE_TRIGRAM_INDEXES = '''
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS teacher_search_trgm_idx ON schedule_teacher USING gin (search_text gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS room_search_trgm_idx ON schedule_room USING gin (search_text gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS group_search_trgm_idx ON schedule_group USING gin (search_text gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS subject_search_trgm_idx ON schedule_subject USING gin (search_text gin_trgm_ops);
+    END IF;
+END
+$$;
+'''
+
+DROP_TRIGRAM_INDEXES = '''
+DROP INDEX IF EXISTS teacher_search_trgm_idx;
+DROP INDEX IF EXISTS room_search_trgm_idx;
+DROP INDEX IF EXISTS group_search_trgm_idx;
+DROP INDEX IF EXISTS subject_search_trgm_idx;
+'''
+
+
+# A frozen copy of `core.apps.common.search.build_search_text` as of this migration, so the
+# backfill keeps producing the same text whatever becomes of the live helpers.
+APOSTROPHES = re.compile("['`’ʼʹ‘]")
+WHITESPACE = re.compile(r'\s+')
+
+
+def fold_search_text(text):
+    text = APOSTROPHES.sub('', text).casefold().replace('ґ', 'г')
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def build_search_text(values):
+    text = APOSTROPHES.sub('', ' '.join(value for value in values if value))
+    variants = [text, translit(text, 'uk', reversed=True), translit(text, 'uk')]
+    return ' '.join(dict.fromkeys(fold_search_text(variant) for variant in variants if variant))
+
+
+def fill_search_text(apps, schema_editor):
+    for model_name, fields in SEARCH_FIELDS.items():
+        model = apps.get_model('schedule', model_name)
+        rows = list(model._base_manager.only(*fields))
+        for row in rows:
+            row.search_text = build_search_text(getattr(row, field) for field in fields)
+        model._base_manager.bulk_update(rows, ['search_text'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='search_text',
+            field=models.TextField(default='', editable=False, verbose_name='Normalized text for search'),
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='search_text',
+            field=models.TextField(default='', editable=False, verbose_name='Normalized text for search'),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='search_text',
+            field=models.TextField(default='', editable=False, verbose_name='Normalized text for search'),
+        ),
+        migrations.AddField(
+            model_name='teacher',
+            name='search_text',
+            field=models.TextField(default='', editable=False, verbose_name='Normalized text for search'),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunSQL(CREATE_TRIGRAM_INDEXES, DROP_TRIGRAM_INDEXES),
+    ]
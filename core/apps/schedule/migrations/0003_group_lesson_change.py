@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-18 17:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0002_search_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupLessonChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created date')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated date')),
+                ('kind', models.CharField(choices=[('add', 'Add'), ('remove', 'Remove'), ('reset', 'Reset')], max_length=6, verbose_name='Kind of change')),
+                ('lesson_uuid', models.UUIDField(blank=True, null=True, verbose_name='Lesson added to or removed from the group')),
+                ('subgroup', models.CharField(blank=True, choices=[('A', 'A'), ('B', 'B')], max_length=1, null=True, verbose_name='Subgroup the change applies to')),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lesson_changes', to='schedule.group', verbose_name='Group whose lessons changed')),
+            ],
+            options={
+                'verbose_name': 'Group Lesson Change',
+                'verbose_name_plural': 'Group Lesson Changes',
+                'indexes': [models.Index(fields=['group', 'id'], name='group_lesson_change_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.3 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0003_group_lesson_change'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='teacher',
+            index=models.Index(fields=['last_name', 'first_name', 'id'], name='teacher_list_order_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@ from .faculty import Faculty
 from .group import (
     Group,
     GroupLesson,
+    GroupLessonChange,
 )
 from .lesson import Lesson
 from .room import Room
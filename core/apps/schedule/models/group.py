@@ -4,17 +4,25 @@ import uuid
 
 from core.apps.clients.models.client import Client
 from core.apps.common.models import (
+    GroupLessonChangeKind,
+    Searchable,
     SoftDeletable,
     Subgroup,
     TimedBaseModel,
 )
 from core.apps.schedule.entities.group import Group as GroupEntity
-from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
+from core.apps.schedule.entities.group_lessons import (
+    GroupLesson as GroupLessonEntity,
+    GroupLessonCell,
+    GroupLessonChange as GroupLessonChangeEntity,
+)
 from core.apps.schedule.models.faculty import Faculty
 from core.apps.schedule.models.lesson import Lesson
 
 
-class Group(TimedBaseModel, SoftDeletable):
+class Group(TimedBaseModel, SoftDeletable, Searchable):
+    search_fields = ('number',)
+
     group_uuid = models.UUIDField(
         verbose_name='UUID group representation',
         editable=False,
@@ -123,3 +131,49 @@ class GroupLesson(TimedBaseModel):
                 nulls_distinct=False,
             ),
         ]
+
+
+class GroupLessonChange(TimedBaseModel):
+    group = models.ForeignKey(
+        Group,
+        verbose_name="Group whose lessons changed",
+        on_delete=models.CASCADE,
+        related_name='lesson_changes',
+    )
+    kind = models.CharField(
+        verbose_name="Kind of change",
+        max_length=6,
+        choices=GroupLessonChangeKind,
+    )
+    lesson_uuid = models.UUIDField(
+        verbose_name="Lesson added to or removed from the group",
+        null=True,
+        blank=True,
+    )
+    subgroup = models.CharField(
+        verbose_name="Subgroup the change applies to",
+        max_length=1,
+        choices=Subgroup,
+        null=True,
+        blank=True,
+    )
+
+    def __str__(self) -> str:
+        return f"{self.group_id} #{self.id}: {self.kind} {self.lesson_uuid or ''}"
+
+    def to_entity(self) -> GroupLessonChangeEntity:
+        return GroupLessonChangeEntity(
+            version=self.id,
+            kind=GroupLessonChangeKind(self.kind),
+            cell=None if self.lesson_uuid is None else GroupLessonCell(
+                lesson_uuid=str(self.lesson_uuid),
+                subgroup=self.subgroup,
+            ),
+        )
+
+    class Meta:
+        verbose_name = "Group Lesson Change"
+        verbose_name_plural = "Group Lesson Changes"
+        indexes = [
+            models.Index(fields=['group', 'id'], name='group_lesson_change_idx'),
+        ]
@@ -3,13 +3,16 @@ from django.db import models
 import uuid
 
 from core.apps.common.models import (
+    Searchable,
     SoftDeletable,
     TimedBaseModel,
 )
 from core.apps.schedule.entities.room import Room as RoomEntity
 
 
-class Room(TimedBaseModel, SoftDeletable):
+class Room(TimedBaseModel, SoftDeletable, Searchable):
+    search_fields = ('number', 'description')
+
     room_uuid = models.UUIDField(
         verbose_name='UUID room representation',
         editable=False,
@@ -1,7 +1,7 @@
-import datetime
-
 from django.db import models
 
+import datetime
+
 from core.apps.common.models import TimedBaseModel
 
 
@@ -3,13 +3,16 @@ from django.db import models
 import uuid
 
 from core.apps.common.models import (
+    Searchable,
     SoftDeletable,
     TimedBaseModel,
 )
 from core.apps.schedule.entities.subject import Subject as SubjectEntity
 
 
-class Subject(TimedBaseModel, SoftDeletable):
+class Subject(TimedBaseModel, SoftDeletable, Searchable):
+    search_fields = ('title',)
+
     subject_uuid = models.UUIDField(
         verbose_name='UUID subject representation',
         editable=False,
@@ -3,6 +3,7 @@ from django.db import models
 import uuid
 
 from core.apps.common.models import (
+    Searchable,
     SoftDeletable,
     TeachersDegree,
     TimedBaseModel,
@@ -10,7 +11,9 @@ from core.apps.common.models import (
 from core.apps.schedule.entities.teacher import Teacher as TeacherEntity
 
 
-class Teacher(TimedBaseModel, SoftDeletable):
+class Teacher(TimedBaseModel, SoftDeletable, Searchable):
+    search_fields = ('last_name', 'first_name', 'middle_name')
+
     teacher_uuid = models.UUIDField(
         verbose_name='UUID teacher representation',
         editable=False,
@@ -57,3 +60,6 @@ class Teacher(TimedBaseModel, SoftDeletable):
     class Meta:
         verbose_name = "Teacher"
         verbose_name_plural = "Teachers"
+        indexes = [
+            models.Index(fields=["last_name", "first_name", "id"], name="teacher_list_order_idx"),
+        ]
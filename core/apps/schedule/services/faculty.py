@@ -9,6 +9,10 @@ from typing import Iterable
 
 from core.api.filters import PaginationIn
 from core.apps.common.filters import SearchFilter as SearchFilterEntity
+from core.apps.common.pagination import (
+    Page,
+    paginate,
+)
 from core.apps.schedule.entities.faculty import Faculty as FacultyEntity
 from core.apps.schedule.exceptions.faculty import (
     FacultyAlreadyExistsException,
@@ -19,6 +23,9 @@ from core.apps.schedule.exceptions.faculty import (
 from core.apps.schedule.models import Faculty as FacultyModel
 
 
+FACULTY_LIST_ORDERING = ('name', 'id')
+
+
 class BaseFacultyService(ABC):
     @abstractmethod
     def create(self, name: str, code_name: str) -> FacultyEntity:
@@ -29,11 +36,7 @@ class BaseFacultyService(ABC):
         ...
 
     @abstractmethod
-    def get_list(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Iterable[FacultyEntity]:
-        ...
-
-    @abstractmethod
-    def get_count(self, filters: SearchFilterEntity) -> int:
+    def get_page(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Page[FacultyEntity]:
         ...
 
     @abstractmethod
@@ -96,17 +99,14 @@ class ORMFacultyService(BaseFacultyService):
     def get_all(self) -> list[FacultyEntity]:
         return [faculty.to_entity() for faculty in FacultyModel.objects.all()]
 
-    def get_list(self, filters: SearchFilterEntity, pagination: PaginationIn) -> list[FacultyEntity]:
-        query = self._build_faculty_query(filters)
-        qs = FacultyModel.objects.filter(query)[
-            pagination.offset:pagination.offset + pagination.limit
-        ]
-        return [faculty.to_entity() for faculty in qs]
-
-    def get_count(self, filters: SearchFilterEntity) -> int:
+    def get_page(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Page[FacultyEntity]:
         query = self._build_faculty_query(filters)
-
-        return FacultyModel.objects.filter(query).count()
+        return paginate(
+            FacultyModel.objects.filter(query),
+            ordering=FACULTY_LIST_ORDERING,
+            pagination=pagination,
+            to_entity=lambda faculty: faculty.to_entity(),
+        )
 
     def get_by_uuid(self, faculty_uuid: str) -> FacultyEntity:
         try:
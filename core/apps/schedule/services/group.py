@@ -1,5 +1,11 @@
 from django.db import IntegrityError
-from django.db.models import Q
+from django.db.models import (
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from abc import (
@@ -11,6 +17,11 @@ from typing import Iterable
 from core.api.filters import PaginationIn
 from core.apps.common.filters import SearchFilter as SearchFilterEntity
 from core.apps.common.models import Subgroup
+from core.apps.common.pagination import (
+    Page,
+    paginate,
+)
+from core.apps.common.search import search_text_query
 from core.apps.schedule.entities.group import Group as GroupEntity
 from core.apps.schedule.exceptions.group import (
     GroupAlreadyExistsException,
@@ -20,7 +31,13 @@ from core.apps.schedule.exceptions.group import (
     GroupWithSubgroupsInvalidSubgroupException,
     HeadmanNotAssignedToAnyGroup,
 )
-from core.apps.schedule.models.group import Group as GroupModel
+from core.apps.schedule.models.group import (
+    Group as GroupModel,
+    GroupLessonChange as GroupLessonChangeModel,
+)
+
+
+GROUP_LIST_ORDERING = ('number', 'id')
 
 
 class BaseGroupService(ABC):
@@ -39,19 +56,27 @@ class BaseGroupService(ABC):
         ...
 
     @abstractmethod
-    def get_list(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Iterable[GroupEntity]:
+    def get_page(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Page[GroupEntity]:
         ...
 
     @abstractmethod
-    def get_count(self, filters: SearchFilterEntity) -> int:
+    def get_by_uuid(self, group_uuid: str) -> GroupEntity:
         ...
 
     @abstractmethod
-    def get_by_uuid(self, group_uuid: str) -> GroupEntity:
+    def get_by_id(self, group_id: int) -> GroupEntity:
         ...
 
     @abstractmethod
-    def get_by_id(self, group_id: int) -> GroupEntity:
+    def get_by_uuids(self, group_uuids: Iterable[str]) -> dict[str, GroupEntity]:
+        ...
+
+    @abstractmethod
+    def get_by_uuid_with_changes_version(self, group_uuid: str) -> tuple[GroupEntity, int]:
+        ...
+
+    @abstractmethod
+    def get_by_uuids_with_changes_versions(self, group_uuids: Iterable[str]) -> dict[str, tuple[GroupEntity, int]]:
         ...
 
     @abstractmethod
@@ -78,6 +103,10 @@ class BaseGroupService(ABC):
     def bump_schedule_updated_at(self, group_id: int) -> None:
         ...
 
+    @abstractmethod
+    def bump_schedule_updated_at_many(self, group_ids: Iterable[int]) -> None:
+        ...
+
     @abstractmethod
     def find_any_by_number(self, group_number: str) -> GroupEntity | None:
         ...
@@ -100,7 +129,7 @@ class ORMGroupService(BaseGroupService):
         query = Q()
 
         if filters.search is not None:
-            query &= Q(number__icontains=filters.search)
+            query &= search_text_query(filters.search)
 
         return query
 
@@ -127,30 +156,32 @@ class ORMGroupService(BaseGroupService):
         groups = (
             GroupModel.objects.
             all().
-            select_related("headman", "faculty")
+            select_related("headman", "faculty").
+            prefetch_related("headman__roles")
         )
         return [group.to_entity() for group in groups]
 
-    def get_list(self, filters: SearchFilterEntity, pagination: PaginationIn) -> list[GroupEntity]:
+    def get_page(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Page[GroupEntity]:
         query = self._build_group_query(filters)
         qs = (
             GroupModel.objects.
             filter(query).
-            select_related("headman", "faculty")
-            [pagination.offset:pagination.offset + pagination.limit]
+            select_related("headman", "faculty").
+            prefetch_related("headman__roles")
+        )
+        return paginate(
+            qs,
+            ordering=GROUP_LIST_ORDERING,
+            pagination=pagination,
+            to_entity=lambda group: group.to_entity(),
         )
-        return [group.to_entity() for group in qs]
-
-    def get_count(self, filters: SearchFilterEntity) -> int:
-        query = self._build_group_query(filters)
-
-        return GroupModel.objects.filter(query).count()
 
     def get_by_uuid(self, group_uuid: str) -> GroupEntity:
         try:
             group = (
                 GroupModel.objects.
                 select_related("headman", "faculty").
+                prefetch_related("headman__roles").
                 get(group_uuid=group_uuid)
             )
         except GroupModel.DoesNotExist:
@@ -163,6 +194,7 @@ class ORMGroupService(BaseGroupService):
             group = (
                 GroupModel.objects.
                 select_related("headman", "faculty").
+                prefetch_related("headman__roles").
                 get(id=group_id)
             )
         except GroupModel.DoesNotExist:
@@ -170,6 +202,39 @@ class ORMGroupService(BaseGroupService):
 
         return group.to_entity()
 
+    def get_by_uuids(self, group_uuids: Iterable[str]) -> dict[str, GroupEntity]:
+        groups = (
+            GroupModel.objects.
+            select_related("headman", "faculty").
+            prefetch_related("headman__roles").
+            filter(group_uuid__in=list(group_uuids))
+        )
+        return {str(group.group_uuid): group.to_entity() for group in groups}
+
+    def get_by_uuid_with_changes_version(self, group_uuid: str) -> tuple[GroupEntity, int]:
+        """The group along with the id of its newest lesson change (0 if
+        none), read in the same query."""
+        try:
+            group = self._with_changes_version(GroupModel.objects.filter(group_uuid=group_uuid)).get()
+        except GroupModel.DoesNotExist:
+            raise GroupNotFoundException(uuid=group_uuid)
+
+        return group.to_entity(), group.changes_version
+
+    def get_by_uuids_with_changes_versions(self, group_uuids: Iterable[str]) -> dict[str, tuple[GroupEntity, int]]:
+        groups = self._with_changes_version(GroupModel.objects.filter(group_uuid__in=list(group_uuids)))
+        return {str(group.group_uuid): (group.to_entity(), group.changes_version) for group in groups}
+
+    @staticmethod
+    def _with_changes_version(groups: QuerySet[GroupModel]) -> QuerySet[GroupModel]:
+        newest_change = GroupLessonChangeModel.objects.filter(group_id=OuterRef('pk')).order_by('-id').values('id')[:1]
+        return (
+            groups.
+            select_related("headman", "faculty").
+            prefetch_related("headman__roles").
+            annotate(changes_version=Coalesce(Subquery(newest_change), 0))
+        )
+
     def check_exists_by_number(self, group_number: str) -> bool:
         return GroupModel.objects.filter(number=group_number).exists()
 
@@ -187,6 +252,7 @@ class ORMGroupService(BaseGroupService):
         group: GroupModel = (
             GroupModel.objects.filter(headman__id=headman_id).
             select_related("headman", "faculty").
+            prefetch_related("headman__roles").
             first()
         )
 
@@ -204,10 +270,14 @@ class ORMGroupService(BaseGroupService):
     def bump_schedule_updated_at(self, group_id: int) -> None:
         GroupModel.objects.filter(id=group_id).update(schedule_updated_at=timezone.now())
 
+    def bump_schedule_updated_at_many(self, group_ids: Iterable[int]) -> None:
+        GroupModel.objects.filter(id__in=list(group_ids)).update(schedule_updated_at=timezone.now())
+
     def find_any_by_number(self, group_number: str) -> GroupEntity | None:
         group = (
             GroupModel.all_objects.
             select_related("headman", "faculty").
+            prefetch_related("headman__roles").
             filter(number=group_number).
             first()
         )
@@ -0,0 +1,266 @@
+from django.db import transaction
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from typing import Iterable
+
+from core.apps.common.cache.service import BaseCacheService
+from core.apps.common.exceptions import ServiceException
+from core.apps.common.models import Subgroup
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.group_lessons import (
+    GroupLesson as GroupLessonEntity,
+    GroupLessonAction,
+    GroupLessonOperation,
+    GroupLessonOperationResult,
+)
+from core.apps.schedule.entities.lesson import Lesson as LessonEntity
+from core.apps.schedule.entities.timetable_index import TimetableIndexEntry
+from core.apps.schedule.exceptions.group_lesson import (
+    GroupLessonAlreadyExists,
+    GroupLessonDeleteError,
+    GroupLessonScheduleConflict,
+)
+from core.apps.schedule.exceptions.lesson import LessonNotFoundException
+from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
+from core.apps.schedule.services.group_lessons import BaseGroupLessonService
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
+from core.apps.schedule.services.lesson import BaseLessonService
+from core.apps.schedule.services.timetable_index import (
+    BaseTimetableIndexService,
+    TimetableIndex,
+)
+from core.apps.schedule.validators.group_lesson import BaseGroupLessonValidatorService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+AssignmentKey = tuple[int, Subgroup | None]
+
+
+class BaseGroupLessonBatchService(ABC):
+    @abstractmethod
+    def apply(self, group: GroupEntity, operations: list[GroupLessonOperation]) -> list[GroupLessonOperationResult]:
+        ...
+
+
+@dataclass
+class ORMGroupLessonBatchService(BaseGroupLessonBatchService):
+    """Applies a list of add / remove / replace operations to one group.
+
+    Operations are validated together against the schedule as it was
+    before the batch: lessons are loaded with one query, additions go
+    through `BaseGroupLessonValidatorService.validate_many` and the
+    group's current assignments are read once. The operations are then
+    replayed in order in memory, so a batch may remove what an earlier
+    step added. While replaying, every addition is also checked against
+    the additions accepted before it, and one that clashes with the
+    schedule only in cells freed by earlier removals is let through, so
+    a swap does not need `replace`. An operation that fails is reported
+    in its result and skipped; the rest are written in a single
+    transaction with one `schedule_updated_at` bump and their net effect
+    on the change log, followed by one snapshot rebuild and one cache
+    invalidation.
+
+    """
+    group_service: BaseGroupService
+    lesson_service: BaseLessonService
+    group_lesson_service: BaseGroupLessonService
+    group_lesson_change_service: BaseGroupLessonChangeService
+    group_schedule_snapshot_service: BaseGroupScheduleSnapshotService
+    timetable_index_service: BaseTimetableIndexService
+    cache_service: BaseCacheService
+
+    uuid_validator_service: BaseUuidValidatorService
+    group_lesson_validator_service: BaseGroupLessonValidatorService
+
+    def apply(self, group: GroupEntity, operations: list[GroupLessonOperation]) -> list[GroupLessonOperationResult]:
+        results = [GroupLessonOperationResult(operation=operation) for operation in operations]
+        for result in results:
+            try:
+                self.uuid_validator_service.validate(uuid_list=result.operation.lesson_uuids)
+            except ServiceException as error:
+                result.error = error
+
+        self._load_lessons(results)
+        self._validate_additions(group=group, results=results)
+
+        additions, removals = self._replay(group=group, results=results)
+        if not additions and not removals:
+            return results
+
+        with transaction.atomic():
+            self.group_lesson_service.delete_many(group_lessons=list(removals.values()))
+            self.group_lesson_service.save_many(group_lessons=list(additions.values()))
+            self.lesson_service.delete_orphans(lesson_ids={lesson_id for lesson_id, _ in removals})
+            self.group_service.bump_schedule_updated_at(group_id=group.id)
+            self.group_lesson_change_service.record(added=additions.values(), removed=removals.values())
+
+        self.timetable_index_service.record(added=additions.values(), removed=removals.values())
+        self.group_schedule_snapshot_service.rebuild(group_uuid=group.uuid)
+        self.cache_service.invalidate_namespace_list(namespaces=[
+            dict(model_prefix='group', func_prefix='all'),
+            *(
+                dict(model_prefix=model_prefix, identifier=uuid, func_prefix='lessons')
+                for model_prefix, uuid in self._timetable_owners(results)
+            ),
+        ])
+        return results
+
+    def _load_lessons(self, results: list[GroupLessonOperationResult]) -> None:
+        pending = [result for result in results if result.is_applied]
+        lessons = self.lesson_service.get_by_uuids(
+            lesson_uuids={uuid for result in pending for uuid in result.operation.lesson_uuids},
+        )
+        for result in pending:
+            missing = [uuid for uuid in result.operation.lesson_uuids if uuid not in lessons]
+            if missing:
+                result.error = LessonNotFoundException(uuid=missing[0])
+                continue
+            result.lesson = lessons[result.operation.lesson_uuid]
+            if result.operation.old_lesson_uuid is not None:
+                result.old_lesson = lessons[result.operation.old_lesson_uuid]
+
+    def _validate_additions(self, group: GroupEntity, results: list[GroupLessonOperationResult]) -> None:
+        additions = [
+            result for result in results
+            if result.is_applied and result.operation.action != GroupLessonAction.REMOVE
+        ]
+        errors = self.group_lesson_validator_service.validate_many(
+            group_lessons=[
+                GroupLessonEntity(group=group, subgroup=result.operation.subgroup, lesson=result.lesson)
+                for result in additions
+            ],
+            old_group_lessons=[
+                None if result.old_lesson is None
+                else GroupLessonEntity(group=group, subgroup=result.operation.subgroup, lesson=result.old_lesson)
+                for result in additions
+            ],
+        )
+        for result, error in zip(additions, errors):
+            result.error = error
+
+    def _replay(
+            self,
+            group: GroupEntity,
+            results: list[GroupLessonOperationResult],
+    ) -> tuple[dict[AssignmentKey, GroupLessonEntity], dict[AssignmentKey, GroupLessonEntity]]:
+        # Clashes with the schedule before the batch are checked again
+        # below, once the removals preceding them are known.
+        pending = [
+            result for result in results
+            if result.is_applied or isinstance(result.error, GroupLessonScheduleConflict)
+        ]
+        assigned = self.group_lesson_service.get_assigned(
+            group_id=group.id,
+            lesson_ids={
+                lesson.id for result in pending for lesson in (result.lesson, result.old_lesson) if lesson is not None
+            },
+        )
+        additions: dict[AssignmentKey, GroupLessonEntity] = {}
+        removals: dict[AssignmentKey, GroupLessonEntity] = {}
+        # The additions accepted so far, which later ones must not clash with.
+        accepted = TimetableIndex()
+
+        def add(lesson: LessonEntity, subgroup: Subgroup | None) -> None:
+            key = (lesson.id, subgroup)
+            assigned.add(key)
+            if removals.pop(key, None) is None:
+                additions[key] = GroupLessonEntity(group=group, subgroup=subgroup, lesson=lesson)
+                accepted.add(TimetableIndexEntry.from_group_lesson(additions[key]))
+
+        def remove(lesson: LessonEntity, subgroup: Subgroup | None) -> None:
+            key = (lesson.id, subgroup)
+            assigned.discard(key)
+            added_here = additions.pop(key, None)
+            if added_here is None:
+                removals[key] = GroupLessonEntity(group=group, subgroup=subgroup, lesson=lesson)
+            else:
+                accepted.remove(TimetableIndexEntry.from_group_lesson(added_here))
+
+        for result in pending:
+            action, subgroup = result.operation.action, result.operation.subgroup
+            removed = result.lesson if action == GroupLessonAction.REMOVE else result.old_lesson
+            added = result.lesson if action != GroupLessonAction.REMOVE else None
+
+            if removed is not None and (removed.id, subgroup) not in assigned:
+                result.error = GroupLessonDeleteError(
+                    group_number=group.number,
+                    lesson_uuid=removed.uuid,
+                    subgroup=subgroup,
+                )
+                continue
+            if added is not None and (added.id, subgroup) in assigned:
+                result.error = GroupLessonAlreadyExists(
+                    group_uuid=group.uuid,
+                    lesson_uuid=added.uuid,
+                    subgroup=subgroup,
+                )
+                continue
+            if added is not None:
+                result.error = self._find_conflict(
+                    group_lesson=GroupLessonEntity(group=group, subgroup=subgroup, lesson=added),
+                    replaced=None if removed is None else GroupLessonEntity(
+                        group=group, subgroup=subgroup, lesson=removed,
+                    ),
+                    removed=removals.values(),
+                    accepted=accepted,
+                    recheck=result.error is not None,
+                )
+                if result.error is not None:
+                    continue
+
+            if removed is not None:
+                remove(removed, subgroup)
+            if added is not None:
+                add(added, subgroup)
+
+        return additions, removals
+
+    def _find_conflict(
+            self,
+            group_lesson: GroupLessonEntity,
+            replaced: GroupLessonEntity | None,
+            removed: Iterable[GroupLessonEntity],
+            accepted: TimetableIndex,
+            recheck: bool,
+    ) -> GroupLessonScheduleConflict | None:
+        """The clash of `group_lesson` with the additions `accepted` so far
+        and, if `recheck`, with the schedule without the assignments the
+        batch has `removed`; an addition that passed validation does not
+        clash with the schedule, so it is not looked up again."""
+        conflicts = accepted.conflicts_for(
+            TimetableIndexEntry.from_group_lesson(group_lesson),
+            ignore=[] if replaced is None else [TimetableIndexEntry.from_group_lesson(replaced)],
+        )
+        if recheck:
+            conflicts += self.timetable_index_service.find_conflicts(
+                group_lesson=group_lesson,
+                replaced=replaced,
+                removed=removed,
+            )
+        if not conflicts:
+            return None
+        return GroupLessonScheduleConflict(
+            group_uuid=group_lesson.group.uuid,
+            lesson_uuid=group_lesson.lesson.uuid,
+            subgroup=group_lesson.subgroup,
+            conflicts=[asdict(conflict) for conflict in conflicts],
+        )
+
+    @staticmethod
+    def _timetable_owners(results: list[GroupLessonOperationResult]) -> set[tuple[str, str]]:
+        """`(model prefix, uuid)` of the teachers and rooms whose timetables
+        the applied operations changed."""
+        return {
+            owner
+            for result in results if result.is_applied
+            for lesson in (result.lesson, result.old_lesson) if lesson is not None
+            for owner in (('teacher', lesson.teacher.uuid), ('room', lesson.room.uuid))
+        }
@@ -0,0 +1,103 @@
+from django.db import transaction
+from django.db.models import Max
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from datetime import datetime
+from typing import Iterable
+
+from core.apps.common.models import GroupLessonChangeKind
+from core.apps.schedule.entities.group_lessons import (
+    GroupLesson as GroupLessonEntity,
+    GroupLessonChange as GroupLessonChangeEntity,
+)
+from core.apps.schedule.models.group import GroupLessonChange as GroupLessonChangeModel
+
+
+GROUP_LESSON_CHANGE_BATCH_SIZE = 1000
+
+
+class BaseGroupLessonChangeService(ABC):
+    @abstractmethod
+    def record(
+            self,
+            added: Iterable[GroupLessonEntity] = (),
+            removed: Iterable[GroupLessonEntity] = (),
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def get_version(self, group_id: int) -> int:
+        ...
+
+    @abstractmethod
+    def get_changes(self, group_id: int, after: int, until: int) -> list[GroupLessonChangeEntity]:
+        ...
+
+    @abstractmethod
+    def compact(self, before: datetime) -> int:
+        ...
+
+
+class ORMGroupLessonChangeService(BaseGroupLessonChangeService):
+    """Append-only log of the lesson cells added to and removed from
+    groups; the id of a row is the group's version after that change.
+
+    Writers call `record` inside their transaction, after bumping the
+    group's `schedule_updated_at`: the UPDATE locks the group row, so the
+    ids of one group's changes are handed out in commit order and a
+    reader never sees a version before an earlier one has committed.
+
+    """
+
+    def record(
+            self,
+            added: Iterable[GroupLessonEntity] = (),
+            removed: Iterable[GroupLessonEntity] = (),
+    ) -> None:
+        rows = [
+            GroupLessonChangeModel(
+                group_id=group_lesson.group.id,
+                kind=kind,
+                lesson_uuid=group_lesson.lesson.uuid,
+                subgroup=group_lesson.subgroup,
+            )
+            for kind, group_lessons in ((GroupLessonChangeKind.REMOVE, removed), (GroupLessonChangeKind.ADD, added))
+            for group_lesson in group_lessons
+        ]
+        if rows:
+            GroupLessonChangeModel.objects.bulk_create(rows, batch_size=GROUP_LESSON_CHANGE_BATCH_SIZE)
+
+    def get_version(self, group_id: int) -> int:
+        version = GroupLessonChangeModel.objects.filter(group_id=group_id).aggregate(version=Max('id'))['version']
+        return version or 0
+
+    def get_changes(self, group_id: int, after: int, until: int) -> list[GroupLessonChangeEntity]:
+        changes = GroupLessonChangeModel.objects.filter(group_id=group_id, id__gt=after, id__lte=until).order_by('id')
+        return [change.to_entity() for change in changes]
+
+    def compact(self, before: datetime) -> int:
+        """Drop the changes made before `before`.
+
+        The newest of each group's dropped changes is kept as a `RESET`
+        entry, so a client whose version predates it still learns that
+        its history is gone and reloads the whole timetable, while
+        clients past it are unaffected. Returns the number of rows
+        deleted.
+
+        """
+        stale = GroupLessonChangeModel.objects.filter(created_at__lt=before)
+        horizons = list(stale.values('group_id').annotate(horizon=Max('id')).values_list('horizon', flat=True))
+        if not horizons:
+            return 0
+
+        with transaction.atomic():
+            GroupLessonChangeModel.objects.filter(id__in=horizons).update(
+                kind=GroupLessonChangeKind.RESET,
+                lesson_uuid=None,
+                subgroup=None,
+            )
+            deleted, _ = stale.exclude(id__in=horizons).delete()
+        return deleted
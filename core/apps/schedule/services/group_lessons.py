@@ -1,7 +1,12 @@
+from django.db.models import Q
+
 from abc import (
     ABC,
     abstractmethod,
 )
+from functools import reduce
+from operator import or_
+from typing import Iterable
 
 from core.apps.common.models import Subgroup
 from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
@@ -9,15 +14,34 @@ from core.apps.schedule.exceptions.group_lesson import GroupLessonDeleteError
 from core.apps.schedule.models.group import GroupLesson as GroupLessonModel
 
 
+GROUP_LESSON_BATCH_SIZE = 1000
+
+
 class BaseGroupLessonService(ABC):
     @abstractmethod
     def save(self, group_lesson: GroupLessonEntity) -> None:
         ...
 
+    @abstractmethod
+    def save_many(self, group_lessons: list[GroupLessonEntity]) -> None:
+        ...
+
+    @abstractmethod
+    def delete_many(self, group_lessons: list[GroupLessonEntity]) -> None:
+        ...
+
     @abstractmethod
     def check_exists(self, group_lesson: GroupLessonEntity) -> bool:
         ...
 
+    @abstractmethod
+    def find_existing(self, group_lessons: list[GroupLessonEntity]) -> set[tuple[int, int, Subgroup | None]]:
+        ...
+
+    @abstractmethod
+    def get_assigned(self, group_id: int, lesson_ids: Iterable[int]) -> set[tuple[int, Subgroup | None]]:
+        ...
+
     @abstractmethod
     def check_lesson_belongs_to_any_group(self, lesson_id: int) -> bool:
         ...
@@ -40,6 +64,19 @@ class ORMGroupLessonService(BaseGroupLessonService):
         group_lesson_dto = GroupLessonModel.from_entity(entity=group_lesson)
         group_lesson_dto.save()
 
+    def save_many(self, group_lessons: list[GroupLessonEntity]) -> None:
+        """Insert the assignments in batches of `GROUP_LESSON_BATCH_SIZE`
+        rows; ones that already exist are skipped."""
+        GroupLessonModel.objects.bulk_create(
+            [GroupLessonModel.from_entity(entity=group_lesson) for group_lesson in group_lessons],
+            batch_size=GROUP_LESSON_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+    def delete_many(self, group_lessons: list[GroupLessonEntity]) -> None:
+        if group_lessons:
+            GroupLessonModel.objects.filter(self._match_any(group_lessons)).delete()
+
     def check_exists(self, group_lesson: GroupLessonEntity) -> bool:
         return GroupLessonModel.objects.filter(
             group_id=group_lesson.group.id,
@@ -47,6 +84,31 @@ class ORMGroupLessonService(BaseGroupLessonService):
             subgroup=group_lesson.subgroup,
         ).exists()
 
+    def find_existing(self, group_lessons: list[GroupLessonEntity]) -> set[tuple[int, int, Subgroup | None]]:
+        """`(group_id, lesson_id, subgroup)` of the given assignments that are
+        already stored, read with a single query."""
+        if not group_lessons:
+            return set()
+        return set(
+            GroupLessonModel.objects.
+            filter(self._match_any(group_lessons)).
+            values_list('group_id', 'lesson_id', 'subgroup'),
+        )
+
+    def get_assigned(self, group_id: int, lesson_ids: Iterable[int]) -> set[tuple[int, Subgroup | None]]:
+        return set(
+            GroupLessonModel.objects.
+            filter(group_id=group_id, lesson_id__in=list(lesson_ids)).
+            values_list('lesson_id', 'subgroup'),
+        )
+
+    @staticmethod
+    def _match_any(group_lessons: list[GroupLessonEntity]) -> Q:
+        return reduce(or_, (
+            Q(group_id=group_lesson.group.id, lesson_id=group_lesson.lesson.id, subgroup=group_lesson.subgroup)
+            for group_lesson in group_lessons
+        ))
+
     def check_lesson_belongs_to_any_group(self, lesson_id: int) -> bool:
         return GroupLessonModel.objects.filter(
             lesson_id=lesson_id,
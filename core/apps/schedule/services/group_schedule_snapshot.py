@@ -0,0 +1,182 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    replace,
+)
+
+from core.apps.common.cache.decorator import cache_decorator
+from core.apps.common.cache.service import (
+    BaseCacheService,
+    ReservedCacheKey,
+)
+from core.apps.common.cache.timeouts import Timeout
+from core.apps.schedule.entities.timetable import Timetable
+from core.apps.schedule.entities.views import GroupScheduleSnapshot
+from core.apps.schedule.filters.group import LessonFilter
+from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.lesson import BaseLessonService
+
+
+SNAPSHOT_CACHE_SUFFIX = 'timetable'
+
+
+class BaseGroupScheduleSnapshotService(ABC):
+    @abstractmethod
+    def get(self, group_uuid: str) -> GroupScheduleSnapshot:
+        ...
+
+    @abstractmethod
+    def get_many(self, group_uuids: list[str]) -> dict[str, GroupScheduleSnapshot]:
+        ...
+
+    @abstractmethod
+    def rebuild(self, group_uuid: str) -> GroupScheduleSnapshot:
+        ...
+
+    @abstractmethod
+    def slice(self, snapshot: GroupScheduleSnapshot, filters: LessonFilter) -> Timetable:
+        ...
+
+
+@dataclass
+class CachedGroupScheduleSnapshotService(BaseGroupScheduleSnapshotService):
+    """Keeps the whole timetable of a group (both parities, every subgroup)
+    as a single cached document.
+
+    The document lives under `group_<uuid>_lessons_timetable`, so bumping
+    either the group's namespace or the `group` + `lessons` namespace
+    evicts it, and so does `invalidate_dependents` for any subject,
+    teacher or room it lists. Writers regenerate it via `rebuild` right
+    after bumping `schedule_updated_at`; readers only slice it in memory.
+    `changes_version` is read along with the group, before the lessons,
+    so the change log past it brings the snapshot up to date even if a
+    write landed in between.
+
+    """
+    group_service: BaseGroupService
+    lesson_service: BaseLessonService
+    cache_service: BaseCacheService
+
+    @cache_decorator.get_or_set_cache(
+        model_prefix='group',
+        identifier=lambda kw: kw['group_uuid'],
+        func_prefix='lessons',
+        filters=SNAPSHOT_CACHE_SUFFIX,
+        timeout=Timeout.MONTH,
+        dependencies=lambda snapshot: snapshot.timetable.dependencies(),
+    )
+    def get(self, group_uuid: str) -> GroupScheduleSnapshot:
+        return self._build(group_uuid=group_uuid)
+
+    def get_many(self, group_uuids: list[str]) -> dict[str, GroupScheduleSnapshot]:
+        """Snapshots of `group_uuids` by uuid, from the same cache entries
+        as `get`; unknown groups are left out.
+
+        Cached snapshots are fetched with one MGET. The missing ones are
+        built together: one query for the groups and their change-log
+        versions, one for all of their lessons. They are then written back in
+        one pipeline. Like `get`, this creates no namespace counters for
+        groups that do not exist.
+
+        """
+        reserved = self.cache_service.reserve_cache_keys(
+            'group',
+            identifiers=group_uuids,
+            func_prefix='lessons',
+            filters=SNAPSHOT_CACHE_SUFFIX,
+        )
+        cached = self.cache_service.get_cache_values(
+            keys=[cache_key.key for cache_key in reserved.values() if not cache_key.unseeded],
+        )
+        snapshots = {uuid: cached[cache_key.key] for uuid, cache_key in reserved.items() if cache_key.key in cached}
+
+        missing = [uuid for uuid in group_uuids if uuid not in snapshots]
+        if not missing:
+            return snapshots
+
+        dependents_version = self.cache_service.get_dependents_version()
+        built = self._build_many(group_uuids=missing)
+        if built:
+            self.cache_service.add_dependencies_many(entries=[
+                (
+                    {'model_prefix': 'group', 'identifier': uuid, 'func_prefix': 'lessons'},
+                    snapshot.timetable.dependencies(),
+                )
+                for uuid, snapshot in built.items()
+            ])
+        # Only groups that exist get namespace counters, and only if no
+        # write created them or invalidated a dependency while the
+        # snapshots were being built.
+        claimed = self.cache_service.claim_cache_keys(
+            reserved={uuid: reserved[uuid] for uuid in built},
+            dependents_version=dependents_version,
+        )
+        if claimed:
+            self.cache_service.set_cache_many(
+                values={reserved[uuid].key: built[uuid] for uuid in claimed},
+                timeout=Timeout.MONTH,
+            )
+        snapshots.update(built)
+        return snapshots
+
+    def rebuild(self, group_uuid: str) -> GroupScheduleSnapshot:
+        # A new generation retires the old document and every ETag derived
+        # from it; the fresh snapshot is then stored under the new key,
+        # unless a dependency was invalidated while it was being built.
+        dependents_version = self.cache_service.get_dependents_version()
+        self.cache_service.invalidate_namespace(model_prefix='group', identifier=group_uuid)
+        snapshot = self._build(group_uuid=group_uuid)
+        self.cache_service.add_dependencies(
+            namespace={'model_prefix': 'group', 'identifier': group_uuid, 'func_prefix': 'lessons'},
+            dependencies=snapshot.timetable.dependencies(),
+        )
+        cache_key = self.cache_service.generate_cache_key(
+            model_prefix='group',
+            identifier=group_uuid,
+            func_prefix='lessons',
+            filters=SNAPSHOT_CACHE_SUFFIX,
+        )
+        if self.cache_service.claim_cache_key(ReservedCacheKey(key=cache_key), dependents_version=dependents_version):
+            self.cache_service.set_cache(key=cache_key, value=snapshot, timeout=Timeout.MONTH)
+        return snapshot
+
+    def slice(self, snapshot: GroupScheduleSnapshot, filters: LessonFilter) -> Timetable:
+        timetable = snapshot.timetable
+        entries = []
+        for entry in timetable.entries:
+            if timetable.timeslot_of(entry).is_even != filters.is_even:
+                continue
+            if filters.subgroup is None:
+                entries.append(entry)
+            elif filters.subgroup in entry.subgroups:
+                entries.append(replace(entry, subgroups=[filters.subgroup]))
+        return timetable.with_entries(entries)
+
+    def _build(self, group_uuid: str) -> GroupScheduleSnapshot:
+        group, changes_version = self.group_service.get_by_uuid_with_changes_version(group_uuid=group_uuid)
+        return GroupScheduleSnapshot(
+            group=group,
+            version=group.schedule_updated_at,
+            changes_version=changes_version,
+            timetable=self.lesson_service.get_all_lessons_with_subgroups_for_group(group_id=group.id),
+        )
+
+    def _build_many(self, group_uuids: list[str]) -> dict[str, GroupScheduleSnapshot]:
+        if not group_uuids:
+            return {}
+        groups = self.group_service.get_by_uuids_with_changes_versions(group_uuids=group_uuids)
+        timetables = self.lesson_service.get_all_lessons_with_subgroups_for_groups(
+            group_ids=[group.id for group, _ in groups.values()],
+        )
+        return {
+            uuid: GroupScheduleSnapshot(
+                group=group,
+                version=group.schedule_updated_at,
+                changes_version=changes_version,
+                timetable=timetables[group.id],
+            )
+            for uuid, (group, changes_version) in groups.items()
+        }
@@ -1,15 +1,19 @@
-from django.db.models import Q
+from django.db.models import (
+    Q,
+    QuerySet,
+)
 
 from abc import (
     ABC,
     abstractmethod,
 )
+from typing import Iterable
 
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
-from core.apps.schedule.entities.views import (
-    GroupForLessonView,
-    LessonForGroupView,
-    LessonWithGroupsView,
+from core.apps.schedule.entities.timetable import (
+    Timetable,
+    TimetableEntry,
+    TimetableGroup,
 )
 from core.apps.schedule.exceptions.lesson import (
     LessonDeleteError,
@@ -25,12 +29,20 @@ class BaseLessonService(ABC):
     def get_or_create(self, lesson: LessonEntity) -> LessonEntity:
         ...
 
+    @abstractmethod
+    def get_or_create_many(self, lessons: list[LessonEntity]) -> list[int]:
+        ...
+
     @abstractmethod
     def get_by_uuid(self, lesson_uuid: str) -> LessonEntity:
         ...
 
     @abstractmethod
-    def get_lessons_with_groups(self, lesson_filter: Q) -> list[LessonWithGroupsView]:
+    def get_by_uuids(self, lesson_uuids: Iterable[str]) -> dict[str, LessonEntity]:
+        ...
+
+    @abstractmethod
+    def get_lessons_with_groups(self, lesson_filter: Q) -> Timetable:
         ...
 
     @abstractmethod
@@ -38,7 +50,15 @@ class BaseLessonService(ABC):
             self,
             group_id: int,
             filter_query: LessonFilter,
-    ) -> list[LessonForGroupView]:
+    ) -> Timetable:
+        ...
+
+    @abstractmethod
+    def get_all_lessons_with_subgroups_for_group(self, group_id: int) -> Timetable:
+        ...
+
+    @abstractmethod
+    def get_all_lessons_with_subgroups_for_groups(self, group_ids: Iterable[int]) -> dict[int, Timetable]:
         ...
 
     @abstractmethod
@@ -46,7 +66,15 @@ class BaseLessonService(ABC):
             self,
             teacher_id: int,
             filter_query: LessonFilter,
-    ) -> list[LessonWithGroupsView]:
+    ) -> Timetable:
+        ...
+
+    @abstractmethod
+    def get_lessons_with_groups_for_room(
+            self,
+            room_id: int,
+            filter_query: LessonFilter,
+    ) -> Timetable:
         ...
 
     @abstractmethod
@@ -65,6 +93,10 @@ class BaseLessonService(ABC):
     def delete_by_uuid(self, lesson_uuid: str) -> None:
         ...
 
+    @abstractmethod
+    def delete_orphans(self, lesson_ids: Iterable[int]) -> None:
+        ...
+
 
 class ORMLessonService(BaseLessonService):
 
@@ -78,6 +110,29 @@ class ORMLessonService(BaseLessonService):
         )
         return lesson_model.to_entity()
 
+    def get_or_create_many(self, lessons: list[LessonEntity]) -> list[int]:
+        """Upsert `lessons` with a single INSERT .. ON CONFLICT on the lesson
+        combination and return their ids in input order.
+
+        Rows that already exist keep their uuid; only `updated_at` is
+        touched.
+
+        """
+        lesson_models: dict[tuple, LessonModel] = {}
+        for lesson in lessons:
+            lesson_models.setdefault(self._combination(lesson), LessonModel.from_entity(lesson))
+        LessonModel.objects.bulk_create(
+            list(lesson_models.values()),
+            update_conflicts=True,
+            unique_fields=['subject', 'teacher', 'room', 'timeslot', 'type'],
+            update_fields=['updated_at'],
+        )
+        return [lesson_models[self._combination(lesson)].id for lesson in lessons]
+
+    @staticmethod
+    def _combination(lesson: LessonEntity) -> tuple:
+        return lesson.subject.id, lesson.teacher.id, lesson.room.id, lesson.timeslot.id, lesson.type
+
     def get_by_uuid(self, lesson_uuid: str) -> LessonEntity:
         try:
             lesson = (
@@ -90,6 +145,14 @@ class ORMLessonService(BaseLessonService):
 
         return lesson.to_entity()
 
+    def get_by_uuids(self, lesson_uuids: Iterable[str]) -> dict[str, LessonEntity]:
+        lessons = (
+            LessonModel.objects.
+            select_related("subject", "teacher", "room", "timeslot").
+            filter(lesson_uuid__in=list(lesson_uuids))
+        )
+        return {str(lesson.lesson_uuid): lesson.to_entity() for lesson in lessons}
+
     def _build_group_lesson_filter(self, filters: LessonFilter) -> Q:
         query = Q()
         if filters.subgroup is not None:
@@ -98,7 +161,29 @@ class ORMLessonService(BaseLessonService):
             query &= Q(lesson__timeslot__is_even=filters.is_even)
         return query
 
-    def get_lessons_with_groups(self, lesson_filter: Q) -> list[LessonWithGroupsView]:
+    @staticmethod
+    def _add_timetable_entry(timetable: Timetable, lesson: LessonModel) -> TimetableEntry:
+        if lesson.subject_id not in timetable.subjects:
+            timetable.subjects[lesson.subject_id] = lesson.subject.to_entity()
+        if lesson.teacher_id not in timetable.teachers:
+            timetable.teachers[lesson.teacher_id] = lesson.teacher.to_entity()
+        if lesson.room_id not in timetable.rooms:
+            timetable.rooms[lesson.room_id] = lesson.room.to_entity()
+        if lesson.timeslot_id not in timetable.timeslots:
+            timetable.timeslots[lesson.timeslot_id] = lesson.timeslot.to_entity()
+
+        entry = TimetableEntry(
+            lesson_uuid=str(lesson.lesson_uuid),
+            type=lesson.type,
+            subject_id=lesson.subject_id,
+            teacher_id=lesson.teacher_id,
+            room_id=lesson.room_id,
+            timeslot_id=lesson.timeslot_id,
+        )
+        timetable.entries.append(entry)
+        return entry
+
+    def get_lessons_with_groups(self, lesson_filter: Q) -> Timetable:
         rows = (
             GroupLessonModel.objects
             .filter(lesson_filter)
@@ -110,57 +195,84 @@ class ORMLessonService(BaseLessonService):
             .order_by('lesson__timeslot__day', 'lesson__timeslot__ord_number', 'group__number')
         )
 
-        lesson_bucket: dict[int, LessonWithGroupsView] = {}
-        group_bucket: dict[tuple[int, int], GroupForLessonView] = {}
+        timetable = Timetable()
+        entry_bucket: dict[int, TimetableEntry] = {}
+        group_bucket: dict[tuple[int, int], TimetableGroup] = {}
 
         for row in rows:
-            if row.lesson_id not in lesson_bucket:
-                lesson_bucket[row.lesson_id] = LessonWithGroupsView(
-                    lesson=row.lesson.to_entity(),
-                    groups=[],
-                )
+            if row.lesson_id not in entry_bucket:
+                entry_bucket[row.lesson_id] = self._add_timetable_entry(timetable, row.lesson)
+            if row.group_id not in timetable.groups:
+                timetable.groups[row.group_id] = row.group.to_entity()
             key = (row.lesson_id, row.group_id)
             if key not in group_bucket:
-                gv = GroupForLessonView(group=row.group.to_entity(), subgroups=[])
-                group_bucket[key] = gv
-                lesson_bucket[row.lesson_id].groups.append(gv)
+                group_bucket[key] = TimetableGroup(group_id=row.group_id)
+                entry_bucket[row.lesson_id].groups.append(group_bucket[key])
             if row.subgroup is not None:
                 group_bucket[key].subgroups.append(row.subgroup)
 
-        return list(lesson_bucket.values())
+        return timetable
 
     def get_lessons_with_groups_for_teacher(
             self,
             teacher_id: int,
             filter_query: LessonFilter,
-    ) -> list[LessonWithGroupsView]:
+    ) -> Timetable:
         query = self._build_group_lesson_filter(filter_query) & Q(lesson__teacher_id=teacher_id)
         return self.get_lessons_with_groups(query)
 
+    def get_lessons_with_groups_for_room(
+            self,
+            room_id: int,
+            filter_query: LessonFilter,
+    ) -> Timetable:
+        query = self._build_group_lesson_filter(filter_query) & Q(lesson__room_id=room_id)
+        return self.get_lessons_with_groups(query)
+
     def get_lessons_with_subgroups_for_group(
             self,
             group_id: int,
             filter_query: LessonFilter,
-    ) -> list[LessonForGroupView]:
+    ) -> Timetable:
         query = self._build_group_lesson_filter(filter_query) & Q(group_id=group_id)
-        rows = (
-            GroupLessonModel.objects
-            .filter(query)
-            .select_related('lesson__subject', 'lesson__teacher', 'lesson__room', 'lesson__timeslot')
-            .order_by('lesson__timeslot__day', 'lesson__timeslot__ord_number')
-        )
+        return self._get_lessons_with_subgroups(query)
 
-        bucket: dict[int, LessonForGroupView] = {}
-        for row in rows:
+    def get_all_lessons_with_subgroups_for_group(self, group_id: int) -> Timetable:
+        return self._get_lessons_with_subgroups(Q(group_id=group_id))
+
+    def get_all_lessons_with_subgroups_for_groups(self, group_ids: Iterable[int]) -> dict[int, Timetable]:
+        """The timetable of every group in `group_ids`, read with a single
+        query; a group without lessons gets an empty one."""
+        group_ids = list(group_ids)
+        timetables = {group_id: Timetable() for group_id in group_ids}
+        buckets: dict[tuple[int, int], TimetableEntry] = {}
+        for row in self._lessons_with_subgroups(Q(group_id__in=group_ids)):
+            key = (row.group_id, row.lesson_id)
+            if key not in buckets:
+                buckets[key] = self._add_timetable_entry(timetables[row.group_id], row.lesson)
+            if row.subgroup is not None:
+                buckets[key].subgroups.append(row.subgroup)
+        return timetables
+
+    def _get_lessons_with_subgroups(self, query: Q) -> Timetable:
+        timetable = Timetable()
+        bucket: dict[int, TimetableEntry] = {}
+        for row in self._lessons_with_subgroups(query):
             if row.lesson_id not in bucket:
-                bucket[row.lesson_id] = LessonForGroupView(
-                    lesson=row.lesson.to_entity(),
-                    subgroups=[],
-                )
+                bucket[row.lesson_id] = self._add_timetable_entry(timetable, row.lesson)
             if row.subgroup is not None:
                 bucket[row.lesson_id].subgroups.append(row.subgroup)
 
-        return list(bucket.values())
+        return timetable
+
+    @staticmethod
+    def _lessons_with_subgroups(query: Q) -> QuerySet[GroupLessonModel]:
+        return (
+            GroupLessonModel.objects
+            .filter(query)
+            .select_related('lesson__subject', 'lesson__teacher', 'lesson__room', 'lesson__timeslot')
+            .order_by('lesson__timeslot__day', 'lesson__timeslot__ord_number', 'lesson__timeslot__is_even')
+        )
 
     def check_if_teacher_has_lessons(self, teacher_id: int) -> bool:
         return GroupLessonModel.objects.filter(lesson__teacher_id=teacher_id).exists()
@@ -178,3 +290,6 @@ class ORMLessonService(BaseLessonService):
 
         if not is_deleted:
             raise LessonDeleteError(uuid=lesson_uuid)
+
+    def delete_orphans(self, lesson_ids: Iterable[int]) -> None:
+        LessonModel.objects.filter(id__in=list(lesson_ids), lesson_groups__isnull=True).delete()
@@ -9,6 +9,11 @@ from typing import Iterable
 
 from core.api.filters import PaginationIn
 from core.apps.common.filters import SearchFilter as SearchFiltersEntity
+from core.apps.common.pagination import (
+    Page,
+    paginate,
+)
+from core.apps.common.search import search_text_query
 from core.apps.schedule.entities.room import Room as RoomEntity
 from core.apps.schedule.exceptions.room import (
     RoomAlreadyExistException,
@@ -19,6 +24,9 @@ from core.apps.schedule.exceptions.room import (
 from core.apps.schedule.models import Room as RoomModel
 
 
+ROOM_LIST_ORDERING = ('number', 'id')
+
+
 class BaseRoomService(ABC):
     @abstractmethod
     def create(self, number: str) -> RoomEntity:
@@ -29,19 +37,19 @@ class BaseRoomService(ABC):
         ...
 
     @abstractmethod
-    def get_list(self, filters: SearchFiltersEntity, pagination: PaginationIn) -> Iterable[RoomEntity]:
+    def get_page(self, filters: SearchFiltersEntity, pagination: PaginationIn) -> Page[RoomEntity]:
         ...
 
     @abstractmethod
-    def get_count(self, filters: SearchFiltersEntity) -> int:
+    def get_by_uuid(self, room_uuid: str) -> RoomEntity:
         ...
 
     @abstractmethod
-    def get_by_uuid(self, room_uuid: str) -> RoomEntity:
+    def get_by_id(self, room_id: int) -> RoomEntity:
         ...
 
     @abstractmethod
-    def get_by_id(self, room_id: int) -> RoomEntity:
+    def get_by_uuids(self, room_uuids: Iterable[str]) -> dict[str, RoomEntity]:
         ...
 
     @abstractmethod
@@ -74,9 +82,7 @@ class ORMRoomService(BaseRoomService):
         query = Q()
 
         if filters.search is not None:
-            query &= Q(number__icontains=filters.search) | Q(
-                description__icontains=filters.search,
-            )
+            query &= search_text_query(filters.search)
 
         return query
 
@@ -90,15 +96,14 @@ class ORMRoomService(BaseRoomService):
     def get_all(self) -> list[RoomEntity]:
         return [room.to_entity() for room in RoomModel.objects.all()]
 
-    def get_list(self, filters: SearchFiltersEntity, pagination: PaginationIn) -> list[RoomEntity]:
-        query = self._build_room_query(filters)
-        qs = RoomModel.objects.filter(query)[pagination.offset:pagination.offset + pagination.limit]
-        return [room.to_entity() for room in qs]
-
-    def get_count(self, filters: SearchFiltersEntity) -> int:
+    def get_page(self, filters: SearchFiltersEntity, pagination: PaginationIn) -> Page[RoomEntity]:
         query = self._build_room_query(filters)
-
-        return RoomModel.objects.filter(query).count()
+        return paginate(
+            RoomModel.objects.filter(query),
+            ordering=ROOM_LIST_ORDERING,
+            pagination=pagination,
+            to_entity=lambda room: room.to_entity(),
+        )
 
     def get_by_uuid(self, room_uuid: str) -> RoomEntity:
         try:
@@ -116,6 +121,10 @@ class ORMRoomService(BaseRoomService):
 
         return room.to_entity()
 
+    def get_by_uuids(self, room_uuids: Iterable[str]) -> dict[str, RoomEntity]:
+        rooms = RoomModel.objects.filter(room_uuid__in=list(room_uuids))
+        return {str(room.room_uuid): room.to_entity() for room in rooms}
+
     def check_exists_by_number(self, room_number: str) -> bool:
         return RoomModel.objects.filter(number=room_number).exists()
 
@@ -128,12 +137,14 @@ class ORMRoomService(BaseRoomService):
 
         if not is_updated:
             raise RoomUpdateException(id=room_id)
+        RoomModel.refresh_search_text(pk=room_id)
 
     def update_description(self, room_id: int, description: str) -> None:
         is_updated = RoomModel.objects.filter(id=room_id).update(description=description)
 
         if not is_updated:
             raise RoomUpdateException(id=room_id)
+        RoomModel.refresh_search_text(pk=room_id)
 
     def soft_delete(self, room_id: int) -> None:
         is_updated = RoomModel.objects.filter(id=room_id).update(is_active=False)
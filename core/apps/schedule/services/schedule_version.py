@@ -0,0 +1,139 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+
+from core.apps.common.cache.service import BaseCacheService
+from core.apps.common.threads import sync_read_to_async
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
+from core.apps.schedule.services.room import BaseRoomService
+from core.apps.schedule.services.teacher import BaseTeacherService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+class BaseScheduleVersionService(ABC):
+    @abstractmethod
+    def get_all_groups_version(self) -> str:
+        ...
+
+    @abstractmethod
+    def get_group_lessons_version(self, group_uuid: str) -> str:
+        ...
+
+    @abstractmethod
+    def get_teacher_lessons_version(self, teacher_uuid: str) -> str:
+        ...
+
+    @abstractmethod
+    def get_room_lessons_version(self, room_uuid: str) -> str:
+        ...
+
+    @abstractmethod
+    async def aget_all_groups_version(self) -> str:
+        ...
+
+    @abstractmethod
+    async def aget_group_lessons_version(self, group_uuid: str) -> str:
+        ...
+
+    @abstractmethod
+    async def aget_teacher_lessons_version(self, teacher_uuid: str) -> str:
+        ...
+
+    @abstractmethod
+    async def aget_room_lessons_version(self, room_uuid: str) -> str:
+        ...
+
+
+@dataclass
+class CacheScheduleVersionService(BaseScheduleVersionService):
+    """Exposes the cache generation of the public schedule documents.
+
+    The generation changes whenever the cached document is invalidated,
+    and reading it costs a single cache round trip. This lets the API
+    answer a conditional GET before touching the use case.
+
+    The uuids come straight from the request, so a missing counter is
+    only created once the uuid is valid and names an existing row;
+    otherwise the lookup raises the same error the use case would. For a
+    group that lookup is the snapshot the use case is about to read.
+
+    """
+    cache_service: BaseCacheService
+    group_schedule_snapshot_service: BaseGroupScheduleSnapshotService
+    teacher_service: BaseTeacherService
+    room_service: BaseRoomService
+
+    uuid_validator_service: BaseUuidValidatorService
+
+    def get_all_groups_version(self) -> str:
+        return self.cache_service.get_generation(model_prefix='group', func_prefix='all')
+
+    def get_group_lessons_version(self, group_uuid: str) -> str:
+        version = self._read_lessons_version(model_prefix='group', identifier=group_uuid)
+        if version is None:
+            self.uuid_validator_service.validate(uuid_str=group_uuid)
+            self.group_schedule_snapshot_service.get(group_uuid=group_uuid)
+            version = self._seed_lessons_version(model_prefix='group', identifier=group_uuid)
+        return version
+
+    def get_teacher_lessons_version(self, teacher_uuid: str) -> str:
+        version = self._read_lessons_version(model_prefix='teacher', identifier=teacher_uuid)
+        if version is None:
+            self.uuid_validator_service.validate(uuid_str=teacher_uuid)
+            self.teacher_service.get_by_uuid(teacher_uuid=teacher_uuid)
+            version = self._seed_lessons_version(model_prefix='teacher', identifier=teacher_uuid)
+        return version
+
+    def get_room_lessons_version(self, room_uuid: str) -> str:
+        version = self._read_lessons_version(model_prefix='room', identifier=room_uuid)
+        if version is None:
+            self.uuid_validator_service.validate(uuid_str=room_uuid)
+            self.room_service.get_by_uuid(room_uuid=room_uuid)
+            version = self._seed_lessons_version(model_prefix='room', identifier=room_uuid)
+        return version
+
+    async def aget_all_groups_version(self) -> str:
+        return await self.cache_service.aget_generation(model_prefix='group', func_prefix='all')
+
+    async def aget_group_lessons_version(self, group_uuid: str) -> str:
+        version = await self._aread_lessons_version(model_prefix='group', identifier=group_uuid)
+        if version is None:
+            version = await sync_read_to_async(self.get_group_lessons_version)(group_uuid=group_uuid)
+        return version
+
+    async def aget_teacher_lessons_version(self, teacher_uuid: str) -> str:
+        version = await self._aread_lessons_version(model_prefix='teacher', identifier=teacher_uuid)
+        if version is None:
+            version = await sync_read_to_async(self.get_teacher_lessons_version)(teacher_uuid=teacher_uuid)
+        return version
+
+    async def aget_room_lessons_version(self, room_uuid: str) -> str:
+        version = await self._aread_lessons_version(model_prefix='room', identifier=room_uuid)
+        if version is None:
+            version = await sync_read_to_async(self.get_room_lessons_version)(room_uuid=room_uuid)
+        return version
+
+    def _read_lessons_version(self, model_prefix: str, identifier: str) -> str | None:
+        return self.cache_service.get_generation(
+            model_prefix=model_prefix,
+            identifier=identifier,
+            func_prefix='lessons',
+            seed=False,
+        )
+
+    async def _aread_lessons_version(self, model_prefix: str, identifier: str) -> str | None:
+        return await self.cache_service.aget_generation(
+            model_prefix=model_prefix,
+            identifier=identifier,
+            func_prefix='lessons',
+            seed=False,
+        )
+
+    def _seed_lessons_version(self, model_prefix: str, identifier: str) -> str:
+        return self.cache_service.get_generation(
+            model_prefix=model_prefix,
+            identifier=identifier,
+            func_prefix='lessons',
+        )
@@ -0,0 +1,104 @@
+from django.db.models import (
+    Case,
+    CharField,
+    Expression,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.functions import Concat
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import Iterable
+
+from core.apps.common.search import (
+    search_text_query,
+    search_tokens,
+)
+from core.apps.schedule.entities.search import (
+    SearchHit,
+    SearchKind,
+)
+from core.apps.schedule.models import (
+    Group as GroupModel,
+    Room as RoomModel,
+    Subject as SubjectModel,
+    Teacher as TeacherModel,
+)
+
+
+WORD_PREFIX_SCORE = 2
+INFIX_SCORE = 1
+
+
+class BaseSearchService(ABC):
+    @abstractmethod
+    def search(self, query: str, kinds: Iterable[SearchKind], limit: int) -> list[SearchHit]:
+        ...
+
+
+class ORMSearchService(BaseSearchService):
+    """Searches the normalized `search_text` of teachers, groups, rooms
+    and subjects (see `core.apps.common.search`) in one UNION query.
+
+    Every token of the query must occur in a record. A token that starts
+    a word scores `WORD_PREFIX_SCORE`, one found inside a word
+    `INFIX_SCORE`; hits come best first, then by label.
+
+    """
+
+    def search(self, query: str, kinds: Iterable[SearchKind], limit: int) -> list[SearchHit]:
+        tokens = search_tokens(query)
+        kinds = list(dict.fromkeys(kinds))
+        if not tokens or not kinds:
+            return []
+
+        first, *rest = [self._candidates(kind, query=query, tokens=tokens) for kind in kinds]
+        rows = first.union(*rest, all=True).order_by('-score', 'label')[:limit]
+        return [
+            SearchHit(kind=SearchKind(row['kind']), uuid=str(row['uuid']), label=row['label'], score=row['score'])
+            for row in rows
+        ]
+
+    def _candidates(self, kind: SearchKind, query: str, tokens: list[str]) -> QuerySet:
+        model, uuid_field, label = {
+            SearchKind.TEACHER: (
+                TeacherModel,
+                'teacher_uuid',
+                Concat('last_name', Value(' '), 'first_name', Value(' '), 'middle_name', output_field=CharField()),
+            ),
+            SearchKind.GROUP: (GroupModel, 'group_uuid', F('number')),
+            SearchKind.ROOM: (RoomModel, 'room_uuid', F('number')),
+            SearchKind.SUBJECT: (SubjectModel, 'subject_uuid', F('title')),
+        }[kind]
+        return (
+            model.objects.
+            filter(search_text_query(query)).
+            annotate(
+                kind=Value(kind.value, output_field=CharField()),
+                uuid=F(uuid_field),
+                label=label,
+                score=self._score(tokens),
+            ).
+            values('kind', 'uuid', 'label', 'score')
+        )
+
+    @staticmethod
+    def _score(tokens: list[str]) -> Expression:
+        score = Value(0, output_field=IntegerField())
+        for token in tokens:
+            score += Case(
+                When(
+                    Q(search_text__startswith=token) | Q(search_text__contains=f' {token}'),
+                    then=Value(WORD_PREFIX_SCORE),
+                ),
+                default=Value(INFIX_SCORE),
+                output_field=IntegerField(),
+            )
+        return score
@@ -3,6 +3,7 @@ from abc import (
     abstractmethod,
 )
 
+from core.apps.common.threads import sync_read_to_async
 from core.apps.schedule.entities.semester_settings import SemesterSettings as SemesterSettingsEntity
 from core.apps.schedule.models import SemesterSettings as SemesterSettingsModel
 
@@ -12,6 +13,10 @@ class BaseSemesterSettingsService(ABC):
     def get_current_settings(self) -> SemesterSettingsEntity:
         ...
 
+    @abstractmethod
+    async def aget_current_settings(self) -> SemesterSettingsEntity:
+        ...
+
 
 class ORMSemesterSettingsService(BaseSemesterSettingsService):
     def get_current_settings(self) -> SemesterSettingsEntity:
@@ -20,3 +25,6 @@ class ORMSemesterSettingsService(BaseSemesterSettingsService):
             start_date=obj.start_date,
             is_above_line=obj.is_above_line,
         )
+
+    async def aget_current_settings(self) -> SemesterSettingsEntity:
+        return await sync_read_to_async(self.get_current_settings)()
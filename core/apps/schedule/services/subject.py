@@ -9,6 +9,11 @@ from typing import Iterable
 
 from core.api.filters import PaginationIn
 from core.apps.common.filters import SearchFilter as SearchFilterEntity
+from core.apps.common.pagination import (
+    Page,
+    paginate,
+)
+from core.apps.common.search import search_text_query
 from core.apps.schedule.entities.subject import Subject as SubjectEntity
 from core.apps.schedule.exceptions.subject import (
     SubjectAlreadyExistException,
@@ -19,6 +24,9 @@ from core.apps.schedule.exceptions.subject import (
 from core.apps.schedule.models import Subject as SubjectModel
 
 
+SUBJECT_LIST_ORDERING = ('title', 'id')
+
+
 class BaseSubjectService(ABC):
     @abstractmethod
     def create(self, title: str, slug: str) -> SubjectEntity:
@@ -29,19 +37,19 @@ class BaseSubjectService(ABC):
         ...
 
     @abstractmethod
-    def get_list(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Iterable[SubjectEntity]:
+    def get_page(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Page[SubjectEntity]:
         ...
 
     @abstractmethod
-    def get_count(self, filters: SearchFilterEntity) -> int:
+    def get_by_uuid(self, subject_uuid: str) -> SubjectEntity:
         ...
 
     @abstractmethod
-    def get_by_uuid(self, subject_uuid: str) -> SubjectEntity:
+    def get_by_id(self, subject_id: int) -> SubjectEntity:
         ...
 
     @abstractmethod
-    def get_by_id(self, subject_id: int) -> SubjectEntity:
+    def get_by_uuids(self, subject_uuids: Iterable[str]) -> dict[str, SubjectEntity]:
         ...
 
     @abstractmethod
@@ -70,7 +78,8 @@ class ORMSubjectService(BaseSubjectService):
         query = Q()
 
         if filters.search is not None:
-            query &= Q(title__icontains=filters.search) | Q(slug__icontains=filters.search)
+            # Slugs are not part of `search_text`.
+            query &= search_text_query(filters.search) | Q(slug__icontains=filters.search)
 
         return query
 
@@ -85,17 +94,14 @@ class ORMSubjectService(BaseSubjectService):
     def get_all(self) -> list[SubjectEntity]:
         return [subject.to_entity() for subject in SubjectModel.objects.all()]
 
-    def get_list(self, filters: SearchFilterEntity, pagination: PaginationIn) -> list[SubjectEntity]:
-        query = self._build_subject_query(filters)
-        qs = SubjectModel.objects.filter(query)[
-            pagination.offset:pagination.offset + pagination.limit
-        ]
-        return [subject.to_entity() for subject in qs]
-
-    def get_count(self, filters: SearchFilterEntity) -> int:
+    def get_page(self, filters: SearchFilterEntity, pagination: PaginationIn) -> Page[SubjectEntity]:
         query = self._build_subject_query(filters)
-
-        return SubjectModel.objects.filter(query).count()
+        return paginate(
+            SubjectModel.objects.filter(query),
+            ordering=SUBJECT_LIST_ORDERING,
+            pagination=pagination,
+            to_entity=lambda subject: subject.to_entity(),
+        )
 
     def get_by_uuid(self, subject_uuid: str) -> SubjectEntity:
         try:
@@ -111,6 +117,10 @@ class ORMSubjectService(BaseSubjectService):
             raise SubjectNotFoundException(id=subject_id)
         return subject.to_entity()
 
+    def get_by_uuids(self, subject_uuids: Iterable[str]) -> dict[str, SubjectEntity]:
+        subjects = SubjectModel.objects.filter(subject_uuid__in=list(subject_uuids))
+        return {str(subject.subject_uuid): subject.to_entity() for subject in subjects}
+
     def check_exists_by_title(self, title: str) -> bool:
         return SubjectModel.objects.filter(title=title).exists()
 
@@ -123,6 +133,7 @@ class ORMSubjectService(BaseSubjectService):
 
         if not is_updated:
             raise SubjectUpdateException(id=subject_id)
+        SubjectModel.refresh_search_text(pk=subject_id)
 
     def soft_delete(self, subject_id: int) -> None:
         is_updated = SubjectModel.objects.filter(id=subject_id).update(is_active=False)
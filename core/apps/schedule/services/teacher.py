@@ -9,6 +9,11 @@ from typing import Iterable
 
 from core.api.filters import PaginationIn
 from core.apps.common.models import TeachersDegree
+from core.apps.common.pagination import (
+    Page,
+    paginate,
+)
+from core.apps.common.search import search_text_query
 from core.apps.schedule.entities.teacher import Teacher as TeacherEntity
 from core.apps.schedule.exceptions.teacher import (
     TeacherAlreadyExistsException,
@@ -20,6 +25,9 @@ from core.apps.schedule.filters.teacher import TeacherFilter
 from core.apps.schedule.models.teacher import Teacher as TeacherModel
 
 
+TEACHER_LIST_ORDERING = ('last_name', 'first_name', 'id')
+
+
 class BaseTeacherService(ABC):
     @abstractmethod
     def create(
@@ -36,19 +44,19 @@ class BaseTeacherService(ABC):
         ...
 
     @abstractmethod
-    def get_list(self, filters: TeacherFilter, pagination: PaginationIn) -> Iterable[TeacherEntity]:
+    def get_page(self, filters: TeacherFilter, pagination: PaginationIn) -> Page[TeacherEntity]:
         ...
 
     @abstractmethod
-    def get_count(self, filters: TeacherFilter) -> int:
+    def get_by_uuid(self, teacher_uuid: str) -> TeacherEntity:
         ...
 
     @abstractmethod
-    def get_by_uuid(self, teacher_uuid: str) -> TeacherEntity:
+    def get_by_id(self, teacher_id: int) -> TeacherEntity:
         ...
 
     @abstractmethod
-    def get_by_id(self, teacher_id: int) -> TeacherEntity:
+    def get_by_uuids(self, teacher_uuids: Iterable[str]) -> dict[str, TeacherEntity]:
         ...
 
     @abstractmethod
@@ -96,12 +104,7 @@ class ORMTeacherService(BaseTeacherService):
         query = Q()
 
         if filters.name is not None:
-            for token in filters.name.split():
-                query &= (
-                    Q(first_name__icontains=token) |
-                    Q(last_name__icontains=token) |
-                    Q(middle_name__icontains=token)
-                )
+            query &= search_text_query(filters.name)
         if filters.rank is not None:
             query &= (Q(rank__icontains=filters.rank))
 
@@ -129,15 +132,14 @@ class ORMTeacherService(BaseTeacherService):
     def get_all(self) -> list[TeacherEntity]:
         return [teacher.to_entity() for teacher in TeacherModel.objects.all()]
 
-    def get_list(self, filters: TeacherFilter, pagination: PaginationIn) -> list[TeacherEntity]:
-        query = self._build_teacher_query(filters)
-        qs = TeacherModel.objects.filter(query)[pagination.offset:pagination.offset + pagination.limit]
-        return [teacher.to_entity() for teacher in qs]
-
-    def get_count(self, filters: TeacherFilter) -> int:
+    def get_page(self, filters: TeacherFilter, pagination: PaginationIn) -> Page[TeacherEntity]:
         query = self._build_teacher_query(filters)
-
-        return TeacherModel.objects.filter(query).count()
+        return paginate(
+            TeacherModel.objects.filter(query),
+            ordering=TEACHER_LIST_ORDERING,
+            pagination=pagination,
+            to_entity=lambda teacher: teacher.to_entity(),
+        )
 
     def get_by_uuid(self, teacher_uuid: str) -> TeacherEntity:
         try:
@@ -155,6 +157,10 @@ class ORMTeacherService(BaseTeacherService):
 
         return teacher.to_entity()
 
+    def get_by_uuids(self, teacher_uuids: Iterable[str]) -> dict[str, TeacherEntity]:
+        teachers = TeacherModel.objects.filter(teacher_uuid__in=list(teacher_uuids))
+        return {str(teacher.teacher_uuid): teacher.to_entity() for teacher in teachers}
+
     def check_exists_by_full_name(self, first_name: str, last_name: str, middle_name: str) -> bool:
         return TeacherModel.objects.filter(
             first_name=first_name,
@@ -189,6 +195,7 @@ class ORMTeacherService(BaseTeacherService):
         )
         if not is_updated:
             raise TeacherUpdateException(id=teacher_id)
+        TeacherModel.refresh_search_text(pk=teacher_id)
 
     def update_rank(
             self,
@@ -2,6 +2,7 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from typing import Iterable
 
 from core.apps.common.models import (
     Day,
@@ -12,11 +13,18 @@ from core.apps.schedule.exceptions.timeslot import TimeslotNotFoundException
 from core.apps.schedule.models import Timeslot as TimeslotModel
 
 
+TimeslotKey = tuple[Day, OrdinaryNumber, bool]
+
+
 class BaseTimeslotService(ABC):
     @abstractmethod
     def get_or_create(self, day: Day, ord_number: OrdinaryNumber, is_even: bool) -> TimeslotEntity:
         ...
 
+    @abstractmethod
+    def get_or_create_many(self, keys: Iterable[TimeslotKey]) -> dict[TimeslotKey, int]:
+        ...
+
     @abstractmethod
     def get_by_id(self, timeslot_id: int) -> TimeslotEntity:
         ...
@@ -27,6 +35,24 @@ class ORMTimeslotService(BaseTimeslotService):
         timeslot, _ = TimeslotModel.objects.get_or_create(day=day, ord_number=ord_number, is_even=is_even)
         return timeslot.to_entity()
 
+    def get_or_create_many(self, keys: Iterable[TimeslotKey]) -> dict[TimeslotKey, int]:
+        """Upsert every `(day, ord_number, is_even)` in one statement and
+        map each of them to its timeslot id."""
+        timeslots = [
+            TimeslotModel(day=day, ord_number=ord_number, is_even=is_even)
+            for day, ord_number, is_even in set(keys)
+        ]
+        TimeslotModel.objects.bulk_create(
+            timeslots,
+            update_conflicts=True,
+            unique_fields=['day', 'ord_number', 'is_even'],
+            update_fields=['updated_at'],
+        )
+        return {
+            (Day(timeslot.day), OrdinaryNumber(timeslot.ord_number), timeslot.is_even): timeslot.id
+            for timeslot in timeslots
+        }
+
     def get_by_id(self, timeslot_id: int) -> TimeslotEntity:
         try:
             timeslot = TimeslotModel.objects.get(id=timeslot_id)
@@ -0,0 +1,382 @@
+from django.core.cache import cache
+
+import threading
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import (
+    Counter,
+    defaultdict,
+)
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+from typing import (
+    Iterable,
+    Iterator,
+)
+
+from core.apps.common.cache.service import GENERATION_TTL_SECONDS
+from core.apps.common.cache.timeouts import Timeout
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+    Subgroup,
+)
+from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
+from core.apps.schedule.entities.timetable_index import (
+    ConflictDimension,
+    TimetableConflict,
+    TimetableIndexDelta,
+    TimetableIndexEntry,
+)
+from core.apps.schedule.models import GroupLesson as GroupLessonModel
+from core.apps.schedule.services.timeslot import TimeslotKey
+
+
+TIMETABLE_INDEX_VERSION_KEY = 'timetable_index_version'
+TIMETABLE_INDEX_DELTA_KEY_PREFIX = 'timetable_index_delta'
+TIMETABLE_INDEX_DELTA_TTL_SECONDS = int(Timeout.HOUR)
+# A worker further behind than this reloads rather than replays.
+TIMETABLE_INDEX_MAX_REPLAY = 500
+TIMETABLE_INDEX_CHUNK_SIZE = 5000
+
+CellKey = tuple[TimeslotKey, str]
+CellMember = tuple[Subgroup | None, str]
+
+DAY_ORDER = {day: order for order, day in enumerate(Day)}
+ORDINARY_NUMBER_ORDER = {ord_number: order for order, ord_number in enumerate(OrdinaryNumber)}
+
+
+def timeslot_mask(timeslots: Iterable[TimeslotKey]) -> int:
+    """Bit set of the given timeslots in a room occupancy bitmap: 7 days
+    x 6 lessons x 2 parities, 84 bits in all."""
+    mask = 0
+    for day, ord_number, is_even in timeslots:
+        position = (DAY_ORDER[day] * len(OrdinaryNumber) + ORDINARY_NUMBER_ORDER[ord_number]) * 2 + (not is_even)
+        mask |= 1 << position
+    return mask
+
+
+class TimetableIndex:
+    """Occupancy of every (timeslot, teacher), (timeslot, room) and
+    (timeslot, group) cell, held in the memory of one worker process.
+
+    A cell counts the group lessons occupying it per `(subgroup, lesson)`
+    member; teacher and room cells ignore the subgroup. A lecture shared
+    by several groups therefore occupies its teacher and room once, and
+    two members clash only when they are different lessons whose
+    subgroups overlap (no subgroup means the whole group). Alongside the
+    room cells every room keeps an occupancy bitmap (see
+    `timeslot_mask`), so free rooms are found with one AND per room.
+    Every entry is held at most once, so adding one the index already
+    holds, or removing one it does not, changes nothing. Callers must
+    hold `lock` while reading or changing the index.
+
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.version: int | None = None
+        self._entries: set[TimetableIndexEntry] = set()
+        self._cells: dict[ConflictDimension, defaultdict[CellKey, Counter[CellMember]]] = {
+            dimension: defaultdict(Counter) for dimension in ConflictDimension
+        }
+        self._room_occupancy: dict[str, int] = {}
+
+    def load(self, entries: Iterable[TimetableIndexEntry], version: int) -> None:
+        self.clear()
+        for entry in entries:
+            self.add(entry)
+        self.version = version
+
+    def clear(self) -> None:
+        self.version = None
+        self._entries.clear()
+        for cells in self._cells.values():
+            cells.clear()
+        self._room_occupancy.clear()
+
+    def apply(self, delta: TimetableIndexDelta) -> None:
+        for entry in delta.removed:
+            self.remove(entry)
+        for entry in delta.added:
+            self.add(entry)
+
+    def add(self, entry: TimetableIndexEntry) -> None:
+        if entry in self._entries:
+            return
+        self._entries.add(entry)
+        for dimension, key, member in self._members(entry):
+            self._cells[dimension][key][member] += 1
+        room_bit = timeslot_mask([entry.timeslot_key])
+        self._room_occupancy[entry.room_uuid] = self._room_occupancy.get(entry.room_uuid, 0) | room_bit
+
+    def remove(self, entry: TimetableIndexEntry) -> None:
+        if entry not in self._entries:
+            return
+        self._entries.remove(entry)
+        for dimension, key, member in self._members(entry):
+            occupied = self._cells[dimension].get(key)
+            if occupied is None:
+                continue
+            occupied[member] -= 1
+            if occupied[member] <= 0:
+                del occupied[member]
+            if not occupied:
+                del self._cells[dimension][key]
+                if dimension == ConflictDimension.ROOM:
+                    self._release_room(entry)
+
+    def free_rooms(self, room_uuids: Iterable[str], mask: int) -> list[str]:
+        """The rooms of `room_uuids` not occupied in any timeslot of
+        `mask`, in the given order."""
+        return [uuid for uuid in room_uuids if not self._room_occupancy.get(uuid, 0) & mask]
+
+    def conflicts_for(
+            self,
+            entry: TimetableIndexEntry,
+            ignore: Iterable[TimetableIndexEntry] = (),
+    ) -> list[TimetableConflict]:
+        """Lessons that `entry` would clash with, not counting the
+        assignments in `ignore` (e.g. the one a replacement removes)."""
+        ignored = Counter(member for other in ignore for member in self._members(other))
+        conflicts = []
+        for dimension, key, member in self._members(entry):
+            occupied = self._cells[dimension].get(key, {})
+            lessons = {
+                other[1] for other, count in occupied.items()
+                if count > ignored[(dimension, key, other)] and self._clash(member, other)
+            }
+            if lessons:
+                conflicts.append(self._conflict(dimension, key, lessons))
+        return conflicts
+
+    def conflicts(self) -> list[TimetableConflict]:
+        conflicts = []
+        for dimension, cells in self._cells.items():
+            for key, occupied in cells.items():
+                if len(occupied) < 2:
+                    continue
+                lessons = {
+                    member[1]
+                    for pair in combinations(occupied, 2) if self._clash(*pair)
+                    for member in pair
+                }
+                if lessons:
+                    conflicts.append(self._conflict(dimension, key, lessons))
+        return sorted(conflicts, key=lambda conflict: (
+            DAY_ORDER[conflict.day], conflict.ord_number, conflict.is_even, conflict.dimension.value,
+            conflict.identifier,
+        ))
+
+    def _release_room(self, entry: TimetableIndexEntry) -> None:
+        occupancy = self._room_occupancy.get(entry.room_uuid, 0) & ~timeslot_mask([entry.timeslot_key])
+        if occupancy:
+            self._room_occupancy[entry.room_uuid] = occupancy
+        else:
+            self._room_occupancy.pop(entry.room_uuid, None)
+
+    @staticmethod
+    def _members(entry: TimetableIndexEntry) -> tuple[tuple[ConflictDimension, CellKey, CellMember], ...]:
+        timeslot = entry.timeslot_key
+        return (
+            (ConflictDimension.TEACHER, (timeslot, entry.teacher_uuid), (None, entry.lesson_uuid)),
+            (ConflictDimension.ROOM, (timeslot, entry.room_uuid), (None, entry.lesson_uuid)),
+            (ConflictDimension.GROUP, (timeslot, entry.group_uuid), (entry.subgroup, entry.lesson_uuid)),
+        )
+
+    @staticmethod
+    def _clash(member: CellMember, other: CellMember) -> bool:
+        (subgroup, lesson_uuid), (other_subgroup, other_lesson_uuid) = member, other
+        if lesson_uuid == other_lesson_uuid:
+            return False
+        return subgroup is None or other_subgroup is None or subgroup == other_subgroup
+
+    @staticmethod
+    def _conflict(dimension: ConflictDimension, key: CellKey, lessons: set[str]) -> TimetableConflict:
+        (day, ord_number, is_even), identifier = key
+        return TimetableConflict(
+            dimension=dimension,
+            identifier=identifier,
+            day=day,
+            ord_number=ord_number,
+            is_even=is_even,
+            lesson_uuids=tuple(sorted(lessons)),
+        )
+
+
+@lru_cache(1)
+def get_timetable_index() -> TimetableIndex:
+    return TimetableIndex()
+
+
+class BaseTimetableIndexService(ABC):
+    @abstractmethod
+    def find_conflicts(
+            self,
+            group_lesson: GroupLessonEntity,
+            replaced: GroupLessonEntity | None = None,
+            removed: Iterable[GroupLessonEntity] = (),
+    ) -> list[TimetableConflict]:
+        ...
+
+    @abstractmethod
+    def get_conflicts(self) -> list[TimetableConflict]:
+        ...
+
+    @abstractmethod
+    def find_free_rooms(self, room_uuids: Iterable[str], timeslots: Iterable[TimeslotKey]) -> list[str]:
+        ...
+
+    @abstractmethod
+    def record(
+            self,
+            added: Iterable[GroupLessonEntity] = (),
+            removed: Iterable[GroupLessonEntity] = (),
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        ...
+
+
+@dataclass
+class InMemoryTimetableIndexService(BaseTimetableIndexService):
+    """Answers conflict checks from the worker's `TimetableIndex` instead
+    of the database.
+
+    The index is stamped with a version counter kept in Redis. Reading it
+    costs one cache round trip. Writers call `record` after their
+    transaction: it bumps the counter and publishes the change under the
+    new version, so a worker whose index is behind fetches the changes it
+    missed with one MGET and replays them. A worker too far behind, or
+    missing a change that already expired, reloads the index with a
+    single query over all group lessons. `invalidate` only bumps the
+    counter, for writes too large to replay, which makes every worker
+    reload.
+
+    """
+
+    @property
+    def index(self) -> TimetableIndex:
+        return get_timetable_index()
+
+    def find_conflicts(
+            self,
+            group_lesson: GroupLessonEntity,
+            replaced: GroupLessonEntity | None = None,
+            removed: Iterable[GroupLessonEntity] = (),
+    ) -> list[TimetableConflict]:
+        """Lessons `group_lesson` would clash with once `replaced` and the
+        assignments in `removed` (e.g. earlier steps of a batch) are gone."""
+        entry = TimetableIndexEntry.from_group_lesson(group_lesson)
+        ignore = [TimetableIndexEntry.from_group_lesson(other) for other in removed]
+        if replaced is not None:
+            ignore.append(TimetableIndexEntry.from_group_lesson(replaced))
+        with self.index.lock:
+            return self._refresh().conflicts_for(entry, ignore=ignore)
+
+    def get_conflicts(self) -> list[TimetableConflict]:
+        with self.index.lock:
+            return self._refresh().conflicts()
+
+    def find_free_rooms(self, room_uuids: Iterable[str], timeslots: Iterable[TimeslotKey]) -> list[str]:
+        mask = timeslot_mask(timeslots)
+        with self.index.lock:
+            return self._refresh().free_rooms(room_uuids, mask=mask)
+
+    def record(
+            self,
+            added: Iterable[GroupLessonEntity] = (),
+            removed: Iterable[GroupLessonEntity] = (),
+    ) -> None:
+        added = [TimetableIndexEntry.from_group_lesson(group_lesson) for group_lesson in added]
+        removed = [TimetableIndexEntry.from_group_lesson(group_lesson) for group_lesson in removed]
+        if not added and not removed:
+            return
+
+        delta = TimetableIndexDelta(added=tuple(added), removed=tuple(removed))
+        with self.index.lock:
+            version = self._bump_version()
+            cache.set(self._delta_key(version), delta, timeout=TIMETABLE_INDEX_DELTA_TTL_SECONDS)
+            if self.index.version == version - 1:
+                self.index.apply(delta)
+                self.index.version = version
+
+    def invalidate(self) -> None:
+        self._bump_version()
+
+    def _refresh(self) -> TimetableIndex:
+        version = self._read_version()
+        if self.index.version != version and not self._replay(version):
+            # The version is read before the rows, so a write committed
+            # meanwhile is replayed again later, which changes nothing.
+            self.index.load(self._load_entries(), version=version)
+        return self.index
+
+    def _replay(self, version: int) -> bool:
+        """Bring the index up to `version` with the changes published
+        since its own; False if it has to be reloaded instead."""
+        current = self.index.version
+        if current is None or not 0 < version - current <= TIMETABLE_INDEX_MAX_REPLAY:
+            return False
+        delta_keys = [self._delta_key(missed) for missed in range(current + 1, version + 1)]
+        deltas = cache.get_many(delta_keys)
+        if len(deltas) != len(delta_keys):
+            return False
+        for delta_key in delta_keys:
+            self.index.apply(deltas[delta_key])
+        self.index.version = version
+        return True
+
+    @staticmethod
+    def _delta_key(version: int) -> str:
+        return f'{TIMETABLE_INDEX_DELTA_KEY_PREFIX}:{version}'
+
+    @staticmethod
+    def _read_version() -> int:
+        version = cache.get(TIMETABLE_INDEX_VERSION_KEY)
+        if version is not None:
+            return version
+        # Seeded from the clock, like cache generations, so a counter lost
+        # to eviction never returns to a value some worker already holds.
+        cache.add(TIMETABLE_INDEX_VERSION_KEY, int(time.time() * 1000), timeout=GENERATION_TTL_SECONDS)
+        return cache.get(TIMETABLE_INDEX_VERSION_KEY)
+
+    def _bump_version(self) -> int:
+        try:
+            version = cache.incr(TIMETABLE_INDEX_VERSION_KEY)
+        except ValueError:
+            return self._read_version()
+        cache.touch(TIMETABLE_INDEX_VERSION_KEY, GENERATION_TTL_SECONDS)
+        return version
+
+    @staticmethod
+    def _load_entries() -> Iterator[TimetableIndexEntry]:
+        rows = GroupLessonModel.objects.values_list(
+            'group__group_uuid',
+            'subgroup',
+            'lesson__lesson_uuid',
+            'lesson__teacher__teacher_uuid',
+            'lesson__room__room_uuid',
+            'lesson__timeslot__day',
+            'lesson__timeslot__ord_number',
+            'lesson__timeslot__is_even',
+        )
+        for group_uuid, subgroup, lesson_uuid, teacher_uuid, room_uuid, day, ord_number, is_even in rows.iterator(
+            chunk_size=TIMETABLE_INDEX_CHUNK_SIZE,
+        ):
+            yield TimetableIndexEntry(
+                group_uuid=str(group_uuid),
+                subgroup=Subgroup(subgroup) if subgroup else None,
+                lesson_uuid=str(lesson_uuid),
+                teacher_uuid=str(teacher_uuid),
+                room_uuid=str(room_uuid),
+                day=Day(day),
+                ord_number=OrdinaryNumber(ord_number),
+                is_even=is_even,
+            )
@@ -10,6 +10,11 @@ from core.apps.schedule.services.faculty import BaseFacultyService
 class GetAllFacultiesUseCase:
     faculty_service: BaseFacultyService
 
-    @cache_decorator.get_or_set_cache(model_prefix='faculty', func_prefix='all', timeout=Timeout.WEEK)
+    @cache_decorator.get_or_set_cache(
+        model_prefix='faculty',
+        func_prefix='all',
+        timeout=Timeout.WEEK,
+        stale_after=Timeout.DAY,
+    )
     def execute(self) -> list[FacultyEntity]:
         return list(self.faculty_service.get_all())
@@ -1,10 +1,10 @@
-from collections.abc import Iterable
 from dataclasses import dataclass
 
 from core.api.filters import PaginationIn
 from core.apps.common.cache.decorator import cache_decorator
 from core.apps.common.cache.timeouts import Timeout
 from core.apps.common.filters import SearchFilter
+from core.apps.common.pagination import Page
 from core.apps.schedule.entities.faculty import Faculty as FacultyEntity
 from core.apps.schedule.services.faculty import BaseFacultyService
 
@@ -18,8 +18,5 @@ class GetFacultyListUseCase:
             self,
             filters: SearchFilter,
             pagination_in: PaginationIn,
-    ) -> tuple[Iterable[FacultyEntity], int]:
-        faculty_list = self.faculty_service.get_list(filters=filters, pagination=pagination_in)
-        faculty_count = self.faculty_service.get_count(filters=filters)
-
-        return faculty_list, faculty_count
+    ) -> Page[FacultyEntity]:
+        return self.faculty_service.get_page(filters=filters, pagination=pagination_in)
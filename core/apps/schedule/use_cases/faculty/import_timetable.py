@@ -0,0 +1,155 @@
+from django.db import transaction
+
+from dataclasses import (
+    dataclass,
+    replace,
+)
+from typing import Iterable
+
+from core.apps.common.cache.service import BaseCacheService
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
+from core.apps.schedule.entities.lesson import Lesson as LessonEntity
+from core.apps.schedule.entities.timeslot import Timeslot as TimeslotEntity
+from core.apps.schedule.entities.timetable_import import (
+    TimetableImportResult,
+    TimetableImportRow,
+)
+from core.apps.schedule.exceptions.timetable_import import (
+    TimetableImportEmptyException,
+    TimetableImportGroupsOutsideFacultyException,
+    TimetableImportReferencesNotFoundException,
+)
+from core.apps.schedule.services.faculty import BaseFacultyService
+from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
+from core.apps.schedule.services.group_lessons import BaseGroupLessonService
+from core.apps.schedule.services.lesson import BaseLessonService
+from core.apps.schedule.services.room import BaseRoomService
+from core.apps.schedule.services.subject import BaseSubjectService
+from core.apps.schedule.services.teacher import BaseTeacherService
+from core.apps.schedule.services.timeslot import BaseTimeslotService
+from core.apps.schedule.services.timetable_index import BaseTimetableIndexService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+@dataclass
+class ImportFacultyTimetableUseCase:
+    """Assigns a whole faculty's timetable in one pass.
+
+    Every referenced group, subject, teacher and room is loaded with one
+    `IN` query per dimension and all rows are validated before anything
+    is written. Timeslots and lessons are then upserted, the group
+    assignments inserted in batches (already assigned ones are skipped,
+    so importing the same file twice is harmless), and each group's
+    `schedule_updated_at` is bumped by a single UPDATE. Caches and the
+    timetable index are invalidated once, after the transaction; group
+    snapshots and the index are rebuilt lazily by the next read.
+
+    """
+    faculty_service: BaseFacultyService
+    group_service: BaseGroupService
+    subject_service: BaseSubjectService
+    teacher_service: BaseTeacherService
+    room_service: BaseRoomService
+    timeslot_service: BaseTimeslotService
+    lesson_service: BaseLessonService
+    group_lesson_service: BaseGroupLessonService
+    group_lesson_change_service: BaseGroupLessonChangeService
+    timetable_index_service: BaseTimetableIndexService
+    cache_service: BaseCacheService
+
+    uuid_validator_service: BaseUuidValidatorService
+
+    def execute(self, faculty_uuid: str, rows: list[TimetableImportRow]) -> TimetableImportResult:
+        if not rows:
+            raise TimetableImportEmptyException
+
+        group_uuids = {row.group_uuid for row in rows}
+        subject_uuids = {row.subject_uuid for row in rows}
+        teacher_uuids = {row.teacher_uuid for row in rows}
+        room_uuids = {row.room_uuid for row in rows}
+        self.uuid_validator_service.validate(
+            uuid_list=[faculty_uuid, *group_uuids, *subject_uuids, *teacher_uuids, *room_uuids],
+        )
+
+        faculty = self.faculty_service.get_by_uuid(faculty_uuid=faculty_uuid)
+        groups = self.group_service.get_by_uuids(group_uuids=group_uuids)
+        subjects = self.subject_service.get_by_uuids(subject_uuids=subject_uuids)
+        teachers = self.teacher_service.get_by_uuids(teacher_uuids=teacher_uuids)
+        rooms = self.room_service.get_by_uuids(room_uuids=room_uuids)
+
+        missing = {
+            dimension: sorted(requested - found.keys())
+            for dimension, requested, found in (
+                ('group', group_uuids, groups),
+                ('subject', subject_uuids, subjects),
+                ('teacher', teacher_uuids, teachers),
+                ('room', room_uuids, rooms),
+            )
+            if requested - found.keys()
+        }
+        if missing:
+            raise TimetableImportReferencesNotFoundException(missing=missing)
+
+        foreign_groups = sorted(
+            uuid for uuid, group in groups.items()
+            if group.faculty is None or group.faculty.id != faculty.id
+        )
+        if foreign_groups:
+            raise TimetableImportGroupsOutsideFacultyException(faculty_uuid=faculty_uuid, group_uuids=foreign_groups)
+
+        for row in rows:
+            self.group_service.validate_subgroup_for_group(group=groups[row.group_uuid], subgroup=row.subgroup)
+
+        with transaction.atomic():
+            timeslot_ids = self.timeslot_service.get_or_create_many(keys=[row.timeslot_key for row in rows])
+            lessons = [
+                LessonEntity(
+                    type=row.type,
+                    subject=subjects[row.subject_uuid],
+                    teacher=teachers[row.teacher_uuid],
+                    room=rooms[row.room_uuid],
+                    timeslot=TimeslotEntity(id=timeslot_ids[row.timeslot_key]),
+                )
+                for row in rows
+            ]
+            lesson_ids = self.lesson_service.get_or_create_many(lessons=lessons)
+
+            group_lessons: dict[tuple, GroupLessonEntity] = {}
+            for row, lesson, lesson_id in zip(rows, lessons, lesson_ids):
+                group_lessons.setdefault(
+                    (row.group_uuid, row.subgroup, lesson_id),
+                    GroupLessonEntity(
+                        group=groups[row.group_uuid],
+                        subgroup=row.subgroup,
+                        lesson=replace(lesson, id=lesson_id),
+                    ),
+                )
+            self.group_lesson_service.save_many(group_lessons=list(group_lessons.values()))
+            self.group_service.bump_schedule_updated_at_many(group_ids=[group.id for group in groups.values()])
+            # Rows that were already assigned are logged too; to a client an
+            # add of a cell it has is a no-op.
+            self.group_lesson_change_service.record(added=group_lessons.values())
+
+        self.timetable_index_service.invalidate()
+        self._invalidate_caches(groups=groups.values(), teacher_uuids=teacher_uuids, room_uuids=room_uuids)
+
+        return TimetableImportResult(
+            groups=len(groups),
+            lessons=len(set(lesson_ids)),
+            group_lessons=len(group_lessons),
+        )
+
+    def _invalidate_caches(
+            self,
+            groups: Iterable[GroupEntity],
+            teacher_uuids: Iterable[str],
+            room_uuids: Iterable[str],
+    ) -> None:
+        self.cache_service.invalidate_namespace_list(namespaces=[
+            dict(model_prefix='group', func_prefix='all'),
+            *(dict(model_prefix='group', identifier=group.uuid) for group in groups),
+            *(dict(model_prefix='teacher', identifier=uuid, func_prefix='lessons') for uuid in teacher_uuids),
+            *(dict(model_prefix='room', identifier=uuid, func_prefix='lessons') for uuid in room_uuids),
+        ])
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.group_lessons import (
+    GroupLessonOperation,
+    GroupLessonOperationResult,
+)
+from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.group_lesson_batch import BaseGroupLessonBatchService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+@dataclass
+class AdminBatchUpdateGroupLessonsUseCase:
+    group_service: BaseGroupService
+    group_lesson_batch_service: BaseGroupLessonBatchService
+
+    uuid_validator_service: BaseUuidValidatorService
+
+    def execute(
+            self,
+            group_uuid: str,
+            operations: list[GroupLessonOperation],
+    ) -> tuple[GroupEntity, list[GroupLessonOperationResult]]:
+        self.uuid_validator_service.validate(uuid_str=group_uuid)
+
+        group = self.group_service.get_by_uuid(group_uuid=group_uuid)
+
+        return group, self.group_lesson_batch_service.apply(group=group, operations=operations)
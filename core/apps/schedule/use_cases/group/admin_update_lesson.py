@@ -8,8 +8,11 @@ from core.apps.schedule.entities.group import Group as GroupEntity
 from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
 from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
 from core.apps.schedule.services.group_lessons import BaseGroupLessonService
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
 from core.apps.schedule.services.lesson import BaseLessonService
+from core.apps.schedule.services.timetable_index import BaseTimetableIndexService
 from core.apps.schedule.validators.group_lesson import BaseGroupLessonValidatorService
 from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
 
@@ -19,21 +22,31 @@ class AdminUpdateLessonInGroupUseCase:
     group_service: BaseGroupService
     lesson_service: BaseLessonService
     group_lesson_service: BaseGroupLessonService
+    group_lesson_change_service: BaseGroupLessonChangeService
+    group_schedule_snapshot_service: BaseGroupScheduleSnapshotService
+    timetable_index_service: BaseTimetableIndexService
 
     uuid_validator_service: BaseUuidValidatorService
     group_lesson_validator_service: BaseGroupLessonValidatorService
 
     @cache_decorator.delete_caches([
         dict(model_prefix='group', func_prefix='all'),
-        dict(model_prefix='group', identifier=lambda kw: kw['group_uuid'], func_prefix='lessons', filters='*'),
         dict(
             model_prefix='teacher', identifier=lambda kw, res: res[1].teacher.uuid,
             func_prefix='lessons', filters='*',
         ),
+        dict(
+            model_prefix='room', identifier=lambda kw, res: res[1].room.uuid,
+            func_prefix='lessons', filters='*',
+        ),
         dict(
             model_prefix='teacher', identifier=lambda kw, res: res[2].teacher.uuid,
             func_prefix='lessons', filters='*',
         ),
+        dict(
+            model_prefix='room', identifier=lambda kw, res: res[2].room.uuid,
+            func_prefix='lessons', filters='*',
+        ),
     ])
     def execute(
             self,
@@ -63,7 +76,10 @@ class AdminUpdateLessonInGroupUseCase:
             lesson=new_lesson,
         )
 
-        self.group_lesson_validator_service.validate(group_lesson=new_group_subgroup_lesson_entity)
+        self.group_lesson_validator_service.validate(
+            group_lesson=new_group_subgroup_lesson_entity,
+            old_group_lesson=old_group_subgroup_lesson_entity,
+        )
 
         with transaction.atomic():
             self.group_lesson_service.save(group_lesson=new_group_subgroup_lesson_entity)
@@ -73,5 +89,15 @@ class AdminUpdateLessonInGroupUseCase:
                 self.lesson_service.delete_by_uuid(lesson_uuid=old_lesson.uuid)
 
             self.group_service.bump_schedule_updated_at(group_id=group.id)
+            self.group_lesson_change_service.record(
+                added=[new_group_subgroup_lesson_entity],
+                removed=[old_group_subgroup_lesson_entity],
+            )
+
+        self.timetable_index_service.record(
+            added=[new_group_subgroup_lesson_entity],
+            removed=[old_group_subgroup_lesson_entity],
+        )
+        self.group_schedule_snapshot_service.rebuild(group_uuid=group.uuid)
 
         return group, new_lesson, old_lesson
@@ -10,6 +10,11 @@ from core.apps.schedule.services.group import BaseGroupService
 class GetAllGroupsUseCase:
     group_service: BaseGroupService
 
-    @cache_decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.WEEK)
+    @cache_decorator.get_or_set_cache(
+        model_prefix='group',
+        func_prefix='all',
+        timeout=Timeout.WEEK,
+        stale_after=Timeout.DAY,
+    )
     def execute(self) -> list[GroupEntity]:
         return list(self.group_service.get_all())
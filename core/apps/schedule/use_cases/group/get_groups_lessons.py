@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.timetable import Timetable
+from core.apps.schedule.filters.group import LessonFilter
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+@dataclass
+class GetGroupsLessonsUseCase:
+    group_schedule_snapshot_service: BaseGroupScheduleSnapshotService
+
+    uuid_validator_service: BaseUuidValidatorService
+
+    def execute(self, group_uuids: list[str], is_even: bool) -> dict[str, tuple[GroupEntity, Timetable]]:
+        """The timetables of `group_uuids` for one week parity, by group
+        uuid; groups that do not exist are left out."""
+        self.uuid_validator_service.validate(uuid_list=group_uuids)
+
+        snapshots = self.group_schedule_snapshot_service.get_many(group_uuids=list(dict.fromkeys(group_uuids)))
+        filters = LessonFilter(is_even=is_even)
+        return {
+            uuid: (snapshot.group, self.group_schedule_snapshot_service.slice(snapshot=snapshot, filters=filters))
+            for uuid, snapshot in snapshots.items()
+        }
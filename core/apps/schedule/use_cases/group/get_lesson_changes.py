@@ -0,0 +1,77 @@
+from dataclasses import (
+    dataclass,
+    replace,
+)
+
+from core.apps.common.models import (
+    GroupLessonChangeKind,
+    Subgroup,
+)
+from core.apps.schedule.entities.group_lessons import GroupLessonCell
+from core.apps.schedule.entities.views import (
+    GroupScheduleSnapshot,
+    GroupTimetableDelta,
+)
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+@dataclass
+class GetGroupLessonChangesUseCase:
+    """Brings a client's copy of a group timetable from version `since` to
+    the version of the cached snapshot.
+
+    The change log between the two is folded into the last change per
+    cell, and added cells take their content from the snapshot. Without
+    `since`, with one newer than the snapshot, or when the log past
+    `since` was compacted, the whole snapshot is returned instead.
+
+    """
+    group_schedule_snapshot_service: BaseGroupScheduleSnapshotService
+    group_lesson_change_service: BaseGroupLessonChangeService
+
+    uuid_validator_service: BaseUuidValidatorService
+
+    def execute(self, group_uuid: str, since: int | None) -> GroupTimetableDelta:
+        self.uuid_validator_service.validate(uuid_str=group_uuid)
+
+        snapshot = self.group_schedule_snapshot_service.get(group_uuid=group_uuid)
+        if since is None or since > snapshot.changes_version:
+            return self._full(snapshot)
+
+        changes = self.group_lesson_change_service.get_changes(
+            group_id=snapshot.group.id,
+            after=since,
+            until=snapshot.changes_version,
+        )
+        last_kinds: dict[GroupLessonCell, GroupLessonChangeKind] = {}
+        for change in changes:
+            if change.kind == GroupLessonChangeKind.RESET:
+                return self._full(snapshot)
+            last_kinds[change.cell] = change.kind
+
+        added: dict[str, list[Subgroup | None]] = {}
+        for cell, kind in last_kinds.items():
+            if kind == GroupLessonChangeKind.ADD:
+                added.setdefault(cell.lesson_uuid, []).append(cell.subgroup)
+
+        timetable = snapshot.timetable
+        return GroupTimetableDelta(
+            group=snapshot.group,
+            version=snapshot.changes_version,
+            added=timetable.with_entries([
+                replace(entry, subgroups=[subgroup for subgroup in added[entry.lesson_uuid] if subgroup is not None])
+                for entry in timetable.entries if entry.lesson_uuid in added
+            ]),
+            removed=[cell for cell, kind in last_kinds.items() if kind == GroupLessonChangeKind.REMOVE],
+        )
+
+    @staticmethod
+    def _full(snapshot: GroupScheduleSnapshot) -> GroupTimetableDelta:
+        return GroupTimetableDelta(
+            group=snapshot.group,
+            version=snapshot.changes_version,
+            is_full=True,
+            added=snapshot.timetable,
+        )
@@ -12,8 +12,11 @@ from core.apps.schedule.entities.group import Group as GroupEntity
 from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
 from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
 from core.apps.schedule.services.group_lessons import BaseGroupLessonService
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
 from core.apps.schedule.services.lesson import BaseLessonService
+from core.apps.schedule.services.timetable_index import BaseTimetableIndexService
 from core.apps.schedule.validators.group_lesson import BaseGroupLessonValidatorService
 from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
 
@@ -24,17 +27,23 @@ class HeadmanAddLessonToGroupUseCase:
     group_service: BaseGroupService
     lesson_service: BaseLessonService
     group_lesson_service: BaseGroupLessonService
+    group_lesson_change_service: BaseGroupLessonChangeService
+    group_schedule_snapshot_service: BaseGroupScheduleSnapshotService
+    timetable_index_service: BaseTimetableIndexService
 
     uuid_validator_service: BaseUuidValidatorService
     group_lesson_validator_service: BaseGroupLessonValidatorService
 
     @cache_decorator.delete_caches([
         dict(model_prefix='group', func_prefix='all'),
-        dict(model_prefix='group', identifier=lambda kw, res: res[0].uuid, func_prefix='lessons', filters='*'),
         dict(
             model_prefix='teacher', identifier=lambda kw, res: res[1].teacher.uuid,
             func_prefix='lessons', filters='*',
         ),
+        dict(
+            model_prefix='room', identifier=lambda kw, res: res[1].room.uuid,
+            func_prefix='lessons', filters='*',
+        ),
     ])
     def execute(
             self,
@@ -63,5 +72,9 @@ class HeadmanAddLessonToGroupUseCase:
         with transaction.atomic():
             self.group_lesson_service.save(group_lesson=group_subgroup_lesson_entity)
             self.group_service.bump_schedule_updated_at(group_id=group.id)
+            self.group_lesson_change_service.record(added=[group_subgroup_lesson_entity])
+
+        self.timetable_index_service.record(added=[group_subgroup_lesson_entity])
+        self.group_schedule_snapshot_service.rebuild(group_uuid=group.uuid)
 
         return group, lesson
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from core.apps.clients.services.client import BaseClientService
+from core.apps.common.models import ClientRole
+from core.apps.schedule.entities.group import Group as GroupEntity
+from core.apps.schedule.entities.group_lessons import (
+    GroupLessonOperation,
+    GroupLessonOperationResult,
+)
+from core.apps.schedule.services.group import BaseGroupService
+from core.apps.schedule.services.group_lesson_batch import BaseGroupLessonBatchService
+from core.apps.schedule.validators.group_lesson import BaseGroupLessonValidatorService
+
+
+@dataclass
+class HeadmanBatchUpdateGroupLessonsUseCase:
+    client_service: BaseClientService
+    group_service: BaseGroupService
+    group_lesson_batch_service: BaseGroupLessonBatchService
+
+    group_lesson_validator_service: BaseGroupLessonValidatorService
+
+    def execute(
+            self,
+            headman_email: str,
+            operations: list[GroupLessonOperation],
+    ) -> tuple[GroupEntity, list[GroupLessonOperationResult]]:
+        client = self.client_service.get_by_email(client_email=headman_email)
+        self.group_lesson_validator_service.validate(client_roles=client.roles, required_role=ClientRole.HEADMAN)
+
+        group = self.group_service.get_group_from_headman(headman_id=client.id)
+
+        return group, self.group_lesson_batch_service.apply(group=group, operations=operations)
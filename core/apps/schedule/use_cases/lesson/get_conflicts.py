@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from core.apps.schedule.entities.timetable_index import (
+    ConflictDimension,
+    TimetableConflict,
+)
+from core.apps.schedule.services.timetable_index import BaseTimetableIndexService
+
+
+@dataclass
+class GetTimetableConflictsUseCase:
+    timetable_index_service: BaseTimetableIndexService
+
+    def execute(self, dimension: ConflictDimension | None = None) -> list[TimetableConflict]:
+        conflicts = self.timetable_index_service.get_conflicts()
+        if dimension is not None:
+            conflicts = [conflict for conflict in conflicts if conflict.dimension == dimension]
+        return conflicts
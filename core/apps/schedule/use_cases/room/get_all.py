@@ -10,6 +10,11 @@ from core.apps.schedule.services.room import BaseRoomService
 class GetAllRoomsUseCase:
     room_service: BaseRoomService
 
-    @cache_decorator.get_or_set_cache(model_prefix='room', func_prefix='all', timeout=Timeout.WEEK)
+    @cache_decorator.get_or_set_cache(
+        model_prefix='room',
+        func_prefix='all',
+        timeout=Timeout.WEEK,
+        stale_after=Timeout.DAY,
+    )
     def execute(self) -> list[RoomEntity]:
         return list(self.room_service.get_all())
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+from core.apps.common.cache.decorator import cache_decorator
+from core.apps.common.cache.timeouts import Timeout
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+)
+from core.apps.schedule.entities.room import Room as RoomEntity
+from core.apps.schedule.services.room import BaseRoomService
+from core.apps.schedule.services.timetable_index import BaseTimetableIndexService
+
+
+@dataclass
+class GetFreeRoomsUseCase:
+    """Lists the rooms without a lesson in any of the requested slots.
+
+    Occupancy comes from the room bitmaps of the timetable index and the
+    room list from the cached document `GetAllRoomsUseCase` serves, so a
+    warm request does not query the database. Without `is_even` a room
+    has to be free in both week parities.
+
+    """
+    room_service: BaseRoomService
+    timetable_index_service: BaseTimetableIndexService
+
+    def execute(self, day: Day, ord_numbers: list[OrdinaryNumber], is_even: bool | None = None) -> list[RoomEntity]:
+        parities = (True, False) if is_even is None else (is_even,)
+        rooms = {room.uuid: room for room in self.get_rooms()}
+        free_uuids = self.timetable_index_service.find_free_rooms(
+            room_uuids=rooms.keys(),
+            timeslots=[(day, ord_number, parity) for ord_number in ord_numbers for parity in parities],
+        )
+        return [rooms[uuid] for uuid in free_uuids]
+
+    # Same key spec as `GetAllRoomsUseCase.execute`, so both share one entry.
+    @cache_decorator.get_or_set_cache(
+        model_prefix='room',
+        func_prefix='all',
+        timeout=Timeout.WEEK,
+        stale_after=Timeout.DAY,
+    )
+    def get_rooms(self) -> list[RoomEntity]:
+        return list(self.room_service.get_all())
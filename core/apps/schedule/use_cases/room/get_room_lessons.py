@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from core.apps.common.cache.decorator import cache_decorator
+from core.apps.common.cache.timeouts import Timeout
+from core.apps.schedule.entities.room import Room as RoomEntity
+from core.apps.schedule.entities.timetable import Timetable
+from core.apps.schedule.filters.group import LessonFilter
+from core.apps.schedule.services.lesson import BaseLessonService
+from core.apps.schedule.services.room import BaseRoomService
+from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
+
+
+@dataclass
+class GetLessonsForRoomUseCase:
+    room_service: BaseRoomService
+    lesson_service: BaseLessonService
+
+    uuid_validator_service: BaseUuidValidatorService
+
+    @cache_decorator.get_or_set_cache(
+        model_prefix='room',
+        identifier=lambda kw: kw['room_uuid'],
+        func_prefix='lessons',
+        timeout=Timeout.HALF_DAY,
+        dependencies=lambda result: result[1].dependencies(),
+    )
+    def execute(
+            self,
+            room_uuid: str,
+            filters: LessonFilter,
+    ) -> tuple[RoomEntity, Timetable]:
+        self.uuid_validator_service.validate(uuid_str=room_uuid)
+
+        room = self.room_service.get_by_uuid(room_uuid=room_uuid)
+        timetable = self.lesson_service.get_lessons_with_groups_for_room(
+            room_id=room.id,
+            filter_query=filters,
+        )
+
+        return room, timetable
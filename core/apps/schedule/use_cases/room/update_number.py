@@ -17,9 +17,9 @@ class UpdateRoomNumberUseCase:
     @cache_decorator.delete_caches([
         dict(model_prefix='room', func_prefix='all'),
         dict(model_prefix='room', func_prefix='list', filters='*', pagination_in='*'),
-        dict(model_prefix='group', identifier='*', func_prefix='lessons', filters='*'),
-        dict(model_prefix='teacher', identifier='*', func_prefix='lessons', filters='*'),
+        dict(model_prefix='room', identifier=lambda kw: kw['room_uuid'], func_prefix='lessons'),
     ])
+    @cache_decorator.delete_dependents('room', identifier=lambda kw: kw['room_uuid'])
     def execute(self, room_uuid: str, new_number: str) -> RoomEntity:
         self.uuid_validator_service.validate(uuid_str=room_uuid)
 
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+from core.apps.schedule.entities.search import (
+    SearchHit,
+    SearchKind,
+)
+from core.apps.schedule.services.search import BaseSearchService
+
+
+@dataclass
+class TypeaheadSearchUseCase:
+    search_service: BaseSearchService
+
+    def execute(self, query: str, kinds: Iterable[SearchKind] | None = None, limit: int = 10) -> list[SearchHit]:
+        return self.search_service.search(query=query, kinds=kinds or list(SearchKind), limit=limit)
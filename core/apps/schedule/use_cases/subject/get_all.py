@@ -10,6 +10,11 @@ from core.apps.schedule.services.subject import BaseSubjectService
 class GetAllSubjectsUseCase:
     subject_service: BaseSubjectService
 
-    @cache_decorator.get_or_set_cache(model_prefix='subject', func_prefix='all', timeout=Timeout.WEEK)
+    @cache_decorator.get_or_set_cache(
+        model_prefix='subject',
+        func_prefix='all',
+        timeout=Timeout.WEEK,
+        stale_after=Timeout.DAY,
+    )
     def execute(self) -> list[SubjectEntity]:
         return list(self.subject_service.get_all())
@@ -18,9 +18,8 @@ class UpdateSubjectUseCase:
     @cache_decorator.delete_caches([
         dict(model_prefix='subject', func_prefix='all'),
         dict(model_prefix='subject', func_prefix='list', filters='*', pagination_in='*'),
-        dict(model_prefix='group', identifier='*', func_prefix='lessons', filters='*'),
-        dict(model_prefix='teacher', identifier='*', func_prefix='lessons', filters='*'),
     ])
+    @cache_decorator.delete_dependents('subject', identifier=lambda kw: kw['subject_uuid'])
     def execute(self, subject_uuid: str, title: str) -> SubjectEntity:
         self.uuid_validator_service.validate(uuid_str=subject_uuid)
 
@@ -10,6 +10,11 @@ from core.apps.schedule.services.teacher import BaseTeacherService
 class GetAllTeachersUseCase:
     teacher_service: BaseTeacherService
 
-    @cache_decorator.get_or_set_cache(model_prefix='teacher', func_prefix='all', timeout=Timeout.WEEK)
+    @cache_decorator.get_or_set_cache(
+        model_prefix='teacher',
+        func_prefix='all',
+        timeout=Timeout.WEEK,
+        stale_after=Timeout.DAY,
+    )
     def execute(self) -> list[TeacherEntity]:
         return list(self.teacher_service.get_all())
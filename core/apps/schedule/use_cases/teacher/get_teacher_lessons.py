@@ -3,13 +3,18 @@ from dataclasses import dataclass
 from core.apps.common.cache.decorator import cache_decorator
 from core.apps.common.cache.timeouts import Timeout
 from core.apps.schedule.entities.teacher import Teacher as TeacherEntity
-from core.apps.schedule.entities.views import LessonWithGroupsView
+from core.apps.schedule.entities.timetable import Timetable
 from core.apps.schedule.filters.group import LessonFilter
 from core.apps.schedule.services.lesson import BaseLessonService
 from core.apps.schedule.services.teacher import BaseTeacherService
 from core.apps.schedule.validators.uuid_validator import BaseUuidValidatorService
 
 
+# Part of the cache key: entries cached before teachers got a Timetable
+# are never read back.
+TEACHER_LESSONS_CACHE_SUFFIX = 'timetable'
+
+
 @dataclass
 class GetLessonsForTeacherUseCase:
     teacher_service: BaseTeacherService
@@ -21,19 +26,21 @@ class GetLessonsForTeacherUseCase:
         model_prefix='teacher',
         identifier=lambda kw: kw['teacher_uuid'],
         func_prefix='lessons',
+        filters=lambda kw: (TEACHER_LESSONS_CACHE_SUFFIX, kw['filters']),
         timeout=Timeout.HALF_DAY,
+        dependencies=lambda result: result[1].dependencies(),
     )
     def execute(
             self,
             teacher_uuid: str,
             filters: LessonFilter,
-    ) -> tuple[TeacherEntity, list[LessonWithGroupsView]]:
+    ) -> tuple[TeacherEntity, Timetable]:
         self.uuid_validator_service.validate(uuid_str=teacher_uuid)
 
         teacher = self.teacher_service.get_by_uuid(teacher_uuid=teacher_uuid)
-        views = self.lesson_service.get_lessons_with_groups_for_teacher(
+        timetable = self.lesson_service.get_lessons_with_groups_for_teacher(
             teacher_id=teacher.id,
             filter_query=filters,
         )
 
-        return teacher, views
+        return teacher, timetable
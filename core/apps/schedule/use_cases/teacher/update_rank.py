@@ -19,8 +19,8 @@ class UpdateTeacherRankUseCase:
         dict(model_prefix='teacher', func_prefix='all'),
         dict(model_prefix='teacher', func_prefix='list', filters='*', pagination_in='*'),
         dict(model_prefix='teacher', identifier=lambda kw: kw['teacher_uuid'], func_prefix='*', filters='*'),
-        dict(model_prefix='group', identifier='*', func_prefix='lessons', filters='*'),
     ])
+    @cache_decorator.delete_dependents('teacher', identifier=lambda kw: kw['teacher_uuid'])
     def execute(self, teacher_uuid: str, rank: TeachersDegree) -> TeacherEntity:
         self.uuid_validator_service.validate(uuid_str=teacher_uuid)
 
@@ -2,18 +2,26 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from dataclasses import dataclass
+from dataclasses import (
+    asdict,
+    dataclass,
+)
 
 from core.apps.clients.services.client_auth import BaseClientAuthService
+from core.apps.common.exceptions import ServiceException
 from core.apps.common.models import (
     ClientRole,
     Subgroup,
 )
 from core.apps.schedule.entities.group import Group
 from core.apps.schedule.entities.group_lessons import GroupLesson
-from core.apps.schedule.exceptions.group_lesson import GroupLessonAlreadyExists
+from core.apps.schedule.exceptions.group_lesson import (
+    GroupLessonAlreadyExists,
+    GroupLessonScheduleConflict,
+)
 from core.apps.schedule.services.group import BaseGroupService
 from core.apps.schedule.services.group_lessons import BaseGroupLessonService
+from core.apps.schedule.services.timetable_index import BaseTimetableIndexService
 
 
 class BaseGroupLessonValidatorService(ABC):
@@ -26,9 +34,39 @@ class BaseGroupLessonValidatorService(ABC):
             group: Group | None = None,
             subgroup: Subgroup | None = None,
             group_lesson: GroupLesson | None = None,
+            old_group_lesson: GroupLesson | None = None,
     ):
         ...
 
+    def validate_many(
+            self,
+            group_lessons: list[GroupLesson],
+            old_group_lessons: list[GroupLesson | None] | None = None,
+    ) -> list[ServiceException | None]:
+        """Validate each assignment and return its first error instead of
+        raising it, so a batch can report every failing item.
+
+        `old_group_lessons`, when given, pairs every assignment with the
+        one it replaces.
+
+        """
+        if old_group_lessons is None:
+            old_group_lessons = [None] * len(group_lessons)
+        errors = []
+        for group_lesson, old_group_lesson in zip(group_lessons, old_group_lessons):
+            try:
+                self.validate(
+                    group=group_lesson.group,
+                    subgroup=group_lesson.subgroup,
+                    group_lesson=group_lesson,
+                    old_group_lesson=old_group_lesson,
+                )
+            except ServiceException as error:
+                errors.append(error)
+            else:
+                errors.append(None)
+        return errors
+
 
 @dataclass
 class CheckGroupHasSubgroupValidatorService(BaseGroupLessonValidatorService):
@@ -67,6 +105,48 @@ class CheckLessonInGroupAlreadyExistsValidatorService(BaseGroupLessonValidatorSe
                     subgroup=group_lesson.subgroup,
                 )
 
+    def validate_many(
+            self,
+            group_lessons: list[GroupLesson],
+            old_group_lessons: list[GroupLesson | None] | None = None,
+    ) -> list[ServiceException | None]:
+        existing = self.group_lesson_service.find_existing(group_lessons=group_lessons)
+        return [
+            GroupLessonAlreadyExists(
+                group_uuid=group_lesson.group.uuid,
+                lesson_uuid=group_lesson.lesson.uuid,
+                subgroup=group_lesson.subgroup,
+            )
+            if (group_lesson.group.id, group_lesson.lesson.id, group_lesson.subgroup) in existing
+            else None
+            for group_lesson in group_lessons
+        ]
+
+
+@dataclass
+class CheckLessonScheduleConflictValidatorService(BaseGroupLessonValidatorService):
+    timetable_index_service: BaseTimetableIndexService
+
+    def validate(
+            self,
+            group_lesson: GroupLesson | None = None,
+            old_group_lesson: GroupLesson | None = None,
+            *args,
+            **kwargs,
+    ):
+        if group_lesson:
+            conflicts = self.timetable_index_service.find_conflicts(
+                group_lesson=group_lesson,
+                replaced=old_group_lesson,
+            )
+            if conflicts:
+                raise GroupLessonScheduleConflict(
+                    group_uuid=group_lesson.group.uuid,
+                    lesson_uuid=group_lesson.lesson.uuid,
+                    subgroup=group_lesson.subgroup,
+                    conflicts=[asdict(conflict) for conflict in conflicts],
+                )
+
 
 @dataclass
 class ComposedGroupLessonValidatorService(BaseGroupLessonValidatorService):
@@ -79,6 +159,7 @@ class ComposedGroupLessonValidatorService(BaseGroupLessonValidatorService):
             group: Group | None = None,
             subgroup: Subgroup | None = None,
             group_lesson: GroupLesson | None = None,
+            old_group_lesson: GroupLesson | None = None,
     ):
         for validator in self.validators:
             validator.validate(
@@ -87,4 +168,18 @@ class ComposedGroupLessonValidatorService(BaseGroupLessonValidatorService):
                 group=group,
                 subgroup=subgroup,
                 group_lesson=group_lesson,
+                old_group_lesson=old_group_lesson,
             )
+
+    def validate_many(
+            self,
+            group_lessons: list[GroupLesson],
+            old_group_lessons: list[GroupLesson | None] | None = None,
+    ) -> list[ServiceException | None]:
+        errors: list[ServiceException | None] = [None] * len(group_lessons)
+        for validator in self.validators:
+            results = validator.validate_many(group_lessons=group_lessons, old_group_lessons=old_group_lessons)
+            for index, error in enumerate(results):
+                if errors[index] is None:
+                    errors[index] = error
+        return errors
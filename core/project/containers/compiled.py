@@ -0,0 +1,137 @@
+import punq
+from dataclasses import (
+    fields,
+    is_dataclass,
+    MISSING,
+)
+from enum import Enum
+from inspect import (
+    Parameter,
+    signature,
+)
+from typing import (
+    Any,
+    Callable,
+)
+
+
+Factory = Callable[[], Any]
+
+IMMUTABLE_TYPES = (str, bytes, int, float, Enum)
+
+
+class CompiledContainer(punq.Container):
+    """Punq container that can be compiled into a table of ready-made
+    factories.
+
+    `compile` walks every registration once, resolves its constructor
+    arguments up front and stores a zero-argument factory per service,
+    so `resolve` becomes a dict lookup and a call instead of punq's
+    reflection over the dependency graph. Services found to be stateless
+    are built once and handed out as singletons. A service counts as
+    stateless when every attribute of a freshly built instance is either
+    immutable, a stateless singleton from this container (or a non-empty
+    list or a tuple of them), or the very object its dataclass `default_factory`
+    returns each time (a process-wide `lru_cache` getter). Everything
+    else, and any `resolve` called with extra arguments, falls back to
+    punq's transient resolution.
+
+    """
+
+    def __init__(self):
+        self._services: list[Any] = []
+        self._compiled: dict[Any, Factory] = {}
+        self._shared: dict[Any, Any] = {}
+        self._shared_ids: set[int] = set()
+        super().__init__()
+
+    @property
+    def singletons(self) -> dict[Any, Any]:
+        return self._shared
+
+    @property
+    def is_compiled(self) -> bool:
+        return bool(self._compiled)
+
+    def register(self, service, factory=punq.empty, instance=punq.empty, scope=punq.Scope.transient, **kwargs):
+        self._compiled.clear()
+        self._shared.clear()
+        self._shared_ids.clear()
+        if service not in self._services:
+            self._services.append(service)
+        return super().register(service, factory=factory, instance=instance, scope=scope, **kwargs)
+
+    def compile(self) -> None:
+        for service in self._services:
+            self._compile(service)
+
+    def resolve(self, service_key, **kwargs):
+        if not kwargs:
+            factory = self._compiled.get(service_key)
+            if factory is not None:
+                return factory()
+        return super().resolve(service_key, **kwargs)
+
+    def _compile(self, service) -> Factory:
+        factory = self._compiled.get(service)
+        if factory is not None:
+            return factory
+
+        registration = self.registrations[service][-1]
+        if registration.scope == punq.Scope.singleton:
+            instance = registration.builder()
+            factory = self._compiled[service] = self._singleton_factory(service, instance)
+            return factory
+
+        dependencies = self._compile_dependencies(registration)
+        builder, args = registration.builder, registration.args
+
+        def factory():
+            return builder(**args, **{name: dependency() for name, dependency in dependencies.items()})
+
+        instance = factory()
+        if self._is_stateless(instance):
+            factory = self._singleton_factory(service, instance)
+        self._compiled[service] = factory
+        return factory
+
+    def _compile_dependencies(self, registration) -> dict[str, Factory]:
+        parameters = signature(registration.builder).parameters
+        dependencies = {}
+        for name, hint in registration.needs.items():
+            if name == 'return' or name in registration.args:
+                continue
+            if self.registrations[hint]:
+                dependencies[name] = self._compile(hint)
+            elif name not in parameters or parameters[name].default is Parameter.empty:
+                raise punq.MissingDependencyError(f'Failed to resolve implementation for {hint}')
+        return dependencies
+
+    def _singleton_factory(self, service, instance) -> Factory:
+        self._shared[service] = instance
+        self._shared_ids.add(id(instance))
+        return lambda: instance
+
+    def _is_stateless(self, instance) -> bool:
+        try:
+            attributes = vars(instance)
+        except TypeError:
+            return False
+        default_factories = {
+            field.name: field.default_factory
+            for field in fields(instance) if field.default_factory is not MISSING
+        } if is_dataclass(instance) else {}
+        return all(
+            self._is_shared(value) or (name in default_factories and default_factories[name]() is value)
+            for name, value in attributes.items()
+        )
+
+    def _is_shared(self, value) -> bool:
+        if value is None or isinstance(value, IMMUTABLE_TYPES):
+            return True
+        if isinstance(value, tuple):
+            return all(self._is_shared(item) for item in value)
+        if isinstance(value, list):
+            # An empty list is more likely a buffer than a set of injected services.
+            return bool(value) and all(self._is_shared(item) for item in value)
+        return id(value) in self._shared_ids
@@ -1,6 +1,9 @@
+from django.conf import settings
+
 import punq
 from functools import lru_cache
 
+from core.project.containers.compiled import CompiledContainer
 from core.project.containers.services.cache.cache import register_cache_services
 from core.project.containers.services.client.client import register_client_services
 from core.project.containers.services.schedule import register_schedule_services
@@ -14,7 +17,7 @@ def get_container() -> punq.Container:
 
 
 def _initialize_container() -> punq.Container:
-    container = punq.Container()
+    container = CompiledContainer()
 
     # Validator containers
     register_validators(container=container)
@@ -31,4 +34,7 @@ def _initialize_container() -> punq.Container:
     # Time containers
     register_time_services(container=container)
 
+    if settings.DI_CONTAINER_COMPILED:
+        container.compile()
+
     return container
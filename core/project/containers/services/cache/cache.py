@@ -1,12 +1,17 @@
 import punq
 
 from core.apps.common.cache.class_decorator import CacheDecorator
+from core.apps.common.cache.metrics import (
+    BaseCacheMetricsService,
+    get_cache_metrics,
+)
 from core.apps.common.cache.service import (
     BaseCacheService,
-    RedisCacheService,
+    TwoTierCacheService,
 )
 
 
 def register_cache_services(container: punq.Container):
-    container.register(BaseCacheService, RedisCacheService)
+    container.register(BaseCacheService, TwoTierCacheService)
+    container.register(BaseCacheMetricsService, instance=get_cache_metrics())
     container.register(CacheDecorator)
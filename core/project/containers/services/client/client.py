@@ -1,3 +1,5 @@
+from django.conf import settings
+
 import punq
 
 from core.apps.clients.services.client import (
@@ -10,7 +12,7 @@ from core.apps.clients.services.client_auth import (
 )
 from core.apps.clients.services.issuedjwttoken import (
     BaseIssuedJwtTokenService,
-    ORMIssuedJwtTokenService,
+    RedisIssuedJwtTokenService,
 )
 from core.apps.clients.services.role import (
     BaseRoleService,
@@ -32,6 +34,7 @@ from core.apps.clients.usecases.headman.get_headman_group import GetHeadmanGroup
 from core.apps.common.authentication.password import (
     BasePasswordService,
     BcryptPasswordService,
+    PooledBcryptPasswordService,
 )
 from core.apps.common.authentication.token import (
     BaseTokenService,
@@ -42,9 +45,12 @@ from core.apps.common.authentication.token import (
 def register_client_services(container: punq.Container):
     container.register(BaseClientService, ORMClientService)
     container.register(BaseClientAuthService, ORMClientAuthService)
-    container.register(BasePasswordService, BcryptPasswordService)
+    if settings.PASSWORD_HASH_WORKERS > 0:
+        container.register(BasePasswordService, PooledBcryptPasswordService)
+    else:
+        container.register(BasePasswordService, BcryptPasswordService)
     container.register(BaseTokenService, JWTTokenService)
-    container.register(BaseIssuedJwtTokenService, ORMIssuedJwtTokenService)
+    container.register(BaseIssuedJwtTokenService, RedisIssuedJwtTokenService)
     container.register(BaseRoleService, ORMRoleService)
 
     container.register(CreateClientUseCase)
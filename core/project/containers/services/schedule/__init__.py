@@ -5,10 +5,13 @@ from core.project.containers.services.schedule.group import register_group_servi
 from core.project.containers.services.schedule.group_lesson import register_group_lesson_services
 from core.project.containers.services.schedule.lesson import register_lesson_services
 from core.project.containers.services.schedule.room import register_room_services
+from core.project.containers.services.schedule.schedule_version import register_schedule_version_services
+from core.project.containers.services.schedule.search import register_search_services
 from core.project.containers.services.schedule.semester_settings import register_semester_settings_services
 from core.project.containers.services.schedule.subject import register_subject_services
 from core.project.containers.services.schedule.teacher import register_teacher_services
 from core.project.containers.services.schedule.timeslot import register_timeslot_services
+from core.project.containers.services.schedule.timetable_index import register_timetable_index_services
 
 
 def register_schedule_services(container: punq.Container):
@@ -21,3 +24,6 @@ def register_schedule_services(container: punq.Container):
     register_timeslot_services(container=container)
     register_faculty_services(container=container)
     register_semester_settings_services(container=container)
+    register_schedule_version_services(container=container)
+    register_timetable_index_services(container=container)
+    register_search_services(container=container)
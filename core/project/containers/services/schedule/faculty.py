@@ -8,6 +8,7 @@ from core.apps.schedule.use_cases.faculty.create import CreateFacultyUseCase
 from core.apps.schedule.use_cases.faculty.delete import DeleteFacultyUseCase
 from core.apps.schedule.use_cases.faculty.get_all import GetAllFacultiesUseCase
 from core.apps.schedule.use_cases.faculty.get_list import GetFacultyListUseCase
+from core.apps.schedule.use_cases.faculty.import_timetable import ImportFacultyTimetableUseCase
 from core.apps.schedule.use_cases.faculty.update_code_name import UpdateFacultyCodeNameUseCase
 from core.apps.schedule.use_cases.faculty.update_name import UpdateFacultyNameUseCase
 
@@ -21,3 +22,4 @@ def register_faculty_services(container: punq.Container):
     container.register(UpdateFacultyNameUseCase)
     container.register(UpdateFacultyCodeNameUseCase)
     container.register(DeleteFacultyUseCase)
+    container.register(ImportFacultyTimetableUseCase)
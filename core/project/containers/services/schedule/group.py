@@ -4,16 +4,28 @@ from core.apps.schedule.services.group import (
     BaseGroupService,
     ORMGroupService,
 )
+from core.apps.schedule.services.group_lesson_batch import (
+    BaseGroupLessonBatchService,
+    ORMGroupLessonBatchService,
+)
+from core.apps.schedule.services.group_schedule_snapshot import (
+    BaseGroupScheduleSnapshotService,
+    CachedGroupScheduleSnapshotService,
+)
 from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.admin_batch_lessons import AdminBatchUpdateGroupLessonsUseCase
 from core.apps.schedule.use_cases.group.admin_remove_lesson import AdminRemoveLessonFromGroupUseCase
 from core.apps.schedule.use_cases.group.admin_update_lesson import AdminUpdateLessonInGroupUseCase
 from core.apps.schedule.use_cases.group.create import CreateGroupUseCase
 from core.apps.schedule.use_cases.group.delete import DeleteGroupUseCase
 from core.apps.schedule.use_cases.group.get_all import GetAllGroupsUseCase
 from core.apps.schedule.use_cases.group.get_group_lessons import GetGroupLessonsUseCase
+from core.apps.schedule.use_cases.group.get_groups_lessons import GetGroupsLessonsUseCase
 from core.apps.schedule.use_cases.group.get_info import GetGroupInfoUseCase
+from core.apps.schedule.use_cases.group.get_lesson_changes import GetGroupLessonChangesUseCase
 from core.apps.schedule.use_cases.group.get_list import GetGroupListUseCase
 from core.apps.schedule.use_cases.group.headman_add_lesson import HeadmanAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.headman_batch_lessons import HeadmanBatchUpdateGroupLessonsUseCase
 from core.apps.schedule.use_cases.group.headman_remove_lesson import HeadmanRemoveLessonFromGroupUseCase
 from core.apps.schedule.use_cases.group.headman_update_lesson import HeadmanUpdateLessonInGroupUseCase
 from core.apps.schedule.use_cases.group.update_headman import UpdateGroupHeadmanUseCase
@@ -21,12 +33,16 @@ from core.apps.schedule.use_cases.group.update_headman import UpdateGroupHeadman
 
 def register_group_services(container: punq.Container):
     container.register(BaseGroupService, ORMGroupService)
+    container.register(BaseGroupScheduleSnapshotService, CachedGroupScheduleSnapshotService)
+    container.register(BaseGroupLessonBatchService, ORMGroupLessonBatchService)
 
     container.register(GetAllGroupsUseCase)
     container.register(GetGroupListUseCase)
     container.register(CreateGroupUseCase)
     container.register(DeleteGroupUseCase)
     container.register(GetGroupLessonsUseCase)
+    container.register(GetGroupsLessonsUseCase)
+    container.register(GetGroupLessonChangesUseCase)
     container.register(GetGroupInfoUseCase)
     container.register(UpdateGroupHeadmanUseCase)
     container.register(AdminAddLessonToGroupUseCase)
@@ -35,3 +51,5 @@ def register_group_services(container: punq.Container):
     container.register(HeadmanAddLessonToGroupUseCase)
     container.register(HeadmanUpdateLessonInGroupUseCase)
     container.register(HeadmanRemoveLessonFromGroupUseCase)
+    container.register(AdminBatchUpdateGroupLessonsUseCase)
+    container.register(HeadmanBatchUpdateGroupLessonsUseCase)
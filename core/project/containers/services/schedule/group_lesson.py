@@ -1,5 +1,9 @@
 import punq
 
+from core.apps.schedule.services.group_lesson_changes import (
+    BaseGroupLessonChangeService,
+    ORMGroupLessonChangeService,
+)
 from core.apps.schedule.services.group_lessons import (
     BaseGroupLessonService,
     ORMGroupLessonService,
@@ -8,3 +12,4 @@ from core.apps.schedule.services.group_lessons import (
 
 def register_group_lesson_services(container: punq.Container):
     container.register(BaseGroupLessonService, ORMGroupLessonService)
+    container.register(BaseGroupLessonChangeService, ORMGroupLessonChangeService)
@@ -7,7 +7,9 @@ from core.apps.schedule.services.room import (
 from core.apps.schedule.use_cases.room.create import CreateRoomUseCase
 from core.apps.schedule.use_cases.room.delete import DeleteRoomUseCase
 from core.apps.schedule.use_cases.room.get_all import GetAllRoomsUseCase
+from core.apps.schedule.use_cases.room.get_free import GetFreeRoomsUseCase
 from core.apps.schedule.use_cases.room.get_list import GetRoomListUseCase
+from core.apps.schedule.use_cases.room.get_room_lessons import GetLessonsForRoomUseCase
 from core.apps.schedule.use_cases.room.update_description import UpdateRoomDescriptionUseCase
 from core.apps.schedule.use_cases.room.update_number import UpdateRoomNumberUseCase
 
@@ -18,6 +20,8 @@ def register_room_services(container: punq.Container):
     container.register(CreateRoomUseCase)
     container.register(GetRoomListUseCase)
     container.register(GetAllRoomsUseCase)
+    container.register(GetFreeRoomsUseCase)
+    container.register(GetLessonsForRoomUseCase)
     container.register(UpdateRoomNumberUseCase)
     container.register(UpdateRoomDescriptionUseCase)
     container.register(DeleteRoomUseCase)
@@ -0,0 +1,10 @@
+import punq
+
+from core.apps.schedule.services.schedule_version import (
+    BaseScheduleVersionService,
+    CacheScheduleVersionService,
+)
+
+
+def register_schedule_version_services(container: punq.Container):
+    container.register(BaseScheduleVersionService, CacheScheduleVersionService)
@@ -0,0 +1,13 @@
+import punq
+
+from core.apps.schedule.services.search import (
+    BaseSearchService,
+    ORMSearchService,
+)
+from core.apps.schedule.use_cases.search.typeahead import TypeaheadSearchUseCase
+
+
+def register_search_services(container: punq.Container):
+    container.register(BaseSearchService, ORMSearchService)
+
+    container.register(TypeaheadSearchUseCase)
@@ -0,0 +1,13 @@
+import punq
+
+from core.apps.schedule.services.timetable_index import (
+    BaseTimetableIndexService,
+    InMemoryTimetableIndexService,
+)
+from core.apps.schedule.use_cases.lesson.get_conflicts import GetTimetableConflictsUseCase
+
+
+def register_timetable_index_services(container: punq.Container):
+    container.register(BaseTimetableIndexService, InMemoryTimetableIndexService)
+
+    container.register(GetTimetableConflictsUseCase)
@@ -4,6 +4,7 @@ from core.apps.schedule.validators.group_lesson import (
     BaseGroupLessonValidatorService,
     CheckGroupHasSubgroupValidatorService,
     CheckLessonInGroupAlreadyExistsValidatorService,
+    CheckLessonScheduleConflictValidatorService,
     ClientDoesNotMatchRolesValidatorService,
     ComposedGroupLessonValidatorService,
 )
@@ -13,6 +14,7 @@ def register_group_lesson_validators(container: punq.Container):
     container.register(CheckGroupHasSubgroupValidatorService)
     container.register(ClientDoesNotMatchRolesValidatorService)
     container.register(CheckLessonInGroupAlreadyExistsValidatorService)
+    container.register(CheckLessonScheduleConflictValidatorService)
 
     def build_group_lesson_validators() -> BaseGroupLessonValidatorService:
         return ComposedGroupLessonValidatorService(
@@ -20,6 +22,7 @@ def register_group_lesson_validators(container: punq.Container):
                 container.resolve(CheckGroupHasSubgroupValidatorService),
                 container.resolve(ClientDoesNotMatchRolesValidatorService),
                 container.resolve(CheckLessonInGroupAlreadyExistsValidatorService),
+                container.resolve(CheckLessonScheduleConflictValidatorService),
             ],
         )
 
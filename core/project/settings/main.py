@@ -157,3 +157,34 @@ CACHES = {
         },
     },
 }
+
+# Per-worker in-process cache in front of Redis (see core/apps/common/cache/local.py).
+# Setting any of the limits to 0 disables it.
+LOCAL_CACHE_MAX_ENTRIES = env.int('LOCAL_CACHE_MAX_ENTRIES', default=1024)
+LOCAL_CACHE_MAX_BYTES = env.int('LOCAL_CACHE_MAX_BYTES', default=64 * 1024 * 1024)
+LOCAL_CACHE_TTL = env.int('LOCAL_CACHE_TTL', default=300)
+# How long a worker trusts its copy of a namespace generation before asking Redis again;
+# this bounds how stale another worker's data can be after an invalidation.
+LOCAL_CACHE_GENERATION_TTL = env.float('LOCAL_CACHE_GENERATION_TTL', default=1.0)
+
+# Seconds each worker buffers cache hit/miss counters before shipping them to Redis.
+CACHE_METRICS_FLUSH_INTERVAL = env.float('CACHE_METRICS_FLUSH_INTERVAL', default=5.0)
+
+# bcrypt cost factor for new hashes; existing hashes are upgraded on the next successful login.
+PASSWORD_HASH_ROUNDS = env.int('PASSWORD_HASH_ROUNDS', default=12)
+# Threads per worker that run bcrypt off the request thread, and how many more calls may queue
+# behind them before logins are rejected with 503. 0 workers hashes inline on the request thread.
+PASSWORD_HASH_WORKERS = env.int('PASSWORD_HASH_WORKERS', default=2)
+PASSWORD_HASH_MAX_PENDING = env.int('PASSWORD_HASH_MAX_PENDING', default=16)
+
+# Compile the dependency container when it is first built: stateless services become singletons and
+# every resolve is a dict lookup (see core/project/containers/compiled.py). False keeps punq's
+# per-call reflection, e.g. to compare the two.
+DI_CONTAINER_COMPILED = env.bool('DI_CONTAINER_COMPILED', default=True)
+
+# Days of group lesson changes kept for delta sync; clients that last synced before that get the whole timetable.
+GROUP_LESSON_CHANGES_RETENTION_DAYS = env.int('GROUP_LESSON_CHANGES_RETENTION_DAYS', default=30)
+
+# Async public reads run their ORM and cache work on asgiref's thread pool (see core/apps/common/threads.py).
+# True runs it on the thread sync views use instead, which the test suite needs to see data it has not committed.
+ASYNC_READS_THREAD_SENSITIVE = env.bool('ASYNC_READS_THREAD_SENSITIVE', default=False)
@@ -15,3 +15,9 @@ import os
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.project.settings.dev')
 
 application = get_wsgi_application()
+
+# Build the dependency container while the worker boots instead of on its first request.
+from core.project.containers.containers import get_container  # noqa: E402
+
+
+get_container()
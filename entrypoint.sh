@@ -1,8 +1,14 @@
 #!/bin/bash
 # !WARNING This file should not contain last blank line
 WORKERS="${GUNICORN_WORKERS:-2}"
+# asgi: uvicorn workers serving core.project.asgi (async public endpoints); wsgi: classic sync workers.
+if [ "${APP_SERVER:-asgi}" = "asgi" ]; then
+    SERVER_ARGS="core.project.asgi:application -k uvicorn_worker.UvicornWorker"
+else
+    SERVER_ARGS="core.project.wsgi:application"
+fi
 if [ "${DJANGO_ENV}" = "dev" ]; then
-    exec gunicorn core.project.wsgi:application -w "${WORKERS}" --bind 0.0.0.0:8000 --reload
+    exec gunicorn ${SERVER_ARGS} -w "${WORKERS}" --bind 0.0.0.0:8000 --reload
 else
-    exec gunicorn core.project.wsgi:application -w "${WORKERS}" --bind 0.0.0.0:8000
+    exec gunicorn ${SERVER_ARGS} -w "${WORKERS}" --bind 0.0.0.0:8000
 fi
\ No newline at end of file
@@ -0,0 +1,28 @@
+from django.core.cache import cache
+
+import pytest
+import uuid
+from tests.factories.client.client import ClientModelFactory
+from tests.factories.client.role import RoleModelFactory
+
+from core.apps.common.authentication.token import BaseTokenService
+from core.apps.common.models import ClientRole
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def auth_header(container):
+    def _build(role: ClientRole = ClientRole.ADMIN) -> dict[str, str]:
+        client = ClientModelFactory.create(roles=[RoleModelFactory(id=role)])
+        token = container.resolve(BaseTokenService).create_access_token(
+            client=client.to_entity(),
+            payload={'device_id': str(uuid.uuid4())},
+        )
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+    return _build
@@ -0,0 +1,89 @@
+from django.core.cache import cache
+from django.test import AsyncClient
+
+import asyncio
+import pytest
+from asgiref.sync import async_to_sync
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+
+from core.api.v1.schedule.groups.handlers import (
+    get_all_groups,
+    get_group_lesson_changes,
+    get_group_lessons,
+    get_groups_lessons,
+)
+from core.api.v1.schedule.rooms.handlers import get_lessons_for_room
+from core.api.v1.schedule.search.handlers import search_schedule
+from core.api.v1.schedule.teachers.handlers import (
+    get_all_teachers,
+    get_lessons_for_teacher,
+)
+from core.api.v1.time.handlers import get_current_time_info
+
+
+@pytest.fixture
+def async_client() -> AsyncClient:
+    return AsyncClient()
+
+
+def test_public_read_handlers_are_coroutines():
+    handlers = (
+        get_all_groups,
+        get_group_lessons,
+        get_group_lesson_changes,
+        get_groups_lessons,
+        get_all_teachers,
+        get_lessons_for_teacher,
+        get_lessons_for_room,
+        search_schedule,
+        get_current_time_info,
+    )
+    for handler in handlers:
+        assert asyncio.iscoroutinefunction(handler), handler.__name__
+
+
+@pytest.mark.django_db
+def test_public_read_handlers_answer_async_client(async_client: AsyncClient):
+    group = GroupModelFactory()
+    teacher = TeacherModelFactory()
+    urls = [
+        '/api/v1/schedule/group/all',
+        f'/api/v1/schedule/group/{group.group_uuid}/lessons?is_even=true',
+        f'/api/v1/schedule/group/{group.group_uuid}/lessons/changes',
+        f'/api/v1/schedule/group/lessons?group_uuid={group.group_uuid}&is_even=true',
+        '/api/v1/schedule/teacher/all',
+        f'/api/v1/schedule/teacher/{teacher.teacher_uuid}/lessons?is_even=true',
+        '/api/v1/time/time/current',
+        '/api/v1/schedule/search/?q=a',
+    ]
+
+    for url in urls:
+        response = async_to_sync(async_client.get)(url)
+        assert response.status_code == 200, url
+
+
+@pytest.mark.django_db
+def test_group_lessons_answers_304_to_async_client(async_client: AsyncClient, django_assert_num_queries):
+    group = GroupModelFactory()
+    url = f'/api/v1/schedule/group/{group.group_uuid}/lessons?is_even=true'
+    etag = async_to_sync(async_client.get)(url).headers['ETag']
+
+    with django_assert_num_queries(0):
+        response = async_to_sync(async_client.get)(url, headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db(transaction=True)
+def test_group_lessons_reads_on_thread_pool(async_client: AsyncClient, settings):
+    settings.ASYNC_READS_THREAD_SENSITIVE = False
+    group = GroupLessonModelFactory(subgroup=None).group
+    cache.clear()
+
+    response = async_to_sync(async_client.get)(f'/api/v1/schedule/group/{group.group_uuid}/lessons?is_even=true')
+
+    assert response.status_code == 200
+    assert response.json()['data']['group']['uuid'] == str(group.group_uuid)
+    cache.clear()
@@ -0,0 +1,151 @@
+from django.core.cache import cache
+from django.utils.http import http_date
+
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+
+from core.apps.common.cache.service import (
+    BaseCacheService,
+    GENERATION_KEY_PREFIX,
+)
+from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
+
+
+def _group_lessons_url(group) -> str:
+    return f'/api/v1/schedule/group/{group.group_uuid}/lessons?is_even=true'
+
+
+@pytest.mark.django_db
+def test_group_lessons_returns_validators(client):
+    group = GroupModelFactory()
+
+    response = client.get(_group_lessons_url(group))
+
+    assert response.status_code == 200
+    assert response.headers['ETag']
+    assert 'no-cache' in response.headers['Cache-Control']
+
+
+@pytest.mark.django_db
+def test_group_lessons_matching_etag_returns_304_without_queries(client, django_assert_num_queries):
+    group = GroupModelFactory()
+    etag = client.get(_group_lessons_url(group)).headers['ETag']
+
+    with django_assert_num_queries(0):
+        response = client.get(_group_lessons_url(group), HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['ETag'] == etag
+
+
+@pytest.mark.django_db
+def test_group_lessons_etag_differs_per_filter(client):
+    group = GroupModelFactory()
+
+    even = client.get(_group_lessons_url(group)).headers['ETag']
+    odd = client.get(f'/api/v1/schedule/group/{group.group_uuid}/lessons?is_even=false').headers['ETag']
+
+    assert even != odd
+
+
+@pytest.mark.django_db
+def test_group_lessons_etag_changes_after_edit(client, container):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson = LessonModelFactory()
+    url = f'/api/v1/schedule/group/{group.group_uuid}/lessons?is_even={str(lesson.timeslot.is_even).lower()}'
+    etag = client.get(url).headers['ETag']
+
+    container.resolve(AdminAddLessonToGroupUseCase).execute(
+        group_uuid=str(group.group_uuid),
+        subgroup=None,
+        lesson_uuid=lesson.lesson_uuid,
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert response.headers['Last-Modified']
+    assert len(response.json()['data']['lessons']) == 1
+
+
+@pytest.mark.django_db
+def test_all_groups_conditional_get(client):
+    GroupModelFactory.create_batch(2)
+    etag = client.get('/api/v1/schedule/group/all').headers['ETag']
+
+    response = client.get('/api/v1/schedule/group/all', HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_teacher_lessons_conditional_get(client, container):
+    lesson = LessonModelFactory()
+    url = f'/api/v1/schedule/teacher/{lesson.teacher.teacher_uuid}/lessons?is_even=true'
+    etag = client.get(url).headers['ETag']
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    cache_service: BaseCacheService = container.resolve(BaseCacheService)
+    cache_service.invalidate_namespace(model_prefix='teacher', identifier='*', func_prefix='lessons')
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_teacher_lessons_last_modified_follows_group_edits(client, container):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson = LessonModelFactory()
+    is_even = str(lesson.timeslot.is_even).lower()
+    url = f'/api/v1/schedule/teacher/{lesson.teacher.teacher_uuid}/lessons?is_even={is_even}'
+    response = client.get(url)
+    assert 'Last-Modified' not in response.headers
+
+    container.resolve(AdminAddLessonToGroupUseCase).execute(
+        group_uuid=str(group.group_uuid),
+        subgroup=None,
+        lesson_uuid=lesson.lesson_uuid,
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=response.headers['ETag'])
+
+    assert response.status_code == 200
+    group.refresh_from_db()
+    assert response.headers['Last-Modified'] == http_date(group.schedule_updated_at.timestamp())
+    assert client.get(url, HTTP_IF_NONE_MATCH=response.headers['ETag']).status_code == 304
+
+
+@pytest.mark.django_db
+def test_room_lessons_etag_changes_after_edit(client, container):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson = LessonModelFactory()
+    url = f'/api/v1/schedule/room/{lesson.room.room_uuid}/lessons?is_even={str(lesson.timeslot.is_even).lower()}'
+    etag = client.get(url).headers['ETag']
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    container.resolve(AdminAddLessonToGroupUseCase).execute(
+        group_uuid=str(group.group_uuid),
+        subgroup=None,
+        lesson_uuid=lesson.lesson_uuid,
+    )
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    [room_lesson] = response.json()['data']['lessons']
+    assert room_lesson['teacher']['uuid'] == str(lesson.teacher.teacher_uuid)
+    assert room_lesson['groups'][0]['uuid'] == str(group.group_uuid)
+
+
+@pytest.mark.django_db
+def test_lessons_of_unknown_rows_leave_no_generation_counters(client):
+    unknown_uuid = '11111111-1111-1111-1111-111111111111'
+
+    assert client.get(f'/api/v1/schedule/group/{unknown_uuid}/lessons?is_even=true').status_code == 404
+    assert client.get(f'/api/v1/schedule/teacher/{unknown_uuid}/lessons?is_even=true').status_code == 404
+    assert client.get('/api/v1/schedule/room/not-a-uuid/lessons?is_even=true').status_code == 400
+    assert client.get(f'/api/v1/schedule/group/lessons?group_uuid={unknown_uuid}&is_even=true').status_code == 200
+
+    assert cache.keys(f'{GENERATION_KEY_PREFIX}:*:{unknown_uuid}') == []
+    assert cache.keys(f'{GENERATION_KEY_PREFIX}:room:not-a-uuid') == []
@@ -0,0 +1,36 @@
+import pytest
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
+
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+)
+
+
+FREE_ROOMS_URL = '/api/v1/schedule/room/free'
+
+
+@pytest.mark.django_db
+def test_free_rooms_accepts_several_lessons(client, auth_header):
+    idle = RoomModelFactory()
+    for ord_number in (OrdinaryNumber.THIRD, OrdinaryNumber.FOURTH):
+        timeslot = TimeslotModelFactory(day=Day.WEDNESDAY, ord_number=ord_number, is_even=False)
+        GroupLessonModelFactory(lesson=LessonModelFactory(timeslot=timeslot), subgroup=None)
+
+    response = client.get(
+        f'{FREE_ROOMS_URL}?day=WD&ord_number=3&ord_number=4&is_even=false',
+        **auth_header(),
+    )
+
+    assert response.status_code == 200
+    assert [room['uuid'] for room in response.json()['data']] == [str(idle.room_uuid)]
+
+
+@pytest.mark.django_db
+def test_free_rooms_requires_a_lesson_number(client, auth_header):
+    response = client.get(f'{FREE_ROOMS_URL}?day=WD', **auth_header())
+
+    assert response.status_code == 422
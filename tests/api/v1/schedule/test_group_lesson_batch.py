@@ -0,0 +1,117 @@
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
+
+from core.apps.clients.models import Client as ClientModel
+from core.apps.common.models import ClientRole
+from core.apps.schedule.models import GroupLesson as GroupLessonModel
+
+
+def _batch_url(group) -> str:
+    return f'/api/v1/schedule/group/{group.group_uuid}/lessons/batch'
+
+
+@pytest.mark.django_db
+def test_batch_reports_failed_operations_by_index(client, auth_header):
+    group = GroupModelFactory(has_subgroups=False)
+    assigned, added = LessonModelFactory.create_batch(2)
+    GroupLessonModelFactory(group=group, lesson=assigned, subgroup=None)
+
+    response = client.patch(
+        _batch_url(group),
+        data={'operations': [
+            {'action': 'add', 'lesson_uuid': str(assigned.lesson_uuid)},
+            {'action': 'add', 'lesson_uuid': str(added.lesson_uuid)},
+        ]},
+        content_type='application/json',
+        **auth_header(ClientRole.SCHEDULE_MANAGER),
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['data'] == {'group_uuid': str(group.group_uuid), 'applied': 1, 'failed': 1}
+    assert [error['data']['index'] for error in body['errors']] == [0]
+    assert GroupLessonModel.objects.filter(group=group, lesson=added).exists()
+
+
+@pytest.mark.django_db
+def test_batch_rejects_additions_clashing_with_each_other(client, auth_header):
+    group = GroupModelFactory(has_subgroups=False)
+    first = LessonModelFactory()
+    second = LessonModelFactory(teacher=first.teacher, timeslot=first.timeslot)
+
+    response = client.patch(
+        _batch_url(group),
+        data={'operations': [
+            {'action': 'add', 'lesson_uuid': str(first.lesson_uuid)},
+            {'action': 'add', 'lesson_uuid': str(second.lesson_uuid)},
+        ]},
+        content_type='application/json',
+        **auth_header(ClientRole.SCHEDULE_MANAGER),
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['data']['applied'] == 1
+    [error] = body['errors']
+    assert error['code'] == 'GROUP_LESSON_SCHEDULE_CONFLICT'
+    assert error['data']['index'] == 1
+    assert {conflict['lesson_uuids'][0] for conflict in error['data']['conflicts']} == {str(first.lesson_uuid)}
+    assert not GroupLessonModel.objects.filter(group=group, lesson=second).exists()
+
+
+@pytest.mark.django_db
+def test_batch_adds_into_cells_freed_by_earlier_removals(client, auth_header):
+    group = GroupModelFactory(has_subgroups=False)
+    timeslot = TimeslotModelFactory()
+    removed = LessonModelFactory(timeslot=timeslot)
+    GroupLessonModelFactory(group=group, lesson=removed, subgroup=None)
+    added = LessonModelFactory(teacher=removed.teacher, room=removed.room, timeslot=timeslot)
+
+    response = client.patch(
+        _batch_url(group),
+        data={'operations': [
+            {'action': 'remove', 'lesson_uuid': str(removed.lesson_uuid)},
+            {'action': 'add', 'lesson_uuid': str(added.lesson_uuid)},
+        ]},
+        content_type='application/json',
+        **auth_header(ClientRole.SCHEDULE_MANAGER),
+    )
+
+    assert response.status_code == 200
+    assert response.json()['errors'] == []
+    assert list(GroupLessonModel.objects.filter(group=group).values_list('lesson', flat=True)) == [added.id]
+
+
+@pytest.mark.django_db
+def test_batch_replace_requires_old_lesson_uuid(client, auth_header):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson = LessonModelFactory()
+
+    response = client.patch(
+        _batch_url(group),
+        data={'operations': [{'action': 'replace', 'lesson_uuid': str(lesson.lesson_uuid)}]},
+        content_type='application/json',
+        **auth_header(),
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.django_db
+def test_headman_batch_targets_own_group(client, auth_header):
+    headers = auth_header(ClientRole.HEADMAN)
+    group = GroupModelFactory(headman=ClientModel.objects.get(), has_subgroups=False)
+    lesson = LessonModelFactory()
+
+    response = client.patch(
+        '/api/v1/schedule/group/lessons/batch',
+        data={'operations': [{'action': 'add', 'lesson_uuid': str(lesson.lesson_uuid)}]},
+        content_type='application/json',
+        **headers,
+    )
+
+    assert response.status_code == 200
+    assert GroupLessonModel.objects.filter(group=group, lesson=lesson).exists()
@@ -0,0 +1,48 @@
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+
+from core.apps.common.models import ClientRole
+
+
+def _changes_url(group, since: int | None = None) -> str:
+    url = f'/api/v1/schedule/group/{group.group_uuid}/lessons/changes'
+    return url if since is None else f'{url}?since={since}'
+
+
+@pytest.mark.django_db
+def test_changes_endpoint_syncs_a_client(client, auth_header):
+    group = GroupModelFactory(has_subgroups=False)
+    existing = GroupLessonModelFactory(group=group, subgroup=None)
+    added = LessonModelFactory()
+
+    full = client.get(_changes_url(group)).json()['data']
+    assert full['is_full'] is True
+    assert [lesson['uuid'] for lesson in full['added']] == [str(existing.lesson.lesson_uuid)]
+
+    response = client.patch(
+        f'/api/v1/schedule/group/{group.group_uuid}/lessons/batch',
+        data={'operations': [
+            {'action': 'add', 'lesson_uuid': str(added.lesson_uuid)},
+            {'action': 'remove', 'lesson_uuid': str(existing.lesson.lesson_uuid)},
+        ]},
+        content_type='application/json',
+        **auth_header(ClientRole.SCHEDULE_MANAGER),
+    )
+    assert response.status_code == 200
+
+    delta = client.get(_changes_url(group, since=full['version'])).json()['data']
+    assert delta['is_full'] is False
+    assert delta['version'] > full['version']
+    assert [(lesson['uuid'], lesson['subgroups']) for lesson in delta['added']] == [(str(added.lesson_uuid), None)]
+    assert delta['removed'] == [{'lesson_uuid': str(existing.lesson.lesson_uuid), 'subgroup': None}]
+
+
+@pytest.mark.django_db
+def test_changes_endpoint_rejects_negative_version(client):
+    group = GroupModelFactory()
+
+    response = client.get(_changes_url(group, since=-1))
+
+    assert response.status_code == 422
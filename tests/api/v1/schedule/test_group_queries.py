@@ -0,0 +1,41 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from tests.factories.client.client import ClientModelFactory
+from tests.factories.client.role import RoleModelFactory
+from tests.factories.schedule.group import GroupModelFactory
+
+from core.apps.common.cache.local import get_local_cache
+from core.apps.common.models import ClientRole
+
+
+GET_ALL_GROUPS_URL = '/api/v1/schedule/group/all'
+
+
+def _create_groups_with_headmen(count: int) -> None:
+    role = RoleModelFactory(id=ClientRole.HEADMAN)
+    for _ in range(count):
+        GroupModelFactory(headman=ClientModelFactory(roles=[role]))
+
+
+def _count_cold_get_all_queries(client) -> int:
+    cache.clear()
+    get_local_cache().clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(GET_ALL_GROUPS_URL)
+    assert response.status_code == 200
+    return len(queries)
+
+
+@pytest.mark.django_db
+def test_get_all_groups_query_count_does_not_grow_with_groups(client):
+    _create_groups_with_headmen(1)
+    few_groups = _count_cold_get_all_queries(client)
+
+    _create_groups_with_headmen(10)
+    many_groups = _count_cold_get_all_queries(client)
+
+    assert many_groups == few_groups
+    assert len(client.get(GET_ALL_GROUPS_URL).json()['data']) == 11
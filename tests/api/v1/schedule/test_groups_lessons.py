@@ -0,0 +1,55 @@
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
+
+
+def _groups_lessons_url(*group_uuids: str, is_even: bool = True) -> str:
+    query = '&'.join(f'group_uuid={uuid}' for uuid in group_uuids)
+    return f'/api/v1/schedule/group/lessons?{query}&is_even={str(is_even).lower()}'
+
+
+@pytest.mark.django_db
+def test_groups_lessons_returns_each_group_in_request_order(client):
+    first, second = GroupModelFactory.create_batch(2, has_subgroups=False)
+    even_lesson = LessonModelFactory(timeslot=TimeslotModelFactory(is_even=True))
+    odd_lesson = LessonModelFactory(timeslot=TimeslotModelFactory(is_even=False))
+    GroupLessonModelFactory(group=first, lesson=even_lesson, subgroup=None)
+    GroupLessonModelFactory(group=first, lesson=odd_lesson, subgroup=None)
+    first_uuid, second_uuid = str(first.group_uuid), str(second.group_uuid)
+
+    response = client.get(_groups_lessons_url(second_uuid, first_uuid, second_uuid))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item['group']['uuid'] for item in body['data']] == [second_uuid, first_uuid]
+    assert body['data'][0]['lessons'] is None
+    assert [lesson['uuid'] for lesson in body['data'][1]['lessons']] == [str(even_lesson.lesson_uuid)]
+    assert body['errors'] == []
+
+
+@pytest.mark.django_db
+def test_groups_lessons_reports_unknown_groups(client):
+    group = GroupModelFactory()
+    unknown_uuid = '00000000-0000-0000-0000-000000000000'
+
+    response = client.get(_groups_lessons_url(unknown_uuid, str(group.group_uuid)))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item['group']['uuid'] for item in body['data']] == [str(group.group_uuid)]
+    assert [error['data']['index'] for error in body['errors']] == [0]
+
+
+@pytest.mark.django_db
+def test_groups_lessons_rejects_invalid_uuid(client):
+    response = client.get(_groups_lessons_url('not-a-uuid'))
+
+    assert response.status_code == 400
+
+
+def test_groups_lessons_requires_a_group(client):
+    response = client.get('/api/v1/schedule/group/lessons?is_even=true')
+
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+import pytest
+from tests.factories.schedule.room import RoomModelFactory
+
+
+ROOM_LIST_URL = '/api/v1/schedule/room/'
+
+
+@pytest.mark.django_db
+def test_room_list_next_cursor_continues_after_last_item(client, auth_header):
+    rooms = RoomModelFactory.create_batch(3)
+
+    first = client.get(f'{ROOM_LIST_URL}?limit=2', **auth_header()).json()['data']
+    cursor = first['pagination']['next_cursor']
+    second = client.get(f'{ROOM_LIST_URL}?limit=2&cursor={cursor}', **auth_header()).json()['data']
+
+    assert first['pagination']['total'] == 3
+    assert second['pagination'] == {'offset': 0, 'limit': 2, 'total': None, 'next_cursor': None}
+    numbers = [room['number'] for room in first['items'] + second['items']]
+    assert sorted(numbers) == sorted(room.number for room in rooms)
+
+
+@pytest.mark.django_db
+def test_room_list_without_total(client, auth_header):
+    RoomModelFactory.create_batch(2)
+
+    response = client.get(f'{ROOM_LIST_URL}?with_total=false', **auth_header())
+
+    assert response.json()['data']['pagination']['total'] is None
+    assert len(response.json()['data']['items']) == 2
+
+
+@pytest.mark.django_db
+def test_room_list_rejects_malformed_cursor(client, auth_header):
+    response = client.get(f'{ROOM_LIST_URL}?cursor=bm90LWpzb24', **auth_header())
+
+    assert response.status_code == 400
+    assert response.json()['errors'][0]['code'] == 'INVALID_PAGINATION_CURSOR'
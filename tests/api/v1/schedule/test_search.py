@@ -0,0 +1,26 @@
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+
+
+SEARCH_URL = '/api/v1/schedule/search/'
+
+
+@pytest.mark.django_db
+def test_search_is_public_and_filters_by_kind(client):
+    teacher = TeacherModelFactory(last_name='Гончаренко', first_name='Ірина', middle_name='Петрівна')
+    GroupModelFactory(number='ГН-11')
+
+    response = client.get(f'{SEARCH_URL}?q=honchar&kind=teacher')
+
+    assert response.status_code == 200
+    assert response.json()['data'] == [
+        {'kind': 'teacher', 'uuid': str(teacher.teacher_uuid), 'label': 'Гончаренко Ірина Петрівна'},
+    ]
+
+
+@pytest.mark.django_db
+def test_search_requires_a_query(client):
+    response = client.get(f'{SEARCH_URL}?q=')
+
+    assert response.status_code == 422
@@ -0,0 +1,30 @@
+import pytest
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+
+from core.apps.common.models import ClientRole
+
+
+CONFLICTS_URL = '/api/v1/schedule/lesson/conflicts'
+
+
+@pytest.mark.django_db
+def test_conflicts_forbidden_for_headman(client, auth_header):
+    response = client.get(CONFLICTS_URL, **auth_header(ClientRole.HEADMAN))
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_conflicts_lists_double_booked_rooms(client, auth_header):
+    booked = LessonModelFactory()
+    clashing = LessonModelFactory(room=booked.room, timeslot=booked.timeslot)
+    GroupLessonModelFactory(lesson=booked, subgroup=None)
+    GroupLessonModelFactory(lesson=clashing, subgroup=None)
+
+    response = client.get(CONFLICTS_URL, {'dimension': 'room'}, **auth_header(ClientRole.SCHEDULE_MANAGER))
+
+    assert response.status_code == 200
+    [conflict] = response.json()['data']
+    assert conflict['identifier'] == str(booked.room.room_uuid)
+    assert sorted(conflict['lesson_uuids']) == sorted([str(booked.lesson_uuid), str(clashing.lesson_uuid)])
@@ -0,0 +1,96 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+import pytest
+from tests.factories.schedule.faculty import FacultyModelFactory
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.subject import SubjectModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+
+from core.apps.common.models import ClientRole
+from core.apps.schedule.models import GroupLesson as GroupLessonModel
+
+
+CSV_HEADER = 'group_uuid,subgroup,subject_uuid,teacher_uuid,room_uuid,type,day,ord_number,is_even'
+
+
+def _import_url(faculty) -> str:
+    return f'/api/v1/schedule/faculty/{faculty.faculty_uuid}/timetable'
+
+
+def _csv_upload(*rows: dict) -> SimpleUploadedFile:
+    lines = [CSV_HEADER, *(','.join(str(value) for value in row.values()) for row in rows)]
+    return SimpleUploadedFile('timetable.csv', '\n'.join(lines).encode(), content_type='text/csv')
+
+
+@pytest.fixture
+def timetable():
+    faculty = FacultyModelFactory()
+    group = GroupModelFactory(faculty=faculty, has_subgroups=True)
+    subject, teacher, room = SubjectModelFactory(), TeacherModelFactory(), RoomModelFactory()
+    row = dict(
+        group_uuid=str(group.group_uuid),
+        subgroup='A',
+        subject_uuid=str(subject.subject_uuid),
+        teacher_uuid=str(teacher.teacher_uuid),
+        room_uuid=str(room.room_uuid),
+        type='lecture',
+        day='MN',
+        ord_number=1,
+        is_even=True,
+    )
+    return faculty, row
+
+
+@pytest.mark.django_db
+def test_import_timetable_forbidden_for_group_manager(client, auth_header, timetable):
+    faculty, row = timetable
+
+    response = client.post(
+        _import_url(faculty),
+        data={'lessons': [row]},
+        content_type='application/json',
+        **auth_header(ClientRole.GROUP_MANAGER),
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_import_timetable_from_json(client, auth_header, timetable):
+    faculty, row = timetable
+
+    response = client.post(
+        _import_url(faculty),
+        data={'lessons': [row, {**row, 'subgroup': 'B'}]},
+        content_type='application/json',
+        **auth_header(ClientRole.SCHEDULE_MANAGER),
+    )
+
+    assert response.status_code == 200
+    assert response.json()['data'] == {'groups': 1, 'lessons': 1, 'group_lessons': 2}
+
+
+@pytest.mark.django_db
+def test_import_timetable_from_csv(client, auth_header, timetable):
+    faculty, row = timetable
+
+    response = client.post(f'{_import_url(faculty)}/csv', data={'file': _csv_upload(row)}, **auth_header())
+
+    assert response.status_code == 200
+    assert GroupLessonModel.objects.get().subgroup == 'A'
+
+
+@pytest.mark.django_db
+def test_import_timetable_csv_reports_bad_line(client, auth_header, timetable):
+    faculty, row = timetable
+    upload = _csv_upload(row, {**row, 'day': 'XX'})
+
+    response = client.post(f'{_import_url(faculty)}/csv', data={'file': upload}, **auth_header())
+
+    assert response.status_code == 400
+    error = response.json()['errors'][0]
+    assert error['code'] == 'TIMETABLE_IMPORT_PARSE'
+    assert error['data']['line'] == 3
+    assert error['data']['detail'].startswith('day:')
+    assert not GroupLessonModel.objects.exists()
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.core.cache import cache
+
+import pytest
+
+from core.apps.common.cache.metrics import (
+    CacheEvent,
+    get_cache_metrics,
+)
+from core.apps.common.models import ClientRole
+
+
+METRICS_URL = '/api/v1/metrics/cache'
+
+
+@pytest.mark.django_db
+def test_cache_metrics_requires_token(client):
+    assert client.get(METRICS_URL).status_code == 401
+
+
+@pytest.mark.django_db
+def test_cache_metrics_forbidden_for_non_admin(client, auth_header):
+    assert client.get(METRICS_URL, **auth_header(ClientRole.SCHEDULE_MANAGER)).status_code == 403
+
+
+@pytest.mark.django_db
+def test_cache_metrics_renders_prometheus_text(client, auth_header):
+    metrics = get_cache_metrics()
+    metrics.flush()
+    cache.clear()
+    metrics.record_event(model_prefix='group', func_prefix='all', event=CacheEvent.HIT)
+    metrics.observe_compute(model_prefix='group', func_prefix='all', seconds=0.02)
+
+    response = client.get(METRICS_URL, **auth_header())
+
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+    body = response.content.decode()
+    assert 'schedule_cache_events_total{model_prefix="group",func_prefix="all",event="hit"} 1' in body
+    assert 'schedule_cache_compute_seconds_bucket{model_prefix="group",func_prefix="all",le="0.025"} 1' in body
+    assert 'schedule_cache_compute_seconds_bucket{model_prefix="group",func_prefix="all",le="0.01"} 0' in body
+    assert 'schedule_cache_compute_seconds_bucket{model_prefix="group",func_prefix="all",le="0.005"} 0' in body
+    assert body.index('le="0.005"') < body.index('le="10.0"') < body.index('le="+Inf"')
+    assert 'schedule_cache_compute_seconds_count{model_prefix="group",func_prefix="all"} 1' in body
+
+
+@pytest.mark.django_db
+def test_password_hash_metrics_renders_pool_state(client, auth_header):
+    response = client.get('/api/v1/metrics/password-hashing', **auth_header())
+
+    assert response.status_code == 200
+    body = response.content.decode()
+    assert f'schedule_password_hash_workers {settings.PASSWORD_HASH_WORKERS}' in body
+    assert 'schedule_password_hash_queue_depth 0' in body
+    assert '# TYPE schedule_password_hash_rejected_total counter' in body
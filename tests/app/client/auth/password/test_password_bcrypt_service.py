@@ -1,4 +1,14 @@
-from core.apps.common.authentication.password import BasePasswordService
+import bcrypt
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.apps.common.authentication.password import (
+    BasePasswordService,
+    PasswordHashPool,
+)
+from core.apps.common.exceptions import PasswordHashingOverloadedException
 
 
 def test_verify_password_success(password_service: BasePasswordService, hash_password, generate_password):
@@ -19,3 +29,39 @@ def test_verify_password_fail(password_service: BasePasswordService, hash_passwo
         password_service.verify_password(plain_password=another_plain_password, hashed_password=hashed_password) is
         False
     )
+
+
+def test_needs_rehash_detects_changed_cost(password_service: BasePasswordService, generate_password, settings):
+    plain_password = generate_password()
+    current_hash = password_service.hash_password(plain_password=plain_password)
+    cheaper_hash = bcrypt.hashpw(plain_password.encode(), bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS - 1))
+
+    assert password_service.needs_rehash(hashed_password=current_hash) is False
+    assert password_service.needs_rehash(hashed_password=cheaper_hash.decode()) is True
+
+
+def test_pool_runs_calls_off_the_request_thread():
+    pool = PasswordHashPool(max_workers=1, max_pending=0)
+
+    assert pool.run(threading.current_thread) is not threading.current_thread()
+    assert pool.stats().completed == 1
+
+
+def test_pool_rejects_calls_beyond_capacity():
+    pool = PasswordHashPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=2) as callers:
+        try:
+            busy = [callers.submit(pool.run, release.wait) for _ in range(2)]
+            while (stats := pool.stats()).running != 1 or stats.queued != 1:
+                time.sleep(0.001)
+
+            with pytest.raises(PasswordHashingOverloadedException):
+                pool.run(release.wait)
+            stats = pool.stats()
+        finally:
+            release.set()
+
+    assert (stats.running, stats.queued, stats.rejected) == (1, 1, 1)
+    assert all(future.result() for future in busy)
+    assert pool.stats().completed == 2
@@ -1,3 +1,5 @@
+from ninja.errors import HttpError
+
 import jwt
 import pytest
 import uuid
@@ -5,7 +7,6 @@ from datetime import (
     datetime,
     timezone,
 )
-from ninja.errors import HttpError
 
 from core.apps.clients.services.issuedjwttoken import BaseIssuedJwtTokenService
 from core.apps.common.authentication.auth_check import AuthCheck
@@ -153,8 +154,8 @@ def test_authenticate_revoked_token_raises_401(
         token_service: BaseTokenService,
 ):
     client_entity, token = valid_access_token(role=ClientRole.HEADMAN)
-    payload = token_service.decode_token(token=token)
-    issued_jwt_token_service.bulk_create(subject=client_entity, raw_tokens=[payload])
+    claims = token_service.decode_claims(token=token)
+    issued_jwt_token_service.bulk_create(subject=client_entity, claims=[claims])
     issued_jwt_token_service.revoke_client_tokens(subject=client_entity)
 
     auth = AuthCheck(allowed_roles=[ClientRole.HEADMAN])
@@ -1,6 +1,8 @@
+import jwt
 import pytest
 from tests.factories.client.client import ClientModelFactory
 from tests.factories.client.role import RoleModelFactory
+from unittest import mock
 
 from core.apps.clients.entities.client import Client as ClientEntity
 from core.apps.common.authentication.token import BaseTokenService
@@ -67,3 +69,26 @@ def test_decode_token_payload(token_service: BaseTokenService, service_params):
     assert payload["client_roles"] == service_params['client'].roles
     assert payload["device_id"] == service_params['payload']['device_id']
     assert payload["iat"] <= token_service.get_expiration_time_from_token(token=access_token)
+
+
+@pytest.mark.django_db
+def test_issue_access_token_returns_decoded_claims(token_service: BaseTokenService, service_params):
+    access_token, claims = token_service.issue_access_token(**service_params)
+
+    assert claims == token_service.decode_claims(token=access_token)
+    assert claims.type == TokenType.ACCESS
+    assert claims.client_email == service_params['client'].email
+    assert claims.client_roles == service_params['client'].roles
+    assert claims.device_id == service_params['payload']['device_id']
+
+
+@pytest.mark.django_db
+def test_decode_claims_verifies_signature_once(token_service: BaseTokenService, service_params):
+    refresh_token = token_service.create_refresh_token(**service_params)
+
+    with mock.patch('core.apps.common.authentication.token.jwt.decode', wraps=jwt.decode) as decode:
+        claims = token_service.decode_claims(token=refresh_token)
+
+    assert decode.call_count == 1
+    assert claims.type == TokenType.REFRESH
+    assert claims.expiration_time > claims.issued_at
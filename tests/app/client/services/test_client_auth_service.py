@@ -1,3 +1,4 @@
+import bcrypt
 import pytest
 from tests.factories.client.role import RoleModelFactory
 
@@ -5,6 +6,7 @@ from core.apps.clients.entities.client import Client as ClientEntity
 from core.apps.clients.exceptions.auth import InvalidAuthDataException
 from core.apps.clients.exceptions.client import ClientRoleNotMatchingWithRequiredException
 from core.apps.clients.services.client_auth import BaseClientAuthService
+from core.apps.common.authentication.password import BasePasswordService
 from core.apps.common.authentication.token import BaseTokenService
 from core.apps.common.models import (
     ClientRole,
@@ -140,3 +142,26 @@ def test_update_access_token(
     assert token_service.get_client_email_from_token(token=tokens.access_token) == client_entity.email
     assert token_service.get_client_role_from_token(token=tokens.access_token) == client_entity.roles
     assert token_service.get_expiration_time_from_token(token=tokens.access_token) > get_current_timestamp
+
+
+@pytest.mark.django_db
+def test_validate_password_rehashes_outdated_cost(
+        client_auth_service: BaseClientAuthService,
+        password_service: BasePasswordService,
+        client_create,
+        generate_password,
+        settings,
+):
+    plain_password = generate_password()
+    outdated_hash = bcrypt.hashpw(
+        plain_password.encode(),
+        bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS - 1),
+    ).decode()
+    client = client_create(password=outdated_hash)
+
+    client_auth_service.validate_password(email=client.email, plain_password=plain_password)
+
+    client.refresh_from_db()
+    assert client.password != outdated_hash
+    assert password_service.needs_rehash(hashed_password=client.password) is False
+    assert password_service.verify_password(plain_password=plain_password, hashed_password=client.password)
@@ -0,0 +1,81 @@
+from django.core.cache import cache
+
+import pytest
+from redis.exceptions import RedisError
+from tests.factories.client.issuedjwttoken import IssuedJwtTokenModelFactory
+from unittest import mock
+
+from core.apps.clients.services.issuedjwttoken import (
+    BaseIssuedJwtTokenService,
+    RedisIssuedJwtTokenService,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_revoked_token_is_answered_without_database(
+        issued_jwt_token_service: BaseIssuedJwtTokenService,
+        django_assert_num_queries,
+):
+    assert isinstance(issued_jwt_token_service, RedisIssuedJwtTokenService)
+    token = IssuedJwtTokenModelFactory.create()
+    other = IssuedJwtTokenModelFactory.create()
+    issued_jwt_token_service.revoke_client_tokens(subject=token.subject.to_entity())
+    issued_jwt_token_service.check_revoked(jti=str(other.jti))
+
+    with django_assert_num_queries(0):
+        assert issued_jwt_token_service.check_revoked(jti=str(token.jti)) is True
+        assert issued_jwt_token_service.check_revoked(jti=str(other.jti)) is False
+
+
+@pytest.mark.django_db
+def test_revoke_device_tokens_keeps_other_devices_valid(issued_jwt_token_service: BaseIssuedJwtTokenService):
+    token = IssuedJwtTokenModelFactory.create()
+    other_device = IssuedJwtTokenModelFactory.create(subject=token.subject)
+
+    issued_jwt_token_service.revoke_client_device_tokens(subject=token.subject.to_entity(), device_id=token.device_id)
+
+    assert issued_jwt_token_service.check_revoked(jti=str(token.jti)) is True
+    assert issued_jwt_token_service.check_revoked(jti=str(other_device.jti)) is False
+
+
+@pytest.mark.django_db
+def test_revocation_store_is_reloaded_after_flush(
+        issued_jwt_token_service: BaseIssuedJwtTokenService,
+        django_assert_num_queries,
+):
+    token = IssuedJwtTokenModelFactory.create()
+    issued_jwt_token_service.revoke_client_tokens(subject=token.subject.to_entity())
+    cache.clear()
+
+    with django_assert_num_queries(1):
+        assert issued_jwt_token_service.check_revoked(jti=str(token.jti)) is True
+    with django_assert_num_queries(0):
+        assert issued_jwt_token_service.check_revoked(jti=str(token.jti)) is True
+
+
+@pytest.mark.django_db
+def test_expired_revoked_tokens_are_not_stored(issued_jwt_token_service: BaseIssuedJwtTokenService):
+    token = IssuedJwtTokenModelFactory.create(expiration_time=1)
+    issued_jwt_token_service.revoke_client_tokens(subject=token.subject.to_entity())
+
+    assert issued_jwt_token_service.check_revoked(jti=str(token.jti)) is False
+
+
+@pytest.mark.django_db
+def test_check_revoked_falls_back_to_database_when_redis_fails(
+        issued_jwt_token_service: BaseIssuedJwtTokenService,
+):
+    token = IssuedJwtTokenModelFactory.create(revoked=True)
+
+    with mock.patch(
+            'core.apps.clients.services.issuedjwttoken.get_redis_connection',
+            side_effect=RedisError,
+    ):
+        assert issued_jwt_token_service.check_revoked(jti=str(token.jti)) is True
@@ -1,4 +1,6 @@
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from tests.factories.client.client import ClientModelFactory
@@ -44,40 +46,57 @@ def seed_roles_and_clients():
 
 @pytest.mark.django_db
 def test_get_client_list_admin_sees_all(get_list_use_case, seed_roles_and_clients):
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=ClientSearchFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    assert count == 3
-    assert len(list(items)) == 3
+    assert page.total == 3
+    assert len(page.items) == 3
 
 
 @pytest.mark.django_db
 def test_get_client_list_client_manager_sees_only_headmen(get_list_use_case, seed_roles_and_clients):
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=ClientSearchFilter(allowed_roles=(ClientRole.HEADMAN,)),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    items = list(items)
-    assert count == 1
+    items = page.items
+    assert page.total == 1
     assert {r for c in items for r in c.roles} == {ClientRole.HEADMAN}
 
 
+@pytest.mark.django_db
+def test_get_client_list_counts_client_with_several_roles_once(get_list_use_case, seed_roles_and_clients):
+    headman_role, cm_role = seed_roles_and_clients["headman"].roles.get(), seed_roles_and_clients["cm"].roles.get()
+    ClientModelFactory(roles=[headman_role, cm_role], last_name="Ddd")
+
+    with CaptureQueriesContext(connection) as queries:
+        page = get_list_use_case.execute(
+            filters=ClientSearchFilter(allowed_roles=(ClientRole.HEADMAN, ClientRole.CLIENT_MANAGER)),
+            pagination_in=PaginationIn(offset=0, limit=10),
+        )
+
+    assert page.total == 3
+    assert [client.last_name for client in page.items] == ["Aaa", "Ccc", "Ddd"]
+    # The page with its total, then the roles prefetch.
+    assert len(queries) == 2
+
+
 @pytest.mark.django_db
 def test_get_client_list_search_filters_by_email(get_list_use_case):
     headman_role = RoleModelFactory(id=ClientRole.HEADMAN)
     ClientModelFactory(email="foo@gmail.com", roles=[headman_role])
     ClientModelFactory(email="bar@gmail.com", roles=[headman_role])
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=ClientSearchFilter(search="foo"),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    items = list(items)
-    assert count == 1
+    items = page.items
+    assert page.total == 1
     assert items[0].email == "foo@gmail.com"
 
 
@@ -87,13 +106,13 @@ def test_get_client_list_search_filters_by_last_name(get_list_use_case):
     ClientModelFactory(last_name="Шевченко", roles=[headman_role])
     ClientModelFactory(last_name="Франко", roles=[headman_role])
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=ClientSearchFilter(search="Шевч"),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    items = list(items)
-    assert count == 1
+    items = page.items
+    assert page.total == 1
     assert items[0].last_name == "Шевченко"
 
 
@@ -90,11 +90,9 @@ def test_update_access_token_refresh_revoked_failure(
 ):
     tokens = client_auth_service.generate_tokens(client=use_case_params['client'])
 
-    raw_tokens = [token_service.decode_token(token) for token in [tokens.access_token, tokens.refresh_token]]
-
     issued_jwt_token_service.bulk_create(
         subject=use_case_params['client'],
-        raw_tokens=raw_tokens,
+        claims=[tokens.access_claims, tokens.refresh_claims],
     )
     issued_jwt_token_service.revoke_client_device_tokens(
         subject=use_case_params["client"],
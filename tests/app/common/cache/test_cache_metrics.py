@@ -0,0 +1,87 @@
+from django.core.cache import cache
+
+import pytest
+from tests.app.common.cache.test_class_decorator import InMemoryCacheService
+
+from core.apps.common.cache.class_decorator import CacheDecorator
+from core.apps.common.cache.metrics import (
+    CacheEvent,
+    InMemoryCacheMetricsService,
+    RedisCacheMetricsService,
+)
+from core.apps.common.cache.timeouts import Timeout
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _events(metrics) -> dict:
+    return {event: value for (_, _, event), value in metrics.collect().events.items()}
+
+
+def test_decorator_records_miss_leader_then_hit():
+    metrics = InMemoryCacheMetricsService()
+    decorator = CacheDecorator(cache_service=InMemoryCacheService(), metrics_service=metrics)
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.HOUR)
+    def compute():
+        return 'value'
+
+    compute()
+    compute()
+
+    snapshot = metrics.collect()
+    assert snapshot.events == {
+        ('group', 'all', CacheEvent.MISS): 1,
+        ('group', 'all', CacheEvent.LEADER): 1,
+        ('group', 'all', CacheEvent.HIT): 1,
+    }
+    assert snapshot.compute[('group', 'all')].count == 1
+
+
+def test_decorator_records_follower_fallback():
+    metrics = InMemoryCacheMetricsService()
+    cache_service = InMemoryCacheService()
+    decorator = CacheDecorator(cache_service=cache_service, metrics_service=metrics)
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.HOUR)
+    def compute():
+        return 'value'
+
+    cache_service.try_acquire_lock('group_all:lock', ttl=10)
+    assert compute() == 'value'
+
+    assert _events(metrics) == {
+        CacheEvent.MISS: 1,
+        CacheEvent.FOLLOWER_WAIT: 1,
+        CacheEvent.FOLLOWER_FALLBACK: 1,
+    }
+    assert metrics.collect().compute[('group', 'all')].count == 1
+
+
+def test_compute_histogram_buckets_are_cumulative():
+    metrics = InMemoryCacheMetricsService()
+
+    metrics.observe_compute(model_prefix='group', func_prefix=None, seconds=0.03)
+
+    histogram = metrics.collect().compute[('group', '')]
+    assert 0.025 not in histogram.buckets
+    assert histogram.buckets[0.05] == 1
+    assert histogram.buckets[10.0] == 1
+    assert histogram.total_seconds == pytest.approx(0.03)
+
+
+def test_redis_metrics_aggregate_across_workers(settings):
+    settings.CACHE_METRICS_FLUSH_INTERVAL = 60
+    first_worker = RedisCacheMetricsService()
+    second_worker = RedisCacheMetricsService()
+
+    first_worker.record_event(model_prefix='group', func_prefix='all', event=CacheEvent.HIT)
+    second_worker.record_event(model_prefix='group', func_prefix='all', event=CacheEvent.HIT)
+    second_worker.flush()
+
+    assert _events(first_worker) == {CacheEvent.HIT: 2}
@@ -1,22 +1,50 @@
+from django.core.cache import cache
+
+import pytest
+import time
+from asgiref.sync import async_to_sync
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pydantic import BaseModel
 
-from core.apps.common.cache.service import RedisCacheService
+from core.apps.common.cache.class_decorator import CacheDecorator
+from core.apps.common.cache.service import (
+    CACHE_TTL_JITTER_RATIO,
+    DEPENDENTS_KEY_PREFIX,
+    GENERATION_KEY_PREFIX,
+    GENERATION_TTL_SECONDS,
+    MAX_ENTRY_TTL_SECONDS,
+    RedisCacheService,
+    ReservedCacheKey,
+)
+from core.apps.common.cache.timeouts import Timeout
 
 
 service = RedisCacheService()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _key_body(key: str) -> str:
+    body, _, _ = key.rpartition(':g')
+    return body
+
+
 def test_generate_key_model_prefix_only():
     key = service.generate_cache_key(model_prefix='group')
 
-    assert key == 'group'
+    assert _key_body(key) == 'group'
 
 
 def test_generate_key_with_identifier():
     key = service.generate_cache_key(model_prefix='group', identifier='abc-123')
 
-    assert key == 'group_abc-123'
+    assert _key_body(key) == 'group_abc-123'
 
 
 def test_generate_key_full_parts():
@@ -26,7 +54,7 @@ def test_generate_key_full_parts():
         func_prefix='lessons',
     )
 
-    assert key == 'group_abc-123_lessons'
+    assert _key_body(key) == 'group_abc-123_lessons'
 
 
 def test_generate_key_wildcard_preserved():
@@ -36,7 +64,7 @@ def test_generate_key_wildcard_preserved():
         func_prefix='lessons',
     )
 
-    assert key == 'group_*_lessons'
+    assert _key_body(key) == 'group_*_lessons'
 
 
 def test_generate_key_pydantic_filter_stable():
@@ -81,4 +109,189 @@ def test_generate_key_none_parts_omitted():
         pagination_in=None,
     )
 
-    assert key == 'group_lessons'
+    assert _key_body(key) == 'group_lessons'
+
+
+def test_generate_key_carries_generation():
+    key = service.generate_cache_key(model_prefix='group', identifier='abc-123', func_prefix='lessons')
+
+    generation = service.get_generation('group', identifier='abc-123', func_prefix='lessons')
+
+    assert key == f'group_abc-123_lessons:g{generation}'
+    assert len(generation.split('.')) == 3
+
+
+def test_aget_generation_matches_sync_and_seeds_missing_namespaces():
+    seeded = async_to_sync(service.aget_generation)('group', identifier='abc-123', func_prefix='lessons')
+
+    assert seeded == service.get_generation('group', identifier='abc-123', func_prefix='lessons')
+    service.invalidate_namespace(model_prefix='group', identifier='abc-123')
+    assert async_to_sync(service.aget_generation)('group', identifier='abc-123', func_prefix='lessons') != seeded
+
+
+def test_generation_counters_expire_after_every_entry():
+    service.generate_cache_key(model_prefix='group', identifier='abc-123')
+    generation_key = f'{GENERATION_KEY_PREFIX}:group:abc-123'
+    assert cache.ttl(generation_key) >= GENERATION_TTL_SECONDS > MAX_ENTRY_TTL_SECONDS
+
+    cache.expire(generation_key, 60)
+    service.invalidate_namespace(model_prefix='group', identifier='abc-123')
+
+    assert cache.ttl(generation_key) >= GENERATION_TTL_SECONDS
+
+
+def test_reserved_key_creates_counters_only_when_claimed():
+    reserved = service.reserve_cache_key(model_prefix='group', identifier='abc-123', func_prefix='lessons')
+
+    assert service.get_generation('group', identifier='abc-123', func_prefix='lessons', seed=False) is None
+    assert service.claim_cache_key(reserved)
+    assert service.generate_cache_key(model_prefix='group', identifier='abc-123', func_prefix='lessons') == reserved.key
+    assert service.reserve_cache_key(model_prefix='group', identifier='abc-123', func_prefix='lessons').unseeded == {}
+
+
+def test_reserved_key_is_not_claimed_after_invalidation():
+    reserved = service.reserve_cache_key(model_prefix='group', identifier='abc-123')
+
+    service.invalidate_namespace(model_prefix='group', identifier='abc-123')
+
+    assert not service.claim_cache_key(reserved)
+
+
+def test_keys_reserved_together_are_claimed_together():
+    reserved = service.reserve_cache_keys('group', identifiers=['abc', 'def', 'xyz'], func_prefix='lessons')
+
+    service.invalidate_namespace(model_prefix='group', identifier='xyz')
+
+    assert service.claim_cache_keys(reserved) == {'abc', 'def'}
+    assert service.reserve_cache_keys('group', identifiers=['abc', 'def'], func_prefix='lessons') == {
+        'abc': ReservedCacheKey(key=reserved['abc'].key),
+        'def': ReservedCacheKey(key=reserved['def'].key),
+    }
+
+
+def test_invalidate_identifier_namespace_changes_only_its_keys():
+    own = service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons')
+    other = service.generate_cache_key(model_prefix='group', identifier='xyz', func_prefix='lessons')
+
+    service.invalidate_namespace(model_prefix='group', identifier='abc')
+
+    assert service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons') != own
+    assert service.generate_cache_key(model_prefix='group', identifier='xyz', func_prefix='lessons') == other
+
+
+def test_invalidate_wildcard_identifier_bumps_func_namespace():
+    lessons = service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons')
+    group_all = service.generate_cache_key(model_prefix='group', func_prefix='all')
+
+    service.invalidate_namespace(model_prefix='group', identifier='*', func_prefix='lessons')
+
+    assert service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons') != lessons
+    assert service.generate_cache_key(model_prefix='group', func_prefix='all') == group_all
+
+
+def test_invalidate_model_prefix_bumps_every_key():
+    lessons = service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons')
+    group_all = service.generate_cache_key(model_prefix='group', func_prefix='all')
+    teacher_all = service.generate_cache_key(model_prefix='teacher', func_prefix='all')
+
+    service.invalidate_namespace(model_prefix='group', func_prefix='*')
+
+    assert service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons') != lessons
+    assert service.generate_cache_key(model_prefix='group', func_prefix='all') != group_all
+    assert service.generate_cache_key(model_prefix='teacher', func_prefix='all') == teacher_all
+
+
+def test_wait_for_signal_times_out_without_signal():
+    started = time.monotonic()
+
+    assert service.wait_for_signal('group_all:ready', timeout=0.1) is False
+    assert time.monotonic() - started >= 0.1
+
+
+def test_wait_for_signal_returns_at_once_when_already_sent():
+    service.send_signal('group_all:ready')
+
+    assert service.wait_for_signal('group_all:ready', timeout=1) is True
+
+
+def test_signal_wakes_every_blocked_waiter():
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        waiters = [executor.submit(service.wait_for_signal, 'group_all:ready', 5) for _ in range(3)]
+        time.sleep(0.1)
+        started = time.monotonic()
+        service.send_signal('group_all:ready')
+
+        assert [waiter.result() for waiter in waiters] == [True, True, True]
+        assert time.monotonic() - started < 1
+
+
+def test_invalidate_dependents_bumps_only_recorded_namespaces():
+    first = service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons')
+    second = service.generate_cache_key(model_prefix='group', identifier='xyz', func_prefix='lessons')
+    service.add_dependencies(
+        namespace={'model_prefix': 'group', 'identifier': 'abc', 'func_prefix': 'lessons'},
+        dependencies=[('teacher', 't1'), ('room', 'r1')],
+    )
+    service.add_dependencies(
+        namespace={'model_prefix': 'group', 'identifier': 'xyz', 'func_prefix': 'lessons'},
+        dependencies=[('teacher', 't2')],
+    )
+
+    service.invalidate_dependents(dimension='teacher', identifier='t1')
+
+    assert service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons') != first
+    assert service.generate_cache_key(model_prefix='group', identifier='xyz', func_prefix='lessons') == second
+
+
+def test_dependents_outlive_every_entry_recorded_in_them():
+    service.add_dependencies(namespace={'model_prefix': 'group', 'identifier': 'abc'}, dependencies=[('teacher', 't1')])
+
+    longest_entry_ttl = max(Timeout) * (1 + CACHE_TTL_JITTER_RATIO)
+    assert cache.ttl(f'{DEPENDENTS_KEY_PREFIX}:teacher:t1') >= MAX_ENTRY_TTL_SECONDS >= longest_entry_ttl
+
+
+def test_value_whose_dependency_is_invalidated_during_compute_is_not_stored():
+    decorator = CacheDecorator(cache_service=service)
+    room_numbers = iter(['old', 'renamed'])
+
+    @decorator.get_or_set_cache(
+        model_prefix='teacher',
+        identifier=lambda kw: kw['teacher_uuid'],
+        func_prefix='lessons',
+        timeout=Timeout.HOUR,
+        dependencies=lambda result: [('room', 'r1')],
+    )
+    def get_lessons(teacher_uuid):
+        room_number = next(room_numbers)
+        if room_number == 'old':
+            # The rename commits after this read, before the value is stored.
+            service.invalidate_dependents(dimension='room', identifier='r1')
+        return room_number
+
+    assert get_lessons(teacher_uuid='t1') == 'old'
+    assert get_lessons(teacher_uuid='t1') == 'renamed'
+    assert get_lessons(teacher_uuid='t1') == 'renamed'
+
+
+def test_claim_fails_once_dependents_are_invalidated():
+    reserved = service.reserve_cache_key(model_prefix='teacher', identifier='t1', func_prefix='lessons')
+    dependents_version = service.get_dependents_version()
+
+    service.invalidate_dependents(dimension='room', identifier='r1')
+
+    assert not service.claim_cache_key(reserved, dependents_version=dependents_version)
+    assert service.claim_cache_keys({'t1': reserved}, dependents_version=dependents_version) == set()
+    assert service.claim_cache_key(reserved, dependents_version=service.get_dependents_version())
+
+
+def test_invalidate_dependents_consumes_the_reverse_index():
+    service.add_dependencies(
+        namespace={'model_prefix': 'group', 'identifier': 'abc'},
+        dependencies=[('teacher', 't1')],
+    )
+    service.invalidate_dependents(dimension='teacher', identifier='t1')
+    key = service.generate_cache_key(model_prefix='group', identifier='abc')
+
+    service.invalidate_dependents(dimension='teacher', identifier='t1')
+
+    assert service.generate_cache_key(model_prefix='group', identifier='abc') == key
@@ -1,10 +1,20 @@
+import pytest
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+)
 from dataclasses import dataclass
 from typing import Any
 
-from core.apps.common.cache.class_decorator import CacheDecorator
+from core.apps.common.cache.class_decorator import (
+    CacheDecorator,
+    StaleWhileRevalidateEntry,
+)
 from core.apps.common.cache.service import (
     BaseCacheService,
     CACHE_MISS,
+    ReservedCacheKey,
 )
 from core.apps.common.cache.timeouts import Timeout
 
@@ -15,9 +25,12 @@ class InMemoryCacheService(BaseCacheService):
 
     def __init__(self):
         self.store: dict[str, Any] = {}
+        self.shared: dict[str, Any] = {}
         self.get_calls: list[str] = []
         self.set_calls: list[tuple[str, Any, int | None]] = []
-        self.invalidate_calls: list[str] = []
+        self.invalidate_calls: list[Any] = []
+        self.signals: list[str] = []
+        self.dependents: dict[tuple[str, str], list[dict]] = {}
 
     def generate_cache_key(self, model_prefix, *, identifier=None, func_prefix=None, filters=None, pagination_in=None):
         parts = [model_prefix]
@@ -26,14 +39,63 @@ class InMemoryCacheService(BaseCacheService):
                 parts.append(str(part))
         return '_'.join(parts)
 
+    def reserve_cache_key(self, model_prefix, *, identifier=None, func_prefix=None, filters=None, pagination_in=None):
+        return ReservedCacheKey(key=self.generate_cache_key(
+            model_prefix,
+            identifier=identifier,
+            func_prefix=func_prefix,
+            filters=filters,
+            pagination_in=pagination_in,
+        ))
+
+    def reserve_cache_keys(self, model_prefix, *, identifiers, func_prefix=None, filters=None, pagination_in=None):
+        return {
+            identifier: self.reserve_cache_key(
+                model_prefix,
+                identifier=identifier,
+                func_prefix=func_prefix,
+                filters=filters,
+                pagination_in=pagination_in,
+            )
+            for identifier in identifiers
+        }
+
+    def claim_cache_key(self, reserved, dependents_version=None):
+        return True
+
+    def claim_cache_keys(self, reserved, dependents_version=None):
+        return set(reserved)
+
+    def get_dependents_version(self):
+        return 0
+
     def get_cache_value(self, key, default=None):
         self.get_calls.append(key)
         return self.store.get(key, default)
 
+    async def aget_cache_value(self, key, default=None):
+        return self.get_cache_value(key, default)
+
+    def get_shared_cache_value(self, key, default=None):
+        return self.shared.get(key, self.store.get(key, default))
+
+    def get_cache_values(self, keys):
+        return {key: self.store[key] for key in keys if key in self.store}
+
     def set_cache(self, key, value, timeout=None):
         self.set_calls.append((key, value, timeout))
         self.store[key] = value
 
+    def set_cache_many(self, values, timeout=None):
+        for key, value in values.items():
+            self.set_cache(key, value, timeout)
+
+    def get_generation(self, model_prefix, *, identifier=None, func_prefix=None, seed=True):
+        return '0'
+
+    async def aget_generation(self, model_prefix, *, identifier=None, func_prefix=None, seed=True):
+        return '0'
+
     def invalidate_cache(self, key):
         self.invalidate_calls.append(key)
         self.store.pop(key, None)
@@ -42,16 +104,26 @@ class InMemoryCacheService(BaseCacheService):
         for key in keys:
             self.invalidate_cache(key)
 
-    def invalidate_cache_pattern(self, key):
-        self.invalidate_calls.append(key)
-        prefix = key.rstrip('*')
+    def invalidate_namespace(self, model_prefix, *, identifier=None, func_prefix=None):
+        namespace = {'model_prefix': model_prefix}
+        if identifier is not None:
+            namespace['identifier'] = identifier
+        if func_prefix is not None:
+            namespace['func_prefix'] = func_prefix
+        self.invalidate_calls.append(namespace)
+        parts = []
+        for part in namespace.values():
+            if part == '*':
+                break
+            parts.append(part)
+        prefix = '_'.join(parts)
         for k in list(self.store.keys()):
             if k.startswith(prefix):
                 self.store.pop(k, None)
 
-    def invalidate_cache_pattern_list(self, keys):
-        for key in keys:
-            self.invalidate_cache_pattern(key)
+    def invalidate_namespace_list(self, namespaces):
+        for namespace in namespaces:
+            self.invalidate_namespace(**namespace)
 
     def try_acquire_lock(self, key, ttl):
         if key in self.store:
@@ -62,6 +134,23 @@ class InMemoryCacheService(BaseCacheService):
     def release_lock(self, key):
         self.store.pop(key, None)
 
+    def add_dependencies(self, namespace, dependencies):
+        for dependency in dependencies:
+            self.dependents.setdefault(dependency, []).append(namespace)
+
+    def add_dependencies_many(self, entries):
+        for namespace, dependencies in entries:
+            self.add_dependencies(namespace, dependencies)
+
+    def invalidate_dependents(self, dimension, identifier):
+        self.invalidate_namespace_list(self.dependents.pop((dimension, identifier), []))
+
+    def send_signal(self, key):
+        self.signals.append(key)
+
+    def wait_for_signal(self, key, timeout):
+        return key in self.signals
+
 
 def test_get_or_set_caches_on_miss_returns_cached_on_hit():
     cache_service = InMemoryCacheService()
@@ -154,6 +243,24 @@ def test_decorator_stateless_filters_per_call():
     assert len(set(keys)) == 2
 
 
+def test_filters_callable_resolves_from_kwargs():
+    cache_service = InMemoryCacheService()
+    decorator = CacheDecorator(cache_service=cache_service)
+
+    @decorator.get_or_set_cache(
+        model_prefix='teacher',
+        identifier=lambda kw: kw['teacher_uuid'],
+        func_prefix='lessons',
+        filters=lambda kw: f"v2-{kw['filters']}",
+        timeout=Timeout.WEEK,
+    )
+    def compute(teacher_uuid, filters):
+        return filters
+
+    assert compute(teacher_uuid='abc', filters='even') == 'even'
+    assert cache_service.store == {'teacher_abc_lessons_v2-even': 'even'}
+
+
 def test_identifier_callable_resolves_from_kwargs():
     cache_service = InMemoryCacheService()
     decorator = CacheDecorator(cache_service=cache_service)
@@ -185,7 +292,9 @@ def test_delete_decorator_invalidates_after_call():
     result = write()
 
     assert result == 'written'
-    assert cache_service.invalidate_calls == ['group_abc_lessons']
+    assert cache_service.invalidate_calls == [
+        {'model_prefix': 'group', 'identifier': 'abc', 'func_prefix': 'lessons'},
+    ]
     assert 'group_abc_lessons_a' not in cache_service.store
 
 
@@ -208,8 +317,8 @@ def test_delete_caches_resolves_callable_identifier_from_kwargs():
     write(teacher_uuid='uuid-abc')
 
     assert cache_service.invalidate_calls == [
-        'teacher_all',
-        'teacher_uuid-abc_lessons_*',
+        {'model_prefix': 'teacher', 'func_prefix': 'all'},
+        {'model_prefix': 'teacher', 'identifier': 'uuid-abc', 'func_prefix': 'lessons'},
     ]
 
 
@@ -229,9 +338,9 @@ def test_delete_caches_invalidates_all_specs():
 
     assert result == 'written'
     assert cache_service.invalidate_calls == [
-        'faculty_all',
-        'faculty_list_*_*',
-        'group_*',
+        {'model_prefix': 'faculty', 'func_prefix': 'all'},
+        {'model_prefix': 'faculty', 'func_prefix': 'list'},
+        {'model_prefix': 'group', 'func_prefix': '*'},
     ]
 
 
@@ -243,3 +352,151 @@ def test_cache_miss_sentinel_distinguishes_from_cached_none():
     cache_service.set_cache('cached-none', None)
 
     assert cache_service.get_cache_value('cached-none', default=CACHE_MISS) is None
+
+
+def test_follower_returns_value_after_leader_signal():
+    cache_service = InMemoryCacheService()
+    decorator = CacheDecorator(cache_service=cache_service)
+    call_count = {'n': 0}
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.HOUR)
+    def compute():
+        call_count['n'] += 1
+        return 'fresh'
+
+    cache_service.try_acquire_lock('group_all:lock', ttl=10)
+    original_wait = cache_service.wait_for_signal
+
+    def wait_for_signal(key, timeout):
+        cache_service.store['group_all'] = 'from-leader'
+        cache_service.send_signal(key)
+        return original_wait(key, timeout)
+
+    cache_service.wait_for_signal = wait_for_signal
+
+    assert compute() == 'from-leader'
+    assert call_count['n'] == 0
+
+
+def test_leader_signals_followers_even_when_compute_fails():
+    cache_service = InMemoryCacheService()
+    decorator = CacheDecorator(cache_service=cache_service)
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.HOUR)
+    def compute():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        compute()
+
+    assert cache_service.signals == ['group_all:ready']
+    assert 'group_all:lock' not in cache_service.store
+
+
+class SynchronousExecutor(Executor):
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def test_stale_value_is_served_and_refreshed_once():
+    cache_service = InMemoryCacheService()
+    executor = SynchronousExecutor()
+    decorator = CacheDecorator(cache_service=cache_service, refresh_executor=executor)
+    results = iter(['first', 'second'])
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.WEEK, stale_after=Timeout.DAY)
+    def compute():
+        return next(results)
+
+    assert compute() == 'first'
+    assert compute() == 'first'
+    assert executor.submitted == 0
+
+    cache_service.store['group_all'] = StaleWhileRevalidateEntry(value='first', fresh_until=time.time() - 1)
+
+    assert compute() == 'first'
+    assert executor.submitted == 1
+    assert compute() == 'second'
+    assert 'group_all:lock' not in cache_service.store
+
+
+def test_stale_local_copy_is_not_refreshed_once_shared_tier_holds_fresh_value():
+    cache_service = InMemoryCacheService()
+    executor = SynchronousExecutor()
+    decorator = CacheDecorator(cache_service=cache_service, refresh_executor=executor)
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.WEEK, stale_after=Timeout.DAY)
+    def compute():
+        return 'recomputed'
+
+    cache_service.store['group_all'] = StaleWhileRevalidateEntry(value='stale', fresh_until=time.time() - 1)
+    cache_service.shared['group_all'] = StaleWhileRevalidateEntry(value='refreshed', fresh_until=time.time() + 60)
+
+    assert compute() == 'refreshed'
+    assert executor.submitted == 0
+
+
+def test_stale_value_is_not_refreshed_while_lock_is_held():
+    cache_service = InMemoryCacheService()
+    executor = SynchronousExecutor()
+    decorator = CacheDecorator(cache_service=cache_service, refresh_executor=executor)
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.WEEK, stale_after=Timeout.DAY)
+    def compute():
+        return 'fresh'
+
+    cache_service.store['group_all'] = StaleWhileRevalidateEntry(value='stale', fresh_until=time.time() - 1)
+    cache_service.try_acquire_lock('group_all:lock', ttl=10)
+
+    assert compute() == 'stale'
+    assert compute() == 'stale'
+    assert executor.submitted == 0
+
+
+def test_failed_refresh_keeps_stale_value_and_releases_lock():
+    cache_service = InMemoryCacheService()
+    decorator = CacheDecorator(cache_service=cache_service, refresh_executor=SynchronousExecutor())
+
+    @decorator.get_or_set_cache(model_prefix='group', func_prefix='all', timeout=Timeout.WEEK, stale_after=Timeout.DAY)
+    def compute():
+        raise ValueError('boom')
+
+    cache_service.store['group_all'] = StaleWhileRevalidateEntry(value='stale', fresh_until=time.time() - 1)
+
+    assert compute() == 'stale'
+    assert 'group_all:lock' not in cache_service.store
+
+
+def test_dependencies_are_recorded_and_evicted_by_delete_dependents():
+    cache_service = InMemoryCacheService()
+    decorator = CacheDecorator(cache_service=cache_service)
+
+    @decorator.get_or_set_cache(
+        model_prefix='group',
+        identifier=lambda kw: kw['group_uuid'],
+        func_prefix='lessons',
+        timeout=Timeout.HOUR,
+        dependencies=lambda result: [('teacher', teacher) for teacher in result],
+    )
+    def get_lessons(group_uuid):
+        return {'abc': ['t1'], 'xyz': ['t2']}[group_uuid]
+
+    @decorator.delete_dependents('teacher', identifier=lambda kw: kw['teacher_uuid'])
+    def rename_teacher(teacher_uuid):
+        return 'renamed'
+
+    get_lessons(group_uuid='abc')
+    get_lessons(group_uuid='xyz')
+
+    assert rename_teacher(teacher_uuid='t1') == 'renamed'
+    assert cache_service.invalidate_calls == [
+        {'model_prefix': 'group', 'identifier': 'abc', 'func_prefix': 'lessons'},
+    ]
+    assert 'group_abc_lessons' not in cache_service.store
+    assert 'group_xyz_lessons' in cache_service.store
@@ -0,0 +1,129 @@
+from django.core.cache import cache
+
+import pytest
+from asgiref.sync import async_to_sync
+from unittest import mock
+
+from core.apps.common.cache.local import LocalLRUCache
+from core.apps.common.cache.service import (
+    CACHE_MISS,
+    TwoTierCacheService,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_lru_evicts_least_recently_used_entry():
+    local = LocalLRUCache(max_entries=2, max_bytes=1024, ttl=60)
+    local.set('a', 1, size=1)
+    local.set('b', 2, size=1)
+    local.get('a')
+
+    local.set('c', 3, size=1)
+
+    assert local.get('a') == 1
+    assert local.get('b', default=CACHE_MISS) is CACHE_MISS
+    assert local.get('c') == 3
+
+
+def test_lru_respects_byte_budget():
+    local = LocalLRUCache(max_entries=10, max_bytes=10, ttl=60)
+    local.set('a', 'x', size=6)
+    local.set('b', 'y', size=6)
+    local.set('too-big', 'z', size=11)
+
+    assert local.get('a', default=CACHE_MISS) is CACHE_MISS
+    assert local.get('b') == 'y'
+    assert local.get('too-big', default=CACHE_MISS) is CACHE_MISS
+    assert local.size == 6
+
+
+def test_lru_expires_entries_after_ttl():
+    local = LocalLRUCache(max_entries=10, max_bytes=1024, ttl=60)
+    with mock.patch('core.apps.common.cache.local.time.monotonic', return_value=100.0):
+        local.set('a', 1, ttl=5)
+    with mock.patch('core.apps.common.cache.local.time.monotonic', return_value=106.0):
+        assert local.get('a', default=CACHE_MISS) is CACHE_MISS
+    assert len(local) == 0
+
+
+def test_lru_disabled_by_zero_limits():
+    local = LocalLRUCache(max_entries=0, max_bytes=1024, ttl=60)
+    local.set('a', 1)
+
+    assert local.get('a', default=CACHE_MISS) is CACHE_MISS
+
+
+def test_two_tier_serves_hit_from_local_memory():
+    service = TwoTierCacheService()
+    key = service.generate_cache_key(model_prefix='group', func_prefix='all')
+    service.set_cache(key=key, value=['group'], timeout=60)
+
+    with mock.patch('core.apps.common.cache.service.cache') as redis_cache:
+        assert service.get_cache_value(key=key) == ['group']
+        assert service.generate_cache_key(model_prefix='group', func_prefix='all') == key
+
+    redis_cache.get.assert_not_called()
+    redis_cache.get_many.assert_not_called()
+
+
+def test_two_tier_async_reads_serve_hit_from_local_memory():
+    service = TwoTierCacheService()
+    key = service.generate_cache_key(model_prefix='group', func_prefix='all')
+    service.set_cache(key=key, value=['group'], timeout=60)
+
+    with mock.patch('core.apps.common.cache.service.cache') as redis_cache:
+        assert async_to_sync(service.aget_cache_value)(key=key) == ['group']
+        assert key.endswith(async_to_sync(service.aget_generation)(model_prefix='group', func_prefix='all'))
+
+    redis_cache.aget.assert_not_called()
+    redis_cache.aget_many.assert_not_called()
+
+
+def test_two_tier_fills_local_memory_from_redis():
+    service = TwoTierCacheService()
+    key = service.generate_cache_key(model_prefix='group', func_prefix='all')
+    cache.set(key, ['from-redis'])
+
+    assert service.get_cache_value(key=key) == ['from-redis']
+
+    cache.delete(key)
+    assert service.get_cache_value(key=key) == ['from-redis']
+
+
+def test_two_tier_shared_read_skips_and_refreshes_local_memory():
+    service = TwoTierCacheService()
+    key = service.generate_cache_key(model_prefix='group', func_prefix='all')
+    service.set_cache(key=key, value='local', timeout=60)
+    cache.set(key, 'refreshed-elsewhere')
+
+    assert service.get_shared_cache_value(key=key) == 'refreshed-elsewhere'
+    assert service.get_cache_value(key=key) == 'refreshed-elsewhere'
+
+
+def test_two_tier_local_bump_is_visible_immediately():
+    service = TwoTierCacheService()
+    key = service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons')
+    service.set_cache(key=key, value='old', timeout=60)
+
+    service.invalidate_namespace(model_prefix='group', identifier='abc')
+
+    new_key = service.generate_cache_key(model_prefix='group', identifier='abc', func_prefix='lessons')
+    assert new_key != key
+    assert service.get_cache_value(key=new_key, default=CACHE_MISS) is CACHE_MISS
+
+
+def test_two_tier_sees_remote_bump_once_generation_expires(settings):
+    service = TwoTierCacheService()
+    key = service.generate_cache_key(model_prefix='group', func_prefix='all')
+
+    cache.incr('generation:group:*:all')
+    assert service.generate_cache_key(model_prefix='group', func_prefix='all') == key
+
+    settings.LOCAL_CACHE_GENERATION_TTL = 0
+    assert service.generate_cache_key(model_prefix='group', func_prefix='all') != key
@@ -0,0 +1,33 @@
+import asyncio
+import threading
+from asgiref.sync import async_to_sync
+
+from core.apps.common.threads import sync_read_to_async
+
+
+def test_sync_reads_run_concurrently(settings):
+    settings.ASYNC_READS_THREAD_SENSITIVE = False
+    barrier = threading.Barrier(2, timeout=5)
+
+    def read() -> int:
+        # Returns only once both reads are inside it at the same time.
+        barrier.wait()
+        return threading.get_ident()
+
+    async def read_twice() -> list[int]:
+        return await asyncio.gather(sync_read_to_async(read)(), sync_read_to_async(read)())
+
+    first, second = async_to_sync(read_twice)()
+
+    assert first != second
+
+
+def test_thread_sensitive_reads_share_one_thread(settings):
+    settings.ASYNC_READS_THREAD_SENSITIVE = True
+
+    async def read_twice() -> list[int]:
+        return await asyncio.gather(*(sync_read_to_async(threading.get_ident)() for _ in range(2)))
+
+    first, second = async_to_sync(read_twice)()
+
+    assert first == second == threading.get_ident()
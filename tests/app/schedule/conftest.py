@@ -11,6 +11,7 @@ from core.apps.schedule.services.faculty import BaseFacultyService
 from core.apps.schedule.services.group import BaseGroupService
 from core.apps.schedule.services.lesson import BaseLessonService
 from core.apps.schedule.services.room import BaseRoomService
+from core.apps.schedule.services.search import BaseSearchService
 from core.apps.schedule.services.subject import BaseSubjectService
 from core.apps.schedule.services.teacher import BaseTeacherService
 from core.apps.schedule.services.timeslot import BaseTimeslotService
@@ -51,6 +52,11 @@ def lesson_service(container) -> BaseLessonService:
     return container.resolve(BaseLessonService)
 
 
+@pytest.fixture
+def search_service(container) -> BaseSearchService:
+    return container.resolve(BaseSearchService)
+
+
 @pytest.fixture(scope='function')
 def subject_create_batch():
     def _subject_create_batch(size: int, **kwargs) -> list:
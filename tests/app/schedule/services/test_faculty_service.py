@@ -30,19 +30,19 @@ def test_create_faculty_already_exists_failure(faculty_service: BaseFacultyServi
 
 
 @pytest.mark.django_db
-def test_get_count_faculty_zero(faculty_service: BaseFacultyService):
-    faculty_count = faculty_service.get_count(filters=SearchFilter())
+def test_get_page_total_faculty_zero(faculty_service: BaseFacultyService):
+    faculty_count = faculty_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).total
     assert faculty_count == 0, f"{faculty_count=}"
 
 
 @pytest.mark.django_db
-def test_get_count_faculty_exist(faculty_service: BaseFacultyService, faculty_create_batch):
+def test_get_page_total_faculty_exist(faculty_service: BaseFacultyService, faculty_create_batch):
     expected_count = 5
     faculties = faculty_create_batch(size=expected_count)
     faculty_names = {faculty.name for faculty in faculties}
     faculty_code_names = {faculty.code_name for faculty in faculties}
 
-    faculty_count = faculty_service.get_count(filters=SearchFilter())
+    faculty_count = faculty_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).total
     assert len(faculty_names) == expected_count, f"{faculty_names=}"
     assert len(faculty_code_names) == expected_count, f"{faculty_code_names=}"
     assert faculty_count == expected_count, f"{faculty_count=}"
@@ -62,12 +62,12 @@ def test_get_all_faculties_success(faculty_service: BaseFacultyService, faculty_
 
 
 @pytest.mark.django_db
-def test_get_list_faculties_success(faculty_service: BaseFacultyService, faculty_create_batch):
+def test_get_page_faculties_success(faculty_service: BaseFacultyService, faculty_create_batch):
     expected_count = 5
     faculties = faculty_create_batch(size=expected_count)
     faculty_names = {faculty.name for faculty in faculties}
 
-    fetched_faculty = faculty_service.get_list(filters=SearchFilter(), pagination=PaginationIn())
+    fetched_faculty = faculty_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).items
     fetched_names = {faculty.name for faculty in fetched_faculty}
 
     assert len(fetched_names) == expected_count, f"{fetched_names=}"
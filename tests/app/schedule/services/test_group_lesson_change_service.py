@@ -0,0 +1,63 @@
+from django.utils import timezone
+
+import pytest
+from datetime import timedelta
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+
+from core.apps.common.models import (
+    GroupLessonChangeKind,
+    Subgroup,
+)
+from core.apps.schedule.entities.group_lessons import (
+    GroupLesson as GroupLessonEntity,
+    GroupLessonCell,
+)
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
+
+
+@pytest.fixture
+def group_lesson_change_service(container) -> BaseGroupLessonChangeService:
+    return container.resolve(BaseGroupLessonChangeService)
+
+
+def _group_lesson(group, lesson, subgroup: Subgroup | None = None) -> GroupLessonEntity:
+    return GroupLessonEntity(group=group.to_entity(), lesson=lesson.to_entity(), subgroup=subgroup)
+
+
+@pytest.mark.django_db
+def test_record_logs_removals_before_additions(group_lesson_change_service: BaseGroupLessonChangeService):
+    group = GroupModelFactory()
+    old, new = LessonModelFactory.create_batch(2)
+
+    group_lesson_change_service.record(
+        added=[_group_lesson(group, new, Subgroup.A)],
+        removed=[_group_lesson(group, old, Subgroup.A)],
+    )
+
+    version = group_lesson_change_service.get_version(group_id=group.id)
+    changes = group_lesson_change_service.get_changes(group_id=group.id, after=0, until=version)
+    assert [(change.kind, change.cell) for change in changes] == [
+        (GroupLessonChangeKind.REMOVE, GroupLessonCell(lesson_uuid=str(old.lesson_uuid), subgroup=Subgroup.A)),
+        (GroupLessonChangeKind.ADD, GroupLessonCell(lesson_uuid=str(new.lesson_uuid), subgroup=Subgroup.A)),
+    ]
+    assert changes[-1].version == version
+
+
+@pytest.mark.django_db
+def test_compact_keeps_newest_dropped_change_as_reset(group_lesson_change_service: BaseGroupLessonChangeService):
+    groups = GroupModelFactory.create_batch(2)
+    lessons = LessonModelFactory.create_batch(3)
+    for lesson in lessons:
+        group_lesson_change_service.record(added=[_group_lesson(group, lesson) for group in groups])
+    versions = [group_lesson_change_service.get_version(group_id=group.id) for group in groups]
+
+    deleted = group_lesson_change_service.compact(before=timezone.now() + timedelta(seconds=1))
+
+    assert deleted == 4
+    for group, version in zip(groups, versions):
+        changes = group_lesson_change_service.get_changes(group_id=group.id, after=0, until=version)
+        assert [(change.version, change.kind, change.cell) for change in changes] == [
+            (version, GroupLessonChangeKind.RESET, None),
+        ]
+    assert group_lesson_change_service.compact(before=timezone.now() - timedelta(days=1)) == 0
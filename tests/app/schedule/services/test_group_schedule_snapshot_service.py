@@ -0,0 +1,205 @@
+from django.core.cache import cache
+
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
+from unittest import mock
+
+from core.apps.common.cache.service import BaseCacheService
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+    Subgroup,
+)
+from core.apps.schedule.exceptions.group import GroupNotFoundException
+from core.apps.schedule.filters.group import LessonFilter
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def snapshot_service(container) -> BaseGroupScheduleSnapshotService:
+    return container.resolve(BaseGroupScheduleSnapshotService)
+
+
+@pytest.fixture
+def group_with_timetable():
+    group = GroupModelFactory(has_subgroups=True)
+    even_lesson = LessonModelFactory(
+        timeslot=TimeslotModelFactory(day=Day.MONDAY, ord_number=OrdinaryNumber.FIRST, is_even=True),
+    )
+    odd_lesson = LessonModelFactory(
+        timeslot=TimeslotModelFactory(day=Day.MONDAY, ord_number=OrdinaryNumber.FIRST, is_even=False),
+    )
+    GroupLessonModelFactory(group=group, lesson=even_lesson, subgroup=Subgroup.A)
+    GroupLessonModelFactory(group=group, lesson=even_lesson, subgroup=Subgroup.B)
+    GroupLessonModelFactory(group=group, lesson=odd_lesson, subgroup=Subgroup.B)
+    return group, even_lesson, odd_lesson
+
+
+@pytest.mark.django_db
+def test_get_builds_snapshot_with_both_parities(snapshot_service, group_with_timetable):
+    group, even_lesson, odd_lesson = group_with_timetable
+
+    snapshot = snapshot_service.get(group_uuid=str(group.group_uuid))
+
+    assert snapshot.group.uuid == str(group.group_uuid)
+    assert {entry.lesson_uuid for entry in snapshot.timetable.entries} == {
+        str(even_lesson.lesson_uuid),
+        str(odd_lesson.lesson_uuid),
+    }
+
+
+@pytest.mark.django_db
+def test_get_serves_cached_snapshot_without_queries(
+        snapshot_service,
+        group_with_timetable,
+        django_assert_num_queries,
+):
+    group, _, _ = group_with_timetable
+    snapshot_service.get(group_uuid=str(group.group_uuid))
+
+    with django_assert_num_queries(0):
+        snapshot = snapshot_service.get(group_uuid=str(group.group_uuid))
+
+    assert len(snapshot.timetable.entries) == 2
+
+
+@pytest.mark.django_db
+def test_get_unknown_group_raises(snapshot_service):
+    with pytest.raises(GroupNotFoundException):
+        snapshot_service.get(group_uuid='00000000-0000-0000-0000-000000000000')
+
+
+@pytest.mark.django_db
+def test_slice_filters_parity_and_subgroup(snapshot_service, group_with_timetable):
+    group, even_lesson, odd_lesson = group_with_timetable
+    snapshot = snapshot_service.get(group_uuid=str(group.group_uuid))
+
+    even_all = snapshot_service.slice(snapshot=snapshot, filters=LessonFilter(is_even=True))
+    even_a = snapshot_service.slice(snapshot=snapshot, filters=LessonFilter(is_even=True, subgroup=Subgroup.A))
+    odd_a = snapshot_service.slice(snapshot=snapshot, filters=LessonFilter(is_even=False, subgroup=Subgroup.A))
+
+    assert [entry.lesson_uuid for entry in even_all.entries] == [str(even_lesson.lesson_uuid)]
+    assert sorted(even_all.entries[0].subgroups) == [Subgroup.A, Subgroup.B]
+    assert even_a.entries[0].subgroups == [Subgroup.A]
+    assert odd_a.entries == []
+    assert even_a.subjects is snapshot.timetable.subjects
+
+
+@pytest.mark.django_db
+def test_slice_does_not_mutate_snapshot(snapshot_service, group_with_timetable):
+    group, _, _ = group_with_timetable
+    snapshot = snapshot_service.get(group_uuid=str(group.group_uuid))
+
+    snapshot_service.slice(snapshot=snapshot, filters=LessonFilter(is_even=True, subgroup=Subgroup.A))
+
+    entries = snapshot.timetable.entries
+    assert sorted(entries[0].subgroups + entries[1].subgroups) == [
+        Subgroup.A, Subgroup.B, Subgroup.B,
+    ]
+
+
+@pytest.mark.django_db
+def test_rebuild_replaces_cached_snapshot(snapshot_service, group_with_timetable):
+    group, _, _ = group_with_timetable
+    snapshot_service.get(group_uuid=str(group.group_uuid))
+
+    GroupLessonModelFactory(
+        group=group,
+        lesson=LessonModelFactory(
+            timeslot=TimeslotModelFactory(day=Day.FRIDAY, ord_number=OrdinaryNumber.THIRD, is_even=True),
+        ),
+        subgroup=Subgroup.A,
+    )
+    snapshot_service.rebuild(group_uuid=str(group.group_uuid))
+
+    assert len(snapshot_service.get(group_uuid=str(group.group_uuid)).timetable.entries) == 3
+
+
+@pytest.mark.django_db
+def test_get_many_builds_misses_together_and_shares_cache_with_get(
+        snapshot_service,
+        group_with_timetable,
+        django_assert_max_num_queries,
+        django_assert_num_queries,
+):
+    group, _, _ = group_with_timetable
+    others = GroupModelFactory.create_batch(3)
+    shared_lessons = [
+        LessonModelFactory(
+            timeslot=TimeslotModelFactory(day=Day.FRIDAY, ord_number=OrdinaryNumber.THIRD, is_even=is_even),
+        )
+        for is_even in (True, False)
+    ]
+    for other in others:
+        for lesson in shared_lessons:
+            GroupLessonModelFactory(group=other, lesson=lesson, subgroup=None)
+    cached_uuid = str(group.group_uuid)
+    snapshot_service.get(group_uuid=cached_uuid)
+    unknown_uuid = '00000000-0000-0000-0000-000000000000'
+    group_uuids = [cached_uuid, unknown_uuid, *(str(other.group_uuid) for other in others)]
+
+    with django_assert_max_num_queries(3):
+        snapshots = snapshot_service.get_many(group_uuids=group_uuids)
+
+    assert set(snapshots) == set(group_uuids) - {unknown_uuid}
+    assert len(snapshots[cached_uuid].timetable.entries) == 2
+    assert all(len(snapshots[str(other.group_uuid)].timetable.entries) == 2 for other in others)
+
+    with django_assert_num_queries(0):
+        assert snapshot_service.get(group_uuid=str(others[0].group_uuid)) == snapshots[str(others[0].group_uuid)]
+        assert snapshot_service.get_many(group_uuids=list(snapshots)) == snapshots
+
+
+@pytest.mark.django_db
+def test_get_many_on_empty_cache_stores_every_snapshot(snapshot_service, django_assert_num_queries):
+    group_uuids = [str(group.group_uuid) for group in GroupModelFactory.create_batch(3)]
+
+    snapshots = snapshot_service.get_many(group_uuids=group_uuids)
+
+    with django_assert_num_queries(0):
+        assert snapshot_service.get_many(group_uuids=group_uuids) == snapshots
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('method', ['get_many', 'rebuild'])
+def test_snapshot_is_not_stored_when_a_dependency_is_invalidated_while_building(
+        container,
+        snapshot_service,
+        group_with_timetable,
+        django_assert_num_queries,
+        method,
+):
+    group, even_lesson, _ = group_with_timetable
+    group_uuid = str(group.group_uuid)
+    cache_service: BaseCacheService = container.resolve(BaseCacheService)
+    lesson_service = snapshot_service.lesson_service
+    build = {
+        'get_many': 'get_all_lessons_with_subgroups_for_groups',
+        'rebuild': 'get_all_lessons_with_subgroups_for_group',
+    }[method]
+    read_lessons = getattr(lesson_service, build)
+
+    def read_then_rename(**kwargs):
+        timetable = read_lessons(**kwargs)
+        # The teacher is renamed after the lessons were read.
+        cache_service.invalidate_dependents(dimension='teacher', identifier=str(even_lesson.teacher.teacher_uuid))
+        return timetable
+
+    with mock.patch.object(lesson_service, build, side_effect=read_then_rename):
+        if method == 'get_many':
+            snapshot_service.get_many(group_uuids=[group_uuid])
+        else:
+            snapshot_service.rebuild(group_uuid=group_uuid)
+
+    with django_assert_num_queries(2):
+        snapshot_service.get(group_uuid=group_uuid)
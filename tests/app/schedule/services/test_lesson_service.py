@@ -3,6 +3,7 @@ from django.db.models import Q
 import pytest
 from tests.factories.schedule.group import GroupModelFactory
 from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
 
 from core.apps.common.models import Subgroup
 from core.apps.schedule.entities.lesson import Lesson as LessonEntity
@@ -168,14 +169,15 @@ def test_get_lessons_with_groups_for_teacher_buckets_rows(
     GroupLessonModelFactory(lesson=create_lesson, group=group, subgroup=Subgroup.A)
     GroupLessonModelFactory(lesson=create_lesson, group=group, subgroup=Subgroup.B)
 
-    views = lesson_service.get_lessons_with_groups_for_teacher(
+    timetable = lesson_service.get_lessons_with_groups_for_teacher(
         teacher_id=create_lesson.teacher_id,
         filter_query=LessonFilter(is_even=create_lesson.timeslot.is_even),
     )
 
-    assert len(views) == 1
-    assert len(views[0].groups) == 1
-    assert sorted(views[0].groups[0].subgroups) == [Subgroup.A, Subgroup.B]
+    assert len(timetable.entries) == 1
+    assert len(timetable.entries[0].groups) == 1
+    assert sorted(timetable.entries[0].groups[0].subgroups) == [Subgroup.A, Subgroup.B]
+    assert timetable.groups[group.id].uuid == str(group.group_uuid)
 
 
 @pytest.mark.django_db
@@ -183,12 +185,12 @@ def test_get_lessons_with_groups_for_teacher_empty_when_no_match(
         lesson_service: BaseLessonService,
         create_lesson,
 ):
-    views = lesson_service.get_lessons_with_groups_for_teacher(
+    timetable = lesson_service.get_lessons_with_groups_for_teacher(
         teacher_id=create_lesson.teacher_id,
         filter_query=LessonFilter(is_even=True),
     )
 
-    assert views == []
+    assert timetable.entries == []
 
 
 @pytest.mark.django_db
@@ -200,13 +202,13 @@ def test_get_lessons_with_subgroups_for_group_buckets_rows(
     GroupLessonModelFactory(lesson=create_lesson, group=group, subgroup=Subgroup.A)
     GroupLessonModelFactory(lesson=create_lesson, group=group, subgroup=Subgroup.B)
 
-    views = lesson_service.get_lessons_with_subgroups_for_group(
+    timetable = lesson_service.get_lessons_with_subgroups_for_group(
         group_id=group.id,
         filter_query=LessonFilter(is_even=create_lesson.timeslot.is_even),
     )
 
-    assert len(views) == 1
-    assert sorted(views[0].subgroups) == [Subgroup.A, Subgroup.B]
+    assert len(timetable.entries) == 1
+    assert sorted(timetable.entries[0].subgroups) == [Subgroup.A, Subgroup.B]
 
 
 @pytest.mark.django_db
@@ -217,12 +219,12 @@ def test_get_lessons_with_subgroups_for_group_subgroup_filter(
     group = GroupModelFactory()
     GroupLessonModelFactory(lesson=create_lesson, group=group, subgroup=Subgroup.A)
 
-    views = lesson_service.get_lessons_with_subgroups_for_group(
+    timetable = lesson_service.get_lessons_with_subgroups_for_group(
         group_id=group.id,
         filter_query=LessonFilter(is_even=create_lesson.timeslot.is_even, subgroup=Subgroup.A),
     )
 
-    assert len(views) == 1
+    assert len(timetable.entries) == 1
 
 
 @pytest.mark.django_db
@@ -247,9 +249,27 @@ def test_get_lessons_with_groups_with_raw_query(
     group = GroupModelFactory()
     GroupLessonModelFactory(lesson=create_lesson, group=group)
 
-    views = lesson_service.get_lessons_with_groups(
+    timetable = lesson_service.get_lessons_with_groups(
         lesson_filter=Q(lesson__teacher_id=create_lesson.teacher_id),
     )
 
-    assert len(views) == 1
-    assert views[0].lesson.uuid == str(create_lesson.lesson_uuid)
+    assert len(timetable.entries) == 1
+    assert timetable.entries[0].lesson_uuid == str(create_lesson.lesson_uuid)
+
+
+@pytest.mark.django_db
+def test_get_lessons_with_groups_stores_shared_rows_once(lesson_service: BaseLessonService, create_lesson):
+    groups = GroupModelFactory.create_batch(3)
+    for group in groups:
+        GroupLessonModelFactory(lesson=create_lesson, group=group)
+    other_lesson = LessonModelFactory(teacher=create_lesson.teacher, subject=create_lesson.subject)
+    GroupLessonModelFactory(lesson=other_lesson, group=groups[0])
+
+    timetable = lesson_service.get_lessons_with_groups(
+        lesson_filter=Q(lesson__teacher_id=create_lesson.teacher_id),
+    )
+
+    assert len(timetable.entries) == 2
+    assert list(timetable.teachers) == [create_lesson.teacher_id]
+    assert list(timetable.subjects) == [create_lesson.subject_id]
+    assert set(timetable.groups) == {group.id for group in groups}
@@ -1,9 +1,13 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 
 from core.api.filters import (
     PaginationIn,
     SearchFilter,
 )
+from core.apps.common.exceptions import InvalidPaginationCursorException
 from core.apps.schedule.exceptions.room import (
     RoomAlreadyExistException,
     RoomDeleteException,
@@ -34,17 +38,17 @@ def test_create_room_already_exists_failure(room_service: BaseRoomService, room_
 
 
 @pytest.mark.django_db
-def test_get_count_room_zero(room_service: BaseRoomService):
-    room_count = room_service.get_count(filters=SearchFilter())
+def test_get_page_total_room_zero(room_service: BaseRoomService):
+    room_count = room_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).total
     assert room_count == 0, f"{room_count=}"
 
 
 @pytest.mark.django_db
-def test_get_count_room_exist(room_service: BaseRoomService, room_create_batch):
+def test_get_page_total_room_exist(room_service: BaseRoomService, room_create_batch):
     expected_count = 5
     room_create_batch(size=expected_count)
 
-    room_count = room_service.get_count(filters=SearchFilter())
+    room_count = room_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).total
     assert room_count == expected_count, f"{room_count=}"
 
 
@@ -62,12 +66,12 @@ def test_get_all_rooms_success(room_service: BaseRoomService, room_create_batch)
 
 
 @pytest.mark.django_db
-def test_get_list_rooms_success(room_service: BaseRoomService, room_create_batch):
+def test_get_page_rooms_success(room_service: BaseRoomService, room_create_batch):
     expected_count = 5
     rooms = room_create_batch(size=expected_count)
     room_numbers = {room.number for room in rooms}
 
-    fetched_rooms = room_service.get_list(filters=SearchFilter(), pagination=PaginationIn())
+    fetched_rooms = room_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).items
     fetched_numbers = {room.number for room in fetched_rooms}
 
     assert len(fetched_numbers) == expected_count, f"{fetched_numbers=}"
@@ -176,3 +180,51 @@ def test_soft_delete_room_failure(room_service: BaseRoomService, room_build):
 
     with pytest.raises(RoomDeleteException):
         room_service.soft_delete(room_id=room.id)
+
+
+@pytest.mark.django_db
+def test_get_page_counts_total_in_the_same_query(room_service: BaseRoomService, room_create_batch):
+    room_create_batch(size=5)
+
+    with CaptureQueriesContext(connection) as queries:
+        page = room_service.get_page(filters=SearchFilter(), pagination=PaginationIn(limit=2))
+
+    assert len(queries) == 1
+    assert page.total == 5
+    assert len(page.items) == 2
+    assert page.next_cursor is not None
+
+
+@pytest.mark.django_db
+def test_get_page_follows_cursor_to_the_last_page(room_service: BaseRoomService, room_create_batch):
+    rooms = room_create_batch(size=5)
+
+    numbers, cursor, totals = [], None, []
+    while True:
+        page = room_service.get_page(filters=SearchFilter(), pagination=PaginationIn(limit=2, cursor=cursor))
+        numbers.extend(room.number for room in page.items)
+        totals.append(page.total)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(numbers) == 5
+    assert set(numbers) == {room.number for room in rooms}
+    assert totals == [5, None, None]
+
+
+@pytest.mark.django_db
+def test_get_page_past_the_end_still_reports_total(room_service: BaseRoomService, room_create_batch):
+    room_create_batch(size=3)
+
+    page = room_service.get_page(filters=SearchFilter(), pagination=PaginationIn(offset=10))
+
+    assert page.items == []
+    assert page.total == 3
+    assert page.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_get_page_rejects_malformed_cursor(room_service: BaseRoomService):
+    with pytest.raises(InvalidPaginationCursorException):
+        room_service.get_page(filters=SearchFilter(), pagination=PaginationIn(cursor='not-a-cursor'))
@@ -0,0 +1,105 @@
+from django.core.cache import cache
+
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+
+from core.apps.common.cache.service import (
+    BaseCacheService,
+    GENERATION_KEY_PREFIX,
+)
+from core.apps.schedule.exceptions.group import GroupNotFoundException
+from core.apps.schedule.exceptions.validators.uuid_validator import InvalidUuidFormatStringException
+from core.apps.schedule.services.group_schedule_snapshot import BaseGroupScheduleSnapshotService
+from core.apps.schedule.services.schedule_version import BaseScheduleVersionService
+
+
+UNKNOWN_UUID = '11111111-1111-1111-1111-111111111111'
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def version_service(container) -> BaseScheduleVersionService:
+    return container.resolve(BaseScheduleVersionService)
+
+
+@pytest.fixture
+def cache_service(container) -> BaseCacheService:
+    return container.resolve(BaseCacheService)
+
+
+@pytest.fixture
+def group_uuid() -> str:
+    return str(GroupModelFactory().group_uuid)
+
+
+@pytest.fixture
+def teacher_uuid() -> str:
+    return str(TeacherModelFactory().teacher_uuid)
+
+
+@pytest.mark.django_db
+def test_version_is_stable_until_invalidated(version_service, teacher_uuid):
+    first = version_service.get_teacher_lessons_version(teacher_uuid=teacher_uuid)
+
+    assert version_service.get_teacher_lessons_version(teacher_uuid=teacher_uuid) == first
+
+
+@pytest.mark.django_db
+def test_version_of_unknown_row_creates_no_counter(version_service):
+    with pytest.raises(InvalidUuidFormatStringException):
+        version_service.get_group_lessons_version(group_uuid='not-a-uuid')
+    with pytest.raises(GroupNotFoundException):
+        version_service.get_group_lessons_version(group_uuid=UNKNOWN_UUID)
+
+    assert cache.keys(f'{GENERATION_KEY_PREFIX}:group:*') == []
+
+
+@pytest.mark.django_db
+def test_lessons_pattern_invalidation_changes_version(version_service, cache_service, group_uuid, teacher_uuid):
+    group_version = version_service.get_group_lessons_version(group_uuid=group_uuid)
+    teacher_version = version_service.get_teacher_lessons_version(teacher_uuid=teacher_uuid)
+
+    cache_service.invalidate_namespace_list([
+        dict(model_prefix='group', identifier='*', func_prefix='lessons'),
+        dict(model_prefix='teacher', identifier='*', func_prefix='lessons'),
+    ])
+
+    assert version_service.get_group_lessons_version(group_uuid=group_uuid) != group_version
+    assert version_service.get_teacher_lessons_version(teacher_uuid=teacher_uuid) != teacher_version
+
+
+def test_all_groups_invalidation_changes_all_groups_version(version_service, cache_service):
+    version = version_service.get_all_groups_version()
+
+    cache_service.invalidate_namespace(model_prefix='group', func_prefix='all')
+
+    assert version_service.get_all_groups_version() != version
+
+
+@pytest.mark.django_db
+def test_unrelated_invalidation_keeps_version(version_service, cache_service, group_uuid):
+    version = version_service.get_group_lessons_version(group_uuid=group_uuid)
+
+    cache_service.invalidate_namespace_list([
+        dict(model_prefix='group', func_prefix='all'),
+        dict(model_prefix='teacher', identifier='*', func_prefix='lessons'),
+    ])
+
+    assert version_service.get_group_lessons_version(group_uuid=group_uuid) == version
+
+
+@pytest.mark.django_db
+def test_snapshot_rebuild_changes_group_version(container, version_service):
+    group = GroupModelFactory()
+    version = version_service.get_group_lessons_version(group_uuid=str(group.group_uuid))
+
+    container.resolve(BaseGroupScheduleSnapshotService).rebuild(group_uuid=str(group.group_uuid))
+
+    assert version_service.get_group_lessons_version(group_uuid=str(group.group_uuid)) != version
@@ -0,0 +1,101 @@
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.subject import SubjectModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+
+from core.apps.common.search import (
+    build_search_text,
+    fold_search_text,
+)
+from core.apps.schedule.entities.search import SearchKind
+from core.apps.schedule.services.search import BaseSearchService
+
+
+ALL_KINDS = list(SearchKind)
+
+
+def test_fold_search_text_drops_apostrophes_and_folds_case():
+    assert fold_search_text("  Мар’яна   ҐУДЗЬ ") == 'маряна гудзь'
+
+
+def test_build_search_text_contains_both_scripts():
+    search_text = build_search_text(['Шевченко', None, 'Тарас'])
+
+    assert 'шевченко тарас' in search_text
+    assert 'shevchenko taras' in search_text
+
+
+@pytest.mark.django_db
+def test_search_finds_cyrillic_teacher_by_latin_query(search_service: BaseSearchService):
+    teacher = TeacherModelFactory(last_name='Шевченко', first_name='Тарас', middle_name='Григорович')
+
+    hits = search_service.search(query='Shevch', kinds=ALL_KINDS, limit=10)
+
+    assert [(hit.kind, hit.uuid) for hit in hits] == [(SearchKind.TEACHER, teacher.teacher_uuid)]
+    assert hits[0].label == 'Шевченко Тарас Григорович'
+
+
+@pytest.mark.django_db
+def test_search_ignores_apostrophes_and_case(search_service: BaseSearchService):
+    teacher = TeacherModelFactory(last_name="Мар'яненко", first_name='Ґанна')
+
+    hits = search_service.search(query='МАРЯНЕН ганна', kinds=[SearchKind.TEACHER], limit=10)
+
+    assert [hit.uuid for hit in hits] == [teacher.teacher_uuid]
+
+
+@pytest.mark.django_db
+def test_search_requires_every_token(search_service: BaseSearchService):
+    TeacherModelFactory(last_name='Коваленко', first_name='Олена')
+
+    assert search_service.search(query='коваленко петро', kinds=ALL_KINDS, limit=10) == []
+
+
+@pytest.mark.django_db
+def test_search_ranks_word_prefix_above_infix(search_service: BaseSearchService):
+    infix = SubjectModelFactory(title='Геоалгебра')
+    prefix = SubjectModelFactory(title='Алгебра і геометрія')
+
+    hits = search_service.search(query='алгебр', kinds=[SearchKind.SUBJECT], limit=10)
+
+    assert [hit.uuid for hit in hits] == [prefix.subject_uuid, infix.subject_uuid]
+    assert hits[0].score > hits[1].score
+
+
+@pytest.mark.django_db
+def test_search_filters_by_kind_and_limit(search_service: BaseSearchService):
+    GroupModelFactory(number='ФІЗ-31')
+    room = RoomModelFactory(number='305', description='Лабораторія фізики')
+    SubjectModelFactory(title='Фізика твердого тіла')
+
+    hits = search_service.search(query='фіз', kinds=[SearchKind.ROOM], limit=10)
+    assert [(hit.kind, hit.uuid) for hit in hits] == [(SearchKind.ROOM, room.room_uuid)]
+
+    assert len(search_service.search(query='фіз', kinds=ALL_KINDS, limit=2)) == 2
+
+
+@pytest.mark.django_db
+def test_search_sees_renamed_teacher(search_service: BaseSearchService, teacher_service):
+    teacher = TeacherModelFactory(last_name='Петренко')
+
+    teacher_service.update_name(
+        teacher_id=teacher.id,
+        first_name=teacher.first_name,
+        last_name='Бондаренко',
+        middle_name=teacher.middle_name,
+    )
+
+    assert search_service.search(query='petrenko', kinds=ALL_KINDS, limit=10) == []
+    assert [hit.uuid for hit in search_service.search(query='bondar', kinds=ALL_KINDS, limit=10)] == [
+        teacher.teacher_uuid,
+    ]
+
+
+@pytest.mark.django_db
+def test_search_is_one_query(search_service: BaseSearchService, django_assert_num_queries):
+    TeacherModelFactory(last_name='Іваненко')
+    GroupModelFactory(number='ІП-21')
+
+    with django_assert_num_queries(1):
+        search_service.search(query='і', kinds=ALL_KINDS, limit=10)
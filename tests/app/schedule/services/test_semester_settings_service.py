@@ -1,5 +1,6 @@
 import datetime
 import pytest
+from asgiref.sync import async_to_sync
 
 from core.apps.schedule.services.semester_settings import BaseSemesterSettingsService
 
@@ -17,3 +18,10 @@ def test_get_current_settings_returns_entity_with_defaults(
 
     assert isinstance(settings.start_date, datetime.date)
     assert isinstance(settings.is_above_line, bool)
+
+
+@pytest.mark.django_db
+def test_aget_current_settings_matches_sync(semester_settings_service: BaseSemesterSettingsService):
+    assert async_to_sync(semester_settings_service.aget_current_settings)() == (
+        semester_settings_service.get_current_settings()
+    )
@@ -35,17 +35,17 @@ def test_create_subject_already_exists_failure(subject_service: BaseSubjectServi
 
 
 @pytest.mark.django_db
-def test_get_count_subject_zero(subject_service: BaseSubjectService):
-    subject_count = subject_service.get_count(filters=SearchFilter())
+def test_get_page_total_subject_zero(subject_service: BaseSubjectService):
+    subject_count = subject_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).total
     assert subject_count == 0, f"{subject_count=}"
 
 
 @pytest.mark.django_db
-def test_get_count_subject_exist(subject_service: BaseSubjectService, subject_create_batch):
+def test_get_page_total_subject_exist(subject_service: BaseSubjectService, subject_create_batch):
     expected_count = 5
     subject_create_batch(size=expected_count)
 
-    subject_count = subject_service.get_count(filters=SearchFilter())
+    subject_count = subject_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).total
     assert subject_count == expected_count, f"{subject_count=}"
 
 
@@ -63,18 +63,30 @@ def test_get_all_subjects_success(subject_service: BaseSubjectService, subject_c
 
 
 @pytest.mark.django_db
-def test_get_list_subject_success(subject_service: BaseSubjectService, subject_create_batch):
+def test_get_page_subject_success(subject_service: BaseSubjectService, subject_create_batch):
     expected_count = 5
     subjects = subject_create_batch(size=expected_count)
     subject_titles = {subject.title for subject in subjects}
 
-    fetched_subjects = subject_service.get_list(filters=SearchFilter(), pagination=PaginationIn())
+    fetched_subjects = subject_service.get_page(filters=SearchFilter(), pagination=PaginationIn()).items
     fetched_titles = {subject.title for subject in fetched_subjects}
 
     assert len(fetched_titles) == expected_count, f"{fetched_titles=}"
     assert subject_titles == fetched_titles, f"{subject_titles=}"
 
 
+@pytest.mark.django_db
+def test_get_page_subject_matches_title_or_slug(subject_service: BaseSubjectService, subject_create):
+    by_title = subject_create(title='Math analysis', slug='analysis')
+    by_slug = subject_create(title='Фізика', slug='math-physics')
+    subject_create(title='Історія', slug='history')
+
+    fetched_subjects = subject_service.get_page(filters=SearchFilter(search='math'), pagination=PaginationIn()).items
+
+    assert {subject.id for subject in fetched_subjects} == {by_title.id, by_slug.id}
+    assert subject_service.get_page(filters=SearchFilter(search='math-phys'), pagination=PaginationIn()).total == 1
+
+
 @pytest.mark.django_db
 def test_get_by_uuid_subject_success(subject_service: BaseSubjectService, subject_create):
     subject = subject_create()
@@ -41,17 +41,17 @@ def test_create_teacher_success(teacher_service: BaseTeacherService, teacher_bui
 
 
 @pytest.mark.django_db
-def test_get_count_teacher_zero(teacher_service: BaseTeacherService):
-    teacher_count = teacher_service.get_count(filters=TeacherFilter())
+def test_get_page_total_teacher_zero(teacher_service: BaseTeacherService):
+    teacher_count = teacher_service.get_page(filters=TeacherFilter(), pagination=PaginationIn()).total
     assert teacher_count == 0, f"{teacher_count=}"
 
 
 @pytest.mark.django_db
-def test_get_count_teacher_exist(teacher_service: BaseTeacherService, teacher_create_batch):
+def test_get_page_total_teacher_exist(teacher_service: BaseTeacherService, teacher_create_batch):
     expected_count = 5
     teacher_create_batch(size=expected_count)
 
-    teacher_count = teacher_service.get_count(filters=TeacherFilter())
+    teacher_count = teacher_service.get_page(filters=TeacherFilter(), pagination=PaginationIn()).total
     assert teacher_count == expected_count, f"{teacher_count=}"
 
 
@@ -69,12 +69,12 @@ def test_get_all_teachers_success(teacher_service: BaseTeacherService, teacher_c
 
 
 @pytest.mark.django_db
-def test_get_list_teachers_success(teacher_service: BaseTeacherService, teacher_create_batch):
+def test_get_page_teachers_success(teacher_service: BaseTeacherService, teacher_create_batch):
     expected_count = 5
     teachers = teacher_create_batch(size=expected_count)
     teacher_last_names = {teacher.last_name for teacher in teachers}
 
-    fetched_teacher = teacher_service.get_list(filters=TeacherFilter(), pagination=PaginationIn())
+    fetched_teacher = teacher_service.get_page(filters=TeacherFilter(), pagination=PaginationIn()).items
     fetched_last_names = {teacher.last_name for teacher in fetched_teacher}
 
     assert len(fetched_last_names) == expected_count, f"{fetched_last_names=}"
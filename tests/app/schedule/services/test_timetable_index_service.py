@@ -0,0 +1,229 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
+from unittest import mock
+
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+    Subgroup,
+)
+from core.apps.schedule.entities.group_lessons import GroupLesson as GroupLessonEntity
+from core.apps.schedule.entities.timetable_index import (
+    ConflictDimension,
+    TimetableIndexEntry,
+)
+from core.apps.schedule.services.timetable_index import (
+    BaseTimetableIndexService,
+    timeslot_mask,
+    TIMETABLE_INDEX_DELTA_KEY_PREFIX,
+    TIMETABLE_INDEX_VERSION_KEY,
+    TimetableIndex,
+)
+
+
+@pytest.fixture
+def timetable_index_service(container) -> BaseTimetableIndexService:
+    return container.resolve(BaseTimetableIndexService)
+
+
+@pytest.fixture
+def timeslot():
+    return TimeslotModelFactory(day=Day.MONDAY, ord_number=OrdinaryNumber.FIRST, is_even=True)
+
+
+def _entity(group, lesson, subgroup=None) -> GroupLessonEntity:
+    return GroupLessonEntity(group=group.to_entity(), subgroup=subgroup, lesson=lesson.to_entity())
+
+
+@pytest.mark.django_db
+def test_find_conflicts_reports_double_booked_teacher_and_room(timetable_index_service, timeslot):
+    teacher, room = TeacherModelFactory(), RoomModelFactory()
+    booked = LessonModelFactory(teacher=teacher, room=room, timeslot=timeslot)
+    GroupLessonModelFactory(lesson=booked, subgroup=None)
+    candidate = LessonModelFactory(teacher=teacher, room=room, timeslot=timeslot)
+
+    conflicts = timetable_index_service.find_conflicts(group_lesson=_entity(GroupModelFactory(), candidate))
+
+    assert {conflict.dimension for conflict in conflicts} == {ConflictDimension.TEACHER, ConflictDimension.ROOM}
+    assert all(conflict.lesson_uuids == (str(booked.lesson_uuid),) for conflict in conflicts)
+
+
+@pytest.mark.django_db
+def test_find_conflicts_allows_shared_lessons_and_disjoint_subgroups(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=True)
+    lecture = LessonModelFactory(timeslot=timeslot)
+    GroupLessonModelFactory(lesson=lecture, subgroup=None)
+    practice = LessonModelFactory(timeslot=timeslot)
+    GroupLessonModelFactory(group=group, lesson=practice, subgroup=Subgroup.A)
+    other_practice = LessonModelFactory(timeslot=timeslot)
+
+    assert timetable_index_service.find_conflicts(group_lesson=_entity(group, lecture)) != []
+    assert timetable_index_service.find_conflicts(group_lesson=_entity(group, lecture, Subgroup.B)) == []
+    assert timetable_index_service.find_conflicts(group_lesson=_entity(group, other_practice, Subgroup.B)) == []
+    assert [
+        conflict.dimension
+        for conflict in timetable_index_service.find_conflicts(
+            group_lesson=_entity(group, other_practice, Subgroup.A),
+        )
+    ] == [ConflictDimension.GROUP]
+
+
+@pytest.mark.django_db
+def test_find_conflicts_ignores_replaced_assignment(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    old_lesson = LessonModelFactory(timeslot=timeslot)
+    GroupLessonModelFactory(group=group, lesson=old_lesson, subgroup=None)
+    new_lesson = LessonModelFactory(teacher=old_lesson.teacher, timeslot=timeslot)
+
+    assert timetable_index_service.find_conflicts(
+        group_lesson=_entity(group, new_lesson),
+        replaced=_entity(group, old_lesson),
+    ) == []
+
+
+@pytest.mark.django_db
+def test_find_conflicts_ignores_removed_assignments(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    teacher_lesson, room_lesson = LessonModelFactory.create_batch(2, timeslot=timeslot)
+    for lesson in (teacher_lesson, room_lesson):
+        GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+    candidate = LessonModelFactory(teacher=teacher_lesson.teacher, room=room_lesson.room, timeslot=timeslot)
+
+    assert timetable_index_service.find_conflicts(
+        group_lesson=_entity(group, candidate),
+        removed=[_entity(group, teacher_lesson)],
+    ) != []
+    assert timetable_index_service.find_conflicts(
+        group_lesson=_entity(group, candidate),
+        removed=[_entity(group, teacher_lesson), _entity(group, room_lesson)],
+    ) == []
+
+
+@pytest.mark.django_db
+def test_record_keeps_index_current_without_reloading(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson, candidate = LessonModelFactory.create_batch(2, timeslot=timeslot)
+    timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+    timetable_index_service.record(added=[_entity(group, lesson)])
+
+    with CaptureQueriesContext(connection) as queries:
+        conflicts = timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    assert len(queries) == 0
+    assert [conflict.dimension for conflict in conflicts] == [ConflictDimension.GROUP]
+
+
+def _record_on_other_worker(timetable_index_service, **changes) -> None:
+    with mock.patch(
+        'core.apps.schedule.services.timetable_index.get_timetable_index',
+        return_value=TimetableIndex(),
+    ):
+        timetable_index_service.record(**changes)
+
+
+@pytest.mark.django_db
+def test_changes_recorded_by_other_workers_are_replayed_without_reloading(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson, candidate = LessonModelFactory.create_batch(2, timeslot=timeslot)
+    timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+    _record_on_other_worker(timetable_index_service, added=[_entity(group, lesson)])
+
+    with CaptureQueriesContext(connection) as queries:
+        conflicts = timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    assert len(queries) == 0
+    assert [conflict.dimension for conflict in conflicts] == [ConflictDimension.GROUP]
+
+
+@pytest.mark.django_db
+def test_index_is_reloaded_when_a_change_is_no_longer_published(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson, candidate = LessonModelFactory.create_batch(2, timeslot=timeslot)
+    timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+    _record_on_other_worker(timetable_index_service, added=[_entity(group, lesson)])
+    cache.delete(f'{TIMETABLE_INDEX_DELTA_KEY_PREFIX}:{cache.get(TIMETABLE_INDEX_VERSION_KEY)}')
+
+    with CaptureQueriesContext(connection) as queries:
+        conflicts = timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    assert len(queries) == 1
+    assert [conflict.dimension for conflict in conflicts] == [ConflictDimension.GROUP]
+
+
+def test_index_holds_each_entry_once():
+    index = TimetableIndex()
+    entry = TimetableIndexEntry(
+        group_uuid='group',
+        lesson_uuid='lesson',
+        teacher_uuid='teacher',
+        room_uuid='room',
+        day=Day.MONDAY,
+        ord_number=OrdinaryNumber.FIRST,
+        is_even=True,
+    )
+    monday_first = [(Day.MONDAY, OrdinaryNumber.FIRST, True)]
+
+    index.add(entry)
+    index.add(entry)
+    index.remove(entry)
+
+    assert index.free_rooms(['room'], mask=timeslot_mask(monday_first)) == ['room']
+    assert index.conflicts_for(entry) == []
+
+
+@pytest.mark.django_db
+def test_invalidate_reloads_index_from_database(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson, candidate = LessonModelFactory.create_batch(2, timeslot=timeslot)
+    timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate))
+
+    GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+    timetable_index_service.invalidate()
+
+    assert timetable_index_service.find_conflicts(group_lesson=_entity(group, candidate)) != []
+
+
+@pytest.mark.django_db
+def test_get_conflicts_scans_whole_timetable(timetable_index_service, timeslot):
+    teacher = TeacherModelFactory()
+    first, second = LessonModelFactory.create_batch(2, teacher=teacher, timeslot=timeslot)
+    GroupLessonModelFactory(lesson=first, subgroup=None)
+    GroupLessonModelFactory(lesson=second, subgroup=None)
+
+    conflicts = timetable_index_service.get_conflicts()
+
+    assert len(conflicts) == 1
+    assert conflicts[0].dimension == ConflictDimension.TEACHER
+    assert conflicts[0].identifier == str(teacher.teacher_uuid)
+    assert set(conflicts[0].lesson_uuids) == {str(first.lesson_uuid), str(second.lesson_uuid)}
+
+
+@pytest.mark.django_db
+def test_find_free_rooms_follows_recorded_changes(timetable_index_service, timeslot):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson = LessonModelFactory(timeslot=timeslot)
+    room_uuids = [str(lesson.room.room_uuid), str(RoomModelFactory().room_uuid)]
+    monday_first = [(Day.MONDAY, OrdinaryNumber.FIRST, True)]
+    timetable_index_service.find_free_rooms(room_uuids=room_uuids, timeslots=monday_first)
+
+    GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+    timetable_index_service.record(added=[_entity(group, lesson)])
+    assert timetable_index_service.find_free_rooms(room_uuids=room_uuids, timeslots=monday_first) == room_uuids[1:]
+
+    timetable_index_service.record(removed=[_entity(group, lesson)])
+    assert timetable_index_service.find_free_rooms(room_uuids=room_uuids, timeslots=monday_first) == room_uuids
@@ -1,20 +1,45 @@
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 import pytest
+from dataclasses import replace
+from tests.factories.schedule.faculty import FacultyModelFactory
 from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.subject import SubjectModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
 
 from core.api.filters import PaginationIn
 from core.apps.common.filters import SearchFilter
+from core.apps.common.models import (
+    Day,
+    LessonType,
+    OrdinaryNumber,
+    Subgroup,
+)
+from core.apps.schedule.entities.timetable_import import TimetableImportRow
 from core.apps.schedule.exceptions.faculty import (
     FacultyAlreadyExistsException,
     FacultyHasGroupsException,
     FacultyNotFoundException,
 )
+from core.apps.schedule.exceptions.timetable_import import (
+    TimetableImportGroupsOutsideFacultyException,
+    TimetableImportReferencesNotFoundException,
+)
 from core.apps.schedule.exceptions.validators.uuid_validator import InvalidUuidFormatStringException
+from core.apps.schedule.models import (
+    Group as GroupModel,
+    GroupLesson as GroupLessonModel,
+    Lesson as LessonModel,
+)
+from core.apps.schedule.services.schedule_version import BaseScheduleVersionService
 from core.apps.schedule.use_cases.faculty.create import CreateFacultyUseCase
 from core.apps.schedule.use_cases.faculty.delete import DeleteFacultyUseCase
 from core.apps.schedule.use_cases.faculty.get_all import GetAllFacultiesUseCase
 from core.apps.schedule.use_cases.faculty.get_list import GetFacultyListUseCase
+from core.apps.schedule.use_cases.faculty.import_timetable import ImportFacultyTimetableUseCase
 from core.apps.schedule.use_cases.faculty.update_code_name import UpdateFacultyCodeNameUseCase
 from core.apps.schedule.use_cases.faculty.update_name import UpdateFacultyNameUseCase
 
@@ -56,6 +81,40 @@ def update_code_name_use_case(container) -> UpdateFacultyCodeNameUseCase:
     return container.resolve(UpdateFacultyCodeNameUseCase)
 
 
+@pytest.fixture
+def import_timetable_use_case(container) -> ImportFacultyTimetableUseCase:
+    return container.resolve(ImportFacultyTimetableUseCase)
+
+
+def _import_row(group, subject, teacher, room, **kwargs) -> TimetableImportRow:
+    values = dict(
+        group_uuid=str(group.group_uuid),
+        subject_uuid=str(subject.subject_uuid),
+        teacher_uuid=str(teacher.teacher_uuid),
+        room_uuid=str(room.room_uuid),
+        type=LessonType.LECTURE,
+        day=Day.MONDAY,
+        ord_number=OrdinaryNumber.FIRST,
+        is_even=True,
+    )
+    values.update(kwargs)
+    return TimetableImportRow(**values)
+
+
+def _faculty_timetable(group_count: int) -> tuple:
+    faculty = FacultyModelFactory()
+    groups = GroupModelFactory.create_batch(group_count, faculty=faculty, has_subgroups=False)
+    subject, teacher, room = SubjectModelFactory(), TeacherModelFactory(), RoomModelFactory()
+    rows = []
+    for group in groups:
+        rows.append(_import_row(group, subject, teacher, room))
+        rows.append(_import_row(
+            group, subject, teacher, room,
+            type=LessonType.PRACTICE, ord_number=OrdinaryNumber.SECOND, is_even=False,
+        ))
+    return faculty, groups, rows
+
+
 @pytest.mark.django_db
 def test_get_all_faculties_returns_list(get_all_use_case, faculty_create_batch):
     faculty_create_batch(size=3)
@@ -69,13 +128,13 @@ def test_get_all_faculties_returns_list(get_all_use_case, faculty_create_batch):
 def test_get_faculty_list_returns_paginated(get_list_use_case, faculty_create_batch):
     faculty_create_batch(size=5)
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=SearchFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    assert count == 5
-    assert len(list(items)) == 5
+    assert page.total == 5
+    assert len(page.items) == 5
 
 
 @pytest.mark.django_db
@@ -233,3 +292,86 @@ def test_update_faculty_code_name_happy_path(update_code_name_use_case, faculty_
 
     assert updated.code_name == "NEW-CODE"
     assert updated.id == faculty.id
+
+
+@pytest.mark.django_db
+def test_import_timetable_assigns_shared_lessons(import_timetable_use_case):
+    faculty, groups, rows = _faculty_timetable(group_count=3)
+    split_group = GroupModelFactory(faculty=faculty, has_subgroups=True)
+    subject, teacher, room = SubjectModelFactory(), TeacherModelFactory(), RoomModelFactory()
+    rows += [
+        _import_row(split_group, subject, teacher, room, subgroup=Subgroup.A),
+        _import_row(split_group, subject, teacher, room, subgroup=Subgroup.B),
+    ]
+
+    result = import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows)
+
+    assert (result.groups, result.lessons, result.group_lessons) == (4, 3, 8)
+    assert LessonModel.objects.count() == 3
+    assert GroupLessonModel.objects.count() == 8
+    assert set(
+        GroupLessonModel.objects.filter(group=split_group).values_list('subgroup', flat=True),
+    ) == {Subgroup.A, Subgroup.B}
+    assert not GroupModel.objects.filter(schedule_updated_at__isnull=True).exists()
+
+
+@pytest.mark.django_db
+def test_import_timetable_twice_keeps_existing_rows(import_timetable_use_case):
+    faculty, _, rows = _faculty_timetable(group_count=2)
+    import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows)
+    lesson_uuids = set(LessonModel.objects.values_list('lesson_uuid', flat=True))
+
+    import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows)
+
+    assert set(LessonModel.objects.values_list('lesson_uuid', flat=True)) == lesson_uuids
+    assert GroupLessonModel.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_import_timetable_query_count_does_not_grow_with_rows(import_timetable_use_case):
+    def count_queries(group_count: int) -> int:
+        faculty, _, rows = _faculty_timetable(group_count=group_count)
+        with CaptureQueriesContext(connection) as queries:
+            import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows)
+        return len(queries)
+
+    assert count_queries(group_count=1) == count_queries(group_count=20)
+
+
+@pytest.mark.django_db
+def test_import_timetable_reports_every_missing_reference(import_timetable_use_case):
+    faculty, _, rows = _faculty_timetable(group_count=1)
+    unknown_group, unknown_room = 'a1b2c3d4-0000-4000-8000-000000000001', 'a1b2c3d4-0000-4000-8000-000000000002'
+    rows += [replace(rows[0], group_uuid=unknown_group), replace(rows[0], room_uuid=unknown_room)]
+
+    with pytest.raises(TimetableImportReferencesNotFoundException) as error:
+        import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows)
+
+    assert error.value.missing == {'group': [unknown_group], 'room': [unknown_room]}
+    assert not LessonModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_timetable_rejects_groups_of_another_faculty(import_timetable_use_case):
+    faculty, _, rows = _faculty_timetable(group_count=1)
+    _, foreign_groups, foreign_rows = _faculty_timetable(group_count=1)
+
+    with pytest.raises(TimetableImportGroupsOutsideFacultyException) as error:
+        import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows + foreign_rows)
+
+    assert error.value.group_uuids == [str(foreign_groups[0].group_uuid)]
+    assert not GroupLessonModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test_import_timetable_invalidates_group_caches(import_timetable_use_case, container):
+    version_service: BaseScheduleVersionService = container.resolve(BaseScheduleVersionService)
+    faculty, groups, rows = _faculty_timetable(group_count=1)
+    group_uuid = str(groups[0].group_uuid)
+    all_version = version_service.get_all_groups_version()
+    lessons_version = version_service.get_group_lessons_version(group_uuid=group_uuid)
+
+    import_timetable_use_case.execute(faculty_uuid=str(faculty.faculty_uuid), rows=rows)
+
+    assert version_service.get_all_groups_version() != all_version
+    assert version_service.get_group_lessons_version(group_uuid=group_uuid) != lessons_version
@@ -5,17 +5,22 @@ from tests.factories.client.client import ClientModelFactory
 from tests.factories.client.role import RoleModelFactory
 from tests.factories.schedule.faculty import FacultyModelFactory
 from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
 from tests.factories.schedule.lesson import LessonModelFactory
 
+from core.apps.common.cache.class_decorator import StaleWhileRevalidateEntry
 from core.apps.common.cache.service import (
     BaseCacheService,
     CACHE_MISS,
 )
 from core.apps.common.models import ClientRole
+from core.apps.schedule.filters.group import LessonFilter
 from core.apps.schedule.services.group import BaseGroupService
 from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
 from core.apps.schedule.use_cases.group.create import CreateGroupUseCase
 from core.apps.schedule.use_cases.group.get_all import GetAllGroupsUseCase
+from core.apps.schedule.use_cases.group.get_group_lessons import GetGroupLessonsUseCase
+from core.apps.schedule.use_cases.teacher.update_name import UpdateTeacherNameUseCase
 
 
 @pytest.fixture(autouse=True)
@@ -53,9 +58,10 @@ def test_get_all_caches_on_miss(get_all_use_case, cache_service, group_all_cache
     result = get_all_use_case.execute()
 
     cached = cache_service.get_cache_value(group_all_cache_key, default=CACHE_MISS)
-    assert cached is not CACHE_MISS
-    assert len(cached) == 2
-    assert cached == result
+    assert isinstance(cached, StaleWhileRevalidateEntry)
+    assert cached.is_fresh
+    assert len(cached.value) == 2
+    assert cached.value == result
 
 
 @pytest.mark.django_db
@@ -77,8 +83,8 @@ def test_get_all_caches_empty_result(get_all_use_case, cache_service, group_all_
     assert result == []
 
     cached = cache_service.get_cache_value(group_all_cache_key, default=CACHE_MISS)
-    assert cached is not CACHE_MISS
-    assert cached == []
+    assert isinstance(cached, StaleWhileRevalidateEntry)
+    assert cached.value == []
 
 
 @pytest.mark.django_db
@@ -89,7 +95,7 @@ def test_create_group_invalidates_get_all_cache(
         group_all_cache_key,
 ):
     assert get_all_use_case.execute() == []
-    assert cache_service.get_cache_value(group_all_cache_key, default=CACHE_MISS) == []
+    assert cache_service.get_cache_value(group_all_cache_key, default=CACHE_MISS).value == []
 
     faculty = FacultyModelFactory.create()
     headman = ClientModelFactory.create(roles=[RoleModelFactory(id=ClientRole.HEADMAN)])
@@ -101,7 +107,9 @@ def test_create_group_invalidates_get_all_cache(
         has_subgroups=True,
     )
 
-    assert cache_service.get_cache_value(group_all_cache_key, default=CACHE_MISS) is CACHE_MISS
+    current_key = cache_service.generate_cache_key(model_prefix='group', func_prefix='all')
+    assert current_key != group_all_cache_key
+    assert cache_service.get_cache_value(current_key, default=CACHE_MISS) is CACHE_MISS
 
     after = get_all_use_case.execute()
     assert len(after) == 1
@@ -158,10 +166,75 @@ def test_admin_add_lesson_reflected_in_get_all_after_cache_invalidation(
         subgroup=None,
         lesson_uuid=lesson.lesson_uuid,
     )
-    cache_service.invalidate_cache_pattern(
-        key=cache_service.generate_cache_key(model_prefix='group', func_prefix='all'),
-    )
+    cache_service.invalidate_namespace(model_prefix='group', func_prefix='all')
 
     after = get_all_use_case.execute()
     assert len(after) == 1
     assert after[0].schedule_updated_at is not None
+
+
+@pytest.mark.django_db
+def test_admin_add_lesson_regenerates_group_snapshot(container):
+    use_case: AdminAddLessonToGroupUseCase = container.resolve(AdminAddLessonToGroupUseCase)
+    get_lessons_use_case: GetGroupLessonsUseCase = container.resolve(GetGroupLessonsUseCase)
+    group = GroupModelFactory.create(has_subgroups=False)
+    lesson = LessonModelFactory.create()
+    is_even = lesson.timeslot.is_even
+
+    _, before = get_lessons_use_case.execute(group_uuid=str(group.group_uuid), filters=LessonFilter(is_even=is_even))
+    assert before.entries == []
+
+    use_case.execute(
+        group_uuid=str(group.group_uuid),
+        subgroup=None,
+        lesson_uuid=lesson.lesson_uuid,
+    )
+
+    returned_group, after = get_lessons_use_case.execute(
+        group_uuid=str(group.group_uuid),
+        filters=LessonFilter(is_even=is_even),
+    )
+    assert [entry.lesson_uuid for entry in after.entries] == [str(lesson.lesson_uuid)]
+    assert returned_group.schedule_updated_at is not None
+
+
+@pytest.mark.django_db
+def test_teacher_rename_invalidates_only_dependent_snapshots(container, cache_service):
+    get_lessons_use_case: GetGroupLessonsUseCase = container.resolve(GetGroupLessonsUseCase)
+    update_name_use_case: UpdateTeacherNameUseCase = container.resolve(UpdateTeacherNameUseCase)
+    renamed_lesson = GroupLessonModelFactory.create(group__has_subgroups=False)
+    untouched_lesson = GroupLessonModelFactory.create(group__has_subgroups=False)
+    renamed_group_uuid = str(renamed_lesson.group.group_uuid)
+    untouched_group_uuid = str(untouched_lesson.group.group_uuid)
+
+    def snapshot_key(group_uuid: str) -> str:
+        return cache_service.generate_cache_key(
+            model_prefix='group',
+            identifier=group_uuid,
+            func_prefix='lessons',
+            filters='timetable',
+        )
+
+    for lesson in (renamed_lesson, untouched_lesson):
+        get_lessons_use_case.execute(
+            group_uuid=str(lesson.group.group_uuid),
+            filters=LessonFilter(is_even=lesson.lesson.timeslot.is_even),
+        )
+    renamed_key, untouched_key = snapshot_key(renamed_group_uuid), snapshot_key(untouched_group_uuid)
+
+    update_name_use_case.execute(
+        teacher_uuid=str(renamed_lesson.lesson.teacher.teacher_uuid),
+        first_name='Нове',
+        last_name='Прізвище',
+        middle_name='Імʼя',
+    )
+
+    assert snapshot_key(renamed_group_uuid) != renamed_key
+    assert snapshot_key(untouched_group_uuid) == untouched_key
+    assert cache_service.get_cache_value(untouched_key, default=CACHE_MISS) is not CACHE_MISS
+
+    _, after = get_lessons_use_case.execute(
+        group_uuid=renamed_group_uuid,
+        filters=LessonFilter(is_even=renamed_lesson.lesson.timeslot.is_even),
+    )
+    assert [teacher.last_name for teacher in after.teachers.values()] == ['Прізвище']
@@ -0,0 +1,138 @@
+from django.core.cache import cache
+from django.utils import timezone
+
+import pytest
+import uuid
+from datetime import timedelta
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+
+from core.apps.common.models import Subgroup
+from core.apps.schedule.entities.group_lessons import (
+    GroupLessonAction,
+    GroupLessonCell,
+    GroupLessonOperation,
+)
+from core.apps.schedule.models import GroupLessonChange as GroupLessonChangeModel
+from core.apps.schedule.services.group_lesson_changes import BaseGroupLessonChangeService
+from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.admin_batch_lessons import AdminBatchUpdateGroupLessonsUseCase
+from core.apps.schedule.use_cases.group.admin_remove_lesson import AdminRemoveLessonFromGroupUseCase
+from core.apps.schedule.use_cases.group.admin_update_lesson import AdminUpdateLessonInGroupUseCase
+from core.apps.schedule.use_cases.group.get_lesson_changes import GetGroupLessonChangesUseCase
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def changes_use_case(container) -> GetGroupLessonChangesUseCase:
+    return container.resolve(GetGroupLessonChangesUseCase)
+
+
+@pytest.mark.django_db
+def test_changes_without_since_return_whole_timetable(changes_use_case: GetGroupLessonChangesUseCase):
+    group = GroupModelFactory()
+    group_lessons = GroupLessonModelFactory.create_batch(2, group=group, subgroup=None)
+
+    delta = changes_use_case.execute(group_uuid=str(group.group_uuid), since=None)
+
+    assert delta.is_full
+    assert delta.version == 0
+    assert {entry.lesson_uuid for entry in delta.added.entries} == {
+        str(group_lesson.lesson.lesson_uuid) for group_lesson in group_lessons
+    }
+
+
+@pytest.mark.django_db
+def test_changes_since_version_list_added_and_removed_cells(container, changes_use_case: GetGroupLessonChangesUseCase):
+    group = GroupModelFactory(has_subgroups=True)
+    kept, replaced, removed = LessonModelFactory.create_batch(3)
+    for lesson in (kept, replaced, removed):
+        GroupLessonModelFactory(group=group, lesson=lesson, subgroup=Subgroup.A)
+    added, replacement = LessonModelFactory.create_batch(2)
+    group_uuid = str(group.group_uuid)
+    since = changes_use_case.execute(group_uuid=group_uuid, since=None).version
+
+    container.resolve(AdminAddLessonToGroupUseCase).execute(
+        group_uuid=group_uuid,
+        subgroup=Subgroup.B,
+        lesson_uuid=str(added.lesson_uuid),
+    )
+    container.resolve(AdminUpdateLessonInGroupUseCase).execute(
+        group_uuid=group_uuid,
+        subgroup=Subgroup.A,
+        lesson_uuid=str(replacement.lesson_uuid),
+        old_lesson_uuid=str(replaced.lesson_uuid),
+    )
+    container.resolve(AdminRemoveLessonFromGroupUseCase).execute(
+        group_uuid=group_uuid,
+        subgroup=Subgroup.A,
+        lesson_uuid=str(removed.lesson_uuid),
+    )
+
+    delta = changes_use_case.execute(group_uuid=group_uuid, since=since)
+
+    assert not delta.is_full
+    assert delta.version > since
+    assert {(entry.lesson_uuid, tuple(entry.subgroups)) for entry in delta.added.entries} == {
+        (str(added.lesson_uuid), (Subgroup.B,)),
+        (str(replacement.lesson_uuid), (Subgroup.A,)),
+    }
+    assert set(delta.removed) == {
+        GroupLessonCell(lesson_uuid=str(replaced.lesson_uuid), subgroup=Subgroup.A),
+        GroupLessonCell(lesson_uuid=str(removed.lesson_uuid), subgroup=Subgroup.A),
+    }
+
+    up_to_date = changes_use_case.execute(group_uuid=group_uuid, since=delta.version)
+    assert (up_to_date.is_full, up_to_date.added.entries, up_to_date.removed) == (False, [], [])
+
+
+@pytest.mark.django_db
+def test_batch_logs_its_net_effect(container, changes_use_case: GetGroupLessonChangesUseCase):
+    group = GroupModelFactory(has_subgroups=False)
+    transient, lesson = LessonModelFactory.create_batch(2)
+    group_uuid = str(group.group_uuid)
+
+    container.resolve(AdminBatchUpdateGroupLessonsUseCase).execute(
+        group_uuid=group_uuid,
+        operations=[
+            GroupLessonOperation(action=GroupLessonAction.ADD, lesson_uuid=str(transient.lesson_uuid)),
+            GroupLessonOperation(action=GroupLessonAction.ADD, lesson_uuid=str(lesson.lesson_uuid)),
+            GroupLessonOperation(action=GroupLessonAction.REMOVE, lesson_uuid=str(transient.lesson_uuid)),
+        ],
+    )
+
+    assert list(GroupLessonChangeModel.objects.filter(group=group).values_list('kind', 'lesson_uuid')) == [
+        ('add', uuid.UUID(str(lesson.lesson_uuid))),
+    ]
+    delta = changes_use_case.execute(group_uuid=group_uuid, since=None)
+    assert [entry.lesson_uuid for entry in delta.added.entries] == [str(lesson.lesson_uuid)]
+
+
+@pytest.mark.django_db
+def test_compacted_history_falls_back_to_whole_timetable(
+        container,
+        changes_use_case: GetGroupLessonChangesUseCase,
+):
+    group = GroupModelFactory(has_subgroups=False)
+    first, second = LessonModelFactory.create_batch(2)
+    group_uuid = str(group.group_uuid)
+    add_use_case = container.resolve(AdminAddLessonToGroupUseCase)
+
+    add_use_case.execute(group_uuid=group_uuid, subgroup=None, lesson_uuid=str(first.lesson_uuid))
+    stale_version = changes_use_case.execute(group_uuid=group_uuid, since=None).version
+    add_use_case.execute(group_uuid=group_uuid, subgroup=None, lesson_uuid=str(second.lesson_uuid))
+    current_version = changes_use_case.execute(group_uuid=group_uuid, since=None).version
+
+    deleted = container.resolve(BaseGroupLessonChangeService).compact(before=timezone.now() + timedelta(seconds=1))
+
+    assert deleted == 1
+    assert changes_use_case.execute(group_uuid=group_uuid, since=stale_version).is_full
+    delta = changes_use_case.execute(group_uuid=group_uuid, since=current_version)
+    assert (delta.is_full, delta.version) == (False, current_version)
@@ -1,4 +1,6 @@
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from tests.factories.client.client import ClientModelFactory
@@ -15,6 +17,10 @@ from core.apps.common.models import (
     ClientRole,
     Subgroup,
 )
+from core.apps.schedule.entities.group_lessons import (
+    GroupLessonAction,
+    GroupLessonOperation,
+)
 from core.apps.schedule.exceptions.group import (
     GroupNotFoundException,
     GroupWithoutSubgroupsInvalidSubgroupException,
@@ -23,16 +29,20 @@ from core.apps.schedule.exceptions.group import (
 from core.apps.schedule.exceptions.group_lesson import (
     GroupLessonAlreadyExists,
     GroupLessonDeleteError,
+    GroupLessonScheduleConflict,
 )
 from core.apps.schedule.exceptions.lesson import LessonNotFoundException
 from core.apps.schedule.exceptions.validators.uuid_validator import InvalidUuidFormatStringException
 from core.apps.schedule.models import (
+    Group as GroupModel,
     GroupLesson as GroupLessonModel,
     Lesson as LessonModel,
 )
+from core.apps.schedule.use_cases.group.admin_batch_lessons import AdminBatchUpdateGroupLessonsUseCase
 from core.apps.schedule.use_cases.group.admin_remove_lesson import AdminRemoveLessonFromGroupUseCase
 from core.apps.schedule.use_cases.group.admin_update_lesson import AdminUpdateLessonInGroupUseCase
 from core.apps.schedule.use_cases.group.headman_add_lesson import HeadmanAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.headman_batch_lessons import HeadmanBatchUpdateGroupLessonsUseCase
 from core.apps.schedule.use_cases.group.headman_remove_lesson import HeadmanRemoveLessonFromGroupUseCase
 from core.apps.schedule.use_cases.group.headman_update_lesson import HeadmanUpdateLessonInGroupUseCase
 
@@ -75,6 +85,16 @@ def headman_update_use_case(container) -> HeadmanUpdateLessonInGroupUseCase:
     return container.resolve(HeadmanUpdateLessonInGroupUseCase)
 
 
+@pytest.fixture
+def admin_batch_use_case(container) -> AdminBatchUpdateGroupLessonsUseCase:
+    return container.resolve(AdminBatchUpdateGroupLessonsUseCase)
+
+
+@pytest.fixture
+def headman_batch_use_case(container) -> HeadmanBatchUpdateGroupLessonsUseCase:
+    return container.resolve(HeadmanBatchUpdateGroupLessonsUseCase)
+
+
 @pytest.mark.django_db
 def test_admin_remove_invalid_uuid_raises(admin_remove_use_case):
     with pytest.raises(InvalidUuidFormatStringException):
@@ -290,6 +310,24 @@ def test_headman_add_happy_path(headman_add_use_case, headman_client):
     assert GroupLessonModel.objects.filter(group=group, lesson=lesson).exists()
 
 
+@pytest.mark.django_db
+def test_headman_add_double_booked_teacher_raises(headman_add_use_case, headman_client):
+    group = GroupModelFactory(headman=headman_client, has_subgroups=False)
+    booked = LessonModelFactory()
+    GroupLessonModelFactory(lesson=booked, subgroup=None)
+    lesson = LessonModelFactory(teacher=booked.teacher, timeslot=booked.timeslot)
+
+    with pytest.raises(GroupLessonScheduleConflict) as exc_info:
+        headman_add_use_case.execute(
+            headman_email=headman_client.email,
+            subgroup=None,
+            lesson_uuid=str(lesson.lesson_uuid),
+        )
+
+    assert exc_info.value.conflicts[0]['lesson_uuids'] == (str(booked.lesson_uuid),)
+    assert not GroupLessonModel.objects.filter(group=group).exists()
+
+
 @pytest.mark.django_db
 def test_headman_remove_invalid_uuid_raises(headman_remove_use_case, headman_client):
     with pytest.raises(InvalidUuidFormatStringException):
@@ -372,3 +410,106 @@ def test_headman_update_happy_path(headman_update_use_case, headman_client):
     assert returned_old.uuid == str(old_lesson.lesson_uuid)
     assert GroupLessonModel.objects.filter(group=group, lesson=new_lesson).exists()
     assert not GroupLessonModel.objects.filter(group=group, lesson=old_lesson).exists()
+
+
+def _operation(action: GroupLessonAction, lesson, old_lesson=None, subgroup=None) -> GroupLessonOperation:
+    return GroupLessonOperation(
+        action=action,
+        lesson_uuid=lesson if isinstance(lesson, str) else str(lesson.lesson_uuid),
+        old_lesson_uuid=None if old_lesson is None else str(old_lesson.lesson_uuid),
+        subgroup=subgroup,
+    )
+
+
+@pytest.mark.django_db
+def test_admin_batch_applies_valid_operations_and_reports_failures(admin_batch_use_case):
+    group = GroupModelFactory(has_subgroups=False)
+    added, kept, replaced, replacement, removed = LessonModelFactory.create_batch(5)
+    for lesson in (kept, replaced, removed):
+        GroupLessonModelFactory(group=group, lesson=lesson, subgroup=None)
+
+    returned_group, results = admin_batch_use_case.execute(
+        group_uuid=str(group.group_uuid),
+        operations=[
+            _operation(GroupLessonAction.ADD, added),
+            _operation(GroupLessonAction.REPLACE, replacement, old_lesson=replaced),
+            _operation(GroupLessonAction.REMOVE, removed),
+            _operation(GroupLessonAction.ADD, kept),
+            _operation(GroupLessonAction.REMOVE, added),
+            _operation(GroupLessonAction.REMOVE, added),
+            _operation(GroupLessonAction.ADD, '00000000-0000-0000-0000-000000000001'),
+        ],
+    )
+
+    assert returned_group.uuid == str(group.group_uuid)
+    assert [type(result.error) for result in results] == [
+        type(None),
+        type(None),
+        type(None),
+        GroupLessonAlreadyExists,
+        type(None),
+        GroupLessonDeleteError,
+        LessonNotFoundException,
+    ]
+    assert set(GroupLessonModel.objects.filter(group=group).values_list('lesson_id', flat=True)) == {
+        kept.id, replacement.id,
+    }
+    assert not LessonModel.objects.filter(id__in=[replaced.id, removed.id]).exists()
+    assert GroupModel.objects.get(id=group.id).schedule_updated_at is not None
+
+
+@pytest.mark.django_db
+def test_admin_batch_without_applicable_operations_writes_nothing(admin_batch_use_case):
+    group = GroupModelFactory(has_subgroups=False)
+    lesson = LessonModelFactory()
+
+    _, results = admin_batch_use_case.execute(
+        group_uuid=str(group.group_uuid),
+        operations=[_operation(GroupLessonAction.REMOVE, lesson), _operation(GroupLessonAction.ADD, 'not-a-uuid')],
+    )
+
+    assert isinstance(results[0].error, GroupLessonDeleteError)
+    assert isinstance(results[1].error, InvalidUuidFormatStringException)
+    assert GroupModel.objects.get(id=group.id).schedule_updated_at is None
+
+
+@pytest.mark.django_db
+def test_admin_batch_query_count_does_not_grow_with_batch_size(admin_batch_use_case):
+    def run(size: int) -> int:
+        group = GroupModelFactory(has_subgroups=True)
+        operations = [
+            _operation(GroupLessonAction.ADD, lesson, subgroup=Subgroup.A)
+            for lesson in LessonModelFactory.create_batch(size)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            admin_batch_use_case.execute(group_uuid=str(group.group_uuid), operations=operations)
+        return len(queries)
+
+    run(1)  # loads the timetable index
+    assert run(2) == run(10)
+
+
+@pytest.mark.django_db
+def test_headman_batch_applies_to_headman_group(headman_batch_use_case, headman_client):
+    group = GroupModelFactory(headman=headman_client, has_subgroups=False)
+    lesson = LessonModelFactory()
+
+    returned_group, results = headman_batch_use_case.execute(
+        headman_email=headman_client.email,
+        operations=[_operation(GroupLessonAction.ADD, lesson)],
+    )
+
+    assert returned_group.uuid == str(group.group_uuid)
+    assert results[0].is_applied
+    assert GroupLessonModel.objects.filter(group=group, lesson=lesson).exists()
+
+
+@pytest.mark.django_db
+def test_headman_batch_client_lacks_role_raises(headman_batch_use_case):
+    not_headman = ClientModelFactory(roles=[RoleModelFactory(id=ClientRole.ADMIN)])
+
+    with pytest.raises(ClientRoleNotMatchingWithRequiredException):
+        headman_batch_use_case.execute(
+            headman_email=not_headman.email,
+            operations=[_operation(GroupLessonAction.ADD, '00000000-0000-0000-0000-000000000001')],
+        )
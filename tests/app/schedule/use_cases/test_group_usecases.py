@@ -87,13 +87,13 @@ def headman_client():
 def test_get_group_list_returns_paginated(get_list_use_case, group_create_batch):
     group_create_batch(size=5)
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=SearchFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    assert count == 5
-    assert len(list(items)) == 5
+    assert page.total == 5
+    assert len(page.items) == 5
 
 
 @pytest.mark.django_db
@@ -102,13 +102,13 @@ def test_get_group_list_search_filters_by_number(get_list_use_case):
     GroupModelFactory(number="ПМ-102")
     GroupModelFactory(number="ІН-201")
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=SearchFilter(search="ПМ"),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    items = list(items)
-    assert count == 2
+    items = page.items
+    assert page.total == 2
     assert {g.number for g in items} == {"ПМ-101", "ПМ-102"}
 
 
@@ -116,13 +116,13 @@ def test_get_group_list_search_filters_by_number(get_list_use_case):
 def test_get_group_list_handles_groups_without_headman(get_list_use_case):
     GroupModelFactory(headman=None)
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=SearchFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    items = list(items)
-    assert count == 1
+    items = page.items
+    assert page.total == 1
     assert items[0].headman is None
 
 
@@ -301,13 +301,13 @@ def test_get_group_lessons_subgroup_filter_invalid_for_group_without_subgroups_r
 def test_get_group_lessons_happy_path(get_group_lessons_use_case):
     group = GroupModelFactory(has_subgroups=False)
 
-    returned_group, views = get_group_lessons_use_case.execute(
+    returned_group, timetable = get_group_lessons_use_case.execute(
         group_uuid=str(group.group_uuid),
         filters=LessonFilter(is_even=True),
     )
 
     assert returned_group.uuid == str(group.group_uuid)
-    assert isinstance(views, list)
+    assert timetable.entries == []
 
 
 @pytest.mark.django_db
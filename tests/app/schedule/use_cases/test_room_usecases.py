@@ -1,11 +1,19 @@
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 from tests.factories.schedule.group_lesson import GroupLessonModelFactory
 from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
 
 from core.api.filters import PaginationIn
 from core.apps.common.filters import SearchFilter
+from core.apps.common.models import (
+    Day,
+    OrdinaryNumber,
+)
 from core.apps.schedule.exceptions.room import (
     OldAndNewRoomDescriptionsAreSimilarException,
     RoomAlreadyExistException,
@@ -13,10 +21,13 @@ from core.apps.schedule.exceptions.room import (
     RoomNotFoundException,
 )
 from core.apps.schedule.exceptions.validators.uuid_validator import InvalidUuidFormatStringException
+from core.apps.schedule.filters.group import LessonFilter
 from core.apps.schedule.use_cases.room.create import CreateRoomUseCase
 from core.apps.schedule.use_cases.room.delete import DeleteRoomUseCase
 from core.apps.schedule.use_cases.room.get_all import GetAllRoomsUseCase
+from core.apps.schedule.use_cases.room.get_free import GetFreeRoomsUseCase
 from core.apps.schedule.use_cases.room.get_list import GetRoomListUseCase
+from core.apps.schedule.use_cases.room.get_room_lessons import GetLessonsForRoomUseCase
 from core.apps.schedule.use_cases.room.update_description import UpdateRoomDescriptionUseCase
 from core.apps.schedule.use_cases.room.update_number import UpdateRoomNumberUseCase
 
@@ -33,6 +44,16 @@ def get_all_use_case(container) -> GetAllRoomsUseCase:
     return container.resolve(GetAllRoomsUseCase)
 
 
+@pytest.fixture
+def get_free_use_case(container) -> GetFreeRoomsUseCase:
+    return container.resolve(GetFreeRoomsUseCase)
+
+
+@pytest.fixture
+def get_lessons_use_case(container) -> GetLessonsForRoomUseCase:
+    return container.resolve(GetLessonsForRoomUseCase)
+
+
 @pytest.fixture
 def get_list_use_case(container) -> GetRoomListUseCase:
     return container.resolve(GetRoomListUseCase)
@@ -71,13 +92,13 @@ def test_get_all_rooms_returns_list(get_all_use_case, room_create_batch):
 def test_get_room_list_returns_paginated(get_list_use_case, room_create_batch):
     room_create_batch(size=4)
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=SearchFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    assert count == 4
-    assert len(list(items)) == 4
+    assert page.total == 4
+    assert len(page.items) == 4
 
 
 @pytest.mark.django_db
@@ -187,3 +208,78 @@ def test_update_room_description_happy_path(update_description_use_case, room_cr
 
     assert updated.description == "New desc with projector"
     assert updated.id == room.id
+
+
+@pytest.mark.django_db
+def test_get_free_rooms_excludes_rooms_booked_in_requested_slots(get_free_use_case):
+    busy_even, busy_odd, idle = RoomModelFactory.create_batch(3)
+    for room, is_even in ((busy_even, True), (busy_odd, False)):
+        timeslot = TimeslotModelFactory(day=Day.WEDNESDAY, ord_number=OrdinaryNumber.THIRD, is_even=is_even)
+        GroupLessonModelFactory(lesson=LessonModelFactory(room=room, timeslot=timeslot), subgroup=None)
+
+    even_week = get_free_use_case.execute(day=Day.WEDNESDAY, ord_numbers=[OrdinaryNumber.THIRD], is_even=True)
+    every_week = get_free_use_case.execute(day=Day.WEDNESDAY, ord_numbers=[OrdinaryNumber.THIRD])
+    other_lesson = get_free_use_case.execute(day=Day.WEDNESDAY, ord_numbers=[OrdinaryNumber.FOURTH])
+
+    assert {room.uuid for room in even_week} == {str(busy_odd.room_uuid), str(idle.room_uuid)}
+    assert {room.uuid for room in every_week} == {str(idle.room_uuid)}
+    assert len(other_lesson) == 3
+
+
+@pytest.mark.django_db
+def test_get_free_rooms_warm_call_does_not_query_database(get_free_use_case):
+    RoomModelFactory.create_batch(2)
+    get_free_use_case.execute(day=Day.MONDAY, ord_numbers=[OrdinaryNumber.FIRST])
+
+    with CaptureQueriesContext(connection) as queries:
+        rooms = get_free_use_case.execute(day=Day.MONDAY, ord_numbers=[OrdinaryNumber.FIRST, OrdinaryNumber.SECOND])
+
+    assert len(queries) == 0
+    assert len(rooms) == 2
+
+
+@pytest.mark.django_db
+def test_get_room_lessons_lists_lessons_held_in_room(get_lessons_use_case):
+    group_lesson = GroupLessonModelFactory(subgroup=None)
+    room = group_lesson.lesson.room
+    GroupLessonModelFactory(subgroup=None)
+
+    returned_room, timetable = get_lessons_use_case.execute(
+        room_uuid=str(room.room_uuid),
+        filters=LessonFilter(is_even=group_lesson.lesson.timeslot.is_even),
+    )
+
+    assert returned_room.uuid == str(room.room_uuid)
+    assert [entry.lesson_uuid for entry in timetable.entries] == [str(group_lesson.lesson.lesson_uuid)]
+    assert [group.group_id for group in timetable.entries[0].groups] == [group_lesson.group_id]
+
+
+@pytest.mark.django_db
+def test_get_room_lessons_is_refreshed_after_room_rename(get_lessons_use_case, update_number_use_case):
+    group_lesson = GroupLessonModelFactory(subgroup=None)
+    room = group_lesson.lesson.room
+    filters = LessonFilter(is_even=group_lesson.lesson.timeslot.is_even)
+    get_lessons_use_case.execute(room_uuid=str(room.room_uuid), filters=filters)
+
+    update_number_use_case.execute(room_uuid=str(room.room_uuid), new_number='renamed')
+    returned_room, timetable = get_lessons_use_case.execute(room_uuid=str(room.room_uuid), filters=filters)
+
+    assert returned_room.number == 'renamed'
+    assert [room.number for room in timetable.rooms.values()] == ['renamed']
+
+
+@pytest.mark.django_db
+def test_get_room_lessons_of_empty_room_is_refreshed_after_update(
+        get_lessons_use_case,
+        update_number_use_case,
+        update_description_use_case,
+):
+    room_uuid = str(RoomModelFactory().room_uuid)
+    filters = LessonFilter(is_even=True)
+    get_lessons_use_case.execute(room_uuid=room_uuid, filters=filters)
+
+    update_number_use_case.execute(room_uuid=room_uuid, new_number='renamed')
+    assert get_lessons_use_case.execute(room_uuid=room_uuid, filters=filters)[0].number == 'renamed'
+
+    update_description_use_case.execute(room_uuid=room_uuid, description='redescribed')
+    assert get_lessons_use_case.execute(room_uuid=room_uuid, filters=filters)[0].description == 'redescribed'
@@ -63,13 +63,13 @@ def test_get_all_subjects_returns_list(get_all_use_case, subject_create_batch):
 def test_get_subject_list_returns_paginated(get_list_use_case, subject_create_batch):
     subject_create_batch(size=4)
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=SearchFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    assert count == 4
-    assert len(list(items)) == 4
+    assert page.total == 4
+    assert len(page.items) == 4
 
 
 @pytest.mark.django_db
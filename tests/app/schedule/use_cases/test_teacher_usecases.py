@@ -5,6 +5,7 @@ from tests.factories.schedule.group_lesson import GroupLessonModelFactory
 from tests.factories.schedule.lesson import LessonModelFactory
 
 from core.api.filters import PaginationIn
+from core.apps.common.cache.service import BaseCacheService
 from core.apps.common.models import TeachersDegree
 from core.apps.schedule.exceptions.teacher import (
     OldAndNewTeacherRanksAreSimilarException,
@@ -79,13 +80,13 @@ def test_get_all_teachers_returns_list(get_all_use_case, teacher_create_batch):
 def test_get_teacher_list_returns_paginated(get_list_use_case, teacher_create_batch):
     teacher_create_batch(size=4)
 
-    items, count = get_list_use_case.execute(
+    page = get_list_use_case.execute(
         filters=TeacherFilter(),
         pagination_in=PaginationIn(offset=0, limit=10),
     )
 
-    assert count == 4
-    assert len(list(items)) == 4
+    assert page.total == 4
+    assert len(page.items) == 4
 
 
 @pytest.mark.django_db
@@ -98,13 +99,31 @@ def test_get_teacher_lessons_invalid_uuid_raises(get_lessons_use_case):
 def test_get_teacher_lessons_happy_path(get_lessons_use_case, teacher_create):
     teacher = teacher_create()
 
-    returned_teacher, views = get_lessons_use_case.execute(
+    returned_teacher, timetable = get_lessons_use_case.execute(
         teacher_uuid=str(teacher.teacher_uuid),
         filters=LessonFilter(is_even=True),
     )
 
     assert returned_teacher.uuid == str(teacher.teacher_uuid)
-    assert isinstance(views, list)
+    assert timetable.entries == []
+
+
+@pytest.mark.django_db
+def test_get_teacher_lessons_ignores_entries_cached_in_the_old_format(container, get_lessons_use_case, teacher_create):
+    teacher_uuid = str(teacher_create().teacher_uuid)
+    filters = LessonFilter(is_even=True)
+    cache_service: BaseCacheService = container.resolve(BaseCacheService)
+    old_key = cache_service.generate_cache_key(
+        model_prefix='teacher',
+        identifier=teacher_uuid,
+        func_prefix='lessons',
+        filters=filters,
+    )
+    cache_service.set_cache(key=old_key, value=['pre-timetable lesson view'], timeout=60)
+
+    _, timetable = get_lessons_use_case.execute(teacher_uuid=teacher_uuid, filters=filters)
+
+    assert timetable.entries == []
 
 
 @pytest.mark.django_db
@@ -0,0 +1,26 @@
+from django.db import transaction
+
+import pytest
+from tests.benchmarks.dataset import (
+    build_university,
+    University,
+    UniversitySize,
+)
+
+
+@pytest.fixture(scope='module')
+def university(django_db_setup, django_db_blocker) -> University:
+    """Build the benchmark dataset once per module and roll it back
+    afterwards, so it never leaks into other tests."""
+    with django_db_blocker.unblock(), transaction.atomic():
+        yield build_university(UniversitySize())
+        transaction.set_rollback(True)
+
+
+@pytest.fixture
+def benchmark_options(request) -> dict:
+    return {
+        'update': request.config.getoption('benchmark_update'),
+        'threshold': request.config.getoption('benchmark_threshold'),
+        'samples': request.config.getoption('benchmark_samples'),
+    }
@@ -0,0 +1,141 @@
+import factory.random
+import random
+from dataclasses import (
+    dataclass,
+    field,
+)
+from tests.factories.schedule.faculty import FacultyModelFactory
+from tests.factories.schedule.group import GroupModelFactory
+from tests.factories.schedule.group_lesson import GroupLessonModelFactory
+from tests.factories.schedule.lesson import LessonModelFactory
+from tests.factories.schedule.room import RoomModelFactory
+from tests.factories.schedule.subject import SubjectModelFactory
+from tests.factories.schedule.teacher import TeacherModelFactory
+from tests.factories.schedule.timeslot import TimeslotModelFactory
+
+from core.apps.common.models import (
+    Day,
+    GroupLessonChangeKind,
+    LessonType,
+    OrdinaryNumber,
+)
+from core.apps.schedule.models import (
+    GroupLesson,
+    GroupLessonChange,
+    Lesson,
+)
+
+
+DATASET_SEED = 'chmnu-benchmark'
+
+
+@dataclass(frozen=True)
+class UniversitySize:
+    faculties: int = 12
+    groups: int = 300
+    teachers: int = 150
+    rooms: int = 90
+    subjects: int = 200
+    lessons_per_group: int = 12
+    groups_per_lecture: int = 3
+
+
+@dataclass
+class University:
+    size: UniversitySize
+    group_uuids: list[str] = field(default_factory=list)
+    teacher_uuids: list[str] = field(default_factory=list)
+    room_uuids: list[str] = field(default_factory=list)
+    # A version of the first group's timetable half-way through its change log.
+    changes_since: int = 0
+    lessons: int = 0
+    group_lessons: int = 0
+
+
+def build_university(size: UniversitySize) -> University:
+    """Populate the database with a reproducible university built from the
+    regular model factories.
+
+    Groups are split into streams of `groups_per_lecture`; every group
+    gets `lessons_per_group` lessons on distinct timeslots of both week
+    parities, half of them lectures shared by the whole stream and half
+    practices of its own. Dimension rows are created one by one through
+    the factories; lessons and their group links are built by the
+    factories and bulk inserted. The first group's lessons are also
+    logged as added one at a time, so delta requests have changes to
+    fold.
+
+    """
+    factory.random.reseed_random(DATASET_SEED)
+    rng = random.Random(DATASET_SEED)  # noqa: DUO102
+
+    timeslots = [
+        TimeslotModelFactory(day=day, ord_number=ord_number, is_even=is_even)
+        for day in Day
+        for ord_number in OrdinaryNumber
+        for is_even in (True, False)
+    ]
+    faculties = [
+        FacultyModelFactory(code_name=f'F{number}', name=f'Faculty {number}')
+        for number in range(size.faculties)
+    ]
+    teachers = TeacherModelFactory.create_batch(size.teachers)
+    rooms = [RoomModelFactory(number=f'{number + 100}') for number in range(size.rooms)]
+    subjects = SubjectModelFactory.create_batch(size.subjects)
+    groups = [
+        GroupModelFactory(faculty=faculties[number % size.faculties], has_subgroups=False)
+        for number in range(size.groups)
+    ]
+
+    university = University(
+        size=size,
+        group_uuids=[str(group.group_uuid) for group in groups],
+        teacher_uuids=[str(teacher.teacher_uuid) for teacher in teachers],
+        room_uuids=[str(room.room_uuid) for room in rooms],
+    )
+
+    lessons: list[Lesson] = []
+    group_lessons: list[GroupLesson] = []
+    combinations: set[tuple] = set()
+
+    def add_lesson(lesson_type: LessonType, timeslot, attendees: list) -> None:
+        while True:
+            subject, teacher, room = rng.choice(subjects), rng.choice(teachers), rng.choice(rooms)
+            combination = (subject.id, teacher.id, room.id, timeslot.id, lesson_type)
+            if combination not in combinations:
+                combinations.add(combination)
+                break
+        lesson = LessonModelFactory.build(
+            type=lesson_type,
+            subject=subject,
+            teacher=teacher,
+            room=room,
+            timeslot=timeslot,
+        )
+        lessons.append(lesson)
+        group_lessons.extend(GroupLessonModelFactory.build(group=group, lesson=lesson) for group in attendees)
+
+    for start in range(0, size.groups, size.groups_per_lecture):
+        stream = groups[start:start + size.groups_per_lecture]
+        for slot_index, timeslot in enumerate(rng.sample(timeslots, size.lessons_per_group)):
+            if slot_index % 2 == 0:
+                add_lesson(LessonType.LECTURE, timeslot, stream)
+                continue
+            for group in stream:
+                add_lesson(LessonType.PRACTICE, timeslot, [group])
+
+    Lesson.objects.bulk_create(lessons)
+    GroupLesson.objects.bulk_create(group_lessons)
+    changes = GroupLessonChange.objects.bulk_create([
+        GroupLessonChange(
+            group=groups[0],
+            kind=GroupLessonChangeKind.ADD,
+            lesson_uuid=group_lesson.lesson.lesson_uuid,
+            subgroup=group_lesson.subgroup,
+        )
+        for group_lesson in group_lessons if group_lesson.group is groups[0]
+    ])
+    university.changes_since = changes[len(changes) // 2 - 1].id
+    university.lessons = len(lessons)
+    university.group_lessons = len(group_lessons)
+    return university
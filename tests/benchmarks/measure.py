@@ -0,0 +1,116 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+import json
+import statistics
+import time
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from enum import Enum
+from pathlib import Path
+
+from core.apps.common.cache.local import get_local_cache
+
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+BYTES_THRESHOLD = 0.1
+
+
+class CacheState(str, Enum):
+    COLD = 'cold'
+    WARM = 'warm'
+
+
+@dataclass(frozen=True)
+class EndpointMeasurement:
+    queries: int
+    p50_ms: float
+    p95_ms: float
+    bytes: int
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[percent - 1]
+
+
+def _flush_caches() -> None:
+    cache.clear()
+    get_local_cache().clear()
+
+
+def measure_endpoint(client: Client, url: str, state: CacheState, samples: int) -> EndpointMeasurement:
+    """Request `url` `samples` times and summarise the responses.
+
+    One untimed request warms up the process first. For a cold run both
+    cache tiers are then flushed before every request; a warm run starts
+    from the caches that request filled. The query count
+    is the largest one seen across samples. Each request comes from its
+    own address so the anonymous rate limit never kicks in.
+
+    """
+    _flush_caches()
+    client.get(url)
+
+    durations, queries, sizes = [], 0, set()
+    for sample in range(samples):
+        if state is CacheState.COLD:
+            _flush_caches()
+        remote_addr = f'10.0.{sample // 256}.{sample % 256}'
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(url, REMOTE_ADDR=remote_addr)
+            durations.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, f'{url} answered {response.status_code}'
+        queries = max(queries, len(captured))
+        sizes.add(len(response.content))
+
+    return EndpointMeasurement(
+        queries=queries,
+        p50_ms=round(_percentile(durations, 50), 3),
+        p95_ms=round(_percentile(durations, 95), 3),
+        bytes=max(sizes),
+    )
+
+
+def load_baseline() -> dict[str, dict]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline_entry(name: str, state: CacheState, measurement: EndpointMeasurement) -> None:
+    baseline = load_baseline()
+    baseline.setdefault(name, {})[state.value] = asdict(measurement)
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+
+
+def find_regressions(
+        measurement: EndpointMeasurement,
+        baseline: dict,
+        threshold: float,
+        latency_floor_ms: float,
+) -> list[str]:
+    """Compare a measurement with its baseline entry.
+
+    Any extra query is a regression. The median latency may grow by
+    `threshold` (a ratio) plus `latency_floor_ms` of slack; p95 is kept in
+    the baseline for reference only, as a couple of samples decide it.
+    The dataset is seeded, so response size only gets `BYTES_THRESHOLD`.
+
+    """
+    regressions = []
+    if measurement.queries > baseline['queries']:
+        regressions.append(f"queries: {measurement.queries} > baseline {baseline['queries']}")
+    allowed_latency = baseline['p50_ms'] * (1 + threshold) + latency_floor_ms
+    if measurement.p50_ms > allowed_latency:
+        regressions.append(f'p50_ms: {measurement.p50_ms} > allowed {allowed_latency:.3f}')
+    allowed_bytes = baseline['bytes'] * (1 + BYTES_THRESHOLD)
+    if measurement.bytes > allowed_bytes:
+        regressions.append(f'bytes: {measurement.bytes} > allowed {allowed_bytes:.0f}')
+    return regressions
@@ -0,0 +1,41 @@
+from django.test import override_settings
+
+import pytest
+import time
+
+from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.get_group_lessons import GetGroupLessonsUseCase
+from core.project.containers.containers import _initialize_container
+
+
+pytestmark = pytest.mark.benchmark
+
+
+RESOLVE_ROUNDS = 2000
+# Compiled resolution is a dict lookup; anything under this ratio means a per-call graph walk crept back in.
+MIN_SPEEDUP = 20
+
+USE_CASES = [GetGroupLessonsUseCase, AdminAddLessonToGroupUseCase]
+
+
+def _resolve_us(container, use_case) -> float:
+    """Mean cost of one `resolve` in microseconds, after a warm-up call."""
+    container.resolve(use_case)
+    started = time.perf_counter()
+    for _ in range(RESOLVE_ROUNDS):
+        container.resolve(use_case)
+    return (time.perf_counter() - started) / RESOLVE_ROUNDS * 1_000_000
+
+
+@pytest.mark.parametrize('use_case', USE_CASES, ids=lambda use_case: use_case.__name__)
+def test_compiled_container_resolves_use_case_faster(use_case):
+    with override_settings(DI_CONTAINER_COMPILED=False):
+        reflective = _initialize_container()
+    compiled = _initialize_container()
+
+    before, after = _resolve_us(reflective, use_case), _resolve_us(compiled, use_case)
+
+    assert before / after >= MIN_SPEEDUP, (
+        f'{use_case.__name__}: only {before / after:.1f}x faster '
+        f'(punq {before:.1f} us, compiled {after:.2f} us per resolve)'
+    )
@@ -0,0 +1,70 @@
+import pytest
+from tests.benchmarks.dataset import University
+from tests.benchmarks.measure import (
+    CacheState,
+    find_regressions,
+    load_baseline,
+    measure_endpoint,
+    save_baseline_entry,
+)
+
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+
+LATENCY_FLOOR_MS = 2.0
+
+PUBLIC_ENDPOINTS = {
+    'get_all_groups': lambda university: '/api/v1/schedule/group/all',
+    'get_group_lessons': lambda university: (
+        f'/api/v1/schedule/group/{university.group_uuids[0]}/lessons?is_even=true'
+    ),
+    'get_group_lesson_changes': lambda university: (
+        f'/api/v1/schedule/group/{university.group_uuids[0]}/lessons/changes'
+    ),
+    'get_group_lesson_changes_delta': lambda university: (
+        f'/api/v1/schedule/group/{university.group_uuids[0]}/lessons/changes?since={university.changes_since}'
+    ),
+    'get_groups_lessons': lambda university: (
+        '/api/v1/schedule/group/lessons?is_even=true&' +
+        '&'.join(f'group_uuid={uuid}' for uuid in university.group_uuids[:20])
+    ),
+    'get_all_teachers': lambda university: '/api/v1/schedule/teacher/all',
+    'get_lessons_for_teacher': lambda university: (
+        f'/api/v1/schedule/teacher/{university.teacher_uuids[0]}/lessons?is_even=true'
+    ),
+    'get_room_lessons': lambda university: (
+        f'/api/v1/schedule/room/{university.room_uuids[0]}/lessons?is_even=true'
+    ),
+    'search_schedule': lambda university: '/api/v1/schedule/search/?q=ko',
+    'get_current_time_info': lambda university: '/api/v1/time/time/current',
+}
+
+
+@pytest.mark.parametrize('state', list(CacheState), ids=lambda state: state.value)
+@pytest.mark.parametrize('name', PUBLIC_ENDPOINTS)
+def test_public_endpoint_against_baseline(
+        client,
+        university: University,
+        benchmark_options: dict,
+        name: str,
+        state: CacheState,
+):
+    url = PUBLIC_ENDPOINTS[name](university)
+    measurement = measure_endpoint(client, url, state=state, samples=benchmark_options['samples'])
+
+    if benchmark_options['update']:
+        save_baseline_entry(name, state, measurement)
+        return
+
+    baseline = load_baseline().get(name, {}).get(state.value)
+    if baseline is None:
+        pytest.fail(f'no baseline for {name} ({state.value}); run pytest tests/benchmarks --benchmark-update')
+
+    regressions = find_regressions(
+        measurement,
+        baseline,
+        threshold=benchmark_options['threshold'],
+        latency_floor_ms=LATENCY_FLOOR_MS,
+    )
+    assert not regressions, f'{name} ({state.value}) regressed: ' + '; '.join(regressions)
@@ -1,15 +1,64 @@
 import pytest
 from faker import Faker
 
+from core.apps.common.cache.local import get_local_cache
+from core.apps.schedule.services.timetable_index import get_timetable_index
 from core.project.containers.containers import get_container
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", help="run the endpoint benchmarks in tests/benchmarks")
+    group.addoption(
+        "--benchmark-update",
+        action="store_true",
+        help="write measured numbers to tests/benchmarks/baseline.json instead of comparing",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=1.0,
+        help="allowed relative growth of the median latency over the baseline",
+    )
+    group.addoption("--benchmark-samples", type=int, default=20, help="requests per endpoint and cache state")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark") or config.getoption("benchmark_update"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="function")
 def container():
     container = get_container()
     return container
 
 
+@pytest.fixture(autouse=True)
+def thread_sensitive_async_reads(settings):
+    # Test data lives in a transaction on the test's own connection, which
+    # pool threads cannot see; tests of the pool path opt back out.
+    settings.ASYNC_READS_THREAD_SENSITIVE = True
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    get_local_cache().clear()
+    yield
+    get_local_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_timetable_index():
+    get_timetable_index().clear()
+    yield
+    get_timetable_index().clear()
+
+
 # faker = Faker()
 # faker_ua = Faker('uk_UA')
 
@@ -0,0 +1,82 @@
+import punq
+import pytest
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from core.apps.schedule.use_cases.group.admin_add_lesson import AdminAddLessonToGroupUseCase
+from core.apps.schedule.use_cases.group.get_group_lessons import GetGroupLessonsUseCase
+from core.apps.schedule.validators.group_lesson import BaseGroupLessonValidatorService
+from core.project.containers.compiled import CompiledContainer
+
+
+class Clock:
+    ...
+
+
+@dataclass
+class Journal:
+    clock: Clock
+    entries: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Reporter:
+    clock: Clock
+    journal: Journal
+
+
+@dataclass
+class Greeter:
+    clock: Clock
+    greeting: str = 'hello'
+
+
+@pytest.fixture
+def compiled_container() -> CompiledContainer:
+    container = CompiledContainer()
+    container.register(Clock)
+    container.register(Journal)
+    container.register(Reporter)
+    container.register(Greeter)
+    container.compile()
+    return container
+
+
+def test_compile_turns_stateless_services_into_singletons(compiled_container):
+    greeter = compiled_container.resolve(Greeter)
+
+    assert compiled_container.resolve(Greeter) is greeter
+    assert greeter.clock is compiled_container.resolve(Clock)
+
+
+def test_compile_keeps_stateful_services_and_their_dependants_transient(compiled_container):
+    journal = compiled_container.resolve(Journal)
+
+    assert compiled_container.resolve(Journal) is not journal
+    assert compiled_container.resolve(Reporter).journal is not compiled_container.resolve(Reporter).journal
+    assert journal.clock is compiled_container.resolve(Clock)
+    assert set(compiled_container.singletons) == {punq.Container, Clock, Greeter}
+
+
+def test_resolve_with_arguments_falls_back_to_punq(compiled_container):
+    greeter = compiled_container.resolve(Greeter, greeting='hi')
+
+    assert greeter.greeting == 'hi'
+    assert greeter is not compiled_container.resolve(Greeter)
+
+
+def test_register_after_compile_drops_compiled_factories(compiled_container):
+    compiled_container.register(Greeter, Greeter, greeting='hi')
+
+    assert not compiled_container.is_compiled
+    assert compiled_container.resolve(Greeter).greeting == 'hi'
+
+
+def test_project_container_shares_use_cases_and_validators(container):
+    use_case = container.resolve(AdminAddLessonToGroupUseCase)
+
+    assert container.resolve(AdminAddLessonToGroupUseCase) is use_case
+    assert container.resolve(GetGroupLessonsUseCase) is container.resolve(GetGroupLessonsUseCase)
+    assert use_case.group_lesson_validator_service is container.resolve(BaseGroupLessonValidatorService)